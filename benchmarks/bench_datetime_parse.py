@@ -0,0 +1,86 @@
+"""날짜/시간 파싱 마이크로 벤치마크
+
+Bacula API 작업 데이터의 starttime/endtime 파싱에 대해 기존 strptime 방식과
+parse_api_datetime(형식 판별 + fromisoformat + 캐시)을 비교합니다. 스케줄
+작업처럼 같은 시간 문자열이 반복되는 경우와 모두 다른 경우를 함께 측정합니다.
+
+사용 예시:
+    python -m benchmarks.bench_datetime_parse --rows 200000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from src.utils.datetime import parse_api_datetime, parse_datetime
+
+
+API_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def make_values(rows: int, distinct: int) -> List[str]:
+    """시간 문자열 생성
+
+    Args:
+        rows: 생성할 문자열 수
+        distinct: 서로 다른 값의 수
+
+    Returns:
+        YYYY-MM-DD HH:MM:SS 형식 문자열 리스트
+    """
+    base = datetime(2025, 10, 11, 0, 0, 0)
+    return [
+        (base + timedelta(seconds=i % distinct)).strftime(API_FORMAT)
+        for i in range(rows)
+    ]
+
+
+def measure(func: Callable[[str], datetime], values: List[str]) -> float:
+    """전체 값을 파싱하는 데 걸린 시간 (초)"""
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - started
+
+
+def legacy_parse_datetime(value: str) -> datetime:
+    """기존 parse_datetime 동작 (strptime 순차 시도, 첫 형식에서 성공)"""
+    return datetime.strptime(value, API_FORMAT)
+
+
+def run(rows: int) -> None:
+    """시나리오별 파싱 시간 측정 및 출력
+
+    Args:
+        rows: 시나리오별 문자열 수
+    """
+    scenarios = (
+        ('반복 (스케줄 시간 100종)', make_values(rows, 100)),
+        ('모두 다름', make_values(rows, rows)),
+    )
+
+    for name, values in scenarios:
+        parse_api_datetime.cache_clear()
+        legacy = measure(legacy_parse_datetime, values)
+        fast = measure(parse_api_datetime, values)
+        parse_api_datetime.cache_clear()
+        generic = measure(parse_datetime, values)
+        print(
+            f"{name}: strptime={legacy:.3f}s "
+            f"parse_api_datetime={fast:.3f}s ({legacy / fast:.1f}x) "
+            f"parse_datetime={generic:.3f}s ({legacy / generic:.1f}x)"
+        )
+
+
+def main() -> None:
+    """벤치마크 진입점"""
+    parser = argparse.ArgumentParser(description='날짜/시간 파싱 벤치마크')
+    parser.add_argument('--rows', type=int, default=200_000, help='문자열 수')
+    args = parser.parse_args()
+
+    run(args.rows)
+
+
+if __name__ == '__main__':
+    main()
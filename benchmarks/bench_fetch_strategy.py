@@ -0,0 +1,123 @@
+"""작업 조회 전략 벤치마크
+
+레벨별 3회 요청(per_level)과 1회 요청 후 분할(single) 전략의 API 조회 시간을
+비교합니다. 실제 디렉터 대신 요청당 고정 오버헤드와 행당 전송 비용을 흉내내는
+가짜 클라이언트를 사용하며, 작업 데이터는 tests/fixtures/api_response_jobs.json
+스키마를 복제하여 생성합니다.
+
+사용 예시:
+    python -m benchmarks.bench_fetch_strategy --jobs 3000 --overhead 0.2
+"""
+
+import argparse
+import copy
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from src.services.backup import BackupService, FETCH_STRATEGIES
+
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / 'tests' / 'fixtures' / 'api_response_jobs.json'
+)
+
+
+def load_fixture_jobs(count: int) -> List[Dict]:
+    """픽스처 스키마를 복제하여 작업 데이터 생성
+
+    Args:
+        count: 생성할 작업 수
+
+    Returns:
+        API 응답 형식의 작업 딕셔너리 리스트
+    """
+    templates = json.loads(FIXTURE_PATH.read_text(encoding='utf-8'))
+    levels = ('F', 'I', 'I', 'I', 'D')
+
+    jobs = []
+    for i in range(count):
+        job = copy.deepcopy(templates[i % len(templates)])
+        job['jobid'] = i + 1
+        job['type'] = 'B'
+        job['level'] = levels[i % len(levels)]
+        jobs.append(job)
+    return jobs
+
+
+class LatencyClient:
+    """요청 오버헤드를 흉내내는 BaculaClient 대역
+
+    Attributes:
+        jobs: 전체 작업 데이터
+        overhead: 요청당 고정 지연 (초)
+        per_row: 행당 전송 지연 (초)
+        requests: 수행된 요청 수
+    """
+
+    def __init__(self, jobs: List[Dict], overhead: float, per_row: float):
+        self.jobs = jobs
+        self.overhead = overhead
+        self.per_row = per_row
+        self.requests = 0
+
+    def get_jobs(self, start_time=None, end_time=None, level=None, type=None):
+        self.requests += 1
+        rows = [job for job in self.jobs if level is None or job['level'] == level]
+        time.sleep(self.overhead + self.per_row * len(rows))
+        return rows
+
+
+def run(jobs_count: int, overhead: float, per_row: float, repeat: int) -> None:
+    """전략별 조회 시간 측정 및 출력
+
+    Args:
+        jobs_count: 작업 수
+        overhead: 요청당 고정 지연 (초)
+        per_row: 행당 전송 지연 (초)
+        repeat: 반복 횟수 (최솟값 사용)
+    """
+    jobs = load_fixture_jobs(jobs_count)
+    now = datetime.now()
+    results = {}
+
+    for strategy in FETCH_STRATEGIES:
+        best = float('inf')
+        for _ in range(repeat):
+            client = LatencyClient(jobs, overhead, per_row)
+            service = BackupService(client, fetch_strategy=strategy)
+            started = time.perf_counter()
+            fetched = service._fetch_jobs_by_level(now, now)
+            best = min(best, time.perf_counter() - started)
+        results[strategy] = best
+        print(
+            f"{strategy:<10} requests={client.requests} "
+            f"rows={len(fetched)} time={best:.3f}s"
+        )
+
+    baseline = results['per_level']
+    print(f"single / per_level = {results['single'] / baseline:.2f}")
+
+
+def main() -> None:
+    """벤치마크 진입점"""
+    parser = argparse.ArgumentParser(description='작업 조회 전략 벤치마크')
+    parser.add_argument('--jobs', type=int, default=3000, help='작업 수')
+    parser.add_argument(
+        '--overhead', type=float, default=0.2, help='요청당 고정 지연 (초)'
+    )
+    parser.add_argument(
+        '--per-row', type=float, default=0.0, help='행당 전송 지연 (초)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    run(args.jobs, args.overhead, args.per_row, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""CLI 임포트 시간 측정
+
+새 프로세스에서 `python -X importtime` 으로 대상 모듈을 임포트하고, 모듈별
+누적 임포트 시간과 가장 오래 걸린 모듈을 출력합니다. tests/test_import_time.py
+가 같은 측정 함수로 시작 시간 예산을 검사합니다.
+
+사용 예시:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --module src.commands.report --top 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 짧은 CLI 실행(--help, 메일 없는 리포트)에서 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = (
+    'requests', 'urllib3', 'jinja2', 'premailer', 'lxml', 'cssutils',
+    'sqlite3', 'smtplib', 'dotenv',
+)
+
+
+def measure_import_time(module: str) -> Dict[str, int]:
+    """새 프로세스에서 모듈을 임포트하고 모듈별 누적 임포트 시간 반환
+
+    Args:
+        module: 임포트할 모듈 이름 (예: src.cli)
+
+    Returns:
+        {모듈 이름: 누적 임포트 시간(마이크로초)}
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True
+    )
+
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # 형식: "import time: <self us> | <cumulative us> | <들여쓰기된 모듈 이름>"
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = (part.strip() for part in line.split('|'))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def median_import_time(module: str, runs: int) -> Tuple[float, Dict[str, int]]:
+    """여러 번 측정한 누적 임포트 시간 중앙값 (밀리초)과 마지막 측정 결과"""
+    samples: List[float] = []
+    timings: Dict[str, int] = {}
+    for _ in range(runs):
+        timings = measure_import_time(module)
+        samples.append(timings.get(module, 0) / 1000)
+    return statistics.median(samples), timings
+
+
+def main() -> None:
+    """벤치마크 진입점"""
+    parser = argparse.ArgumentParser(description='CLI 임포트 시간 측정')
+    parser.add_argument('--module', default='src.cli', help='측정할 모듈 (기본값: src.cli)')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 모듈 수')
+    args = parser.parse_args()
+
+    total_ms, timings = median_import_time(args.module, args.runs)
+    print(f"{args.module} 임포트 시간 (중앙값, {args.runs}회): {total_ms:.1f}ms")
+
+    loaded = [name for name in HEAVY_MODULES if name in timings]
+    print(f"로드된 무거운 의존성: {', '.join(loaded) if loaded else '없음'}")
+
+    print(f"누적 시간 상위 {args.top}개 모듈:")
+    ranked = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative_us in ranked[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""리포트 템플릿 시작 비용 벤치마크
+
+새 프로세스에서 report_template.html을 처음 로드하는 데 걸리는 시간을
+캐시 없음 / 디스크 바이트코드 캐시 / 사전 컴파일 모듈 세 가지 경우로 측정하고,
+한 프로세스 안에서 ReportGenerator를 반복 생성할 때 매번 새 Environment를
+만드는 기존 방식과 공유 환경을 비교합니다.
+
+사용 예시:
+    python -m benchmarks.bench_report_startup --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+from src.report.environment import clear_environments, compile_templates, get_environment
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TEMPLATE_DIR = PROJECT_ROOT / 'templates'
+TEMPLATE_NAME = 'report_template.html'
+
+# 자식 프로세스에서 jinja2 임포트 이후 템플릿 로드 시간만 측정
+CHILD_SCRIPT = '''
+import sys, time
+from pathlib import Path
+import jinja2
+from src.report.environment import get_environment
+cache_dir = sys.argv[2] or None
+module_dir = sys.argv[3] or None
+started = time.perf_counter()
+get_environment(Path(sys.argv[1]), cache_dir, module_dir).get_template({name!r})
+print(time.perf_counter() - started)
+'''.format(name=TEMPLATE_NAME)
+
+
+def cold_load(cache_dir: str = '', module_dir: str = '') -> float:
+    """새 프로세스에서 템플릿을 처음 로드하는 시간 (초)"""
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, str(TEMPLATE_DIR), cache_dir, module_dir],
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return float(output.strip())
+
+
+def median_cold_load(runs: int, cache_dir: str = '', module_dir: str = '') -> float:
+    return statistics.median(cold_load(cache_dir, module_dir) for _ in range(runs))
+
+
+def warm_loop(iterations: int, shared: bool) -> float:
+    """한 프로세스에서 환경 생성 + 템플릿 로드를 반복한 시간 (초)"""
+    clear_environments()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if shared:
+            env = get_environment(TEMPLATE_DIR)
+        else:
+            env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), autoescape=True)
+        env.get_template(TEMPLATE_NAME)
+    return time.perf_counter() - started
+
+
+def run(runs: int, iterations: int) -> None:
+    """시나리오별 시작 비용 측정 및 출력
+
+    Args:
+        runs: 콜드 스타트 측정 반복 횟수 (중앙값 사용)
+        iterations: 프로세스 내 반복 생성 횟수
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = str(Path(tmp) / 'bytecode')
+        module_dir = str(Path(tmp) / 'compiled')
+
+        no_cache = median_cold_load(runs)
+        cold_load(cache_dir=cache_dir)  # 캐시 채우기
+        bytecode = median_cold_load(runs, cache_dir=cache_dir)
+        compile_templates(TEMPLATE_DIR, Path(module_dir))
+        compiled = median_cold_load(runs, module_dir=module_dir)
+
+    print(f"콜드 스타트 (중앙값, {runs}회)")
+    print(f"  캐시 없음:        {no_cache * 1000:.1f}ms")
+    print(f"  바이트코드 캐시:  {bytecode * 1000:.1f}ms ({no_cache / bytecode:.1f}x)")
+    print(f"  사전 컴파일 모듈: {compiled * 1000:.1f}ms ({no_cache / compiled:.1f}x)")
+
+    fresh = warm_loop(iterations, shared=False)
+    shared = warm_loop(iterations, shared=True)
+    print(f"프로세스 내 반복 생성 ({iterations}회)")
+    print(f"  매번 새 Environment: {fresh:.3f}s")
+    print(f"  공유 Environment:    {shared:.3f}s ({fresh / shared:.0f}x)")
+
+
+def main() -> None:
+    """벤치마크 진입점"""
+    parser = argparse.ArgumentParser(description='리포트 템플릿 시작 비용 벤치마크')
+    parser.add_argument('--runs', type=int, default=5, help='콜드 스타트 측정 횟수')
+    parser.add_argument('--iterations', type=int, default=50, help='프로세스 내 반복 횟수')
+    args = parser.parse_args()
+
+    run(args.runs, args.iterations)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""리포트 통계 집계 벤치마크
+
+기존 다중 순회 방식(목록 필터링 + sum 반복)과 JobAggregate 단일 패스 집계의
+ReportStats 생성 시간을 합성 작업 10k/100k/1M건에서 비교합니다.
+
+사용 예시:
+    python -m benchmarks.bench_report_stats
+    python -m benchmarks.bench_report_stats --sizes 10000 100000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from functools import reduce
+from typing import Callable, List
+
+from src.models.backup_job import BackupJob
+from src.models.job_aggregate import JobAggregate
+from src.models.report_stats import ReportStats
+
+
+START = datetime(2025, 10, 10, 22, 0, 0)
+END = datetime(2025, 10, 11, 9, 0, 0)
+
+
+def make_jobs(count: int, seed: int = 0) -> List[BackupJob]:
+    """합성 BackupJob 생성
+
+    Args:
+        count: 작업 수
+        seed: 난수 시드
+
+    Returns:
+        BackupJob 리스트
+    """
+    rng = random.Random(seed)
+    statuses = 'T' * 85 + 'f' * 5 + 'E' * 3 + 'A' * 4 + 'R' * 3
+    levels = 'F' * 10 + 'I' * 80 + 'D' * 10
+    jobs = []
+    for i in range(count):
+        started = START + timedelta(seconds=rng.randrange(36000))
+        status = rng.choice(statuses)
+        jobs.append(BackupJob(
+            job_id=i + 1,
+            job_name=f'job-{i % 1000}',
+            client_name=f'client-{i % 500}',
+            status=status,
+            level=rng.choice(levels),
+            job_type='B',
+            start_time=started,
+            end_time=None if status == 'R' else started + timedelta(minutes=5),
+            backup_bytes=rng.randrange(1 << 30),
+            job_files=rng.randrange(10000),
+            job_errors=0,
+        ))
+    return jobs
+
+
+def legacy_from_jobs(jobs: List[BackupJob]) -> dict:
+    """기존 다중 순회 방식의 통계 계산 (비교 기준)"""
+    active_jobs = [job for job in jobs if not job.is_canceled]
+    stats = {
+        'clients': len(set(job.client_name for job in active_jobs)),
+        'success': sum(1 for job in active_jobs if job.is_success),
+        'failed': sum(1 for job in active_jobs if job.is_failed),
+        'canceled': sum(1 for job in jobs if job.is_canceled),
+        'running': sum(1 for job in active_jobs if job.is_running),
+        'bytes': sum(job.backup_bytes for job in active_jobs),
+        'files': sum(job.job_files for job in active_jobs),
+    }
+    for level in ('F', 'I', 'D'):
+        level_jobs = [job for job in active_jobs if job.level == level]
+        stats[level] = (
+            len(level_jobs),
+            sum(1 for job in level_jobs if job.is_success),
+            sum(1 for job in level_jobs if job.is_failed),
+        )
+    running_jobs = [job for job in active_jobs if job.is_running]
+    for level in ('F', 'I', 'D'):
+        stats[f'running_{level}'] = sum(1 for job in running_jobs if job.level == level)
+    return stats
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """최소 실행 시간 측정 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    """크기별 집계 시간 측정 및 출력
+
+    Args:
+        sizes: 작업 수 목록
+        repeat: 반복 횟수 (최솟값 사용)
+    """
+    print(f"{'jobs':>10} {'legacy':>10} {'single':>10} {'speedup':>8} {'merge(10)':>10}")
+    for size in sizes:
+        jobs = make_jobs(size)
+        legacy = measure(lambda: legacy_from_jobs(jobs), repeat)
+        single = measure(lambda: ReportStats.from_jobs(jobs, START, END), repeat)
+
+        # 10개 샤드의 부분 집계 병합 비용
+        shard = max(1, size // 10)
+        partials = [
+            JobAggregate.from_jobs(jobs[i:i + shard]) for i in range(0, size, shard)
+        ]
+        merge = measure(
+            lambda: ReportStats.from_aggregate(
+                reduce(JobAggregate.merge, partials, JobAggregate()), START, END
+            ),
+            repeat
+        )
+
+        print(
+            f"{size:>10} {legacy:>9.3f}s {single:>9.3f}s "
+            f"{legacy / single:>7.1f}x {merge * 1000:>8.2f}ms"
+        )
+
+
+def main() -> None:
+    """벤치마크 진입점"""
+    parser = argparse.ArgumentParser(description='리포트 통계 집계 벤치마크')
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+        help='작업 수 목록'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,9 @@
 """API client module"""
 
 from .client import BaculaClient, BaculaAPIError
+from .cassette import Cassette, CassetteError
+from .response_cache import CacheStats, ResponseCache
 
-__all__ = ['BaculaClient', 'BaculaAPIError']
+__all__ = [
+    'BaculaClient', 'BaculaAPIError', 'Cassette', 'CassetteError', 'CacheStats', 'ResponseCache'
+]
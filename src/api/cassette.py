@@ -0,0 +1,274 @@
+"""API 응답 녹화/재생(cassette) 모듈
+
+BaculaClient._request 의 응답을 엔드포인트와 파라미터별로 gzip 압축 JSON
+파일에 저장(record)하고, 네트워크 없이 그대로 돌려줍니다(replay). 느렸던
+프로덕션 실행을 오프라인에서 재현하고 프로파일링하거나, 디렉터에 다시 요청하지
+않고 리포트 변경을 반복 확인할 때 사용합니다.
+
+디렉토리 구조::
+
+    <cassette>/
+        cassette.json                   # 녹화 정보 (모드, 조회 기간, 녹화 시간)
+        jobs-<key>.json.gz              # 요청 하나의 응답
+        jobs_123_log-<key>.json.gz
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.api.client import BaculaAPIError
+
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODE_RECORD = 'record'
+CASSETTE_MODE_REPLAY = 'replay'
+CASSETTE_MODES = (CASSETTE_MODE_RECORD, CASSETTE_MODE_REPLAY)
+
+CASSETTE_VERSION = 1
+
+# 녹화 정보 파일 이름
+METADATA_FILE = 'cassette.json'
+
+# 응답 압축 수준 (녹화 중 요청 지연을 늘리지 않도록 중간값 사용)
+COMPRESS_LEVEL = 6
+
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9]+')
+
+
+def normalize_request(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    json_data: Optional[Dict[str, Any]] = None
+) -> str:
+    """요청을 비교 가능한 JSON 문자열로 정규화
+
+    파라미터 순서와 값의 타입(int/str)에 관계없이 같은 요청은 같은 문자열이
+    되며, 값이 None인 파라미터는 제외합니다.
+
+    Args:
+        method: HTTP 메서드
+        endpoint: API 엔드포인트
+        params: URL 쿼리 파라미터
+        json_data: JSON 요청 본문
+
+    Returns:
+        정규화된 요청 JSON 문자열
+    """
+    return json.dumps({
+        'method': method.upper(),
+        'endpoint': endpoint.strip('/'),
+        'params': {
+            str(key): str(value)
+            for key, value in (params or {}).items() if value is not None
+        },
+        'json': json_data,
+    }, sort_keys=True, ensure_ascii=False)
+
+
+class CassetteError(BaculaAPIError):
+    """녹화 파일이 없거나 읽을 수 없는 경우(재생 모드), 쓸 수 없는 경우(녹화 모드)의 예외"""
+    pass
+
+
+class Cassette:
+    """API 응답 녹화/재생 저장소 (스레드 안전)
+
+    Attributes:
+        path: 녹화 디렉토리
+        mode: 'record' 또는 'replay'
+        recorded: 이번 실행에서 녹화한 응답 수
+        replayed: 이번 실행에서 재생한 응답 수
+    """
+
+    def __init__(self, path: Path, mode: str):
+        """Cassette 초기화
+
+        Args:
+            path: 녹화 디렉토리 (녹화 모드에서는 없으면 생성)
+            mode: 'record' 또는 'replay'
+
+        Raises:
+            ValueError: mode가 잘못된 경우
+            CassetteError: 재생 모드에서 디렉토리가 없는 경우
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(
+                f"잘못된 cassette 모드: {mode}. {' 또는 '.join(CASSETTE_MODES)}을 사용하세요."
+            )
+
+        self.path = Path(path)
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+
+        if mode == CASSETTE_MODE_RECORD:
+            self.path.mkdir(parents=True, exist_ok=True)
+        elif not self.path.is_dir():
+            raise CassetteError(f"녹화 디렉토리가 없습니다: {self.path}")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == CASSETTE_MODE_REPLAY
+
+    @staticmethod
+    def request_key(
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """요청 식별 키
+
+        Args:
+            method: HTTP 메서드
+            endpoint: API 엔드포인트
+            params: URL 쿼리 파라미터
+            json_data: JSON 요청 본문
+
+        Returns:
+            (정규화된 요청 JSON 문자열, 파일 이름)
+        """
+        normalized = normalize_request(method, endpoint, params, json_data)
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:24]
+        slug = _UNSAFE_CHARS.sub('_', endpoint.strip('/')) or 'root'
+        return normalized, f'{slug}-{digest}.json.gz'
+
+    def load(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """녹화된 응답 조회
+
+        Args:
+            method: HTTP 메서드
+            endpoint: API 엔드포인트
+            params: URL 쿼리 파라미터
+            json_data: JSON 요청 본문
+
+        Returns:
+            녹화된 API 응답 딕셔너리
+
+        Raises:
+            CassetteError: 녹화된 응답이 없거나 파일이 손상된 경우
+        """
+        normalized, filename = self.request_key(method, endpoint, params, json_data)
+        file_path = self.path / filename
+        try:
+            with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            raise CassetteError(f"녹화된 응답이 없습니다: {method} {endpoint} {params or {}}")
+        except (OSError, ValueError) as e:
+            raise CassetteError(f"녹화 파일을 읽을 수 없습니다: {file_path} ({e})")
+
+        with self._lock:
+            self.replayed += 1
+        logger.debug(f"녹화 응답 재생: {method} {endpoint} ({filename})")
+        return entry['response']
+
+    def save(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        response: Dict[str, Any]
+    ) -> None:
+        """응답 녹화 (같은 요청은 마지막 응답으로 덮어씀)
+
+        동시 조회 스레드가 같은 디렉토리에 기록하므로 임시 파일에 쓴 뒤
+        원자적으로 교체합니다.
+
+        Args:
+            method: HTTP 메서드
+            endpoint: API 엔드포인트
+            params: URL 쿼리 파라미터
+            json_data: JSON 요청 본문
+            response: API 응답 딕셔너리
+
+        Raises:
+            OSError: 파일 쓰기 실패 시
+        """
+        normalized, filename = self.request_key(method, endpoint, params, json_data)
+        entry = {
+            'request': json.loads(normalized),
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'response': response,
+        }
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.path, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=COMPRESS_LEVEL) as f:
+                    f.write(json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_name, self.path / filename)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            self.recorded += 1
+        logger.debug(f"응답 녹화: {method} {endpoint} ({filename})")
+
+    def save_metadata(self, mode: str, start_period: datetime, end_period: datetime) -> None:
+        """녹화 정보 저장 (재생 시 같은 조회 기간을 사용하기 위함)
+
+        Args:
+            mode: 리포트 실행 모드
+            start_period: 조회 시작 시간
+            end_period: 조회 종료 시간
+
+        Raises:
+            OSError: 파일 쓰기 실패 시
+        """
+        data = {
+            'version': CASSETTE_VERSION,
+            'mode': mode,
+            'start_period': start_period.isoformat(),
+            'end_period': end_period.isoformat(),
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        tmp_path = self.path / (METADATA_FILE + '.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.path / METADATA_FILE)
+
+    def load_period(self) -> Optional[Tuple[datetime, datetime]]:
+        """녹화 당시의 조회 기간
+
+        Returns:
+            (시작 시간, 종료 시간) 튜플, 녹화 정보가 없으면 None
+
+        Raises:
+            CassetteError: 녹화 정보 파일이 손상되었거나 버전이 다른 경우
+        """
+        file_path = self.path / METADATA_FILE
+        if not file_path.exists():
+            return None
+        try:
+            data = json.loads(file_path.read_text(encoding='utf-8'))
+            if data.get('version') != CASSETTE_VERSION:
+                raise ValueError(f"지원하지 않는 버전: {data.get('version')}")
+            return (
+                datetime.fromisoformat(data['start_period']),
+                datetime.fromisoformat(data['end_period']),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise CassetteError(f"녹화 정보를 읽을 수 없습니다: {file_path} ({e})")
@@ -3,13 +3,20 @@
 Bacula REST API와 통신하여 백업 작업 정보를 조회하는 클라이언트 클래스를 제공합니다.
 """
 
+import base64
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
+from src.models.backup_job import BackupJob
+
+if TYPE_CHECKING:
+    from src.api.cassette import Cassette
+    from src.api.response_cache import ResponseCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +41,8 @@ class BaculaClient:
 
     Bacula REST API와 통신하여 백업 작업 정보를 조회합니다.
     재시도 로직과 타임아웃 처리를 포함합니다.
+    keep-alive 세션과 커넥션 풀을 재사용하므로 컨텍스트 매니저로 사용하거나
+    사용 후 close()를 호출해야 합니다.
 
     Attributes:
         api_host: API 서버 호스트 주소
@@ -43,6 +52,10 @@ class BaculaClient:
         base_url: API 베이스 URL
         timeout: 요청 타임아웃 (초)
         max_retries: 최대 재시도 횟수
+        pool_size: 커넥션 풀 크기
+        session: keep-alive HTTP 세션
+        cassette: 응답 녹화/재생 저장소 (None이면 사용 안 함)
+        response_cache: TTL 응답 캐시 (None이면 사용 안 함)
     """
 
     def __init__(
@@ -52,7 +65,10 @@ class BaculaClient:
         username: str,
         password: str,
         timeout: int = 10,
-        max_retries: int = 3
+        max_retries: int = 3,
+        pool_size: int = 4,
+        cassette: Optional['Cassette'] = None,
+        response_cache: Optional['ResponseCache'] = None
     ):
         """BaculaClient 초기화
 
@@ -63,6 +79,9 @@ class BaculaClient:
             password: API 인증 비밀번호
             timeout: 요청 타임아웃 (초), 기본값 10
             max_retries: 최대 재시도 횟수, 기본값 3
+            pool_size: 커넥션 풀 크기, 기본값 4
+            cassette: 응답 녹화/재생 저장소. 재생 모드이면 네트워크 요청 없음
+            response_cache: TTL 응답 캐시. 클라이언트를 닫을 때 함께 닫힘
         """
         self.api_host = api_host
         self.api_port = api_port
@@ -71,12 +90,66 @@ class BaculaClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.base_url = f'http://{api_host}:{api_port}/api/v1'
-        self.auth = HTTPBasicAuth(username, password)
+        self.pool_size = pool_size
+        self.cassette = cassette
+        self.response_cache = response_cache
+        self.session = self._create_session()
 
         logger.info(
             f"BaculaClient 초기화: {api_host}:{api_port}, "
-            f"timeout={timeout}s, max_retries={max_retries}"
+            f"timeout={timeout}s, max_retries={max_retries}, "
+            f"pool_size={pool_size}"
+        )
+
+    def __enter__(self) -> 'BaculaClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """keep-alive HTTP 세션 생성
+
+        커넥션 풀을 가진 어댑터를 마운트하고, Basic 인증 헤더를 미리 만들어
+        요청마다 인증 객체를 다시 처리하지 않도록 합니다.
+
+        Returns:
+            설정된 requests.Session 객체
+        """
+        session = requests.Session()
+
+        # 재시도는 _send_request에서 처리하므로 어댑터 자체 재시도는 비활성화
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=0
         )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        credentials = f"{self.username}:{self.password}".encode('utf-8')
+        session.headers.update({
+            'Authorization': (
+                f"Basic {base64.b64encode(credentials).decode('ascii')}"
+            ),
+            'Connection': 'keep-alive',
+            'Accept': 'application/json',
+        })
+
+        return session
+
+    def close(self) -> None:
+        """HTTP 세션 종료
+
+        응답 캐시의 백그라운드 갱신을 마치고 저장한 뒤 커넥션 풀의 모든 연결을
+        닫습니다. 여러 번 호출해도 안전합니다.
+        """
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            logger.debug("BaculaClient 세션 종료")
 
     def connect(self) -> bool:
         """API 연결 테스트
@@ -127,15 +200,7 @@ class BaculaClient:
             f"start={start_time}, end={end_time}, level={level}, type={type}"
         )
 
-        params = {}
-        if start_time:
-            params['starttime'] = start_time.strftime('%Y-%m-%d %H:%M:%S')
-        if end_time:
-            params['endtime'] = end_time.strftime('%Y-%m-%d %H:%M:%S')
-        if level:
-            params['level'] = level
-        if type:
-            params['type'] = type
+        params = self._build_jobs_params(start_time, end_time, level, type)
 
         try:
             response = self._request('GET', 'jobs', params=params)
@@ -146,6 +211,117 @@ class BaculaClient:
             logger.error(f"백업 작업 조회 실패: {e}")
             raise BaculaAPIError(f"작업 목록 조회 실패: {e}")
 
+    def get_jobs_iter(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        type: Optional[str] = None,
+        page_size: int = 500
+    ) -> Iterator[BackupJob]:
+        """백업 작업 페이지 단위 조회 제너레이터
+
+        limit/offset으로 /jobs를 페이지 단위로 조회하여 파싱된 BackupJob을
+        하나씩 반환합니다. 한 번에 한 페이지의 원본 데이터만 메모리에 유지합니다.
+        파싱에 실패한 작업은 경고 로그를 남기고 건너뜁니다.
+
+        Args:
+            start_time: 조회 시작 시간 (선택)
+            end_time: 조회 종료 시간 (선택)
+            level: 백업 레벨 (F=Full, I=Incremental, D=Differential) (선택)
+            type: 작업 타입 (B=Backup, R=Restore, V=Verify) (선택)
+            page_size: 페이지당 작업 수, 기본값 500
+
+        Yields:
+            BackupJob 객체
+
+        Raises:
+            ValueError: page_size가 1 미만인 경우
+            BaculaAPIError: API 호출 실패 시
+        """
+        for page in self.iter_job_pages(start_time, end_time, level, type, page_size):
+            for job_data in page:
+                try:
+                    yield BackupJob.from_api_response(job_data)
+                except ValueError as e:
+                    logger.warning(f"작업 데이터 파싱 실패: {e}")
+
+    def iter_job_pages(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        type: Optional[str] = None,
+        page_size: int = 500
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """백업 작업 원본 데이터 페이지 제너레이터
+
+        limit/offset으로 /jobs를 조회하여 한 페이지씩 원본 응답 리스트를
+        반환합니다. 호출자가 순회를 멈추면 다음 페이지는 요청하지 않습니다.
+
+        Args:
+            start_time: 조회 시작 시간 (선택)
+            end_time: 조회 종료 시간 (선택)
+            level: 백업 레벨 (선택)
+            type: 작업 타입 (선택)
+            page_size: 페이지당 작업 수, 기본값 500
+
+        Yields:
+            작업 정보 딕셔너리 리스트 (API 응답 순서)
+
+        Raises:
+            ValueError: page_size가 1 미만인 경우
+            BaculaAPIError: API 호출 실패 시
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size는 1 이상이어야 합니다: {page_size}")
+
+        params = self._build_jobs_params(start_time, end_time, level, type)
+        params['limit'] = page_size
+        offset = 0
+        total = 0
+        # 서버가 요청한 limit만큼 돌려준 적이 있는지 (짧은 페이지를 마지막으로 판단)
+        limit_acknowledged = False
+        first_job_id = None
+
+        logger.info(
+            f"백업 작업 페이지 조회 시작: "
+            f"start={start_time}, end={end_time}, level={level}, type={type}, "
+            f"page_size={page_size}"
+        )
+
+        while True:
+            params['offset'] = offset
+            try:
+                response = self._request('GET', 'jobs', params=params)
+            except Exception as e:
+                logger.error(f"백업 작업 페이지 조회 실패: offset={offset}, {e}")
+                raise BaculaAPIError(f"작업 목록 조회 실패: {e}")
+
+            page = response.get('output', [])
+            logger.debug(f"페이지 조회: offset={offset}, {len(page)}건")
+            if not page:
+                break
+            # offset을 무시하는 서버는 같은 페이지를 다시 돌려주므로 중복 전에 종료
+            if offset and page[0].get('jobid') == first_job_id:
+                break
+            first_job_id = page[0].get('jobid')
+
+            total += len(page)
+            yield page
+
+            # 서버가 limit을 무시하고 전체를 반환한 경우 종료
+            if len(page) > page_size:
+                break
+            # 서버가 limit을 지키는 것이 확인된 경우에만 짧은 페이지를 마지막으로 판단
+            # (서버 최대 페이지 크기가 더 작으면 짧은 페이지가 이어질 수 있음)
+            limit_acknowledged = limit_acknowledged or len(page) == page_size
+            if limit_acknowledged and len(page) < page_size:
+                break
+            offset += len(page)
+
+        logger.info(f"백업 작업 {total}건 페이지 조회 완료")
+
     def get_job_details(self, job_id: int) -> Dict[str, Any]:
         """백업 작업 상세 정보 조회
 
@@ -171,6 +347,33 @@ class BaculaClient:
             logger.error(f"작업 상세 정보 조회 실패: job_id={job_id}, {e}")
             raise BaculaAPIError(f"작업 상세 정보 조회 실패: {e}")
 
+    def get_job_log(self, job_id: int) -> List[str]:
+        """작업 로그 조회
+
+        종료된 작업의 로그는 바뀌지 않으므로 응답 캐시 대상으로 적합합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            로그 줄 리스트 (여러 줄이 합쳐진 항목은 줄 단위로 분리)
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        logger.debug(f"작업 로그 조회 시작: job_id={job_id}")
+
+        try:
+            response = self._request('GET', f'jobs/{job_id}/log')
+        except Exception as e:
+            logger.error(f"작업 로그 조회 실패: job_id={job_id}, {e}")
+            raise BaculaAPIError(f"작업 로그 조회 실패: {e}")
+
+        output = response.get('output') or []
+        if isinstance(output, str):
+            output = [output]
+        return [line for chunk in output for line in str(chunk).splitlines()]
+
     def get_clients(self) -> List[Dict[str, Any]]:
         """클라이언트 목록 조회
 
@@ -193,6 +396,35 @@ class BaculaClient:
             logger.error(f"클라이언트 목록 조회 실패: {e}")
             raise BaculaAPIError(f"클라이언트 목록 조회 실패: {e}")
 
+    def _build_jobs_params(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        level: Optional[str],
+        type: Optional[str]
+    ) -> Dict[str, Any]:
+        """/jobs 조회 쿼리 파라미터 구성
+
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+            level: 백업 레벨
+            type: 작업 타입
+
+        Returns:
+            쿼리 파라미터 딕셔너리
+        """
+        params: Dict[str, Any] = {}
+        if start_time:
+            params['starttime'] = start_time.strftime('%Y-%m-%d %H:%M:%S')
+        if end_time:
+            params['endtime'] = end_time.strftime('%Y-%m-%d %H:%M:%S')
+        if level:
+            params['level'] = level
+        if type:
+            params['type'] = type
+        return params
+
     def _request(
         self,
         method: str,
@@ -202,7 +434,45 @@ class BaculaClient:
     ) -> Dict[str, Any]:
         """공통 HTTP 요청 처리
 
-        재시도 로직과 타임아웃 처리를 포함한 HTTP 요청을 수행합니다.
+        재생 모드이면 녹화된 응답을, 응답 캐시가 있으면 캐시된 응답을 돌려주고
+        그 외에는 재시도 로직과 타임아웃 처리를 포함한 HTTP 요청을 수행합니다.
+
+        Args:
+            method: HTTP 메서드 (GET, POST 등)
+            endpoint: API 엔드포인트
+            params: URL 쿼리 파라미터
+            json_data: JSON 요청 본문
+
+        Returns:
+            API 응답 딕셔너리
+
+        Raises:
+            ConnectionError: 연결 실패 시
+            TimeoutError: 타임아웃 발생 시
+            CassetteError: 재생 모드에서 녹화된 응답이 없는 경우
+            BaculaAPIError: 기타 API 오류 시
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            return self.cassette.load(method, endpoint, params, json_data)
+
+        if self.response_cache is not None:
+            # 백그라운드 갱신이 나중에 같은 파라미터로 요청하므로 호출한 쪽의 수정과 분리
+            params = dict(params) if params else params
+            return self.response_cache.get_or_fetch(
+                method, endpoint, params, json_data,
+                lambda: self._send_request(method, endpoint, params, json_data)
+            )
+
+        return self._send_request(method, endpoint, params, json_data)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """재시도 로직과 타임아웃 처리를 포함한 HTTP 요청 (캐시/재생 미적용)
 
         Args:
             method: HTTP 메서드 (GET, POST 등)
@@ -227,11 +497,13 @@ class BaculaClient:
                     f"{method} {url}"
                 )
 
+                if self.session is None:
+                    self.session = self._create_session()
+
                 start_time = time.time()
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
-                    auth=self.auth,
                     params=params,
                     json=json_data,
                     timeout=self.timeout
@@ -246,7 +518,8 @@ class BaculaClient:
                 # HTTP 오류 체크
                 response.raise_for_status()
 
-                return response.json()
+                data = response.json()
+                break
 
             except requests.exceptions.Timeout:
                 logger.warning(
@@ -288,6 +561,32 @@ class BaculaClient:
             except Exception as e:
                 logger.error(f"API 요청 중 예상치 못한 오류: {e}")
                 raise BaculaAPIError(f"API 요청 실패: {e}")
+        else:
+            # 모든 재시도 실패
+            raise BaculaAPIError("API 요청 실패: 최대 재시도 횟수 초과")
 
-        # 모든 재시도 실패
-        raise BaculaAPIError("API 요청 실패: 최대 재시도 횟수 초과")
+        # 녹화 실패는 요청 실패와 구분되도록 요청 처리 밖에서 기록
+        if self.cassette is not None:
+            self._record(method, endpoint, params, json_data, data)
+        return data
+
+    def _record(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict],
+        data: Dict[str, Any]
+    ) -> None:
+        """녹화 모드에서 응답 저장
+
+        Raises:
+            CassetteError: 녹화 파일 쓰기 실패 시
+        """
+        from src.api.cassette import CassetteError
+
+        try:
+            self.cassette.save(method, endpoint, params, json_data, data)
+        except OSError as e:
+            logger.error(f"✗ API 응답 녹화 실패: {endpoint}, {e}")
+            raise CassetteError(f"API 응답 녹화 실패: {self.cassette.path}: {e}")
@@ -0,0 +1,403 @@
+"""API 응답 캐시 모듈
+
+클라이언트 목록이나 종료된 작업의 상세 정보처럼 거의 바뀌지 않는 응답을
+엔드포인트별 TTL 동안 재사용하여 반복/중첩 조회 시 API 호출을 줄입니다.
+
+- 엔드포인트 패턴별 TTL: 숫자 경로는 ``{id}``로 묶음 (예: ``jobs/{id}``)
+- 항목 수 제한 LRU: 가장 오래 사용하지 않은 응답부터 제거
+- 디스크 보관 (선택): gzip JSON 파일로 저장하여 다음 실행에서 재사용
+- stale-while-revalidate (선택): TTL이 지난 응답을 유예 시간 동안 즉시 돌려주고
+  백그라운드 스레드에서 갱신 (serve 상주 실행용)
+
+GET 요청만 캐시하며, 실행 중인 작업의 상세 정보는 상태가 바뀌므로 캐시하지 않습니다.
+"""
+
+import copy
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from src.api.cassette import normalize_request
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_VERSION = 1
+
+# 기본 TTL (초): 클라이언트 목록 1시간, 종료된 작업 상세/실패 작업 로그 1일
+DEFAULT_TTL_SPEC = 'clients=3600,jobs/{id}=86400,jobs/{id}/log=86400'
+
+# 상태가 아직 바뀔 수 있는 작업 (실행 중, 생성됨, 대기 중)
+UNFINISHED_STATUSES = ('R', 'C', 'F')
+
+# 상세 응답에 작업 상태가 들어 있는 엔드포인트
+JOB_DETAIL_PATTERN = 'jobs/{id}'
+
+# 종료 시 백그라운드 갱신을 기다리는 최대 시간 (초)
+REVALIDATE_JOIN_TIMEOUT = 30.0
+
+
+def endpoint_pattern(endpoint: str) -> str:
+    """엔드포인트의 숫자 경로를 {id}로 바꾼 TTL 조회용 패턴
+
+    Args:
+        endpoint: API 엔드포인트 (예: 'jobs/123/log')
+
+    Returns:
+        엔드포인트 패턴 (예: 'jobs/{id}/log')
+    """
+    return '/'.join(
+        '{id}' if segment.isdigit() else segment
+        for segment in endpoint.strip('/').split('/')
+    )
+
+
+def parse_ttl_spec(text: str) -> Dict[str, float]:
+    """'clients=3600,jobs/{id}=86400' 형식의 TTL 설정 파싱
+
+    Args:
+        text: 쉼표로 구분한 '엔드포인트 패턴=초' 목록 (빈 문자열이면 캐시 미사용)
+
+    Returns:
+        엔드포인트 패턴별 TTL(초) 딕셔너리
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 TTL이 0 이하인 경우
+    """
+    ttls: Dict[str, float] = {}
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        pattern, sep, value = item.rpartition('=')
+        pattern = endpoint_pattern(pattern.strip()) if pattern.strip('/ ') else ''
+        try:
+            seconds = float(value)
+        except ValueError:
+            seconds = 0
+        if not sep or not pattern or seconds <= 0:
+            raise ValueError(f"잘못된 캐시 TTL 설정: '{item}' (예: clients=3600)")
+        ttls[pattern] = seconds
+    return ttls
+
+
+@dataclass
+class CacheStats:
+    """응답 캐시 사용 통계
+
+    Attributes:
+        hits: TTL 안의 응답을 돌려준 횟수
+        misses: API를 호출한 횟수 (캐시 대상 요청만)
+        stale_hits: TTL이 지난 응답을 유예 시간 안에 돌려준 횟수
+        revalidations: 백그라운드 갱신에 성공한 횟수
+        evictions: 항목 수 제한으로 제거한 응답 수
+        entries: 현재 보관 중인 응답 수
+    """
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """캐시 대상 요청 중 API를 호출하지 않은 비율"""
+        served = self.hits + self.stale_hits
+        total = served + self.misses
+        return served / total if total else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    pattern: str
+    stored_at: float
+    response: Dict[str, Any]
+
+
+class ResponseCache:
+    """TTL/LRU API 응답 캐시 (스레드 안전)
+
+    Attributes:
+        ttls: 엔드포인트 패턴별 TTL (초). 없는 패턴은 캐시하지 않음
+        max_entries: 최대 보관 응답 수
+        stale_seconds: TTL이 지난 뒤 이전 응답을 돌려주며 갱신하는 유예 시간 (0이면 사용 안 함)
+        path: 디스크 보관 파일 경로 (None이면 메모리에만 보관)
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        max_entries: int = 1024,
+        stale_seconds: float = 0.0,
+        path: Optional[Path] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """ResponseCache 초기화 (path가 있으면 저장된 응답을 불러옴)
+
+        Args:
+            ttls: 엔드포인트 패턴별 TTL (초)
+            max_entries: 최대 보관 응답 수, 기본값 1024
+            stale_seconds: stale-while-revalidate 유예 시간 (초), 기본값 0
+            path: 디스크 보관 파일 경로 (선택)
+            clock: 현재 시각 함수 (디스크 보관을 위해 epoch 초 사용)
+
+        Raises:
+            ValueError: max_entries가 1 미만이거나 stale_seconds가 음수인 경우
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+        if stale_seconds < 0:
+            raise ValueError(f"stale_seconds는 0 이상이어야 합니다: {stale_seconds}")
+
+        self.ttls = {endpoint_pattern(pattern): ttl for pattern, ttl in ttls.items()}
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self.path = Path(path) if path else None
+        self._clock = clock
+
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._revalidating: Set[str] = set()
+        self._threads: Set[threading.Thread] = set()
+        self._dirty = False
+
+        if self.path is not None:
+            self._load()
+
+    def get_or_fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        fetch: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """캐시된 응답 조회, 없거나 만료되었으면 fetch로 조회 후 보관
+
+        Args:
+            method: HTTP 메서드
+            endpoint: API 엔드포인트
+            params: URL 쿼리 파라미터 (백그라운드 갱신에서 다시 쓰므로 이후 수정 금지)
+            json_data: JSON 요청 본문
+            fetch: 실제 API 요청 함수
+
+        Returns:
+            API 응답 딕셔너리 (호출한 쪽에서 수정해도 캐시에 영향 없음)
+
+        Raises:
+            fetch가 발생시킨 예외 (캐시 미스 시)
+        """
+        pattern = endpoint_pattern(endpoint)
+        ttl = self.ttls.get(pattern)
+        if ttl is None or method.upper() != 'GET':
+            return fetch()
+
+        key = normalize_request(method, endpoint, params, json_data)
+        revalidate = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = self._clock() - entry.stored_at
+                if age < ttl:
+                    self._stats.hits += 1
+                elif age < ttl + self.stale_seconds:
+                    self._stats.stale_hits += 1
+                    revalidate = key not in self._revalidating
+                    if revalidate:
+                        self._revalidating.add(key)
+                else:
+                    entry = None
+            if entry is None:
+                self._stats.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                response = copy.deepcopy(entry.response)
+
+        if entry is not None:
+            if revalidate:
+                self._start_revalidation(key, pattern, endpoint, fetch)
+            return response
+
+        response = fetch()
+        self._store(key, pattern, response)
+        return response
+
+    def stats(self) -> CacheStats:
+        """현재 사용 통계 (스냅샷)"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                stale_hits=self._stats.stale_hits,
+                revalidations=self._stats.revalidations,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """보관 중인 응답 모두 삭제 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 대기
+
+        Args:
+            timeout: 스레드별 최대 대기 시간 (초, None이면 무제한)
+        """
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+
+    def save(self) -> None:
+        """보관 중인 응답을 디스크에 저장 (path가 없거나 바뀐 내용이 없으면 생략)
+
+        Raises:
+            OSError: 파일 쓰기 실패 시
+        """
+        if self.path is None:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = [
+                {
+                    'key': key,
+                    'pattern': entry.pattern,
+                    'stored_at': entry.stored_at,
+                    'response': entry.response,
+                }
+                for key, entry in self._entries.items()
+            ]
+            self._dirty = False
+
+        data = {'version': CACHE_FILE_VERSION, 'entries': entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                    f.write(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            with self._lock:
+                self._dirty = True
+            raise
+
+        logger.debug(f"응답 캐시 저장: {len(entries)}건, {self.path}")
+
+    def close(self) -> None:
+        """백그라운드 갱신 완료를 기다리고 디스크에 저장
+
+        저장 실패는 경고만 남깁니다 (다음 실행에서 다시 조회하면 되므로).
+        """
+        self.wait(REVALIDATE_JOIN_TIMEOUT)
+        try:
+            self.save()
+        except OSError as e:
+            logger.warning(f"⚠ 응답 캐시 저장 실패: {self.path}, {e}")
+
+    def _store(self, key: str, pattern: str, response: Dict[str, Any]) -> None:
+        """응답 보관 (캐시할 수 없는 응답은 무시)"""
+        if not self._is_cacheable(pattern, response):
+            return
+
+        entry = _CacheEntry(pattern, self._clock(), copy.deepcopy(response))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+            self._dirty = True
+
+    @staticmethod
+    def _is_cacheable(pattern: str, response: Any) -> bool:
+        """캐시 가능한 응답인지 확인 (상태가 바뀔 수 있는 작업 상세는 제외)"""
+        if not isinstance(response, dict):
+            return False
+        if pattern == JOB_DETAIL_PATTERN:
+            output = response.get('output')
+            return isinstance(output, dict) and output.get('jobstatus') not in UNFINISHED_STATUSES
+        return True
+
+    def _start_revalidation(
+        self,
+        key: str,
+        pattern: str,
+        endpoint: str,
+        fetch: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """백그라운드 스레드에서 만료된 응답 갱신 (같은 요청은 하나만 실행)"""
+        def revalidate() -> None:
+            try:
+                response = fetch()
+                self._store(key, pattern, response)
+                with self._lock:
+                    self._stats.revalidations += 1
+                logger.debug(f"응답 캐시 갱신: {endpoint}")
+            except Exception as e:
+                logger.warning(f"⚠ 응답 캐시 갱신 실패 (이전 응답 유지): {endpoint}, {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+                    self._threads.discard(threading.current_thread())
+
+        thread = threading.Thread(
+            target=revalidate, name=f'cache-revalidate-{pattern}', daemon=True
+        )
+        with self._lock:
+            self._threads.add(thread)
+        thread.start()
+
+    def _load(self) -> None:
+        """디스크에 저장된 응답 불러오기 (유예 시간까지 지난 응답은 제외)
+
+        파일이 손상되었으면 경고만 남기고 빈 캐시로 시작합니다.
+        """
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CACHE_FILE_VERSION:
+                raise ValueError(f"지원하지 않는 버전: {data.get('version')}")
+            raw_entries = data['entries']
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"⚠ 응답 캐시 파일을 읽을 수 없어 무시합니다: {self.path} ({e})")
+            return
+
+        now = self._clock()
+        loaded = 0
+        for item in raw_entries[-self.max_entries:]:
+            try:
+                ttl = self.ttls.get(item['pattern'])
+                if ttl is None or now - item['stored_at'] >= ttl + self.stale_seconds:
+                    continue
+                self._entries[item['key']] = _CacheEntry(
+                    item['pattern'], float(item['stored_at']), item['response']
+                )
+                loaded += 1
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        # 만료되어 제외한 항목이 있으면 다음 저장 시 파일에서도 정리
+        self._dirty = loaded != len(raw_entries)
+        logger.debug(f"응답 캐시 불러오기: {loaded}/{len(raw_entries)}건, {self.path}")
@@ -0,0 +1,28 @@
+"""리포트 파이프라인 벤치마크 모듈.
+
+합성 작업 데이터셋 생성과 오프라인 parse → stats → render → inline 측정,
+기준선 비교 기능을 제공합니다. 로컬 Baculum API 대역 서버는 http.server를
+사용하므로 src.bench.fake_server 에서 직접 임포트합니다.
+"""
+
+from .dataset import DatasetSpec, iter_job_payloads, make_job_payloads, parse_mix
+from .runner import (
+    BenchError,
+    BenchResult,
+    Comparison,
+    FetchOptions,
+    PipelineBenchmark,
+    StageResult,
+    compare_to_baseline,
+    load_baseline,
+    parse_size,
+    run_suite,
+    save_baseline,
+)
+
+__all__ = [
+    'DatasetSpec', 'iter_job_payloads', 'make_job_payloads', 'parse_mix',
+    'BenchError', 'BenchResult', 'Comparison', 'FetchOptions', 'PipelineBenchmark',
+    'StageResult',
+    'compare_to_baseline', 'load_baseline', 'parse_size', 'run_suite', 'save_baseline',
+]
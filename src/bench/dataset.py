@@ -0,0 +1,227 @@
+"""합성 Bacula 작업 데이터셋
+
+tests/fixtures/api_response_jobs.json 과 같은 필드 구성의 API 응답(작업 목록)을
+원하는 크기와 상태/레벨 비율로 생성합니다. 같은 시드는 항상 같은 데이터를
+만들므로 실행 간 벤치마크 결과를 비교할 수 있습니다.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+# 기본 상태 비율 (성공 위주, 실패/취소/실행 중 일부)
+DEFAULT_STATUS_MIX: Dict[str, int] = {'T': 85, 'f': 5, 'E': 3, 'A': 4, 'R': 3}
+
+# 기본 레벨 비율 (주 1회 Full, 나머지 Incremental 위주)
+DEFAULT_LEVEL_MIX: Dict[str, int] = {'F': 10, 'I': 80, 'D': 10}
+
+# 조회 기간 기본값 (프로덕션 모드와 같은 전일 22시 ~ 당일 9시)
+DEFAULT_START = datetime(2025, 10, 10, 22, 0, 0)
+DEFAULT_END = datetime(2025, 10, 11, 9, 0, 0)
+
+# 실패로 끝나는 상태 (joberrors > 0)
+_ERROR_STATUSES = frozenset('fEA')
+
+_API_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """비율 문자열 파싱
+
+    Args:
+        text: 'T=85,f=5,E=3' 형식의 문자열
+
+    Returns:
+        {값: 가중치} 딕셔너리
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 가중치 합이 0인 경우
+    """
+    mix: Dict[str, int] = {}
+    for part in text.split(','):
+        key, sep, weight = part.strip().partition('=')
+        if not sep or not key:
+            raise ValueError(f"비율 형식이 잘못되었습니다 (예: T=85,f=5): '{text}'")
+        mix[key] = int(weight)
+    if any(weight < 0 for weight in mix.values()) or sum(mix.values()) <= 0:
+        raise ValueError(f"비율 가중치는 0 이상이고 합이 0보다 커야 합니다: '{text}'")
+    return mix
+
+
+@dataclass
+class DatasetSpec:
+    """합성 데이터셋 명세
+
+    Attributes:
+        size: 작업 수
+        status_mix: 상태별 가중치
+        level_mix: 레벨별 가중치
+        seed: 난수 시드
+        start: 작업 시작 시간 범위의 시작
+        end: 작업 시작 시간 범위의 끝
+    """
+
+    size: int
+    status_mix: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_STATUS_MIX))
+    level_mix: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_LEVEL_MIX))
+    seed: int = 0
+    start: datetime = DEFAULT_START
+    end: datetime = DEFAULT_END
+
+    @property
+    def client_count(self) -> int:
+        """클라이언트 수 (클라이언트당 약 20개 작업, 최대 5000대)"""
+        return max(1, min(self.size // 20, 5000))
+
+    def describe(self) -> Dict[str, Any]:
+        """기준선 비교용 명세 딕셔너리"""
+        return {
+            'size': self.size,
+            'status_mix': self.status_mix,
+            'level_mix': self.level_mix,
+            'seed': self.seed,
+        }
+
+
+def _choices(rng: random.Random, mix: Dict[str, int], count: int) -> List[str]:
+    return rng.choices(list(mix), weights=list(mix.values()), k=count)
+
+
+def iter_job_payloads(spec: DatasetSpec, chunk_size: int = 10000) -> Iterator[List[Dict[str, Any]]]:
+    """합성 작업 응답을 청크 단위로 생성
+
+    1M건처럼 큰 데이터셋도 원본 응답 전체를 메모리에 두지 않도록 청크로 나눕니다.
+
+    Args:
+        spec: 데이터셋 명세
+        chunk_size: 청크당 작업 수
+
+    Yields:
+        API 응답 형식(작업 딕셔너리)의 리스트
+    """
+    rng = random.Random(spec.seed)
+    span_seconds = max(1, int((spec.end - spec.start).total_seconds()))
+    clients = [
+        f'10_{index // 65536 % 256}_{index // 256 % 256}_{index % 256}'
+        for index in range(spec.client_count)
+    ]
+
+    job_id = 0
+    while job_id < spec.size:
+        count = min(chunk_size, spec.size - job_id)
+        statuses = _choices(rng, spec.status_mix, count)
+        levels = _choices(rng, spec.level_mix, count)
+        chunk = []
+        for status, level in zip(statuses, levels):
+            job_id += 1
+            client_index = rng.randrange(len(clients))
+            chunk.append(_make_payload(
+                rng, job_id, clients[client_index], client_index + 1, status, level,
+                spec, span_seconds
+            ))
+        yield chunk
+
+
+def _make_payload(
+    rng: random.Random,
+    job_id: int,
+    host: str,
+    client_id: int,
+    status: str,
+    level: str,
+    spec: DatasetSpec,
+    span_seconds: int
+) -> Dict[str, Any]:
+    """작업 하나의 API 응답 딕셔너리 (픽스처와 같은 필드 구성)"""
+    # 시작 시간은 [start, end) 안에 두어 기간 조회(starttime 필터)에 모두 포함되도록 함
+    start_time = spec.start + timedelta(seconds=rng.randrange(span_seconds))
+    sched_time = start_time - timedelta(seconds=rng.randrange(1, 5))
+    suffix = level.lower()
+
+    if status == 'R':
+        end_time = None
+        job_files = job_bytes = 0
+    else:
+        duration = rng.randrange(1, 3600 if level == 'F' else 600)
+        end_time = start_time + timedelta(seconds=duration)
+        failed = status in _ERROR_STATUSES
+        job_files = 0 if failed else rng.randrange(0, 50000 if level == 'F' else 2000)
+        job_bytes = job_files * rng.randrange(512, 65536)
+
+    end_text = end_time.strftime(_API_FORMAT) if end_time else None
+    return {
+        'jobid': job_id,
+        'job': f"{host}_{suffix}.{start_time.strftime('%Y-%m-%d_%H.%M.%S')}_{job_id % 100:02d}",
+        'name': f'{host}_{suffix}',
+        'type': 'B',
+        'level': level,
+        'clientid': client_id,
+        'jobstatus': status,
+        'schedtime': sched_time.strftime(_API_FORMAT),
+        'starttime': start_time.strftime(_API_FORMAT),
+        'endtime': end_text,
+        'realendtime': end_text,
+        'jobtdate': int((end_time or start_time).timestamp()),
+        'volsessionid': job_id,
+        'volsessiontime': int(spec.start.timestamp()),
+        'jobfiles': job_files,
+        'jobbytes': job_bytes,
+        'readbytes': job_bytes * 3,
+        'joberrors': 1 if status in _ERROR_STATUSES else 0,
+        'jobmissingfiles': 0,
+        'poolid': 1,
+        'filesetid': 1,
+        'priorjobid': 0,
+        'purgedfiles': 0,
+        'hasbase': 0,
+        'hascache': 0,
+        'reviewed': 0,
+        'comment': '',
+        'filetable': 'File',
+        'client': f'{host}-client',
+        'pool': f'{host}-pool_{suffix}',
+        'fileset': f'{host}-file',
+    }
+
+
+def make_job_payloads(spec: DatasetSpec) -> List[Dict[str, Any]]:
+    """합성 작업 응답 전체를 리스트로 생성 (작은 데이터셋/테스트용)"""
+    return [payload for chunk in iter_job_payloads(spec) for payload in chunk]
+
+
+def make_client_payloads(job_payloads: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """작업 응답에 등장하는 클라이언트 목록 생성
+
+    tests/fixtures/api_response_clients.json 과 같은 필드 구성입니다.
+
+    Args:
+        job_payloads: 작업 응답 딕셔너리 이터러블
+
+    Returns:
+        clientid 순으로 정렬된 클라이언트 딕셔너리 리스트
+    """
+    clients: Dict[int, Dict[str, Any]] = {}
+    for payload in job_payloads:
+        if payload['clientid'] in clients:
+            continue
+        clients[payload['clientid']] = {
+            'clientid': payload['clientid'],
+            'name': payload['client'],
+            'uname': '9.4.4 (28May19) x86_64-pc-linux-gnu,redhat,(Core)',
+            'autoprune': 1,
+            'fileretention': 1209600,
+            'jobretention': 15552000,
+        }
+    return [clients[client_id] for client_id in sorted(clients)]
+
+
+def mix_summary(payloads: List[Dict[str, Any]]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """생성된 응답의 (상태별 건수, 레벨별 건수)"""
+    statuses: Dict[str, int] = {}
+    levels: Dict[str, int] = {}
+    for payload in payloads:
+        statuses[payload['jobstatus']] = statuses.get(payload['jobstatus'], 0) + 1
+        levels[payload['level']] = levels.get(payload['level'], 0) + 1
+    return statuses, levels
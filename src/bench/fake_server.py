@@ -0,0 +1,420 @@
+"""로컬 Baculum API 대역 서버
+
+실제 디렉터 없이 BaculaClient의 재시도/백오프와 동시 조회 동작을 측정할 수
+있도록 표준 라이브러리 HTTP 서버로 Baculum REST API 일부를 흉내냅니다.
+합성 데이터셋(src.bench.dataset)을 응답으로 사용하고, 지연/지터/무응답/5xx
+오류를 주입할 수 있습니다::
+
+    with FakeBaculumServer.from_spec(DatasetSpec(10000), FaultConfig(latency=0.05)) as server:
+        with BaculaClient(**server.client_config()) as client:
+            client.get_jobs(level='F')
+        print(server.stats())
+
+지원 엔드포인트 (모두 GET, 응답 형식 {"output": ..., "error": 0}):
+    /api/v1/jobs              (starttime, endtime, level, type, jobstatus, client,
+                               limit, offset 필터)
+    /api/v1/jobs/{id}
+    /api/v1/jobs/{id}/log
+    /api/v1/clients
+    /api/v1/clients/{id}
+"""
+
+import base64
+import json
+import logging
+import random
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.bench.dataset import DatasetSpec, make_client_payloads, make_job_payloads
+
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = '/api/v1/'
+
+# 실패로 끝난 작업 상태 (작업 로그에 오류 줄 포함)
+_ERROR_STATUSES = frozenset('fE')
+
+
+@dataclass
+class FaultConfig:
+    """응답 지연/오류 주입 설정
+
+    Attributes:
+        latency: 모든 응답의 기본 지연 (초)
+        jitter: 기본 지연에 더하는 0 ~ jitter초 무작위 지연
+        error_rate: error_status로 응답할 확률 (0 ~ 1)
+        error_status: 주입할 HTTP 오류 코드
+        timeout_rate: 응답하지 않고 stall_seconds 동안 대기한 뒤 연결을 끊을 확률
+        stall_seconds: 무응답 대기 시간 (초, 클라이언트 타임아웃보다 길게 설정)
+        fail_first: 처음 N개 요청은 항상 error_status로 응답 (결정적 재시도 테스트용)
+        seed: 지연/오류 난수 시드 (None이면 매번 다름)
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    timeout_rate: float = 0.0
+    stall_seconds: float = 30.0
+    fail_first: int = 0
+    seed: Optional[int] = None
+
+
+@dataclass
+class ServerStats:
+    """서버 요청 통계
+
+    Attributes:
+        requests: 받은 요청 수
+        endpoints: 엔드포인트 종류별 요청 수 (예: {'jobs': 3, 'jobs/{id}/log': 2})
+        injected_errors: 주입한 오류 응답 수
+        injected_timeouts: 주입한 무응답 수
+        max_in_flight: 동시에 처리 중이던 요청 수의 최대값
+    """
+
+    requests: int = 0
+    endpoints: Dict[str, int] = field(default_factory=dict)
+    injected_errors: int = 0
+    injected_timeouts: int = 0
+    max_in_flight: int = 0
+
+
+class FakeBaculumServer:
+    """로컬 Baculum API 대역 서버
+
+    요청마다 스레드를 사용하는 HTTP/1.1(keep-alive) 서버를 백그라운드 스레드에서
+    실행합니다. 포트를 0으로 지정하면 빈 포트를 자동으로 사용합니다.
+
+    Attributes:
+        jobs: 응답할 작업 딕셔너리 리스트 (jobid 순)
+        clients: 응답할 클라이언트 딕셔너리 리스트
+        faults: 지연/오류 주입 설정 (실행 중에 바꿔도 다음 요청부터 적용)
+        username: Basic 인증 사용자명
+        password: Basic 인증 비밀번호
+    """
+
+    def __init__(
+        self,
+        jobs: Optional[List[Dict[str, Any]]] = None,
+        clients: Optional[List[Dict[str, Any]]] = None,
+        faults: Optional[FaultConfig] = None,
+        username: str = 'admin',
+        password: str = 'admin',
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        """FakeBaculumServer 초기화
+
+        Args:
+            jobs: 작업 응답 목록. None이면 빈 목록
+            clients: 클라이언트 응답 목록. None이면 jobs에서 생성
+            faults: 지연/오류 주입 설정. None이면 주입 안 함
+            username: Basic 인증 사용자명
+            password: Basic 인증 비밀번호
+            host: 바인딩 주소
+            port: 바인딩 포트 (0이면 자동 선택)
+        """
+        self.jobs = list(jobs or [])
+        self.clients = clients if clients is not None else make_client_payloads(self.jobs)
+        self.faults = faults or FaultConfig()
+        self.username = username
+        self.password = password
+
+        self._jobs_by_id = {job['jobid']: job for job in self.jobs}
+        self._jobs_desc = sorted(self.jobs, key=lambda job: job['jobid'], reverse=True)
+        self._clients_by_id = {client['clientid']: client for client in self.clients}
+        self._authorization = 'Basic ' + base64.b64encode(
+            f'{username}:{password}'.encode('utf-8')
+        ).decode('ascii')
+        self._rng = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._stats = ServerStats()
+        self._in_flight = 0
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.block_on_close = False
+        self._httpd.app = self
+
+    @classmethod
+    def from_spec(
+        cls,
+        spec: DatasetSpec,
+        faults: Optional[FaultConfig] = None,
+        **kwargs: Any
+    ) -> 'FakeBaculumServer':
+        """합성 데이터셋으로 서버 생성
+
+        Args:
+            spec: 데이터셋 명세
+            faults: 지연/오류 주입 설정
+            **kwargs: FakeBaculumServer 생성자 인자
+
+        Returns:
+            시작 전의 FakeBaculumServer
+        """
+        return cls(jobs=make_job_payloads(spec), faults=faults, **kwargs)
+
+    @property
+    def host(self) -> str:
+        return self._httpd.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        """API 베이스 URL (BaculaClient.base_url과 같은 형식)"""
+        return f'http://{self.host}:{self.port}/api/v1'
+
+    def client_config(self, **overrides: Any) -> Dict[str, Any]:
+        """이 서버에 연결하는 BaculaClient 생성 인자
+
+        Args:
+            **overrides: 덮어쓸 인자 (예: timeout=1, max_retries=2)
+
+        Returns:
+            BaculaClient(**config) 에 넘길 딕셔너리
+        """
+        return {
+            'api_host': self.host,
+            'api_port': self.port,
+            'username': self.username,
+            'password': self.password,
+            **overrides,
+        }
+
+    def start(self) -> 'FakeBaculumServer':
+        """백그라운드 스레드에서 요청 처리 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={'poll_interval': 0.05},
+                name='fake-baculum-server',
+                daemon=True
+            )
+            self._thread.start()
+            logger.debug(f"Baculum API 대역 서버 시작: {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """서버 종료 (무응답 대기 중인 요청도 즉시 끊음)"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeBaculumServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def stats(self) -> ServerStats:
+        """현재까지의 요청 통계 (복사본)"""
+        with self._lock:
+            return ServerStats(
+                requests=self._stats.requests,
+                endpoints=dict(self._stats.endpoints),
+                injected_errors=self._stats.injected_errors,
+                injected_timeouts=self._stats.injected_timeouts,
+                max_in_flight=self._stats.max_in_flight,
+            )
+
+    def reset_stats(self) -> None:
+        """요청 통계 초기화"""
+        with self._lock:
+            self._stats = ServerStats()
+
+    def handle(self, path: str, query: str, authorization: Optional[str]) -> Tuple[str, Any]:
+        """요청 처리 (핸들러 스레드에서 호출)
+
+        Args:
+            path: 요청 경로
+            query: 쿼리 문자열
+            authorization: Authorization 헤더 값
+
+        Returns:
+            ('respond', (상태 코드, 응답 본문)) 또는 ('stall', 대기 시간)
+        """
+        endpoint, resolved = self._resolve(path)
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.endpoints[endpoint] = self._stats.endpoints.get(endpoint, 0) + 1
+            request_number = self._stats.requests
+            faults = self.faults
+            delay = faults.latency + (self._rng.uniform(0, faults.jitter) if faults.jitter else 0)
+            stall = self._rng.random() < faults.timeout_rate
+            error = request_number <= faults.fail_first or self._rng.random() < faults.error_rate
+            if stall:
+                self._stats.injected_timeouts += 1
+            elif error:
+                self._stats.injected_errors += 1
+
+        if stall:
+            return 'stall', faults.stall_seconds
+        if delay and self._stopping.wait(delay):
+            return 'stall', 0
+        if error:
+            return 'respond', (faults.error_status, {'output': 'Injected error', 'error': 1})
+        if authorization != self._authorization:
+            return 'respond', (401, {'output': 'Unauthorized', 'error': 6})
+        if resolved is None:
+            return 'respond', (404, {'output': f'Unknown endpoint: {path}', 'error': 1})
+        return 'respond', resolved(parse_qs(query))
+
+    def wait_stall(self, seconds: float) -> None:
+        """무응답 주입 대기 (서버 종료 시 즉시 반환)"""
+        self._stopping.wait(seconds)
+
+    def enter_request(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self._stats.max_in_flight = max(self._stats.max_in_flight, self._in_flight)
+
+    def exit_request(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _resolve(self, path: str) -> Tuple[str, Any]:
+        """경로를 (통계용 엔드포인트 이름, 처리 함수)로 변환 (없는 경로는 처리 함수 None)"""
+        if not path.startswith(API_PREFIX):
+            return path, None
+        parts = path[len(API_PREFIX):].strip('/').split('/')
+
+        if parts == ['jobs']:
+            return 'jobs', self._list_jobs
+        if parts == ['clients']:
+            return 'clients', lambda query: (200, {'output': self.clients, 'error': 0})
+        if len(parts) in (2, 3) and parts[0] in ('jobs', 'clients') and parts[1].isdigit():
+            object_id = int(parts[1])
+            if parts[0] == 'clients' and len(parts) == 2:
+                return 'clients/{id}', lambda query: self._detail(
+                    self._clients_by_id.get(object_id), 'Client'
+                )
+            if parts[0] == 'jobs' and len(parts) == 2:
+                return 'jobs/{id}', lambda query: self._detail(
+                    self._jobs_by_id.get(object_id), 'Job'
+                )
+            if parts[0] == 'jobs' and parts[2] == 'log':
+                return 'jobs/{id}/log', lambda query: self._job_log(object_id)
+        return '/'.join(parts), None
+
+    def _list_jobs(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        """작업 목록 (BaculaClient가 보내는 필터 적용)"""
+        def param(name: str) -> Optional[str]:
+            values = query.get(name)
+            return values[0] if values else None
+
+        start, end = param('starttime'), param('endtime')
+        filters = {
+            key: param(name) for key, name in (
+                ('level', 'level'), ('type', 'type'),
+                ('jobstatus', 'jobstatus'), ('client', 'client'),
+            ) if param(name)
+        }
+        try:
+            offset = int(param('offset') or 0)
+            limit = int(param('limit') or 0)
+        except ValueError:
+            return 400, {'output': 'Invalid limit/offset', 'error': 1}
+
+        # 날짜 문자열은 고정 형식이므로 문자열 비교로 범위 필터
+        # (실제 API와 같이 jobid 내림차순으로 반환)
+        matched = [
+            job for job in self._jobs_desc
+            if (start is None or job['starttime'] >= start)
+            and (end is None or job['starttime'] <= end)
+            and all(job.get(key) == value for key, value in filters.items())
+        ]
+        page = matched[offset:offset + limit] if limit else matched[offset:]
+        return 200, {'output': page, 'error': 0}
+
+    def _detail(self, item: Optional[Dict[str, Any]], kind: str) -> Tuple[int, Dict[str, Any]]:
+        if item is None:
+            return 404, {'output': f'{kind} does not exist.', 'error': 1}
+        return 200, {'output': item, 'error': 0}
+
+    def _job_log(self, job_id: int) -> Tuple[int, Dict[str, Any]]:
+        job = self._jobs_by_id.get(job_id)
+        if job is None:
+            return 404, {'output': 'Job does not exist.', 'error': 1}
+        return 200, {'output': make_job_log(job), 'error': 0}
+
+
+def make_job_log(job: Dict[str, Any]) -> List[str]:
+    """작업 로그 줄 생성 (실패 작업은 Bacula 형식의 오류 줄 포함)
+
+    Args:
+        job: 작업 응답 딕셔너리
+
+    Returns:
+        로그 줄 리스트
+    """
+    job_id = job['jobid']
+    started = job['starttime']
+    ended = job['endtime'] or started
+    client = job['client']
+    lines = [
+        f"{started} bacula-dir JobId {job_id}: Start Backup JobId {job_id}, Job={job['job']}",
+        f"{started} bacula-dir JobId {job_id}: Using Device \"FileStorage\" to write.",
+    ]
+    status = job['jobstatus']
+    if status in _ERROR_STATUSES:
+        lines.extend([
+            f"{ended} bacula-dir JobId {job_id}: Fatal error: bsock.c:112 Unable to connect to "
+            f"Client: {client} on {client.rsplit('-', 1)[0].replace('_', '.')}:9102. "
+            f"ERR=Connection refused",
+            f"{ended} {client} JobId {job_id}: Error: No Job status returned from FD.",
+            f"{ended} bacula-dir JobId {job_id}: Termination: *** Backup Error ***",
+        ])
+    elif status == 'A':
+        lines.append(f"{ended} bacula-dir JobId {job_id}: Termination: Backup Canceled")
+    elif status == 'T':
+        lines.append(f"{ended} bacula-dir JobId {job_id}: Termination: Backup OK")
+    return lines
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """FakeBaculumServer 요청 핸들러"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'FakeBaculum/1.0'
+
+    def do_GET(self) -> None:
+        app: FakeBaculumServer = self.server.app
+        app.enter_request()
+        try:
+            url = urlsplit(self.path)
+            action, value = app.handle(url.path, url.query, self.headers.get('Authorization'))
+            if action == 'stall':
+                app.wait_stall(value)
+                self.close_connection = True
+                return
+            self._send_json(*value)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 타임아웃으로 먼저 연결을 끊은 경우
+            self.close_connection = True
+        finally:
+            app.exit_request()
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"[fake-baculum] {self.address_string()} {format % args}")
@@ -0,0 +1,467 @@
+"""오프라인 리포트 파이프라인 벤치마크
+
+합성 작업 응답으로 parse → stats → render → inline 단계를 API/SMTP 없이
+실행하고, 단계별 처리량(작업/초)과 메모리를 측정합니다. 결과는 JSON 기준선
+파일로 저장하거나 저장된 기준선과 비교할 수 있습니다.
+"""
+
+import json
+import platform
+import tempfile
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+from src.bench.dataset import DatasetSpec, iter_job_payloads
+from src.utils.timing import StageTimer
+
+if TYPE_CHECKING:
+    from src.bench.fake_server import FakeBaculumServer, FaultConfig
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 기본 기준선 파일
+DEFAULT_BASELINE_FILE = PROJECT_ROOT / 'benchmarks' / 'pipeline_baseline.json'
+
+# 기준선 대비 허용 처리량 감소율 (0.25 = 25% 느려질 때까지 허용)
+DEFAULT_TOLERANCE = 0.25
+
+# fetch 단계에서 받은 응답을 파싱할 때의 청크 크기 (합성 데이터 청크와 동일)
+PARSE_CHUNK_SIZE = 10000
+
+# 템플릿 컴파일/CSS 시트 컴파일을 측정에서 제외하기 위한 예열 작업 수
+WARMUP_SIZE = 200
+
+BASELINE_VERSION = 1
+
+_SIZE_SUFFIXES = {'k': 1000, 'm': 1000000}
+
+
+class BenchError(Exception):
+    """벤치마크 실행/기준선 처리 에러"""
+    pass
+
+
+def parse_size(text: str) -> int:
+    """작업 수 파싱 ('1000', '10k', '1M' 형식)
+
+    Args:
+        text: 작업 수 문자열
+
+    Returns:
+        작업 수
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 1보다 작은 경우
+    """
+    value = text.strip().lower()
+    multiplier = _SIZE_SUFFIXES.get(value[-1:], 1)
+    if multiplier != 1:
+        value = value[:-1]
+    size = int(value) * multiplier
+    if size < 1:
+        raise ValueError(f"작업 수는 1 이상이어야 합니다: '{text}'")
+    return size
+
+
+class BenchConfig:
+    """벤치마크용 ReportGenerator 설정 (.env 없이 기본값 사용)
+
+    디스크 템플릿 캐시와 웹 링크를 사용하지 않고, 이메일용 템플릿 변형도
+    끄므로 inline 단계가 렌더링된 HTML 전체를 변환합니다.
+    """
+
+    template_cache_dir = None
+    template_module_dir = None
+    report_email_ready = False
+
+    def has_baculum_web_config(self) -> bool:
+        return False
+
+
+@dataclass
+class FetchOptions:
+    """fetch 단계 설정 (로컬 Baculum API 대역 서버 사용)
+
+    Attributes:
+        faults: 서버 지연/오류 주입 설정 (None이면 주입 안 함)
+        workers: 레벨별 동시 조회 스레드 수 (BackupService fetch_workers)
+        strategy: 작업 조회 전략 ('per_level' 또는 'single')
+        timeout: BaculaClient 요청 타임아웃 (초)
+    """
+
+    faults: Optional['FaultConfig'] = None
+    workers: int = 1
+    strategy: str = 'per_level'
+    timeout: float = 10
+
+
+@dataclass
+class StageResult:
+    """단계 하나의 측정 결과
+
+    Attributes:
+        stage: 단계 이름
+        jobs: 처리한 작업 수
+        wall_seconds: 벽시계 시간 (초)
+        cpu_seconds: CPU 시간 (초)
+        peak_rss_bytes: 단계 종료 시점까지의 프로세스 누적 최대 RSS (바이트)
+        traced_peak_bytes: 단계 중 Python 할당 최대치 (--trace-memory 사용 시)
+    """
+
+    stage: str
+    jobs: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: Optional[int] = None
+    traced_peak_bytes: Optional[int] = None
+
+    @property
+    def jobs_per_second(self) -> float:
+        """처리량 (작업/초)"""
+        return self.jobs / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            'wall_seconds': round(self.wall_seconds, 6),
+            'cpu_seconds': round(self.cpu_seconds, 6),
+            'jobs_per_second': round(self.jobs_per_second, 1),
+        }
+
+
+@dataclass
+class BenchResult:
+    """데이터셋 하나의 파이프라인 측정 결과
+
+    Attributes:
+        spec: 데이터셋 명세
+        stages: {단계 이름: 측정 결과}
+        html_bytes: 렌더링된 HTML 크기 (인라인 전, 바이트)
+    """
+
+    spec: DatasetSpec
+    stages: Dict[str, StageResult] = field(default_factory=dict)
+    html_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.spec.describe(),
+            'html_bytes': self.html_bytes,
+            'stages': {name: result.to_dict() for name, result in self.stages.items()},
+        }
+
+
+@dataclass
+class Comparison:
+    """기준선 대비 단계 처리량 비교
+
+    Attributes:
+        size: 작업 수
+        stage: 단계 이름
+        baseline: 기준선 처리량 (작업/초)
+        current: 현재 처리량 (작업/초)
+        regressed: 허용 범위를 넘게 느려졌는지 여부
+    """
+
+    size: int
+    stage: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        """기준선 대비 처리량 비율 (1.0보다 크면 빨라짐)"""
+        return self.current / self.baseline if self.baseline > 0 else 0.0
+
+
+class PipelineBenchmark:
+    """오프라인 리포트 파이프라인 벤치마크
+
+    ReportGenerator와 공유 CssInliner를 실행 사이에 재사용하므로 serve 커맨드처럼
+    템플릿/스타일시트 컴파일이 끝난 상태의 단계별 비용을 측정합니다.
+
+    fetch를 지정하면 데이터셋을 로컬 Baculum API 대역 서버에 올리고, 실제
+    BaculaClient/BackupService로 조회하는 fetch 단계를 parse 앞에 추가합니다.
+
+    Attributes:
+        trace_memory: tracemalloc으로 단계별 Python 할당 최대치 측정 여부
+        inline: inline 단계 실행 여부
+        fetch: fetch 단계 설정 (None이면 합성 응답을 바로 파싱)
+    """
+
+    def __init__(
+        self,
+        trace_memory: bool = False,
+        inline: bool = True,
+        fetch: Optional[FetchOptions] = None
+    ):
+        """PipelineBenchmark 초기화
+
+        Args:
+            trace_memory: 단계별 Python 할당 최대치 측정 여부 (측정 대상이 느려짐)
+            inline: inline 단계 실행 여부
+            fetch: fetch 단계 설정 (None이면 fetch 단계 없음)
+        """
+        from src.report.generator import ReportGenerator
+
+        self.trace_memory = trace_memory
+        self.inline = inline
+        self.fetch = fetch
+        self._output_dir = tempfile.TemporaryDirectory(prefix='baculum_bench_')
+        self.generator = ReportGenerator(BenchConfig(), output_dir=self._output_dir.name)
+        self._warmed_up = False
+
+    def close(self) -> None:
+        """임시 출력 디렉토리 정리"""
+        self._output_dir.cleanup()
+
+    def __enter__(self) -> 'PipelineBenchmark':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def run(self, spec: DatasetSpec, repeat: int = 1) -> BenchResult:
+        """데이터셋 하나로 파이프라인 실행
+
+        Args:
+            spec: 데이터셋 명세
+            repeat: 반복 횟수 (단계별로 가장 빠른 실행을 결과로 사용)
+
+        Returns:
+            단계별 측정 결과
+
+        Raises:
+            BenchError: 파이프라인 실행 실패 시
+        """
+        if not self._warmed_up:
+            self._run_stages(DatasetSpec(WARMUP_SIZE, seed=spec.seed), StageTimer())
+            self._warmed_up = True
+
+        with ExitStack() as stack:
+            server = None
+            if self.fetch is not None:
+                # 데이터 생성/서버 적재는 측정에서 제외하고 반복 실행 간 재사용
+                from src.bench.fake_server import FakeBaculumServer
+                server = stack.enter_context(
+                    FakeBaculumServer.from_spec(spec, faults=self.fetch.faults)
+                )
+            return self._run_repeated(spec, repeat, server)
+
+    def _run_repeated(
+        self,
+        spec: DatasetSpec,
+        repeat: int,
+        server: Optional['FakeBaculumServer']
+    ) -> BenchResult:
+        """repeat회 실행하여 단계별로 가장 빠른 결과 선택"""
+        result = BenchResult(spec=spec)
+        for _ in range(max(1, repeat)):
+            # 이전 실행의 JobView 캐시 적중으로 stats 단계가 빨라지지 않도록 비움
+            self.generator.view_cache.clear()
+            timer = StageTimer()
+            if self.trace_memory:
+                tracemalloc.start()
+            try:
+                result.html_bytes = self._run_stages(spec, timer, server)
+            finally:
+                if self.trace_memory:
+                    tracemalloc.stop()
+
+            for (name, _), total in timer.totals().items():
+                best = result.stages.get(name)
+                if best is not None and best.wall_seconds <= total.wall_seconds:
+                    continue
+                result.stages[name] = StageResult(
+                    stage=name,
+                    jobs=spec.size,
+                    wall_seconds=total.wall_seconds,
+                    cpu_seconds=total.cpu_seconds,
+                    peak_rss_bytes=total.peak_rss_bytes,
+                    traced_peak_bytes=total.traced_peak_bytes,
+                )
+        return result
+
+    def _run_stages(
+        self,
+        spec: DatasetSpec,
+        timer: StageTimer,
+        server: Optional['FakeBaculumServer'] = None
+    ) -> int:
+        """(fetch →) parse → stats → render → inline 실행 (렌더링된 HTML 크기 반환)"""
+        from src.models.backup_job import BackupJob
+        from src.utils.css_inliner import get_css_inliner
+
+        try:
+            chunks: Iterable[List[Dict[str, Any]]]
+            if server is not None:
+                with timer.stage('fetch'):
+                    jobs_data = self._fetch_jobs(server, spec)
+                chunks = (
+                    jobs_data[index:index + PARSE_CHUNK_SIZE]
+                    for index in range(0, len(jobs_data), PARSE_CHUNK_SIZE)
+                )
+            else:
+                chunks = iter_job_payloads(spec)
+
+            # 응답 생성 시간은 제외하고 청크별 파싱 시간만 합산
+            jobs: List[BackupJob] = []
+            for chunk in chunks:
+                with timer.stage('parse'):
+                    jobs.extend(BackupJob.from_api_response(payload) for payload in chunk)
+
+            with timer.stage('stats'):
+                context = self.generator._build_context(jobs, spec.start, spec.end)
+
+            template = self.generator._get_template()
+            with timer.stage('render'):
+                html = template.render(**context)
+
+            if self.inline:
+                with timer.stage('inline'):
+                    get_css_inliner().transform(html)
+        except Exception as e:
+            raise BenchError(f"파이프라인 실행 실패 ({spec.size}건): {e}") from e
+
+        return len(html.encode('utf-8'))
+
+    def _fetch_jobs(self, server: 'FakeBaculumServer', spec: DatasetSpec) -> List[Dict[str, Any]]:
+        """대역 서버에서 BaculaClient/BackupService로 기간 내 작업 조회"""
+        from src.api.client import BaculaClient
+        from src.services.backup import BackupService
+
+        config = server.client_config(timeout=self.fetch.timeout)
+        with BaculaClient(**config) as client:
+            service = BackupService(
+                client,
+                fetch_workers=self.fetch.workers,
+                fetch_strategy=self.fetch.strategy
+            )
+            return service._fetch_jobs_by_level(spec.start, spec.end)
+
+
+def run_suite(
+    specs: Sequence[DatasetSpec],
+    repeat: int = 1,
+    trace_memory: bool = False,
+    inline: bool = True,
+    fetch: Optional[FetchOptions] = None
+) -> List[BenchResult]:
+    """여러 데이터셋으로 파이프라인 벤치마크 실행
+
+    Args:
+        specs: 데이터셋 명세 목록 (작은 것부터 실행 권장)
+        repeat: 데이터셋별 반복 횟수 (단계별 최솟값 사용)
+        trace_memory: 단계별 Python 할당 최대치 측정 여부
+        inline: inline 단계 실행 여부
+        fetch: fetch 단계 설정 (None이면 fetch 단계 없음)
+
+    Returns:
+        데이터셋별 측정 결과
+
+    Raises:
+        BenchError: 파이프라인 실행 실패 시
+    """
+    with PipelineBenchmark(trace_memory=trace_memory, inline=inline, fetch=fetch) as bench:
+        return [bench.run(spec, repeat) for spec in specs]
+
+
+def save_baseline(path: Path, results: Sequence[BenchResult]) -> None:
+    """측정 결과를 기준선 파일로 저장
+
+    Args:
+        path: 기준선 파일 경로
+        results: 측정 결과 목록
+
+    Raises:
+        OSError: 파일 쓰기 실패 시
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'version': BASELINE_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': [result.to_dict() for result in results],
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """기준선 파일 로드
+
+    Args:
+        path: 기준선 파일 경로
+
+    Returns:
+        기준선 딕셔너리
+
+    Raises:
+        BenchError: 파일이 없거나 형식이 잘못된 경우
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        raise BenchError(f"기준선 파일이 없습니다: {path}")
+    except (OSError, ValueError) as e:
+        raise BenchError(f"기준선 파일을 읽을 수 없습니다: {path} ({e})")
+
+    if data.get('version') != BASELINE_VERSION or not isinstance(data.get('results'), list):
+        raise BenchError(f"지원하지 않는 기준선 형식입니다: {path}")
+    return data
+
+
+def compare_to_baseline(
+    results: Sequence[BenchResult],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[Comparison]:
+    """측정 결과를 기준선과 비교
+
+    데이터셋 명세(크기, 비율, 시드)가 같은 기준선 항목끼리만 비교합니다.
+
+    Args:
+        results: 측정 결과 목록
+        baseline: load_baseline()으로 읽은 기준선
+        tolerance: 허용 처리량 감소율 (0.25면 기준선의 75% 미만일 때 회귀)
+
+    Returns:
+        단계별 비교 결과 (기준선에 없는 데이터셋/단계는 제외)
+    """
+    baseline_by_spec = {
+        _spec_key(entry): entry for entry in baseline['results']
+    }
+
+    comparisons = []
+    for result in results:
+        entry = baseline_by_spec.get(_spec_key(result.spec.describe()))
+        if entry is None:
+            continue
+        for name, stage_result in result.stages.items():
+            expected = entry.get('stages', {}).get(name, {}).get('jobs_per_second')
+            if not expected:
+                continue
+            current = stage_result.jobs_per_second
+            comparisons.append(Comparison(
+                size=result.spec.size,
+                stage=name,
+                baseline=expected,
+                current=current,
+                regressed=current < expected * (1 - tolerance),
+            ))
+    return comparisons
+
+
+def _spec_key(entry: Dict[str, Any]) -> str:
+    """기준선 항목 매칭 키 (데이터셋 명세 필드만 사용)"""
+    return json.dumps(
+        {key: entry.get(key) for key in ('size', 'status_mix', 'level_mix', 'seed')},
+        sort_keys=True
+    )
@@ -8,12 +8,20 @@ import argparse
 from typing import Dict, Type
 
 from src.commands.base import BaseCommand
+from src.commands.bench import BenchCommand
 from src.commands.report import ReportCommand
+from src.commands.send_queue import SendQueueCommand
+from src.commands.serve import ServeCommand
+from src.commands.templates import CompileTemplatesCommand
 
 
 # 사용 가능한 커맨드 등록
 COMMANDS: Dict[str, Type[BaseCommand]] = {
     'report': ReportCommand,
+    'compile-templates': CompileTemplatesCommand,
+    'send-queue': SendQueueCommand,
+    'serve': ServeCommand,
+    'bench': BenchCommand,
 }
 
 
@@ -37,6 +45,19 @@ def create_parser() -> argparse.ArgumentParser:
 
   # 상세 로그 포함
   python -m src report --mode test --verbose
+
+  # 리포트를 발송 대기열에 등록하고 바로 종료 (발송은 send-queue)
+  python -m src report --mode production --queue-mail
+  python -m src send-queue
+
+  # 상주 실행 (매일 22시 리포트 생성, 세션/캐시 유지)
+  python -m src serve --schedule '0 22 * * *' --send-mail
+
+  # 리포트 템플릿 사전 컴파일
+  python -m src compile-templates --output data/compiled_templates
+
+  # 합성 데이터로 파이프라인 성능 측정 후 기준선과 비교
+  python -m src bench --sizes 1k,10k,100k
         '''
     )
 
@@ -4,6 +4,13 @@
 """
 
 from src.commands.base import BaseCommand
+from src.commands.bench import BenchCommand
 from src.commands.report import ReportCommand
+from src.commands.send_queue import SendQueueCommand
+from src.commands.serve import ServeCommand
+from src.commands.templates import CompileTemplatesCommand
 
-__all__ = ['BaseCommand', 'ReportCommand']
+__all__ = [
+    'BaseCommand', 'ReportCommand', 'CompileTemplatesCommand', 'SendQueueCommand',
+    'ServeCommand', 'BenchCommand',
+]
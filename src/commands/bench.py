@@ -0,0 +1,310 @@
+"""리포트 파이프라인 벤치마크 커맨드
+
+합성 작업 데이터셋으로 parse → stats → render → inline 단계를 API/SMTP 없이
+실행하고 단계별 처리량과 메모리를 출력합니다. 저장된 기준선과 비교해 성능
+회귀를 검사할 수 있습니다.
+"""
+
+import json
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from src.commands.base import BaseCommand
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from src.bench.runner import BenchResult, Comparison
+
+
+# 기본 측정 크기 (1M건까지 지정 가능)
+DEFAULT_SIZES = '1k,10k'
+
+# 기본 반복 횟수 (짧은 단계의 측정 잡음 완화)
+DEFAULT_REPEAT = 3
+
+_MIB = 1024 * 1024
+
+
+class BenchCommand(BaseCommand):
+    """리포트 파이프라인 벤치마크 커맨드
+
+    .env 설정 없이 실행되며, 기준선 파일이 있으면 단계별 처리량을 비교하고
+    허용 범위를 넘게 느려진 단계가 있으면 종료 코드 1을 반환합니다.
+    """
+
+    def __init__(self):
+        """BenchCommand 초기화"""
+        super().__init__(
+            name='bench',
+            description='합성 데이터로 리포트 파이프라인 성능을 측정합니다.'
+        )
+
+    def setup(self, args: Namespace) -> None:
+        """로거만 초기화 (API/SMTP 설정 불필요)
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+        """
+        log_level = 'DEBUG' if getattr(args, 'verbose', False) else 'INFO'
+        self.logger = setup_logger('baculum', log_level=log_level)
+
+    def setup_args(self, parser: ArgumentParser) -> None:
+        """벤치마크 커맨드 CLI 인자 설정
+
+        Args:
+            parser: ArgumentParser 인스턴스
+        """
+        from src.bench.dataset import DEFAULT_LEVEL_MIX, DEFAULT_STATUS_MIX
+
+        parser.add_argument(
+            '--sizes',
+            default=DEFAULT_SIZES,
+            help=f'측정할 작업 수 목록, 쉼표 구분 (1k, 100k, 1M 형식 가능, 기본값: {DEFAULT_SIZES})'
+        )
+
+        parser.add_argument(
+            '--status-mix',
+            default=_format_mix(DEFAULT_STATUS_MIX),
+            help='작업 상태 비율 (기본값: %(default)s)'
+        )
+
+        parser.add_argument(
+            '--level-mix',
+            default=_format_mix(DEFAULT_LEVEL_MIX),
+            help='백업 레벨 비율 (기본값: %(default)s)'
+        )
+
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='데이터 생성 난수 시드 (기본값: 0)'
+        )
+
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help=f'데이터셋별 반복 횟수, 단계별 최솟값 사용 (기본값: {DEFAULT_REPEAT})'
+        )
+
+        parser.add_argument(
+            '--baseline',
+            type=Path,
+            help='비교할 기준선 파일 (기본값: benchmarks/pipeline_baseline.json)'
+        )
+
+        parser.add_argument(
+            '--save-baseline',
+            action='store_true',
+            help='측정 결과를 기준선 파일로 저장 (비교하지 않음)'
+        )
+
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='기준선 대비 허용 처리량 감소율 (기본값: 0.25)'
+        )
+
+        parser.add_argument(
+            '--no-inline',
+            action='store_true',
+            help='inline(CSS 인라인) 단계 제외'
+        )
+
+        parser.add_argument(
+            '--trace-memory',
+            action='store_true',
+            help='tracemalloc으로 단계별 Python 할당 최대치 측정 (측정 대상이 느려짐)'
+        )
+
+        parser.add_argument(
+            '--api',
+            action='store_true',
+            help='로컬 Baculum API 대역 서버로 fetch 단계 측정 (BaculaClient/BackupService 사용)'
+        )
+
+        parser.add_argument(
+            '--api-latency',
+            type=float,
+            default=0.0,
+            metavar='SECONDS',
+            help='--api 사용 시 요청당 응답 지연 (기본값: 0)'
+        )
+
+        parser.add_argument(
+            '--api-jitter',
+            type=float,
+            default=0.0,
+            metavar='SECONDS',
+            help='--api 사용 시 요청당 추가 무작위 지연 최대값 (기본값: 0)'
+        )
+
+        parser.add_argument(
+            '--fetch-workers',
+            type=int,
+            default=1,
+            help='--api 사용 시 레벨별 동시 조회 스레드 수 (기본값: 1)'
+        )
+
+        parser.add_argument(
+            '--fetch-strategy',
+            choices=['per_level', 'single'],
+            default='per_level',
+            help='--api 사용 시 작업 조회 전략 (기본값: per_level)'
+        )
+
+        parser.add_argument(
+            '--json',
+            type=Path,
+            metavar='PATH',
+            help='측정 결과를 JSON 파일로 저장'
+        )
+
+        parser.add_argument(
+            '--verbose',
+            action='store_true',
+            help='상세 로그 출력 (DEBUG 레벨)'
+        )
+
+    def execute(self, args: Namespace) -> int:
+        """벤치마크 실행
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+
+        Returns:
+            종료 코드 (0: 성공, 1: 성능 회귀 또는 오류 발생)
+        """
+        from src.bench.dataset import DatasetSpec, parse_mix
+        from src.bench.runner import (
+            DEFAULT_BASELINE_FILE,
+            BenchError,
+            FetchOptions,
+            compare_to_baseline,
+            load_baseline,
+            parse_size,
+            run_suite,
+            save_baseline,
+        )
+
+        try:
+            sizes = sorted(parse_size(size) for size in args.sizes.split(','))
+            status_mix = parse_mix(args.status_mix)
+            level_mix = parse_mix(args.level_mix)
+        except ValueError as e:
+            self.logger.error(f"✗ 잘못된 인자: {e}")
+            return 1
+
+        specs = [
+            DatasetSpec(size, status_mix=status_mix, level_mix=level_mix, seed=args.seed)
+            for size in sizes
+        ]
+        baseline_file = args.baseline or DEFAULT_BASELINE_FILE
+
+        fetch = None
+        if args.api:
+            from src.bench.fake_server import FaultConfig
+
+            fetch = FetchOptions(
+                faults=FaultConfig(
+                    latency=args.api_latency, jitter=args.api_jitter, seed=args.seed
+                ),
+                workers=args.fetch_workers,
+                strategy=args.fetch_strategy,
+            )
+
+        self.logger.info(f"벤치마크 시작: {', '.join(f'{size:,}건' for size in sizes)}")
+        try:
+            results = run_suite(
+                specs,
+                repeat=args.repeat,
+                trace_memory=args.trace_memory,
+                inline=not args.no_inline,
+                fetch=fetch
+            )
+        except BenchError as e:
+            self.logger.error(f"✗ {e}")
+            return 1
+
+        for result in results:
+            self._log_result(result)
+
+        if args.json:
+            args.json.parent.mkdir(parents=True, exist_ok=True)
+            args.json.write_text(
+                json.dumps([result.to_dict() for result in results], ensure_ascii=False, indent=2),
+                encoding='utf-8'
+            )
+            self.logger.info(f"✓ 측정 결과 저장: {args.json}")
+
+        if args.save_baseline:
+            save_baseline(baseline_file, results)
+            self.logger.info(f"✓ 기준선 저장: {baseline_file}")
+            return 0
+
+        if not baseline_file.exists():
+            self.logger.info(f"기준선 파일이 없어 비교를 건너뜁니다: {baseline_file}")
+            return 0
+
+        try:
+            baseline = load_baseline(baseline_file)
+        except BenchError as e:
+            self.logger.error(f"✗ {e}")
+            return 1
+
+        comparisons = compare_to_baseline(results, baseline, args.tolerance)
+        return self._report_comparisons(comparisons, args.tolerance)
+
+    def _log_result(self, result: 'BenchResult') -> None:
+        """데이터셋 하나의 단계별 결과 출력"""
+        self.logger.info(
+            f"[{result.spec.size:,}건] HTML {result.html_bytes / _MIB:.1f}MiB"
+        )
+        for stage_result in result.stages.values():
+            memory = _format_bytes(stage_result.peak_rss_bytes)
+            if stage_result.traced_peak_bytes is not None:
+                memory += f", 할당 최대 {_format_bytes(stage_result.traced_peak_bytes)}"
+            self.logger.info(
+                f"  {stage_result.stage:<7} {stage_result.wall_seconds * 1000:9.1f}ms  "
+                f"{stage_result.jobs_per_second:>12,.0f} 작업/초  "
+                f"CPU {stage_result.cpu_seconds * 1000:.1f}ms  RSS {memory}"
+            )
+
+    def _report_comparisons(self, comparisons: Sequence['Comparison'], tolerance: float) -> int:
+        """기준선 비교 결과 출력 (회귀가 있으면 1 반환)"""
+        if not comparisons:
+            self.logger.info("기준선에 같은 데이터셋 명세가 없어 비교를 건너뜁니다")
+            return 0
+
+        regressions: List['Comparison'] = []
+        for comparison in comparisons:
+            mark = '✗' if comparison.regressed else '✓'
+            self.logger.info(
+                f"{mark} [{comparison.size:,}건] {comparison.stage}: "
+                f"{comparison.current:,.0f} 작업/초 (기준선 {comparison.baseline:,.0f}, "
+                f"{comparison.ratio:.2f}배)"
+            )
+            if comparison.regressed:
+                regressions.append(comparison)
+
+        if regressions:
+            self.logger.error(
+                f"✗ 성능 회귀 {len(regressions)}건 (허용 감소율 {tolerance:.0%})"
+            )
+            return 1
+
+        self.logger.info("✓ 기준선 대비 성능 회귀 없음")
+        return 0
+
+
+def _format_mix(mix: dict) -> str:
+    """비율 딕셔너리를 'T=85,f=5' 형식으로 변환"""
+    return ','.join(f'{key}={weight}' for key, weight in mix.items())
+
+
+def _format_bytes(value: Optional[int]) -> str:
+    """바이트 수를 MiB 문자열로 변환 (측정 불가 시 '-')"""
+    return '-' if value is None else f'{value / _MIB:.1f}MiB'
@@ -1,19 +1,32 @@
 """리포트 생성 커맨드
 
 백업 리포트를 생성하고 선택적으로 이메일로 발송하는 커맨드입니다.
+
+API 클라이언트(requests), 리포트 생성기(jinja2), 메일 발송(smtplib, premailer)
+모듈은 실제로 사용하는 단계에서 임포트합니다. --help 나 메일 발송 없는 실행이
+쓰지 않는 의존성을 로드하지 않도록 하기 위함입니다.
 """
 
 import time
+import tracemalloc
 from argparse import ArgumentParser, Namespace
+from contextlib import ExitStack
 from datetime import datetime
-from typing import List
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.commands.base import BaseCommand
-from src.api.client import BaculaClient, BaculaAPIError
-from src.services.backup import BackupService
-from src.models.backup_job import BackupJob
-from src.report.generator import ReportGenerator, ReportGeneratorError
-from src.mail.sender import EmailSender, EmailSendError
+from src.utils.timing import StageTimer, stage
+
+if TYPE_CHECKING:
+    from src.api.client import BaculaClient
+    from src.api.response_cache import ResponseCache
+    from src.mail.sender import EmailSender
+    from src.models.backup_job import BackupJob
+    from src.report.artifact import RenderedReport
+    from src.report.generator import ReportGenerator
+    from src.services.job_logs import JobLogFetcher
+    from src.store.job_store import JobStore
 
 
 class ReportCommand(BaseCommand):
@@ -29,6 +42,9 @@ class ReportCommand(BaseCommand):
             name='report',
             description='백업 리포트를 생성하고 선택적으로 이메일로 발송합니다.'
         )
+        self._generator: Optional['ReportGenerator'] = None
+        self._log_fetcher: Optional['JobLogFetcher'] = None
+        self._email_sender: Optional['EmailSender'] = None
 
     def setup_args(self, parser: ArgumentParser) -> None:
         """리포트 커맨드 CLI 인자 설정
@@ -54,18 +70,119 @@ class ReportCommand(BaseCommand):
             help='출력 파일명 (지정하지 않으면 자동 생성: mail_YYYYMMDDHHMMSS.html)'
         )
 
+        parser.add_argument(
+            '--trace-memory',
+            action='store_true',
+            help='tracemalloc으로 단계별 Python 할당 최대치 기록 (실행이 느려짐)'
+        )
+
         parser.add_argument(
             '--send-mail',
             action='store_true',
             help='리포트를 이메일로 발송 (.env에 메일 설정 필요)'
         )
 
+        parser.add_argument(
+            '--queue-mail',
+            action='store_true',
+            help='리포트 메일을 발송 대기열에 등록하고 바로 종료 (send-queue 커맨드가 발송)'
+        )
+
+        cassette_group = parser.add_mutually_exclusive_group()
+        cassette_group.add_argument(
+            '--record',
+            type=Path,
+            metavar='DIR',
+            help='API 응답을 디렉토리에 녹화 (압축 저장, 요청별 파일)'
+        )
+        cassette_group.add_argument(
+            '--replay',
+            type=Path,
+            metavar='DIR',
+            help='--record 로 녹화한 응답으로 실행 (네트워크 요청 없음, 녹화 당시 기간 사용)'
+        )
+
+        sync_group = parser.add_mutually_exclusive_group()
+        sync_group.add_argument(
+            '--incremental',
+            action='store_true',
+            help='증분 동기화 사용 (이전 실행 이후 변경된 작업만 조회)'
+        )
+        sync_group.add_argument(
+            '--store',
+            action='store_true',
+            help='로컬 작업 저장소(SQLite) 사용 (저장소에 없는 구간만 API로 조회)'
+        )
+
     def execute(self, args: Namespace) -> int:
         """리포트 생성 실행
 
         Args:
             args: 파싱된 커맨드 라인 인자
 
+        Returns:
+            종료 코드 (0: 성공, 1: 실패)
+        """
+        try:
+            return self.run_report(args)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """실행 사이에 유지하던 SMTP 세션 종료 (serve 종료 시에도 호출)"""
+        sender, self._email_sender = self._email_sender, None
+        if sender is not None:
+            sender.close()
+
+    def run_report(
+        self,
+        args: Namespace,
+        client: Optional['BaculaClient'] = None,
+        job_store: Optional['JobStore'] = None
+    ) -> int:
+        """리포트 생성 파이프라인 실행
+
+        client/job_store를 넘기면 열린 세션과 저장소를 재사용하고 닫지 않습니다
+        (serve 커맨드에서 여러 번 실행할 때 사용).
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+            client: 재사용할 BaculaClient (없으면 새로 연결 후 종료)
+            job_store: 재사용할 JobStore (없으면 --store 지정 시 새로 열고 닫음)
+
+        Returns:
+            종료 코드 (0: 성공, 1: 실패)
+        """
+        # 단계별 할당 최대치는 tracemalloc이 켜져 있을 때만 기록됨
+        trace_memory = args.trace_memory and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start()
+        timer = StageTimer()
+        try:
+            with timer.activate(), timer.stage('total') as total:
+                result = self._run_pipeline(args, client, job_store)
+                total.ok = result == 0
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+
+        self.logger.info(f"단계별 시간: {timer.summary()}")
+        self._write_timings(timer, args)
+        return result
+
+    def _run_pipeline(
+        self,
+        args: Namespace,
+        client: Optional['BaculaClient'],
+        job_store: Optional['JobStore']
+    ) -> int:
+        """수집 → 생성 → 발송 단계 실행
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+            client: 재사용할 BaculaClient (없으면 새로 연결 후 종료)
+            job_store: 재사용할 JobStore (없으면 --store 지정 시 새로 열고 닫음)
+
         Returns:
             종료 코드 (0: 성공, 1: 실패)
         """
@@ -76,23 +193,18 @@ class ReportCommand(BaseCommand):
         self.logger.info(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
         start_time = time.time()
+        send_mail = args.send_mail or args.queue_mail
 
         # 1. API 연결 및 데이터 수집
         self.logger.info("")
-        self.logger.info("[1/3] Bacula API 연결 및 데이터 수집 중..." if not args.send_mail
+        self.logger.info("[1/3] Bacula API 연결 및 데이터 수집 중..." if not send_mail
                          else "[1/4] Bacula API 연결 및 데이터 수집 중...")
 
-        try:
-            # BaculaClient 및 BackupService 생성
-            client = BaculaClient(**self.config.get_baculum_client_config())
-            client.connect()
-            self.logger.info("✓ API 연결 성공")
-
-            backup_service = BackupService(client)
-
-            # 백업 작업 조회 (서비스 레이어 사용)
-            jobs, start_period, end_period = backup_service.get_jobs_by_period(args.mode)
+        from src.api.client import BaculaAPIError
+        from src.report.generator import ReportGeneratorError
 
+        try:
+            jobs, start_period, end_period = self._collect_jobs(args, client, job_store)
         except BaculaAPIError as e:
             self.logger.error(f"✗ API 오류: {e}")
             return 1
@@ -102,11 +214,13 @@ class ReportCommand(BaseCommand):
 
         # 2. 리포트 생성
         self.logger.info("")
-        self.logger.info("[2/3] HTML 리포트 생성 중..." if not args.send_mail
+        self.logger.info("[2/3] HTML 리포트 생성 중..." if not send_mail
                          else "[2/4] HTML 리포트 생성 중...")
 
         try:
-            report_path = self._generate_report(jobs, start_period, end_period, args.output)
+            report = self._generate_report(
+                jobs, start_period, end_period, args.output, keep_html=send_mail
+            )
         except ReportGeneratorError as e:
             self.logger.error(f"✗ 리포트 생성 실패: {e}")
             return 1
@@ -115,12 +229,22 @@ class ReportCommand(BaseCommand):
             return 1
 
         # 3. 메일 발송 (옵션)
-        if args.send_mail:
+        if send_mail:
+            from src.mail.outbox import OutboxError
+            from src.mail.sender import EmailSendError
+
             self.logger.info("")
-            self.logger.info("[3/4] 이메일 발송 중...")
+            self.logger.info("[3/4] 이메일 발송 대기열 등록 중..." if args.queue_mail
+                             else "[3/4] 이메일 발송 중...")
 
             try:
-                self._send_email(report_path, end_period)
+                if args.queue_mail:
+                    self._queue_email(report)
+                else:
+                    self._send_email(report)
+            except OutboxError as e:
+                self.logger.error(f"✗ 이메일 대기열 등록 실패: {e}")
+                self.logger.warning("  리포트는 생성되었지만 이메일 발송에 실패했습니다.")
             except EmailSendError as e:
                 self.logger.error(f"✗ 이메일 발송 실패: {e}")
                 self.logger.warning("  리포트는 생성되었지만 이메일 발송에 실패했습니다.")
@@ -133,52 +257,258 @@ class ReportCommand(BaseCommand):
         self.logger.info("")
         self.logger.info("=" * 60)
         self.logger.info("백업 리포트 생성 완료!")
-        if args.send_mail and self.config.has_mail_config():
-            self.logger.info("이메일 발송 완료!")
+        if send_mail and self.config.has_mail_config():
+            self.logger.info("이메일 발송 대기열 등록 완료!" if args.queue_mail
+                             else "이메일 발송 완료!")
         self.logger.info(f"총 실행 시간: {elapsed:.2f}초")
         self.logger.info("=" * 60)
 
         return 0
 
+    def _write_timings(self, timer: StageTimer, args: Namespace) -> None:
+        """단계별 계측 결과 저장 (JSON lines, 선택적으로 Prometheus textfile)
+
+        저장 실패는 리포트 결과에 영향을 주지 않도록 경고만 남깁니다.
+
+        Args:
+            timer: 계측 결과
+            args: 파싱된 커맨드 라인 인자
+        """
+        jsonl_file = self.config.metrics_jsonl_file
+        prom_file = self.config.metrics_prom_file
+        try:
+            if jsonl_file:
+                timer.write_json_lines(jsonl_file, mode=args.mode)
+                self.logger.debug(f"단계별 시간 기록: {jsonl_file}")
+            if prom_file:
+                timer.write_prometheus(prom_file)
+                self.logger.debug(f"Prometheus 지표 기록: {prom_file}")
+        except OSError as e:
+            self.logger.warning(f"⚠ 단계별 시간 기록 실패: {e}")
+
+    def create_client(self, args: Namespace) -> 'BaculaClient':
+        """BaculaClient 생성 (--record/--replay 지정 시 cassette, 그 외에는 응답 캐시 연결)
+
+        녹화/재생 중에는 모든 요청이 실제로 녹화되거나 녹화본에서 재생되어야 하므로
+        응답 캐시를 사용하지 않습니다.
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+
+        Returns:
+            BaculaClient 객체 (호출한 쪽에서 close 필요)
+
+        Raises:
+            CassetteError: 재생할 녹화 디렉토리가 없는 경우
+            ConfigError: 응답 캐시 설정이 잘못된 경우
+        """
+        from src.api.cassette import CASSETTE_MODE_RECORD, CASSETTE_MODE_REPLAY, Cassette
+        from src.api.client import BaculaClient
+
+        cassette = None
+        response_cache = None
+        if getattr(args, 'record', None):
+            cassette = Cassette(args.record, CASSETTE_MODE_RECORD)
+            self.logger.info(f"API 응답 녹화: {cassette.path}")
+        elif getattr(args, 'replay', None):
+            cassette = Cassette(args.replay, CASSETTE_MODE_REPLAY)
+            self.logger.info(f"녹화된 API 응답 재생: {cassette.path}")
+        else:
+            response_cache = self._create_response_cache()
+
+        return BaculaClient(
+            **self.config.get_baculum_client_config(),
+            cassette=cassette,
+            response_cache=response_cache
+        )
+
+    def _create_response_cache(self) -> Optional['ResponseCache']:
+        """설정에 따라 API 응답 캐시 생성
+
+        Returns:
+            ResponseCache 객체, BACULUM_API_CACHE_TTL이 비어 있으면 None
+
+        Raises:
+            ConfigError: 캐시 설정이 잘못된 경우
+        """
+        from src.api.response_cache import ResponseCache
+        from src.utils.config import ConfigError
+
+        ttls = self.config.api_cache_ttls
+        if not ttls:
+            return None
+
+        try:
+            cache = ResponseCache(
+                ttls,
+                max_entries=self.config.api_cache_max_entries,
+                stale_seconds=self.config.api_cache_stale_seconds,
+                path=self.config.api_cache_file
+            )
+        except ValueError as e:
+            raise ConfigError(f"API 응답 캐시 설정 오류: {e}")
+
+        ttl_text = ', '.join(f'{pattern}={ttl:g}s' for pattern, ttl in ttls.items())
+        self.logger.info(f"API 응답 캐시 사용: {ttl_text}")
+        if cache.path is not None:
+            self.logger.info(f"  보관 파일: {cache.path} ({cache.stats().entries}건 불러옴)")
+        return cache
+
+    def _collect_jobs(
+        self,
+        args: Namespace,
+        client: Optional['BaculaClient'] = None,
+        job_store: Optional['JobStore'] = None
+    ) -> Tuple[List['BackupJob'], datetime, datetime]:
+        """백업 작업 조회
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+            client: 재사용할 BaculaClient (없으면 새로 연결하고 조회 후 종료)
+            job_store: 재사용할 JobStore (없으면 --store 지정 시 새로 열고 닫음)
+
+        Returns:
+            (작업 리스트, 조회 시작 시간, 조회 종료 시간) 튜플
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        from src.services.backup import BackupService
+        from src.store.job_store import JobStore
+
+        with ExitStack() as stack:
+            if job_store is None and args.store:
+                job_store = JobStore(self.config.job_store_file)
+                stack.callback(job_store.close)
+
+            if client is None:
+                # 세션은 조회 후 자동 종료
+                client = stack.enter_context(self.create_client(args))
+                with stage('connect'):
+                    client.connect()
+                self.logger.info("✓ API 연결 성공")
+
+            backup_service = BackupService(
+                client,
+                fetch_workers=self.config.api_fetch_workers,
+                fetch_strategy=self.config.api_fetch_strategy,
+                page_size=self.config.api_page_size,
+                sync_state_path=(
+                    self.config.sync_state_file if args.incremental else None
+                ),
+                job_store=job_store,
+                log_fetcher=self._get_log_fetcher(client)
+            )
+
+            # 재생 시에는 녹화 당시의 조회 기간을 사용 (요청 파라미터가 같아야 함)
+            cassette = client.cassette
+            period = cassette.load_period() if cassette and cassette.replaying else None
+            if period is not None:
+                self.logger.info(f"녹화 당시 조회 기간 사용: {period[0]} ~ {period[1]}")
+
+            # 백업 작업 조회 (서비스 레이어 사용)
+            jobs, start_period, end_period = backup_service.get_jobs_by_period(
+                args.mode, *(period or ())
+            )
+
+            if cassette is not None:
+                if cassette.replaying:
+                    self.logger.info(f"✓ 녹화 응답 {cassette.replayed}건 재생")
+                else:
+                    cassette.save_metadata(args.mode, start_period, end_period)
+                    self.logger.info(f"✓ API 응답 {cassette.recorded}건 녹화: {cassette.path}")
+
+            if client.response_cache is not None:
+                self._report_cache_usage(client.response_cache)
+
+            return jobs, start_period, end_period
+
+    def _get_log_fetcher(self, client: 'BaculaClient') -> Optional['JobLogFetcher']:
+        """실패 작업 로그 조회기 (serve 모드에서 같은 클라이언트면 재사용하여 캐시 유지)
+
+        Args:
+            client: BaculaClient 인스턴스
+
+        Returns:
+            JobLogFetcher 객체, BACULUM_API_LOG_WORKERS가 0이면 None
+        """
+        from src.services.job_logs import JobLogFetcher
+
+        workers = self.config.api_log_workers
+        if workers < 1:
+            return None
+        if self._log_fetcher is None or self._log_fetcher.client is not client:
+            self._log_fetcher = JobLogFetcher(client, workers=workers)
+        return self._log_fetcher
+
+    def _report_cache_usage(self, cache: 'ResponseCache') -> None:
+        """응답 캐시 통계 로그 출력 후 디스크에 저장
+
+        serve처럼 클라이언트를 계속 사용하는 경우에도 실행마다 보관 파일을 갱신합니다.
+
+        Args:
+            cache: 응답 캐시
+        """
+        cache_stats = cache.stats()
+        self.logger.info(
+            f"✓ API 응답 캐시: 적중 {cache_stats.hits}건, "
+            f"만료 후 재사용 {cache_stats.stale_hits}건, 미적중 {cache_stats.misses}건 "
+            f"(적중률 {cache_stats.hit_ratio:.0%}, 보관 {cache_stats.entries}건)"
+        )
+        try:
+            cache.save()
+        except OSError as e:
+            self.logger.warning(f"⚠ 응답 캐시 저장 실패: {cache.path}, {e}")
+
     def _generate_report(
         self,
-        jobs: List[BackupJob],
+        jobs: List['BackupJob'],
         start_period: datetime,
         end_period: datetime,
-        filename: str = None
-    ) -> str:
+        filename: str = None,
+        keep_html: bool = False
+    ) -> 'RenderedReport':
         """리포트 생성
 
+        메일 발송(--send-mail/--queue-mail) 시에는 HTML을 메모리에 렌더링하고 같은
+        문자열로 보관 파일을 저장합니다. 메일을 보내지 않으면 보관 파일로만
+        스트리밍합니다.
+
         Args:
             jobs: 백업 작업 리스트
             start_period: 조회 시작 시간
             end_period: 조회 종료 시간
             filename: 출력 파일명
+            keep_html: 렌더링된 HTML을 메모리에 유지할지 여부 (메일 발송 시)
 
         Returns:
-            생성된 리포트 파일 경로
+            렌더링된 리포트 (보관 파일 경로 포함)
 
         Raises:
             ReportGeneratorError: 리포트 생성 실패 시
         """
-        generator = ReportGenerator(config=self.config)
-        report_path = generator.generate_report(
+        from src.report.generator import ReportGenerator
+
+        # 생성기는 재사용 (serve 모드에서 작업 뷰 캐시 유지)
+        if self._generator is None:
+            self._generator = ReportGenerator(config=self.config)
+        report = self._generator.render_report(
             jobs=jobs,
             start_period=start_period,
             end_period=end_period,
-            filename=filename
+            filename=filename,
+            keep_html=keep_html
         )
         self.logger.info("✓ 리포트 생성 완료")
-        self.logger.info(f"  파일 경로: {report_path}")
+        self.logger.info(f"  파일 경로: {report.path}")
 
-        return report_path
+        return report
 
-    def _send_email(self, report_path: str, end_period: datetime) -> None:
+    def _send_email(self, report: 'RenderedReport') -> None:
         """이메일 발송
 
         Args:
-            report_path: 리포트 파일 경로
-            end_period: 리포트 종료 날짜
+            report: 렌더링된 리포트
 
         Raises:
             EmailSendError: 이메일 발송 실패 시
@@ -189,17 +519,46 @@ class ReportCommand(BaseCommand):
             self.logger.warning("  .env 파일에서 SMTP 관련 설정을 확인하세요.")
             return
 
-        # EmailSender 생성
-        email_sender = EmailSender(**self.config.get_email_sender_config())
-
-        # 리포트 날짜
-        report_date = end_period.strftime('%Y-%m-%d')
+        # 수신자 전체를 하나의 SMTP 세션으로 발송하고, 세션은 close()까지 유지
+        # (serve 모드에서 여러 리포트가 같은 세션을 재사용)
+        if self._email_sender is None:
+            from src.mail.sender import EmailSender
+            self._email_sender = EmailSender(**self.config.get_email_sender_config())
 
-        # 메일 발송
-        email_sender.send_report_email(
+        # 메일 발송 (메모리에 렌더링된 HTML을 보관 파일을 다시 읽지 않고 전달)
+        self._email_sender.send_report(
             to_email=self.config.mail_to,
-            report_path=report_path,
-            report_date=report_date
+            report=report
         )
         self.logger.info("✓ 이메일 발송 완료")
         self.logger.info(f"  수신자: {self.config.mail_to}")
+
+    def _queue_email(self, report: 'RenderedReport') -> None:
+        """이메일 발송 대기열 등록
+
+        SMTP 발송을 기다리지 않고 리포트를 스풀 디렉토리에 저장합니다.
+        발송은 send-queue 커맨드가 담당합니다.
+
+        Args:
+            report: 렌더링된 리포트
+
+        Raises:
+            OutboxError: 대기열 저장 실패 시
+        """
+        # 메일 설정 확인 (발송 시점이 아니라 등록 시점에 누락을 알림)
+        if not self.config.has_mail_config():
+            self.logger.warning("⚠ 메일 설정이 불완전합니다. 이메일 발송을 건너뜁니다.")
+            self.logger.warning("  .env 파일에서 SMTP 관련 설정을 확인하세요.")
+            return
+
+        from src.mail.outbox import Outbox
+
+        outbox = Outbox(self.config.mail_spool_dir)
+        message = outbox.enqueue(
+            to_email=self.config.mail_to,
+            subject=f"[Bacula] 백업 리포트 - {report.report_date}",
+            report=report
+        )
+        self.logger.info("✓ 이메일 발송 대기열 등록 완료")
+        self.logger.info(f"  메시지 ID: {message.message_id}")
+        self.logger.info(f"  수신자: {self.config.mail_to}")
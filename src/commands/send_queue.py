@@ -0,0 +1,91 @@
+"""메일 발송 대기열 처리 커맨드
+
+report --queue-mail 로 대기열(spool)에 등록된 리포트 메일을 발송하는
+커맨드입니다. cron으로 주기 실행하거나 --watch 로 상주 워커로 실행합니다.
+"""
+
+import threading
+from argparse import ArgumentParser, Namespace
+
+from src.commands.base import BaseCommand
+from src.utils.config import ConfigError
+
+
+class SendQueueCommand(BaseCommand):
+    """메일 발송 대기열 처리 커맨드
+
+    MAIL_SPOOL_DIR의 대기 메시지를 발송하고, 실패한 메시지는 재시도 시간을
+    정해 대기열에 남깁니다. 최대 시도 횟수를 넘긴 메시지는 failed/로 옮깁니다.
+    """
+
+    def __init__(self):
+        """SendQueueCommand 초기화"""
+        super().__init__(
+            name='send-queue',
+            description='메일 발송 대기열의 리포트를 발송합니다.'
+        )
+
+    def setup_args(self, parser: ArgumentParser) -> None:
+        """대기열 처리 커맨드 CLI 인자 설정
+
+        Args:
+            parser: ArgumentParser 인스턴스
+        """
+        parser.add_argument(
+            '--watch',
+            type=float,
+            metavar='SECONDS',
+            help='종료하지 않고 지정한 간격(초)으로 대기열을 계속 처리'
+        )
+
+        parser.add_argument(
+            '--verbose',
+            action='store_true',
+            help='상세 로그 출력 (DEBUG 레벨)'
+        )
+
+    def execute(self, args: Namespace) -> int:
+        """대기열 발송 실행
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+
+        Returns:
+            종료 코드 (0: 성공, 1: 최종 실패한 메시지가 있거나 오류 발생)
+        """
+        from src.mail.outbox import Outbox, OutboxError, OutboxWorker
+        from src.mail.sender import EmailSender
+
+        try:
+            outbox = Outbox(self.config.mail_spool_dir)
+        except OutboxError as e:
+            self.logger.error(f"✗ {e}")
+            return 1
+
+        worker = OutboxWorker(
+            outbox,
+            # 재시도는 워커가 메시지별 대기 시간으로 처리하므로 발송은 한 번만 시도
+            sender_factory=lambda: EmailSender(
+                **{**self.config.get_email_sender_config(), 'max_retries': 1}
+            ),
+            max_attempts=self.config.mail_spool_max_attempts,
+            retry_delay=self.config.mail_spool_retry_delay,
+        )
+
+        if args.watch:
+            self.logger.info(f"메일 대기열 감시 시작: {outbox.spool_dir} ({args.watch}초 간격)")
+            worker.run_forever(args.watch, threading.Event())
+            return 0
+
+        try:
+            sent, retried, failed = worker.run_once()
+        except (OutboxError, ConfigError) as e:
+            self.logger.error(f"✗ {e}")
+            return 1
+
+        counts = outbox.counts()
+        self.logger.info(
+            f"✓ 대기열 처리 완료: 발송 {sent}건, 재시도 대기 {retried}건, 최종 실패 {failed}건"
+        )
+        self.logger.info(f"  남은 메시지: 대기 {counts['new']}건, 실패 보관 {counts['failed']}건")
+        return 1 if failed else 0
@@ -0,0 +1,170 @@
+"""상주 실행 커맨드
+
+프로세스를 종료하지 않고 cron 식 스케줄에 맞춰 리포트 작업을 반복 실행하는
+커맨드입니다. 인터프리터 시작, 모듈 임포트, 설정 로드, 템플릿 컴파일,
+API 세션(TCP/TLS) 연결 비용을 실행마다 다시 치르지 않도록 API 세션, 템플릿
+캐시, 작업 저장소를 실행 사이에 유지합니다.
+"""
+
+import signal
+import threading
+from argparse import ArgumentParser, Namespace
+from contextlib import ExitStack
+from datetime import datetime
+
+from src.commands.base import BaseCommand
+from src.commands.report import ReportCommand
+from src.utils.config import ConfigError
+from src.utils.schedule import CronSchedule, ScheduleError, run_on_schedule
+
+
+# --queue-mail 사용 시 내장 발송 워커의 대기열 확인 간격 (초)
+DEFAULT_OUTBOX_INTERVAL = 60.0
+
+
+class ServeCommand(BaseCommand):
+    """상주 실행 커맨드
+
+    report 커맨드와 같은 인자를 받아 스케줄마다 리포트를 생성합니다.
+    --queue-mail 을 지정하면 같은 프로세스의 백그라운드 스레드가 발송
+    대기열을 처리합니다. SIGTERM/SIGINT를 받으면 진행 중인 작업을 마치고
+    종료합니다.
+    """
+
+    def __init__(self):
+        """ServeCommand 초기화"""
+        super().__init__(
+            name='serve',
+            description='상주하면서 스케줄에 맞춰 백업 리포트를 생성합니다.'
+        )
+        self.report_command = ReportCommand()
+        self.stop_event = threading.Event()
+
+    def setup_args(self, parser: ArgumentParser) -> None:
+        """serve 커맨드 CLI 인자 설정 (report 커맨드 인자 포함)
+
+        Args:
+            parser: ArgumentParser 인스턴스
+        """
+        self.report_command.setup_args(parser)
+        parser.set_defaults(mode='production')
+
+        parser.add_argument(
+            '--schedule',
+            help="리포트 실행 스케줄 cron 식 (기본값: SERVE_SCHEDULE, 예: '0 22 * * *')"
+        )
+
+        parser.add_argument(
+            '--run-now',
+            action='store_true',
+            help='시작 직후 한 번 실행한 뒤 스케줄 대기'
+        )
+
+        parser.add_argument(
+            '--outbox-interval',
+            type=float,
+            default=DEFAULT_OUTBOX_INTERVAL,
+            metavar='SECONDS',
+            help=f'--queue-mail 사용 시 대기열 확인 간격 (기본값: {DEFAULT_OUTBOX_INTERVAL:.0f}초)'
+        )
+
+    def execute(self, args: Namespace) -> int:
+        """상주 실행
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+
+        Returns:
+            종료 코드 (0: 정상 종료, 1: 시작 실패)
+        """
+        try:
+            schedule = CronSchedule(args.schedule or self.config.serve_schedule)
+            # 실행 시간이 없는 식(예: '0 0 30 2 *')은 시작 시점에 거부
+            schedule.next_after(datetime.now())
+        except ScheduleError as e:
+            self.logger.error(f"✗ {e}")
+            return 1
+
+        # 내부 report 커맨드는 이 커맨드의 설정/로거를 공유
+        self.report_command.config = self.config
+        self.report_command.logger = self.logger
+
+        self.logger.info(f"serve 시작: 스케줄 '{schedule.expression}', 모드 {args.mode}")
+
+        from src.api.cassette import CassetteError
+        from src.store.job_store import JobStore
+
+        with ExitStack() as stack:
+            self._install_signal_handlers(stack)
+            # 실행 사이에 유지한 SMTP 세션은 종료 시 닫음
+            stack.callback(self.report_command.close)
+
+            # 실행 사이에 유지되는 자원 (API 세션, 작업 저장소)
+            try:
+                client = stack.enter_context(self.report_command.create_client(args))
+            except (CassetteError, ConfigError) as e:
+                self.logger.error(f"✗ {e}")
+                return 1
+            job_store = None
+            if args.store:
+                job_store = JobStore(self.config.job_store_file)
+                stack.callback(job_store.close)
+
+            if args.queue_mail:
+                self._start_outbox_worker(args.outbox_interval, stack)
+
+            def run_job(scheduled_at: datetime) -> None:
+                try:
+                    self.report_command.run_report(args, client=client, job_store=job_store)
+                except Exception as e:
+                    # 한 번의 실패로 상주 프로세스가 종료되지 않도록 기록만 함
+                    self.logger.error(f"✗ 리포트 작업 실패: {e}", exc_info=True)
+
+            if args.run_now:
+                run_job(datetime.now())
+
+            run_on_schedule(schedule, run_job, self.stop_event)
+
+        self.logger.info("serve 종료")
+        return 0
+
+    def _start_outbox_worker(self, interval: float, stack: ExitStack) -> None:
+        """발송 대기열 워커 스레드 시작 (종료 시 stack이 정리)"""
+        from src.mail.outbox import Outbox, OutboxWorker
+        from src.mail.sender import EmailSender
+
+        worker = OutboxWorker(
+            Outbox(self.config.mail_spool_dir),
+            # 재시도는 워커가 메시지별 대기 시간으로 처리하므로 발송은 한 번만 시도
+            sender_factory=lambda: EmailSender(
+                **{**self.config.get_email_sender_config(), 'max_retries': 1}
+            ),
+            max_attempts=self.config.mail_spool_max_attempts,
+            retry_delay=self.config.mail_spool_retry_delay,
+        )
+        thread = threading.Thread(
+            target=worker.run_forever,
+            args=(interval, self.stop_event),
+            name='outbox-worker',
+            daemon=True
+        )
+        thread.start()
+        # 종료 시 신호를 먼저 설정한 뒤 스레드 대기 (LIFO 순서)
+        stack.callback(thread.join)
+        stack.callback(self.stop_event.set)
+        self.logger.info(f"✓ 발송 대기열 워커 시작 ({interval:.0f}초 간격)")
+
+    def _install_signal_handlers(self, stack: ExitStack) -> None:
+        """SIGTERM/SIGINT 수신 시 종료 신호 설정 (메인 스레드에서만 가능)
+
+        종료 시 stack이 이전 핸들러를 복원합니다.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        def handle(signum, frame):
+            self.logger.info(f"종료 신호 수신 ({signal.Signals(signum).name})")
+            self.stop_event.set()
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            stack.callback(signal.signal, signum, signal.signal(signum, handle))
@@ -0,0 +1,76 @@
+"""템플릿 사전 컴파일 커맨드
+
+리포트 템플릿을 파이썬 모듈로 미리 컴파일하여 report 커맨드의 시작 비용을
+줄이는 커맨드입니다.
+"""
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from src.commands.base import BaseCommand
+
+
+# 기본 템플릿 디렉토리
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent.parent.parent / 'templates'
+
+
+class CompileTemplatesCommand(BaseCommand):
+    """템플릿 사전 컴파일 커맨드
+
+    templates/ 의 템플릿을 TEMPLATE_MODULE_DIR(또는 --output)에 컴파일합니다.
+    원본 템플릿이 바뀌면 컴파일 결과는 자동으로 무시되므로, 배포 시 다시
+    실행하면 됩니다.
+    """
+
+    def __init__(self):
+        """CompileTemplatesCommand 초기화"""
+        super().__init__(
+            name='compile-templates',
+            description='리포트 템플릿을 파이썬 모듈로 사전 컴파일합니다.'
+        )
+
+    def setup_args(self, parser: ArgumentParser) -> None:
+        """템플릿 컴파일 커맨드 CLI 인자 설정
+
+        Args:
+            parser: ArgumentParser 인스턴스
+        """
+        parser.add_argument(
+            '--output',
+            help='컴파일된 모듈 디렉토리 (지정하지 않으면 TEMPLATE_MODULE_DIR 사용)'
+        )
+
+        parser.add_argument(
+            '--verbose',
+            action='store_true',
+            help='상세 로그 출력 (DEBUG 레벨)'
+        )
+
+    def execute(self, args: Namespace) -> int:
+        """템플릿 컴파일 실행
+
+        Args:
+            args: 파싱된 커맨드 라인 인자
+
+        Returns:
+            종료 코드 (0: 성공, 1: 실패)
+        """
+        from src.report.environment import TemplateCompileError, compile_templates
+
+        module_dir = args.output or self.config.template_module_dir
+        if not module_dir:
+            self.logger.error(
+                "✗ 출력 디렉토리가 없습니다. --output 또는 TEMPLATE_MODULE_DIR을 설정하세요."
+            )
+            return 1
+
+        try:
+            count = compile_templates(DEFAULT_TEMPLATE_DIR, Path(module_dir))
+        except TemplateCompileError as e:
+            self.logger.error(f"✗ {e}")
+            return 1
+
+        self.logger.info(f"✓ 템플릿 {count}개 컴파일 완료: {module_dir}")
+        if args.output and args.output != self.config.template_module_dir:
+            self.logger.info(f"  사용하려면 TEMPLATE_MODULE_DIR={module_dir} 로 설정하세요.")
+        return 0
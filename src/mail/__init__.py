@@ -4,5 +4,9 @@ Gmail SMTP를 통한 이메일 발송 기능을 제공합니다.
 """
 
 from .sender import EmailSender, EmailSendError
+from .outbox import Outbox, OutboxError, OutboxMessage, OutboxWorker
 
-__all__ = ['EmailSender', 'EmailSendError']
+__all__ = [
+    'EmailSender', 'EmailSendError',
+    'Outbox', 'OutboxError', 'OutboxMessage', 'OutboxWorker',
+]
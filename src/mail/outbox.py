@@ -0,0 +1,405 @@
+"""메일 발송 대기열(spool) 모듈
+
+report 커맨드가 SMTP 발송을 기다리지 않도록 렌더링된 리포트를 스풀
+디렉토리에 메시지 파일로 저장하고, 별도 워커(send-queue 커맨드)가 재시도와
+함께 발송합니다. 메시지는 파일로 보관되므로 프로세스가 재시작되어도 유지됩니다.
+
+디렉토리 구조:
+    tmp/     작성 중인 메시지 (완성 후 new/로 이동)
+    new/     발송 대기 메시지
+    work/    워커가 발송 중인 메시지 (rename으로 점유)
+    failed/  최대 시도 횟수를 넘긴 메시지
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..report.artifact import RenderedReport
+from .sender import EmailSender, EmailSendError, Recipients, parse_recipients
+
+
+logger = logging.getLogger(__name__)
+
+# 스풀 하위 디렉토리
+SPOOL_SUBDIRS = ('tmp', 'new', 'work', 'failed')
+
+# 점유 후 이 시간(초)이 지나도 work/에 남은 메시지는 중단된 워커의 것으로 보고 복구
+STALE_CLAIM_SECONDS = 3600
+
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_DELAY = 3600.0
+
+
+class OutboxError(Exception):
+    """메일 발송 대기열 관련 예외"""
+    pass
+
+
+@dataclass
+class OutboxMessage:
+    """대기열에 저장되는 메일 메시지
+
+    Attributes:
+        message_id: 메시지 ID (생성 시간 순으로 정렬됨)
+        to: 수신자 이메일 주소 리스트
+        subject: 메일 제목
+        html: 리포트 HTML
+        css_inlined: HTML의 CSS가 이미 인라인되어 있는지 여부
+        created_at: 등록 시간 (epoch 초)
+        attempts: 발송 시도 횟수
+        next_attempt_at: 다음 발송 가능 시간 (epoch 초)
+        last_error: 마지막 발송 오류 메시지
+    """
+
+    message_id: str
+    to: List[str]
+    subject: str
+    html: str
+    css_inlined: bool = False
+    created_at: float = field(default_factory=time.time)
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """스풀 파일명"""
+        return f'{self.message_id}.json'
+
+    def to_report(self) -> RenderedReport:
+        """발송용 RenderedReport로 변환"""
+        return RenderedReport(html=self.html, css_inlined=self.css_inlined)
+
+
+class Outbox:
+    """스풀 디렉토리 기반 메일 발송 대기열
+
+    여러 워커가 동시에 실행되어도 메시지 점유는 원자적 rename으로 이루어지므로
+    같은 메시지를 두 번 발송하지 않습니다.
+
+    Attributes:
+        spool_dir: 스풀 디렉토리 경로
+    """
+
+    def __init__(self, spool_dir: Path):
+        """Outbox 초기화
+
+        Args:
+            spool_dir: 스풀 디렉토리 경로 (없으면 생성)
+
+        Raises:
+            OutboxError: 디렉토리 생성 실패 시
+        """
+        self.spool_dir = Path(spool_dir)
+        try:
+            for name in SPOOL_SUBDIRS:
+                (self.spool_dir / name).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise OutboxError(f"스풀 디렉토리를 만들 수 없습니다: {e}")
+
+    def _dir(self, name: str) -> Path:
+        return self.spool_dir / name
+
+    def enqueue(
+        self,
+        to_email: Recipients,
+        subject: str,
+        report: RenderedReport
+    ) -> OutboxMessage:
+        """리포트를 발송 대기열에 등록
+
+        Args:
+            to_email: 수신자 이메일 주소 또는 주소 목록
+            subject: 메일 제목
+            report: 렌더링된 리포트
+
+        Returns:
+            등록된 메시지
+
+        Raises:
+            OutboxError: 수신자가 없거나 저장 실패 시
+        """
+        recipients = parse_recipients(to_email)
+        if not recipients:
+            raise OutboxError("수신자 이메일 주소가 없습니다")
+
+        # 이름순 정렬이 등록 순서가 되도록 나노초 단위 시간으로 시작
+        now_ns = time.time_ns()
+        timestamp = time.strftime('%Y%m%d%H%M%S', time.localtime(now_ns // 10**9))
+        message = OutboxMessage(
+            message_id=f"{timestamp}-{now_ns % 10**9:09d}-{uuid.uuid4().hex[:8]}",
+            to=recipients,
+            subject=subject,
+            html=report.html,
+            css_inlined=report.css_inlined,
+        )
+        self._write(message, 'new')
+        logger.info(f"메일 대기열 등록: {message.message_id} ({len(recipients)}명)")
+        return message
+
+    def _write(self, message: OutboxMessage, target: str) -> None:
+        """메시지를 tmp/에 기록한 뒤 대상 디렉토리로 원자적으로 이동"""
+        tmp_path = self._dir('tmp') / f'{message.filename}.{os.getpid()}'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(message), f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._dir(target) / message.filename)
+        except OSError as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise OutboxError(f"메일 대기열 저장 실패: {e}")
+
+    def _read(self, path: Path) -> OutboxMessage:
+        """메시지 파일 읽기"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                return OutboxMessage(**json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            raise OutboxError(f"메일 대기열 메시지를 읽을 수 없습니다 ({path.name}): {e}")
+
+    def pending(self) -> List[str]:
+        """발송 대기 메시지 ID 목록 (등록 순)"""
+        return sorted(path.stem for path in self._dir('new').glob('*.json'))
+
+    def claim(self, message_id: str, now: Optional[float] = None) -> Optional[OutboxMessage]:
+        """발송할 메시지 점유
+
+        Args:
+            message_id: 메시지 ID
+            now: 기준 시간 (epoch 초, 기본값: 현재)
+
+        Returns:
+            점유한 메시지. 다른 워커가 먼저 점유했거나 아직 재시도 시간이
+            되지 않았으면 None
+        """
+        now = time.time() if now is None else now
+        source = self._dir('new') / f'{message_id}.json'
+        claimed = self._dir('work') / source.name
+
+        # 재시도 시간이 되지 않은 메시지는 work/로 옮기지 않음
+        # (읽을 수 없는 메시지는 점유한 뒤 failed/로 이동)
+        try:
+            queued = self._read(source)
+        except OutboxError:
+            queued = None
+        if queued is not None and queued.next_attempt_at > now:
+            return None
+
+        # rename은 ctime을 갱신하므로 점유 시간이 recover_stale()의 기준이 됨
+        try:
+            os.rename(source, claimed)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise OutboxError(f"메일 대기열 메시지 점유 실패: {e}")
+
+        try:
+            message = self._read(claimed)
+        except OutboxError as e:
+            logger.error(f"✗ {e}")
+            os.replace(claimed, self._dir('failed') / claimed.name)
+            return None
+
+        if message.next_attempt_at > now:
+            # 확인 후 점유 전에 다른 워커가 재시도 시간을 미룬 경우
+            os.rename(claimed, source)
+            return None
+
+        return message
+
+    def complete(self, message: OutboxMessage) -> None:
+        """발송 완료된 메시지 삭제"""
+        try:
+            (self._dir('work') / message.filename).unlink()
+        except FileNotFoundError:
+            pass
+
+    def release(
+        self,
+        message: OutboxMessage,
+        error: Optional[str],
+        retry_at: float
+    ) -> None:
+        """발송 실패한 메시지를 재시도 시간과 함께 대기열로 되돌림"""
+        message.last_error = error
+        message.next_attempt_at = retry_at
+        self._move_claimed(message, 'new')
+
+    def bury(self, message: OutboxMessage, error: str) -> None:
+        """최대 시도 횟수를 넘긴 메시지를 failed/로 이동"""
+        message.last_error = error
+        self._move_claimed(message, 'failed')
+
+    def _move_claimed(self, message: OutboxMessage, target: str) -> None:
+        """점유 중인 메시지를 갱신한 뒤 대상 디렉토리로 이동
+
+        work/의 파일을 먼저 갱신하고 rename으로 옮기므로, 중간에 중단되어도
+        메시지는 work/ 또는 대상 디렉토리 중 한 곳에만 남습니다 (work/에 남은
+        메시지는 recover_stale()이 복구).
+        """
+        self._write(message, 'work')
+        try:
+            os.rename(self._dir('work') / message.filename, self._dir(target) / message.filename)
+        except OSError as e:
+            raise OutboxError(f"메일 대기열 메시지 이동 실패: {e}")
+
+    def recover_stale(
+        self,
+        max_age: float = STALE_CLAIM_SECONDS,
+        now: Optional[float] = None
+    ) -> int:
+        """중단된 워커가 점유한 채 남긴 메시지를 대기열로 복구
+
+        점유 시간은 work/로 옮길 때 갱신되는 ctime으로 판단합니다. mtime은
+        rename으로 바뀌지 않으므로 오래전에 등록된 메시지를 점유 직후 복구하는
+        일이 생깁니다.
+
+        Args:
+            max_age: 점유 후 경과 시간 기준 (초)
+            now: 기준 시간 (epoch 초, 기본값: 현재)
+
+        Returns:
+            복구한 메시지 수
+        """
+        recovered = 0
+        deadline = (time.time() if now is None else now) - max_age
+        for path in self._dir('work').glob('*.json'):
+            try:
+                if path.stat().st_ctime < deadline:
+                    os.rename(path, self._dir('new') / path.name)
+                    recovered += 1
+            except OSError:
+                continue
+        if recovered:
+            logger.warning(f"⚠ 중단된 발송 메시지 {recovered}개를 대기열로 복구했습니다")
+        return recovered
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 메시지 수 ({'new': n, 'work': n, 'failed': n})"""
+        return {
+            name: sum(1 for _ in self._dir(name).glob('*.json'))
+            for name in ('new', 'work', 'failed')
+        }
+
+
+class OutboxWorker:
+    """발송 대기열 워커
+
+    대기 중인 메시지를 하나의 EmailSender(SMTP 세션)로 발송하고, 실패한
+    메시지는 지수 백오프로 다음 시도 시간을 정해 대기열에 되돌립니다.
+
+    Attributes:
+        outbox: 발송 대기열
+        max_attempts: 메시지별 최대 발송 시도 횟수 (넘으면 failed/로 이동)
+        retry_delay: 재시도 대기 기본 시간 (초, 시도마다 2배)
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        sender_factory: Callable[[], EmailSender],
+        max_attempts: int = 5,
+        retry_delay: float = 60.0
+    ):
+        """OutboxWorker 초기화
+
+        Args:
+            outbox: 발송 대기열
+            sender_factory: EmailSender 생성 함수 (발송할 메시지가 있을 때만 호출)
+            max_attempts: 메시지별 최대 발송 시도 횟수
+            retry_delay: 재시도 대기 기본 시간 (초)
+        """
+        self.outbox = outbox
+        self.sender_factory = sender_factory
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = max(0.0, retry_delay)
+
+    def _next_attempt_at(self, attempts: int, now: float) -> float:
+        return now + min(self.retry_delay * (2 ** (attempts - 1)), MAX_RETRY_DELAY)
+
+    def run_once(self, now: Optional[float] = None) -> Tuple[int, int, int]:
+        """대기 중인 메시지를 한 번 발송
+
+        Args:
+            now: 기준 시간 (epoch 초, 기본값: 현재)
+
+        Returns:
+            (발송 성공 수, 재시도 대기 수, 최종 실패 수)
+        """
+        self.outbox.recover_stale()
+
+        sent = retried = failed = 0
+        sender: Optional[EmailSender] = None
+        try:
+            for message_id in self.outbox.pending():
+                message = self.outbox.claim(message_id, now=now)
+                if message is None:
+                    continue
+
+                if sender is None:
+                    try:
+                        sender = self.sender_factory()
+                    except Exception:
+                        # 발송하지 못한 메시지는 그대로 대기열에 되돌림
+                        self.outbox.release(
+                            message, message.last_error, message.next_attempt_at
+                        )
+                        raise
+
+                message.attempts += 1
+                try:
+                    sender.send_report(message.to, message.to_report(), subject=message.subject)
+                except EmailSendError as e:
+                    if message.attempts >= self.max_attempts:
+                        self.outbox.bury(message, str(e))
+                        logger.error(
+                            f"✗ 메일 발송 최종 실패 ({message.attempts}회): "
+                            f"{message.message_id}"
+                        )
+                        failed += 1
+                    else:
+                        retry_at = self._next_attempt_at(
+                            message.attempts, time.time() if now is None else now
+                        )
+                        self.outbox.release(message, str(e), retry_at)
+                        logger.warning(
+                            f"⚠ 메일 발송 실패 ({message.attempts}/{self.max_attempts}), "
+                            f"재시도 예정: {message.message_id}"
+                        )
+                        retried += 1
+                    continue
+
+                self.outbox.complete(message)
+                logger.info(f"✓ 대기열 메일 발송 완료: {message.message_id}")
+                sent += 1
+        finally:
+            if sender is not None:
+                sender.close()
+
+        return sent, retried, failed
+
+    def run_forever(self, interval: float, stop_event: threading.Event) -> None:
+        """stop_event가 설정될 때까지 주기적으로 대기열 발송
+
+        Args:
+            interval: 대기열 확인 간격 (초)
+            stop_event: 종료 신호
+        """
+        while not stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                # 상주 워커는 설정/스풀 오류가 있어도 다음 주기에 다시 시도
+                logger.error(f"✗ 대기열 처리 실패: {e}")
+            stop_event.wait(interval)
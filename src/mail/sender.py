@@ -5,17 +5,45 @@ Gmail SMTP를 통해 백업 리포트를 HTML 형식으로 발송합니다.
 """
 
 import logging
+import re
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Sequence, Union
 
-from premailer import transform
+from ..report.artifact import RenderedReport
+from ..utils.css_inliner import CssInlineError, get_css_inliner
+from ..utils.timing import stage
 
 
 logger = logging.getLogger(__name__)
 
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_BACKOFF = 60.0
+
+# 수신자 목록 구분자 (MAIL_TO=a@example.com, b@example.com)
+_RECIPIENT_SEPARATOR = re.compile(r'[,;]')
+
+Recipients = Union[str, Sequence[str]]
+
+
+def parse_recipients(recipients: Recipients) -> List[str]:
+    """
+    수신자 목록을 정규화합니다.
+
+    Args:
+        recipients: 이메일 주소 문자열(쉼표/세미콜론 구분) 또는 주소 목록
+
+    Returns:
+        중복과 빈 값을 제거한 이메일 주소 리스트 (입력 순서 유지)
+    """
+    if isinstance(recipients, str):
+        recipients = _RECIPIENT_SEPARATOR.split(recipients)
+    return list(dict.fromkeys(r.strip() for r in recipients if r and r.strip()))
+
 
 class EmailSendError(Exception):
     """이메일 발송 관련 예외."""
@@ -32,6 +60,11 @@ class EmailSender:
         username: SMTP 인증 사용자명 (Gmail 주소)
         password: SMTP 인증 비밀번호 (Gmail 앱 비밀번호)
         from_email: 발신자 이메일 주소
+        max_retries: 발송 최대 시도 횟수
+        retry_backoff: 재시도 대기 기본 시간 (초, 시도마다 2배)
+
+    인증된 SMTP 세션은 인스턴스에 보관되어 여러 메일/리포트 발송에 재사용됩니다.
+    사용 후 close()를 호출하거나 with 문으로 사용하세요.
     """
 
     def __init__(
@@ -40,7 +73,10 @@ class EmailSender:
         smtp_port: int,
         username: str,
         password: str,
-        from_email: Optional[str] = None
+        from_email: Optional[str] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 2.0,
+        sleep: Callable[[float], None] = time.sleep
     ):
         """
         EmailSender 초기화.
@@ -51,12 +87,20 @@ class EmailSender:
             username: SMTP 인증 사용자명
             password: SMTP 인증 비밀번호
             from_email: 발신자 이메일 (미지정 시 username 사용)
+            max_retries: 발송 최대 시도 횟수 (기본값: 3)
+            retry_backoff: 재시도 대기 기본 시간 (초, 기본값: 2.0)
+            sleep: 재시도 대기 함수 (테스트용)
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.username = username
         self.password = password
         self.from_email = from_email or username
+        self.max_retries = max(1, max_retries)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self._sleep = sleep
+        self._server: Optional[smtplib.SMTP] = None
+        self._lock = threading.RLock()
 
         logger.info(
             f"EmailSender 초기화: {self.smtp_server}:{self.smtp_port}"
@@ -98,34 +142,98 @@ class EmailSender:
             logger.error(error_msg)
             raise EmailSendError(error_msg) from e
 
+    def __enter__(self) -> 'EmailSender':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        보관 중인 SMTP 세션을 종료합니다. 여러 번 호출해도 안전합니다.
+        """
+        with self._lock:
+            server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+        logger.debug("SMTP 세션 종료")
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """
+        재사용 가능한 인증 SMTP 세션을 반환합니다.
+
+        보관 중인 세션이 NOOP에 응답하면 그대로 사용하고, 끊겼으면 다시
+        연결합니다. 호출자는 self._lock을 잡고 있어야 합니다.
+
+        Returns:
+            연결 및 인증된 SMTP 객체
+
+        Raises:
+            EmailSendError: 연결 또는 인증 실패 시
+        """
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    logger.debug("SMTP 세션 재사용")
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard_connection()
+
+        self._server = self._connect()
+        return self._server
+
+    def _discard_connection(self) -> None:
+        """
+        오류가 난 SMTP 세션을 버립니다 (다음 발송 시 재연결).
+        """
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.close()
+            except OSError:
+                pass
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        재시도 전 대기 시간 (지수 백오프).
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터)
+
+        Returns:
+            대기 시간 (초)
+        """
+        return min(self.retry_backoff * (2 ** (attempt - 1)), MAX_RETRY_BACKOFF)
+
     def _transform_css_to_inline(self, html_content: str) -> str:
         """
         HTML의 CSS를 인라인 스타일로 변환합니다.
 
-        premailer의 cssutils 로깅을 억제하여 CSS 파싱 경고를 방지합니다.
+        스타일시트별 컴파일 결과를 캐시하는 공유 인라이너를 사용하므로, 같은
+        템플릿으로 만든 리포트는 CSS를 다시 파싱하지 않습니다.
 
         Args:
             html_content: 변환할 HTML 내용
 
         Returns:
             CSS가 인라인으로 변환된 HTML 문자열
-        """
-        # cssutils 로깅 레벨을 CRITICAL로 설정하여 경고 억제
-        cssutils_logger = logging.getLogger('cssutils')
-        original_level = cssutils_logger.level
-        cssutils_logger.setLevel(logging.CRITICAL)
 
+        Raises:
+            EmailSendError: 변환 실패 시
+        """
         try:
-            # CSS를 인라인 스타일로 변환
-            transformed_html = transform(html_content)
-            return transformed_html
-        finally:
-            # 원래 로깅 레벨로 복원
-            cssutils_logger.setLevel(original_level)
+            return get_css_inliner().transform(html_content)
+        except CssInlineError as e:
+            raise EmailSendError(str(e)) from e
 
     def _build_html_message(
         self,
-        to_email: str,
+        to_email: Recipients,
         subject: str,
         html_content: str
     ) -> MIMEMultipart:
@@ -133,7 +241,7 @@ class EmailSender:
         HTML 이메일 메시지를 구성합니다.
 
         Args:
-            to_email: 수신자 이메일 주소
+            to_email: 수신자 이메일 주소 또는 주소 목록
             subject: 메일 제목
             html_content: HTML 본문 내용
 
@@ -142,7 +250,7 @@ class EmailSender:
         """
         message = MIMEMultipart('alternative')
         message['From'] = self.from_email
-        message['To'] = to_email
+        message['To'] = ', '.join(parse_recipients(to_email))
         message['Subject'] = subject
 
         # HTML 파트 추가
@@ -153,48 +261,72 @@ class EmailSender:
 
     def send_html_email(
         self,
-        to_email: str,
+        to_email: Recipients,
         subject: str,
         html_content: str,
-        max_retries: int = 3
+        max_retries: Optional[int] = None
     ) -> bool:
         """
         HTML 형식의 이메일을 발송합니다.
 
+        수신자가 여러 명이어도 하나의 인증 세션에서 한 번의 트랜잭션으로
+        발송하며, 세션은 다음 발송을 위해 유지됩니다. 실패 시 지수 백오프로
+        대기한 뒤 새 세션으로 재시도합니다.
+
         Args:
-            to_email: 수신자 이메일 주소
+            to_email: 수신자 이메일 주소, 쉼표로 구분한 주소 문자열 또는 주소 목록
             subject: 메일 제목
             html_content: HTML 본문 내용
-            max_retries: 최대 재시도 횟수 (기본값: 3)
+            max_retries: 최대 시도 횟수 (미지정 시 인스턴스 설정값)
 
         Returns:
             발송 성공 여부
 
         Raises:
-            EmailSendError: 최대 재시도 후에도 발송 실패 시
+            EmailSendError: 수신자가 없거나 최대 재시도 후에도 발송 실패 시
         """
+        recipients = parse_recipients(to_email)
+        if not recipients:
+            raise EmailSendError("수신자 이메일 주소가 없습니다")
+
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        # 메시지는 한 번만 구성하여 재시도 간 재사용
+        message = self._build_html_message(recipients, subject, html_content)
+        recipient_display = ', '.join(recipients)
+
         for attempt in range(1, max_retries + 1):
             try:
                 logger.info(
-                    f"메일 발송 시도 {attempt}/{max_retries}: {to_email}"
+                    f"메일 발송 시도 {attempt}/{max_retries}: {recipient_display}"
                 )
 
-                # SMTP 서버 연결
-                server = self._connect()
-
-                # 메시지 구성
-                message = self._build_html_message(
-                    to_email, subject, html_content
+                with self._lock:
+                    server = self._get_connection()
+                    try:
+                        refused = server.send_message(message, to_addrs=recipients)
+                    except smtplib.SMTPRecipientsRefused as e:
+                        # 모든 수신자가 거부된 경우 재시도해도 결과가 같음
+                        error_msg = f"모든 수신자가 거부되었습니다: {list(e.recipients)}"
+                        logger.error(error_msg)
+                        raise EmailSendError(error_msg) from e
+                    except (smtplib.SMTPException, OSError):
+                        self._discard_connection()
+                        raise
+
+                if refused:
+                    logger.warning(f"⚠ 일부 수신자 거부: {list(refused)}")
+                logger.info(
+                    f"메일 발송 성공: {len(recipients) - len(refused)}명 ({recipient_display})"
                 )
-
-                # 메일 발송
-                server.send_message(message)
-                server.quit()
-
-                logger.info(f"메일 발송 성공: {to_email}")
                 return True
 
             except EmailSendError as e:
+                if isinstance(e.__cause__, (
+                    smtplib.SMTPAuthenticationError, smtplib.SMTPRecipientsRefused
+                )):
+                    raise
                 logger.warning(f"시도 {attempt} 실패: {e}")
                 if attempt == max_retries:
                     raise
@@ -204,11 +336,64 @@ class EmailSender:
                 if attempt == max_retries:
                     raise EmailSendError(error_msg) from e
 
+            delay = self._retry_delay(attempt)
+            logger.info(f"{delay:.1f}초 후 재시도합니다")
+            self._sleep(delay)
+
         return False
 
+    def send_report(
+        self,
+        to_email: Recipients,
+        report: RenderedReport,
+        subject: Optional[str] = None
+    ) -> bool:
+        """
+        렌더링된 리포트를 이메일로 발송합니다.
+
+        리포트가 HTML을 메모리에 가지고 있으면 그대로 사용하고, 보관 파일만
+        가리키는 리포트(RenderedReport.from_file)는 처음 필요할 때 한 번 읽습니다.
+        CSS 인라인 결과는 리포트 객체에 보관되어 재발송 시 재사용됩니다.
+
+        Args:
+            to_email: 수신자 이메일 주소 또는 주소 목록
+            report: ReportGenerator.render_report()가 반환한 리포트
+            subject: 메일 제목 (미지정 시 리포트 날짜로 구성)
+
+        Returns:
+            발송 성공 여부
+
+        Raises:
+            EmailSendError: 변환 또는 발송 실패 시
+        """
+        try:
+            # CSS를 인라인 스타일로 변환 (이메일 클라이언트 호환성)
+            # 이메일용 템플릿으로 생성된 리포트는 이미 변환되어 있으므로 생략
+            if report.css_inlined:
+                logger.info("CSS 인라인 리포트: 변환 생략")
+            else:
+                logger.info("CSS를 인라인 스타일로 변환 중...")
+            with stage('inline', cached=report.css_inlined):
+                html_content = report.email_html(self._transform_css_to_inline)
+
+            # 메일 제목 구성
+            if subject is None:
+                subject = f"[Bacula] 백업 리포트 - {report.report_date}"
+
+            # 메일 발송
+            with stage('send'):
+                return self.send_html_email(to_email, subject, html_content)
+
+        except EmailSendError:
+            raise
+        except Exception as e:
+            error_msg = f"리포트 메일 발송 실패: {e}"
+            logger.error(error_msg)
+            raise EmailSendError(error_msg) from e
+
     def send_report_email(
         self,
-        to_email: str,
+        to_email: Recipients,
         report_path,
         report_date: str
     ) -> bool:
@@ -216,7 +401,7 @@ class EmailSender:
         백업 리포트 HTML 파일을 이메일로 발송합니다.
 
         Args:
-            to_email: 수신자 이메일 주소
+            to_email: 수신자 이메일 주소 또는 주소 목록
             report_path: HTML 리포트 파일 경로 (str 또는 Path)
             report_date: 리포트 날짜 (예: 2024-01-15)
 
@@ -237,18 +422,7 @@ class EmailSender:
                 error_msg = f"리포트 파일이 존재하지 않습니다: {report_path}"
                 raise EmailSendError(error_msg)
 
-            html_content = report_path.read_text(encoding='utf-8')
-
-            # CSS를 인라인 스타일로 변환 (이메일 클라이언트 호환성)
-            logger.info("CSS를 인라인 스타일로 변환 중...")
-            html_content = self._transform_css_to_inline(html_content)
-            logger.info("CSS 변환 완료")
-
-            # 메일 제목 구성
-            subject = f"[Bacula] 백업 리포트 - {report_date}"
-
-            # 메일 발송
-            return self.send_html_email(to_email, subject, html_content)
+            report = RenderedReport.from_file(report_path)
 
         except EmailSendError:
             raise
@@ -256,3 +430,7 @@ class EmailSender:
             error_msg = f"리포트 메일 발송 실패: {e}"
             logger.error(error_msg)
             raise EmailSendError(error_msg) from e
+
+        return self.send_report(
+            to_email, report, subject=f"[Bacula] 백업 리포트 - {report_date}"
+        )
@@ -258,18 +258,16 @@ def main() -> int:
                     logger.warning("⚠ 메일 설정이 불완전합니다. 이메일 발송을 건너뜁니다.")
                     logger.warning("  .env 파일에서 SMTP 관련 설정을 확인하세요.")
                 else:
-                    # EmailSender 생성
-                    email_sender = EmailSender(**config.get_email_sender_config())
-
                     # 리포트 날짜 (파일명에서 추출 또는 현재 날짜)
                     report_date = end_period.strftime('%Y-%m-%d')
 
-                    # 메일 발송
-                    email_sender.send_report_email(
-                        to_email=config.mail_to,
-                        report_path=report_path,
-                        report_date=report_date
-                    )
+                    # EmailSender 생성 및 메일 발송
+                    with EmailSender(**config.get_email_sender_config()) as email_sender:
+                        email_sender.send_report_email(
+                            to_email=config.mail_to,
+                            report_path=report_path,
+                            report_date=report_date
+                        )
                     logger.info("✓ 이메일 발송 완료")
                     logger.info(f"  수신자: {config.mail_to}")
 
@@ -7,8 +7,38 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-
-@dataclass
+from ..utils.datetime import parse_api_datetime
+
+
+# 작업 상태 코드 분류
+SUCCESS_STATUS = 'T'
+FAILED_STATUSES = ('f', 'E')
+CANCELED_STATUS = 'A'
+RUNNING_STATUS = 'R'
+
+# 상태 코드별 표시 문자열
+STATUS_DISPLAY = {
+    'T': '성공',
+    'f': '실패',
+    'E': '에러',
+    'A': '취소됨',
+    'R': '실행 중',
+    'C': '생성됨',
+    'M': '마이그레이션됨',
+    'S': '스캔됨',
+    'F': '대기 중',
+    'e': '실패 (비치명적)',
+}
+
+# 백업 레벨별 표시 문자열
+LEVEL_DISPLAY = {
+    'F': 'Full',
+    'I': 'Incremental',
+    'D': 'Differential',
+}
+
+
+@dataclass(slots=True)
 class BackupJob:
     """백업 작업 데이터 클래스
 
@@ -53,7 +83,7 @@ class BackupJob:
         Returns:
             성공 시 True, 그 외 False
         """
-        return self.status == 'T'
+        return self.status == SUCCESS_STATUS
 
     @property
     def is_failed(self) -> bool:
@@ -62,7 +92,7 @@ class BackupJob:
         Returns:
             실패 시 True, 그 외 False
         """
-        return self.status in ('f', 'E')
+        return self.status in FAILED_STATUSES
 
     @property
     def is_canceled(self) -> bool:
@@ -71,7 +101,7 @@ class BackupJob:
         Returns:
             취소됨 시 True, 그 외 False
         """
-        return self.status == 'A'
+        return self.status == CANCELED_STATUS
 
     @property
     def is_running(self) -> bool:
@@ -80,7 +110,22 @@ class BackupJob:
         Returns:
             실행 중이면 True, 그 외 False
         """
-        return self.status == 'R'
+        return self.status == RUNNING_STATUS
+
+    @property
+    def is_report_listed(self) -> bool:
+        """리포트 표에 표시되는 작업 여부
+
+        리포트는 성공한 Full 백업과 실패/실행 중/취소된 작업만 표로 보여 줍니다.
+
+        Returns:
+            리포트 표에 표시되면 True, 그 외 False
+        """
+        if self.status == SUCCESS_STATUS:
+            return self.job_type == 'B' and self.level == 'F'
+        return self.status in FAILED_STATUSES or self.status in (
+            RUNNING_STATUS, CANCELED_STATUS
+        )
 
     @property
     def is_backup(self) -> bool:
@@ -98,19 +143,7 @@ class BackupJob:
         Returns:
             한글로 된 상태 설명
         """
-        status_map = {
-            'T': '성공',
-            'f': '실패',
-            'E': '에러',
-            'A': '취소됨',
-            'R': '실행 중',
-            'C': '생성됨',
-            'M': '마이그레이션됨',
-            'S': '스캔됨',
-            'F': '대기 중',
-            'e': '실패 (비치명적)',
-        }
-        return status_map.get(self.status, f'알 수 없음 ({self.status})')
+        return STATUS_DISPLAY.get(self.status, f'알 수 없음 ({self.status})')
 
     @property
     def level_display(self) -> str:
@@ -119,12 +152,7 @@ class BackupJob:
         Returns:
             한글로 된 백업 레벨 설명
         """
-        level_map = {
-            'F': 'Full',
-            'I': 'Incremental',
-            'D': 'Differential',
-        }
-        return level_map.get(self.level, self.level)
+        return LEVEL_DISPLAY.get(self.level, self.level)
 
     @property
     def backup_size_display(self) -> str:
@@ -190,20 +218,14 @@ class BackupJob:
             ValueError: 필수 필드가 없거나 형식이 잘못된 경우
         """
         try:
-            # 날짜/시간 파싱
-            start_time = datetime.strptime(
-                data['starttime'],
-                '%Y-%m-%d %H:%M:%S'
-            )
+            # 날짜/시간 파싱 (고정 형식 빠른 경로 + 캐시)
+            start_time = parse_api_datetime(data['starttime'])
 
             # endtime이 None이거나 빈 문자열이면 None으로 설정 (진행 중인 job)
             endtime_str = data.get('endtime')
             end_time = None
             if endtime_str:
-                end_time = datetime.strptime(
-                    endtime_str,
-                    '%Y-%m-%d %H:%M:%S'
-                )
+                end_time = parse_api_datetime(endtime_str)
 
             # 에러 메시지는 별도로 조회 필요 (여기서는 None)
             # 실제 에러 메시지는 API의 jobs/{id}/log 엔드포인트에서 조회
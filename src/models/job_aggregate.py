@@ -0,0 +1,249 @@
+"""단일 패스 작업 집계
+
+백업 작업을 한 번만 순회하여 클라이언트 × 상태 × 레벨별 작업 수, 백업 크기,
+파일 수를 집계하는 병합 가능한 집계기를 제공합니다.
+"""
+
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .backup_job import BackupJob, CANCELED_STATUS
+from .job_table import JobTable
+
+
+# 그룹 키: (클라이언트명, 상태 코드, 레벨 코드)
+GroupKey = Tuple[str, str, str]
+
+
+def _accumulate(
+    groups: Dict[GroupKey, List[int]],
+    key: GroupKey,
+    count: int,
+    size: int,
+    files: int
+) -> None:
+    """그룹 하나에 작업 수, 백업 바이트, 파일 수 누적 (없으면 생성)"""
+    entry = groups.get(key)
+    if entry is None:
+        groups[key] = [count, size, files]
+    else:
+        entry[0] += count
+        entry[1] += size
+        entry[2] += files
+
+
+class JobAggregate:
+    """클라이언트 × 상태 × 레벨 그룹 집계
+
+    각 그룹에 대해 [작업 수, 백업 바이트, 파일 수]를 보관합니다. 샤드나 일자별로
+    만든 부분 집계는 merge()로 합칠 수 있으며, 합친 결과는 전체를 한 번에
+    집계한 것과 같습니다.
+
+    Attributes:
+        groups: {(client, status, level): [count, bytes, files]} 딕셔너리
+    """
+
+    __slots__ = ('groups',)
+
+    def __init__(self):
+        """빈 집계 생성"""
+        self.groups: Dict[GroupKey, List[int]] = {}
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[BackupJob]) -> 'JobAggregate':
+        """BackupJob 이터러블 집계
+
+        Args:
+            jobs: BackupJob 이터러블
+
+        Returns:
+            JobAggregate 객체
+        """
+        aggregate = cls()
+        # observe()를 C 레벨에서 소비하여 작업당 메서드 호출 비용을 없앰
+        deque(aggregate.observe(jobs), maxlen=0)
+        return aggregate
+
+    @classmethod
+    def from_table(cls, table: JobTable) -> 'JobAggregate':
+        """JobTable 집계
+
+        행 객체를 만들지 않고 컬럼을 직접 순회합니다.
+
+        Args:
+            table: JobTable 객체
+
+        Returns:
+            JobAggregate 객체
+        """
+        aggregate = cls()
+        groups = aggregate.groups
+        for client, status, level, size, files in zip(
+            table.client_names(), table.statuses, table.levels,
+            table.backup_bytes, table.job_files
+        ):
+            _accumulate(groups, (client, chr(status), chr(level)), 1, size, files)
+        return aggregate
+
+    def add(self, job: BackupJob) -> None:
+        """작업 한 건 집계
+
+        Args:
+            job: BackupJob 객체
+        """
+        _accumulate(
+            self.groups, (job.client_name, job.status, job.level),
+            1, job.backup_bytes, job.job_files
+        )
+
+    def observe(self, jobs: Iterable[BackupJob]) -> Iterator[BackupJob]:
+        """작업을 집계하면서 그대로 전달하는 제너레이터
+
+        집계와 다른 처리(작업 분류 등)를 한 번의 순회로 함께 수행할 때 사용합니다.
+
+        Args:
+            jobs: BackupJob 이터러블
+
+        Yields:
+            입력과 동일한 BackupJob 객체
+        """
+        groups = self.groups
+        for job in jobs:
+            _accumulate(
+                groups, (job.client_name, job.status, job.level),
+                1, job.backup_bytes, job.job_files
+            )
+            yield job
+
+    def merge(self, other: 'JobAggregate') -> 'JobAggregate':
+        """다른 집계를 현재 집계에 병합
+
+        Args:
+            other: 병합할 JobAggregate
+
+        Returns:
+            병합된 자기 자신 (연쇄 호출용)
+        """
+        for key, (count, size, files) in other.groups.items():
+            _accumulate(self.groups, key, count, size, files)
+        return self
+
+    def __add__(self, other: 'JobAggregate') -> 'JobAggregate':
+        return JobAggregate().merge(self).merge(other)
+
+    def without_clients(self) -> 'JobAggregate':
+        """클라이언트 차원을 합친 상태 × 레벨 집계
+
+        그룹 수가 상태 × 레벨 조합 수로 줄어들므로, 여러 조건의 count()를
+        반복 호출할 때 먼저 변환해 두면 빠릅니다.
+
+        Returns:
+            클라이언트명이 ''로 통일된 새 JobAggregate
+        """
+        rollup = JobAggregate()
+        groups = rollup.groups
+        for (_, status, level), (count, size, files) in self.groups.items():
+            _accumulate(groups, ('', status, level), count, size, files)
+        return rollup
+
+    def _select(
+        self,
+        statuses: Optional[Sequence[str]],
+        levels: Optional[Sequence[str]],
+        exclude_canceled: bool
+    ) -> Iterator[Tuple[GroupKey, List[int]]]:
+        for key, entry in self.groups.items():
+            _, status, level = key
+            if exclude_canceled and status == CANCELED_STATUS:
+                continue
+            if statuses is not None and status not in statuses:
+                continue
+            if levels is not None and level not in levels:
+                continue
+            yield key, entry
+
+    def count(
+        self,
+        statuses: Optional[Sequence[str]] = None,
+        levels: Optional[Sequence[str]] = None,
+        exclude_canceled: bool = False
+    ) -> int:
+        """조건에 맞는 작업 수
+
+        Args:
+            statuses: 상태 코드 필터 (선택)
+            levels: 레벨 코드 필터 (선택)
+            exclude_canceled: 취소된 작업 제외 여부
+
+        Returns:
+            작업 수
+        """
+        return sum(
+            entry[0] for _, entry in self._select(statuses, levels, exclude_canceled)
+        )
+
+    def total_bytes(self, exclude_canceled: bool = False) -> int:
+        """백업 크기 합계
+
+        Args:
+            exclude_canceled: 취소된 작업 제외 여부
+
+        Returns:
+            바이트 합계
+        """
+        return sum(entry[1] for _, entry in self._select(None, None, exclude_canceled))
+
+    def total_files(self, exclude_canceled: bool = False) -> int:
+        """파일 수 합계
+
+        Args:
+            exclude_canceled: 취소된 작업 제외 여부
+
+        Returns:
+            파일 수 합계
+        """
+        return sum(entry[2] for _, entry in self._select(None, None, exclude_canceled))
+
+    def clients(self, exclude_canceled: bool = False) -> set:
+        """클라이언트명 집합
+
+        Args:
+            exclude_canceled: 취소된 작업만 있는 클라이언트 제외 여부
+
+        Returns:
+            클라이언트명 집합
+        """
+        return {key[0] for key, _ in self._select(None, None, exclude_canceled)}
+
+
+class AggregatedJobs(list):
+    """전체 집계를 함께 보관하는 작업 리스트
+
+    스트리밍 조회 시 모든 작업은 aggregate에 집계하고 리스트에는 필요한 작업만
+    남깁니다. ReportGenerator는 aggregate가 있으면 작업을 다시 집계하지 않습니다.
+
+    Attributes:
+        aggregate: 리스트에서 제외된 작업까지 포함한 전체 집계
+    """
+
+    def __init__(self, jobs: Iterable[BackupJob], aggregate: JobAggregate):
+        super().__init__(jobs)
+        self.aggregate = aggregate
+
+    @classmethod
+    def collect(
+        cls,
+        jobs: Iterable[BackupJob],
+        keep: Callable[[BackupJob], bool]
+    ) -> 'AggregatedJobs':
+        """작업을 한 번 순회하며 집계하고 keep을 만족하는 작업만 보관
+
+        Args:
+            jobs: BackupJob 이터러블 (get_jobs_iter 등)
+            keep: 리스트에 남길 작업 판별 함수
+
+        Returns:
+            AggregatedJobs 객체
+        """
+        aggregate = JobAggregate()
+        return cls([job for job in aggregate.observe(jobs) if keep(job)], aggregate)
@@ -0,0 +1,446 @@
+"""컬럼 기반 백업 작업 테이블
+
+대량의 백업 작업을 행 객체 대신 타입 배열 컬럼으로 보관하는 컨테이너를
+제공합니다. 상태/레벨/타입 코드는 1바이트, 숫자 값은 array, 반복되는 문자열은
+사전 인코딩으로 저장하여 BackupJob 리스트보다 훨씬 적은 메모리를 사용합니다.
+
+목적은 메모리 절감이며, 필터와 집계는 컬럼을 순회하는 일반 파이썬 루프입니다.
+리포트 기본 경로는 BackupJob 리스트를 사용하므로, 장기간 이력을 메모리에
+보관해야 하는 호출자가 선택적으로 사용하는 컨테이너입니다.
+"""
+
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
+
+from .backup_job import BackupJob
+from ..utils.datetime import parse_api_datetime
+
+
+# 타임스탬프 기준 시각 (naive datetime 그대로 초 단위로 변환)
+_EPOCH = datetime(1970, 1, 1)
+
+# 종료 시간이 없는 작업(실행 중)의 타임스탬프 표시값
+_NO_TIME = -1
+
+# 문자열 컬럼의 None 표시값
+_NO_STRING = -1
+
+# 필터 인자: 단일 코드 또는 코드 묶음
+CodeFilter = Optional[Union[str, Sequence[str]]]
+
+
+def _to_seconds(dt: datetime) -> int:
+    return int((dt - _EPOCH).total_seconds())
+
+
+def _from_seconds(seconds: int) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def _to_code(value: str) -> int:
+    return ord(value[0]) if value else 0
+
+
+def _code_set(codes: CodeFilter) -> Optional[Set[int]]:
+    if codes is None:
+        return None
+    if isinstance(codes, str):
+        codes = (codes,)
+    return {_to_code(code) for code in codes}
+
+
+class _StringPool:
+    """반복 문자열 사전 인코딩"""
+
+    __slots__ = ('values', 'index')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NO_STRING
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.index[value] = code
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return None if code == _NO_STRING else self.values[code]
+
+
+class JobTable:
+    """컬럼 기반 백업 작업 테이블
+
+    작업 ID, 상태, 레벨, 시간, 크기, 파일 수 등을 타입 배열로 보관합니다.
+    필터와 집계는 행 객체를 만들지 않고 필요한 컬럼만 파이썬 루프로 순회합니다.
+    행 단위 접근 시에는 BackupJob을 그때그때 생성하므로 기존 템플릿과 그대로
+    호환됩니다. JobAggregate.from_table()로 리포트 통계를 만들 수 있습니다.
+
+    Attributes:
+        job_ids: 작업 ID 컬럼
+        statuses: 상태 코드 컬럼 (1바이트)
+        levels: 레벨 코드 컬럼 (1바이트)
+        job_types: 작업 타입 코드 컬럼 (1바이트)
+        start_times: 시작 시간 컬럼 (초)
+        end_times: 종료 시간 컬럼 (초, 없으면 -1)
+        backup_bytes: 백업 크기 컬럼
+        job_files: 파일 수 컬럼
+        job_errors: 에러 수 컬럼
+    """
+
+    __slots__ = (
+        'job_ids', 'statuses', 'levels', 'job_types', 'start_times',
+        'end_times', 'backup_bytes', 'job_files', 'job_errors',
+        '_names', '_clients', '_pools', '_filesets', '_strings',
+    )
+
+    def __init__(self):
+        """빈 JobTable 생성"""
+        self.job_ids = array('q')
+        self.statuses = bytearray()
+        self.levels = bytearray()
+        self.job_types = bytearray()
+        self.start_times = array('q')
+        self.end_times = array('q')
+        self.backup_bytes = array('q')
+        self.job_files = array('q')
+        self.job_errors = array('l')
+        self._names = array('l')
+        self._clients = array('l')
+        self._pools = array('l')
+        self._filesets = array('l')
+        self._strings = _StringPool()
+
+    @classmethod
+    def from_api_rows(cls, rows: Iterable[dict]) -> 'JobTable':
+        """API 응답 딕셔너리에서 테이블 생성
+
+        Args:
+            rows: Bacula API 작업 딕셔너리 이터러블
+
+        Returns:
+            JobTable 객체
+
+        Raises:
+            ValueError: 필수 필드가 없거나 형식이 잘못된 경우
+        """
+        table = cls()
+        for row in rows:
+            table.append_api_row(row)
+        return table
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[BackupJob]) -> 'JobTable':
+        """BackupJob 이터러블에서 테이블 생성
+
+        Args:
+            jobs: BackupJob 이터러블
+
+        Returns:
+            JobTable 객체
+        """
+        table = cls()
+        for job in jobs:
+            table.append_job(job)
+        return table
+
+    def append_api_row(self, row: dict) -> None:
+        """API 응답 딕셔너리 한 건 추가
+
+        BackupJob 객체를 거치지 않고 컬럼에 바로 기록합니다. 모든 값을 먼저
+        변환한 뒤 추가하므로 실패 시 테이블은 변경되지 않습니다.
+
+        Args:
+            row: Bacula API 작업 딕셔너리
+
+        Raises:
+            ValueError: 필수 필드가 없거나 형식이 잘못된 경우
+        """
+        try:
+            job_id = int(row['jobid'])
+            name = row['name']
+            client = row['client']
+            status = _to_code(row['jobstatus'])
+            level = _to_code(row['level'])
+            start = _to_seconds(parse_api_datetime(row['starttime']))
+            endtime = row.get('endtime')
+            end = (
+                _to_seconds(parse_api_datetime(endtime))
+                if endtime else _NO_TIME
+            )
+            backup_bytes = int(row.get('jobbytes', 0))
+            job_files = int(row.get('jobfiles', 0))
+            job_errors = int(row.get('joberrors', 0))
+        except (KeyError, ValueError, TypeError) as e:
+            raise ValueError(f"API 응답 데이터 파싱 실패: {e}")
+
+        encode = self._strings.encode
+        self.job_ids.append(job_id)
+        self.statuses.append(status)
+        self.levels.append(level)
+        self.job_types.append(_to_code(row.get('type', '')))
+        self.start_times.append(start)
+        self.end_times.append(end)
+        self.backup_bytes.append(backup_bytes)
+        self.job_files.append(job_files)
+        self.job_errors.append(job_errors)
+        self._names.append(encode(name))
+        self._clients.append(encode(client))
+        self._pools.append(encode(row.get('pool')))
+        self._filesets.append(encode(row.get('fileset')))
+
+    def append_job(self, job: BackupJob) -> None:
+        """BackupJob 한 건 추가
+
+        Args:
+            job: BackupJob 객체
+        """
+        encode = self._strings.encode
+        self.job_ids.append(job.job_id)
+        self.statuses.append(_to_code(job.status))
+        self.levels.append(_to_code(job.level))
+        self.job_types.append(_to_code(job.job_type))
+        self.start_times.append(_to_seconds(job.start_time))
+        self.end_times.append(
+            _to_seconds(job.end_time) if job.end_time else _NO_TIME
+        )
+        self.backup_bytes.append(job.backup_bytes)
+        self.job_files.append(job.job_files)
+        self.job_errors.append(job.job_errors)
+        self._names.append(encode(job.job_name))
+        self._clients.append(encode(job.client_name))
+        self._pools.append(encode(job.pool_name))
+        self._filesets.append(encode(job.fileset_name))
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def __getitem__(self, index: int) -> BackupJob:
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[BackupJob]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def row(self, index: int) -> BackupJob:
+        """행 단위 BackupJob 생성
+
+        Args:
+            index: 행 번호
+
+        Returns:
+            해당 행의 BackupJob 객체 (호출 시마다 새로 생성)
+        """
+        decode = self._strings.decode
+        end = self.end_times[index]
+        job_type = self.job_types[index]
+        return BackupJob(
+            job_id=self.job_ids[index],
+            job_name=decode(self._names[index]),
+            client_name=decode(self._clients[index]),
+            status=chr(self.statuses[index]),
+            level=chr(self.levels[index]),
+            job_type=chr(job_type) if job_type else '',
+            start_time=_from_seconds(self.start_times[index]),
+            end_time=None if end == _NO_TIME else _from_seconds(end),
+            backup_bytes=self.backup_bytes[index],
+            job_files=self.job_files[index],
+            job_errors=self.job_errors[index],
+            pool_name=decode(self._pools[index]),
+            fileset_name=decode(self._filesets[index]),
+        )
+
+    def where(
+        self,
+        status: CodeFilter = None,
+        level: CodeFilter = None,
+        job_type: CodeFilter = None,
+        client: Optional[str] = None,
+        exclude_status: CodeFilter = None
+    ) -> List[int]:
+        """조건에 맞는 행 번호 조회
+
+        Args:
+            status: 상태 코드 또는 코드 묶음 (예: 'T', ('f', 'E'))
+            level: 레벨 코드 또는 코드 묶음
+            job_type: 작업 타입 코드 또는 코드 묶음
+            client: 클라이언트명
+            exclude_status: 제외할 상태 코드 또는 코드 묶음
+
+        Returns:
+            조건을 모두 만족하는 행 번호 리스트
+        """
+        conditions = []
+        for column, codes in (
+            (self.statuses, _code_set(status)),
+            (self.levels, _code_set(level)),
+            (self.job_types, _code_set(job_type)),
+        ):
+            if codes is not None:
+                conditions.append((column, codes, True))
+
+        excluded = _code_set(exclude_status)
+        if excluded is not None:
+            conditions.append((self.statuses, excluded, False))
+
+        if client is not None:
+            code = self._strings.index.get(client)
+            if code is None:
+                return []
+            conditions.append((self._clients, {code}, True))
+
+        indices: Iterable[int] = range(len(self))
+        for column, codes, include in conditions:
+            if include:
+                indices = [i for i in indices if column[i] in codes]
+            else:
+                indices = [i for i in indices if column[i] not in codes]
+        return list(indices)
+
+    def take(self, indices: Iterable[int]) -> 'JobTable':
+        """지정한 행만 포함하는 새 테이블 생성
+
+        문자열 사전은 공유하므로 복사 비용은 숫자 컬럼에 비례합니다.
+
+        Args:
+            indices: 행 번호 이터러블
+
+        Returns:
+            새 JobTable 객체
+        """
+        indices = list(indices)
+        table = JobTable()
+        table._strings = self._strings
+        for name in (
+            'job_ids', 'start_times', 'end_times', 'backup_bytes', 'job_files',
+            'job_errors', '_names', '_clients', '_pools', '_filesets',
+        ):
+            source = getattr(self, name)
+            getattr(table, name).extend(source[i] for i in indices)
+        for name in ('statuses', 'levels', 'job_types'):
+            source = getattr(self, name)
+            setattr(table, name, bytearray(source[i] for i in indices))
+        return table
+
+    def filter(self, **conditions) -> 'JobTable':
+        """조건에 맞는 행만 포함하는 새 테이블 생성
+
+        Args:
+            **conditions: where()와 동일한 조건
+
+        Returns:
+            새 JobTable 객체
+        """
+        return self.take(self.where(**conditions))
+
+    def count(self, **conditions) -> int:
+        """조건에 맞는 행 수
+
+        조건이 상태 하나뿐이면 바이트 컬럼의 count()를 사용합니다.
+
+        Args:
+            **conditions: where()와 동일한 조건
+
+        Returns:
+            행 수
+        """
+        if not conditions:
+            return len(self)
+        status = conditions.get('status')
+        if len(conditions) == 1 and isinstance(status, str):
+            return self.statuses.count(_to_code(status))
+        return len(self.where(**conditions))
+
+    def sum_bytes(self, indices: Optional[Iterable[int]] = None) -> int:
+        """백업 크기 합계
+
+        Args:
+            indices: 합산할 행 번호 (None이면 전체)
+
+        Returns:
+            바이트 합계
+        """
+        if indices is None:
+            return sum(self.backup_bytes)
+        column = self.backup_bytes
+        return sum(column[i] for i in indices)
+
+    def sum_files(self, indices: Optional[Iterable[int]] = None) -> int:
+        """백업 파일 수 합계
+
+        Args:
+            indices: 합산할 행 번호 (None이면 전체)
+
+        Returns:
+            파일 수 합계
+        """
+        if indices is None:
+            return sum(self.job_files)
+        column = self.job_files
+        return sum(column[i] for i in indices)
+
+    def status_counts(self) -> Dict[str, int]:
+        """상태 코드별 작업 수
+
+        Returns:
+            {상태 코드: 작업 수} 딕셔너리
+        """
+        return {
+            chr(code): self.statuses.count(code)
+            for code in set(self.statuses)
+        }
+
+    def level_counts(self) -> Dict[str, int]:
+        """레벨 코드별 작업 수
+
+        Returns:
+            {레벨 코드: 작업 수} 딕셔너리
+        """
+        return {
+            chr(code): self.levels.count(code)
+            for code in set(self.levels)
+        }
+
+    def client_names(self) -> Iterator[Optional[str]]:
+        """행 순서의 클라이언트명 (클라이언트가 없는 행은 None)
+
+        Yields:
+            클라이언트명 또는 None
+        """
+        decode = self._strings.decode
+        for code in self._clients:
+            yield decode(code)
+
+    def clients(self, indices: Optional[Iterable[int]] = None) -> Set[str]:
+        """클라이언트명 집합
+
+        Args:
+            indices: 대상 행 번호 (None이면 전체)
+
+        Returns:
+            클라이언트명 집합
+        """
+        column = self._clients
+        codes = set(column) if indices is None else {column[i] for i in indices}
+        return {self._strings.decode(code) for code in codes}
+
+    def memory_usage(self) -> int:
+        """컬럼 및 문자열 사전의 대략적인 메모리 사용량
+
+        Returns:
+            바이트 수
+        """
+        total = 0
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, (array, bytearray)):
+                total += sys.getsizeof(value)
+        total += sum(sys.getsizeof(value) for value in self._strings.values)
+        total += sys.getsizeof(self._strings.index)
+        return total
@@ -5,8 +5,15 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
-from .backup_job import BackupJob
+from typing import Iterable
+from .backup_job import (
+    BackupJob,
+    CANCELED_STATUS,
+    FAILED_STATUSES,
+    RUNNING_STATUS,
+    SUCCESS_STATUS,
+)
+from .job_aggregate import JobAggregate
 
 
 @dataclass
@@ -103,85 +110,78 @@ class ReportStats:
     @classmethod
     def from_jobs(
         cls,
-        jobs: List[BackupJob],
+        jobs: Iterable[BackupJob],
         start_period: datetime,
         end_period: datetime
     ) -> 'ReportStats':
         """백업 작업 리스트에서 통계 생성
 
+        JobAggregate로 작업을 한 번만 순회하여 집계합니다.
+
         Args:
-            jobs: 백업 작업 리스트
+            jobs: 백업 작업 리스트 또는 이터러블 (get_jobs_iter 등)
             start_period: 조회 시작 시간
             end_period: 조회 종료 시간
 
         Returns:
             ReportStats 객체
         """
-        # 취소된 작업 제외 (통계에 포함하지 않음)
-        active_jobs = [job for job in jobs if not job.is_canceled]
-
-        # 클라이언트 중복 제거
-        unique_clients = set(job.client_name for job in active_jobs)
-
-        # 상태별 집계
-        success_count = sum(1 for job in active_jobs if job.is_success)
-        failed_count = sum(1 for job in active_jobs if job.is_failed)
-        canceled_count = sum(1 for job in jobs if job.is_canceled)  # 원본 jobs에서 카운트
-        running_count = sum(1 for job in active_jobs if job.is_running)
-
-        # 전체 백업 크기 및 파일 수 (취소된 작업 제외)
-        total_backup_bytes = sum(job.backup_bytes for job in active_jobs)
-        total_files = sum(job.job_files for job in active_jobs)
-
-        # 백업 레벨별 통계 (취소된 작업 제외)
-        # Full 백업
-        full_jobs = [job for job in active_jobs if job.level == 'F']
-        full_total = len(full_jobs)
-        full_success = sum(1 for job in full_jobs if job.is_success)
-        full_failed = sum(1 for job in full_jobs if job.is_failed)
-
-        # Incremental 백업
-        incremental_jobs = [job for job in active_jobs if job.level == 'I']
-        incremental_total = len(incremental_jobs)
-        incremental_success = sum(1 for job in incremental_jobs if job.is_success)
-        incremental_failed = sum(1 for job in incremental_jobs if job.is_failed)
-
-        # Differential 백업
-        differential_jobs = [job for job in active_jobs if job.level == 'D']
-        differential_total = len(differential_jobs)
-        differential_success = sum(1 for job in differential_jobs if job.is_success)
-        differential_failed = sum(1 for job in differential_jobs if job.is_failed)
-
-        # 실행 중인 백업 레벨별 통계
-        running_jobs = [job for job in active_jobs if job.is_running]
-        running_full = sum(1 for job in running_jobs if job.level == 'F')
-        running_incremental = sum(1 for job in running_jobs if job.level == 'I')
-        running_differential = sum(1 for job in running_jobs if job.level == 'D')
+        return cls.from_aggregate(
+            JobAggregate.from_jobs(jobs), start_period, end_period
+        )
+
+    @classmethod
+    def from_aggregate(
+        cls,
+        aggregate: JobAggregate,
+        start_period: datetime,
+        end_period: datetime
+    ) -> 'ReportStats':
+        """단일 패스 집계 결과에서 통계 생성
+
+        취소된 작업은 canceled_count를 제외한 모든 통계에서 제외합니다.
+
+        Args:
+            aggregate: JobAggregate 객체 (부분 집계를 병합한 결과도 가능)
+            start_period: 조회 시작 시간
+            end_period: 조회 종료 시간
+
+        Returns:
+            ReportStats 객체
+        """
+        total_clients = len(aggregate.clients(exclude_canceled=True))
+        summary = aggregate.without_clients()
+
+        def count(statuses=None, levels=None):
+            return summary.count(statuses, levels, exclude_canceled=True)
+
+        success = (SUCCESS_STATUS,)
+        running = (RUNNING_STATUS,)
 
         return cls(
-            total_jobs=len(active_jobs),
-            success_count=success_count,
-            failed_count=failed_count,
-            canceled_count=canceled_count,
-            running_count=running_count,
-            total_clients=len(unique_clients),
+            total_jobs=count(),
+            success_count=count(success),
+            failed_count=count(FAILED_STATUSES),
+            canceled_count=summary.count((CANCELED_STATUS,)),
+            running_count=count(running),
+            total_clients=total_clients,
             start_period=start_period,
             end_period=end_period,
             report_time=datetime.now(),
-            total_backup_bytes=total_backup_bytes,
-            total_files=total_files,
-            full_total=full_total,
-            full_success=full_success,
-            full_failed=full_failed,
-            incremental_total=incremental_total,
-            incremental_success=incremental_success,
-            incremental_failed=incremental_failed,
-            differential_total=differential_total,
-            differential_success=differential_success,
-            differential_failed=differential_failed,
-            running_full=running_full,
-            running_incremental=running_incremental,
-            running_differential=running_differential,
+            total_backup_bytes=summary.total_bytes(exclude_canceled=True),
+            total_files=summary.total_files(exclude_canceled=True),
+            full_total=count(levels=('F',)),
+            full_success=count(success, ('F',)),
+            full_failed=count(FAILED_STATUSES, ('F',)),
+            incremental_total=count(levels=('I',)),
+            incremental_success=count(success, ('I',)),
+            incremental_failed=count(FAILED_STATUSES, ('I',)),
+            differential_total=count(levels=('D',)),
+            differential_success=count(success, ('D',)),
+            differential_failed=count(FAILED_STATUSES, ('D',)),
+            running_full=count(running, ('F',)),
+            running_incremental=count(running, ('I',)),
+            running_differential=count(running, ('D',)),
         )
 
     def __str__(self) -> str:
@@ -1,5 +1,45 @@
-"""Report generation module"""
+"""Report generation module
 
-from .generator import ReportGenerator, ReportGeneratorError
+하위 모듈(jinja2를 사용하는 generator/environment 등)은 이름을 처음 참조할 때
+임포트합니다. src.report.artifact 처럼 가벼운 모듈만 필요한 경우 jinja2를
+로드하지 않도록 하기 위함입니다.
+"""
 
-__all__ = ['ReportGenerator', 'ReportGeneratorError']
+import importlib
+from typing import Any, List
+
+# {공개 이름: 정의된 하위 모듈}
+_EXPORTS = {
+    'ReportGenerator': '.generator',
+    'ReportGeneratorError': '.generator',
+    'RenderedReport': '.artifact',
+    'EmailTemplateError': '.email_template',
+    'ensure_email_template': '.email_template',
+    'TemplateCompileError': '.environment',
+    'compile_templates': '.environment',
+    'get_environment': '.environment',
+}
+
+__all__ = [
+    'ReportGenerator',
+    'ReportGeneratorError',
+    'RenderedReport',
+    'EmailTemplateError',
+    'TemplateCompileError',
+    'compile_templates',
+    'ensure_email_template',
+    'get_environment',
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,141 @@
+"""렌더링된 리포트 산출물 모듈
+
+리포트 생성 단계와 메일 발송 단계가 같은 HTML을 주고받기 위한 산출물 객체를
+제공합니다. 보관 파일로 스트리밍한 리포트는 경로만 넘기고 본문은 메일 발송처럼
+실제로 필요할 때 읽습니다.
+"""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from .email_template import is_css_inlined
+
+
+# css_inlined 판별을 위해 파일에서 읽는 앞부분 길이 (is_css_inlined 기본값과 같음)
+CSS_MARKER_HEAD_CHARS = 4096
+
+
+class RenderedReport:
+    """렌더링된 HTML 리포트
+
+    HTML은 메모리에 넘겨받거나, 보관 파일 경로만 가지고 있다가 처음 필요할 때
+    읽습니다 (메일을 보내지 않는 실행은 리포트 본문을 메모리에 올리지 않음).
+
+    Attributes:
+        start_period: 조회 시작 시간 (선택)
+        end_period: 조회 종료 시간 (선택)
+        css_inlined: HTML의 CSS가 이미 인라인되어 있는지 여부
+        path: 보관용으로 저장된 파일 경로 (저장하지 않았으면 None)
+    """
+
+    def __init__(
+        self,
+        html: Optional[str] = None,
+        start_period: Optional[datetime] = None,
+        end_period: Optional[datetime] = None,
+        css_inlined: bool = False,
+        path: Optional[Path] = None
+    ):
+        """RenderedReport 초기화
+
+        Args:
+            html: 렌더링된 HTML (None이면 path에서 지연 로드)
+            start_period: 조회 시작 시간 (선택)
+            end_period: 조회 종료 시간 (선택)
+            css_inlined: HTML의 CSS가 이미 인라인되어 있는지 여부
+            path: 보관 파일 경로 (선택)
+
+        Raises:
+            ValueError: html과 path가 모두 없는 경우
+        """
+        if html is None and path is None:
+            raise ValueError("html 또는 path가 필요합니다")
+        self._html = html
+        self.start_period = start_period
+        self.end_period = end_period
+        self.css_inlined = css_inlined
+        self.path = Path(path) if path is not None else None
+        self._email_html: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"RenderedReport(path={self.path}, css_inlined={self.css_inlined}, "
+            f"loaded={self._html is not None})"
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path,
+        start_period: Optional[datetime] = None,
+        end_period: Optional[datetime] = None
+    ) -> 'RenderedReport':
+        """저장된 리포트 파일에서 산출물 생성 (본문은 처음 사용할 때 읽음)
+
+        Args:
+            path: 리포트 파일 경로
+            start_period: 조회 시작 시간 (선택)
+            end_period: 조회 종료 시간 (선택)
+
+        Returns:
+            RenderedReport 객체
+
+        Raises:
+            OSError: 파일 읽기 실패 시
+        """
+        path = Path(path)
+        with open(path, encoding='utf-8') as f:
+            head = f.read(CSS_MARKER_HEAD_CHARS)
+        return cls(
+            start_period=start_period,
+            end_period=end_period,
+            css_inlined=is_css_inlined(head),
+            path=path,
+        )
+
+    @property
+    def html(self) -> str:
+        """렌더링된 HTML (파일 기반이면 처음 접근할 때 읽음)
+
+        Raises:
+            OSError: 파일 읽기 실패 시
+        """
+        if self._html is None:
+            with self._lock:
+                if self._html is None:
+                    self._html = self.path.read_text(encoding='utf-8')
+        return self._html
+
+    @property
+    def loaded(self) -> bool:
+        """HTML 본문이 메모리에 있는지 여부"""
+        return self._html is not None
+
+    @property
+    def report_date(self) -> str:
+        """리포트 날짜 (YYYY-MM-DD, 조회 종료 시간 기준, 없으면 빈 문자열)"""
+        return self.end_period.strftime('%Y-%m-%d') if self.end_period else ''
+
+    def email_html(self, inline_css: Callable[[str], str]) -> str:
+        """이메일 본문용 HTML (CSS 인라인)
+
+        인라인 결과는 산출물에 보관하므로 여러 수신자나 재시도에서도 변환은
+        한 번만 수행됩니다.
+
+        Args:
+            inline_css: CSS 인라인 변환 함수
+
+        Returns:
+            CSS가 인라인된 HTML
+        """
+        if self.css_inlined:
+            return self.html
+
+        html = self.html
+        with self._lock:
+            if self._email_html is None:
+                self._email_html = inline_css(html)
+            return self._email_html
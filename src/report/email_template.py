@@ -0,0 +1,164 @@
+"""이메일용 템플릿 변형 모듈
+
+리포트 템플릿의 <style> 규칙을 빌드 시점에 한 번만 인라인 스타일로 변환한
+"이메일 준비" 템플릿을 만들고 캐시합니다. 이 변형으로 렌더링한 리포트는 이미
+CSS가 인라인되어 있으므로 발송 시 CSS 파싱(premailer)을 건너뜁니다.
+
+캐시 파일명에는 원본 템플릿 내용의 해시가 들어가므로, 원본 템플릿이 바뀔 때만
+다시 생성됩니다.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..utils.css_inliner import CssInlineError, get_css_inliner
+
+
+logger = logging.getLogger(__name__)
+
+# 변환 방식이 바뀌면 증가 (기존 캐시 무효화)
+EMAIL_TEMPLATE_VERSION = 1
+
+# 이메일 변형 템플릿을 저장하는 캐시 하위 디렉토리
+EMAIL_TEMPLATE_SUBDIR = 'email'
+
+# CSS가 이미 인라인된 리포트임을 나타내는 표식 (발송 시 변환 생략 판단에 사용)
+CSS_INLINED_MARKER = '<meta name="x-css-inlined" content="1">'
+
+# Jinja 구문 ({{ }}, {% %}, {# #})
+_JINJA_PATTERN = re.compile(r'\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}', re.DOTALL)
+_PLACEHOLDER = 'JINJAPH{:06d}X'
+_PLACEHOLDER_PATTERN = re.compile(r'JINJAPH(\d{6})X')
+
+# {(원본 경로, 크기, 수정 시간): 변형 템플릿 이름} - 같은 프로세스에서 해시 재계산 방지
+_variants: Dict[Tuple[str, int, int], str] = {}
+_lock = threading.Lock()
+
+
+class EmailTemplateError(Exception):
+    """이메일 템플릿 변형 생성 관련 예외"""
+    pass
+
+
+def inline_template_css(source: str) -> str:
+    """템플릿 소스의 <style> 규칙을 인라인 스타일로 변환
+
+    Jinja 구문은 HTML 파서가 건드리지 않도록 자리표시자로 바꾼 뒤 변환하고
+    다시 복원합니다.
+
+    Args:
+        source: Jinja 템플릿 소스
+
+    Returns:
+        CSS가 인라인된 템플릿 소스
+
+    Raises:
+        EmailTemplateError: 변환 실패 시
+    """
+    blocks = []
+
+    def protect(match: 're.Match') -> str:
+        blocks.append(match.group(0))
+        return _PLACEHOLDER.format(len(blocks) - 1)
+
+    protected = _JINJA_PATTERN.sub(protect, source)
+
+    try:
+        inlined = get_css_inliner().transform(protected)
+    except CssInlineError as e:
+        raise EmailTemplateError(f"템플릿 CSS 인라인 변환 실패: {e}")
+
+    restored = _PLACEHOLDER_PATTERN.sub(lambda m: blocks[int(m.group(1))], inlined)
+    if len(_PLACEHOLDER_PATTERN.findall(inlined)) != len(blocks):
+        raise EmailTemplateError("템플릿 CSS 인라인 변환 중 Jinja 구문이 손실되었습니다")
+
+    return restored.replace('<head>', '<head>\n' + CSS_INLINED_MARKER, 1)
+
+
+def _variant_name(template_name: str, source: str) -> str:
+    """원본 내용 해시를 포함한 변형 템플릿 파일명"""
+    digest = hashlib.sha256(
+        f'{EMAIL_TEMPLATE_VERSION}\0{source}'.encode('utf-8')
+    ).hexdigest()[:16]
+    stem, _, suffix = template_name.rpartition('.')
+    return f'{stem}.{digest}.email.{suffix}'
+
+
+def ensure_email_template(
+    template_dir: Path,
+    template_name: str,
+    cache_dir: Path
+) -> str:
+    """이메일 변형 템플릿 생성 (캐시가 있으면 재사용)
+
+    Args:
+        template_dir: 원본 템플릿 디렉토리
+        template_name: 원본 템플릿 파일명
+        cache_dir: 변형 템플릿을 저장할 디렉토리
+
+    Returns:
+        cache_dir 안의 변형 템플릿 파일명
+
+    Raises:
+        EmailTemplateError: 원본 읽기, 변환 또는 저장 실패 시
+    """
+    source_path = Path(template_dir) / template_name
+    cache_dir = Path(cache_dir)
+    try:
+        stat = source_path.stat()
+    except OSError as e:
+        raise EmailTemplateError(f"템플릿 파일을 읽을 수 없습니다: {e}")
+
+    key = (str(source_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    name = _variants.get(key)
+    if name is not None and (cache_dir / name).exists():
+        return name
+
+    with _lock:
+        source = source_path.read_text(encoding='utf-8')
+        name = _variant_name(template_name, source)
+        target = cache_dir / name
+
+        if not target.exists():
+            inlined = inline_template_css(source)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = target.with_suffix(target.suffix + '.tmp')
+                tmp_path.write_text(inlined, encoding='utf-8')
+                tmp_path.replace(target)
+            except OSError as e:
+                raise EmailTemplateError(f"이메일 템플릿 저장 실패: {e}")
+            _remove_stale_variants(cache_dir, template_name, keep=name)
+            logger.info(f"이메일용 템플릿 생성 (CSS 인라인): {target}")
+
+        _variants[key] = name
+        return name
+
+
+def _remove_stale_variants(cache_dir: Path, template_name: str, keep: str) -> None:
+    """이전 원본으로 만든 변형 템플릿 삭제"""
+    stem, _, suffix = template_name.rpartition('.')
+    for path in cache_dir.glob(f'{stem}.*.email.{suffix}'):
+        if path.name != keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def is_css_inlined(html_content: str, head_limit: Optional[int] = 4096) -> bool:
+    """리포트 HTML이 이미 CSS 인라인 상태인지 확인
+
+    Args:
+        html_content: 리포트 HTML
+        head_limit: 표식을 찾을 앞부분 길이 (None이면 전체)
+
+    Returns:
+        이메일 변형 템플릿으로 렌더링된 리포트이면 True
+    """
+    head = html_content if head_limit is None else html_content[:head_limit]
+    return CSS_INLINED_MARKER in head
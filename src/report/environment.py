@@ -0,0 +1,230 @@
+"""Jinja2 환경 관리 모듈
+
+프로세스 전역에서 공유하는 Jinja2 환경과 템플릿 컴파일 캐시를 제공합니다.
+
+- 같은 템플릿 디렉토리에 대해서는 하나의 Environment를 재사용하므로, 장시간
+  실행되는 프로세스는 템플릿이 바뀌지 않는 한 다시 컴파일하지 않습니다.
+- 디스크 바이트코드 캐시(FileSystemBytecodeCache)를 사용하면 새 프로세스도
+  템플릿 파싱/컴파일을 건너뜁니다.
+- compile_templates()로 템플릿을 미리 파이썬 모듈로 컴파일해 두면
+  ModuleLoader로 바로 로드합니다. 원본 템플릿이 바뀌면 자동으로 무시됩니다.
+- serve처럼 오래 실행되는 프로세스도 수정된 템플릿을 반영합니다. 원본 로더는
+  auto_reload로 수정 시간을 확인하고, 사전 컴파일 모듈을 쓰는 환경은
+  get_environment() 호출 때마다 원본과 비교해 바뀌었으면 원본 로더로 전환합니다.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# 컴파일된 모듈 디렉토리에 기록하는 원본 템플릿 정보 파일명
+SOURCE_STAMP_FILE = 'templates.stamp.json'
+
+# 원본 템플릿 파일 확장자
+TEMPLATE_EXTENSIONS = ('html',)
+
+_EnvKey = Tuple[str, Optional[str], Optional[str]]
+
+_environments: Dict[_EnvKey, Environment] = {}
+# 사전 컴파일 모듈을 로드하는 환경의 키 (조회 때마다 원본 변경 여부 확인)
+_module_backed: Set[_EnvKey] = set()
+_lock = threading.Lock()
+
+
+class TemplateCompileError(Exception):
+    """템플릿 사전 컴파일 관련 예외"""
+    pass
+
+
+def get_environment(
+    template_dir: Path,
+    cache_dir: Optional[Path] = None,
+    module_dir: Optional[Path] = None
+) -> Environment:
+    """공유 Jinja2 환경 조회 (없으면 생성)
+
+    Args:
+        template_dir: 템플릿 디렉토리 경로
+        cache_dir: 바이트코드 캐시 디렉토리. None이면 디스크 캐시 미사용
+        module_dir: 사전 컴파일된 템플릿 모듈 디렉토리 (선택)
+
+    Returns:
+        같은 인자에 대해 동일한 Environment 객체. 사전 컴파일 이후 원본
+        템플릿이 바뀐 경우에만 원본 로더를 쓰는 새 객체
+    """
+    key = (
+        str(Path(template_dir).resolve()),
+        str(cache_dir) if cache_dir else None,
+        str(module_dir) if module_dir else None,
+    )
+    env = _environments.get(key)
+    if env is not None and not _is_module_stale(key, template_dir, module_dir):
+        return env
+
+    with _lock:
+        env = _environments.get(key)
+        if env is not None and _is_module_stale(key, template_dir, module_dir):
+            logger.info(f"사전 컴파일 이후 원본 템플릿 변경, 원본 템플릿 사용: {template_dir}")
+            env = None
+        if env is None:
+            env = _create_environment(Path(template_dir), cache_dir, module_dir)
+            _environments[key] = env
+            if isinstance(env.loader, ChoiceLoader):
+                _module_backed.add(key)
+            else:
+                _module_backed.discard(key)
+        return env
+
+
+def _is_module_stale(
+    key: _EnvKey,
+    template_dir: Path,
+    module_dir: Optional[Path]
+) -> bool:
+    """사전 컴파일 모듈을 쓰는 환경의 원본 템플릿이 바뀌었는지 확인
+
+    ModuleLoader로 로드한 템플릿은 auto_reload 대상이 아니므로 환경을 조회할
+    때마다 원본 템플릿의 크기/수정 시간을 비교합니다.
+    """
+    if key not in _module_backed:
+        return False
+    return not is_compiled_fresh(Path(template_dir), Path(module_dir))
+
+
+def clear_environments() -> None:
+    """공유 환경 초기화 (테스트 및 설정 변경 시 사용)"""
+    with _lock:
+        _environments.clear()
+        _module_backed.clear()
+
+
+def _create_environment(
+    template_dir: Path,
+    cache_dir: Optional[Path],
+    module_dir: Optional[Path]
+) -> Environment:
+    """Jinja2 환경 생성
+
+    Args:
+        template_dir: 템플릿 디렉토리 경로
+        cache_dir: 바이트코드 캐시 디렉토리 (선택)
+        module_dir: 사전 컴파일된 템플릿 모듈 디렉토리 (선택)
+
+    Returns:
+        Environment 객체
+    """
+    loader = FileSystemLoader(str(template_dir))
+    if module_dir and is_compiled_fresh(template_dir, Path(module_dir)):
+        # 사전 컴파일 모듈을 우선 사용하고, 없는 템플릿만 원본에서 로드
+        loader = ChoiceLoader([ModuleLoader(str(module_dir)), loader])
+        logger.debug(f"사전 컴파일 템플릿 사용: {module_dir}")
+    elif module_dir:
+        logger.debug(f"사전 컴파일 템플릿이 없거나 오래되어 원본 사용: {module_dir}")
+
+    bytecode_cache = None
+    if cache_dir:
+        try:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except OSError as e:
+            logger.warning(f"템플릿 바이트코드 캐시 디렉토리 생성 실패, 캐시 미사용: {e}")
+
+    # auto_reload: 원본 로더의 템플릿은 조회할 때마다 수정 시간을 확인
+    return Environment(
+        loader=loader,
+        autoescape=True,
+        auto_reload=True,
+        bytecode_cache=bytecode_cache
+    )
+
+
+def _source_stamp(template_dir: Path) -> Dict[str, list]:
+    """원본 템플릿의 크기/수정 시간 정보
+
+    Args:
+        template_dir: 템플릿 디렉토리 경로
+
+    Returns:
+        {템플릿 상대 경로: [크기, 수정 시간(ns)]} 딕셔너리
+    """
+    stamp = {}
+    for extension in TEMPLATE_EXTENSIONS:
+        for path in template_dir.rglob(f'*.{extension}'):
+            stat = path.stat()
+            stamp[path.relative_to(template_dir).as_posix()] = [
+                stat.st_size, stat.st_mtime_ns
+            ]
+    return stamp
+
+
+def is_compiled_fresh(template_dir: Path, module_dir: Path) -> bool:
+    """사전 컴파일 모듈이 현재 원본 템플릿과 일치하는지 확인
+
+    Args:
+        template_dir: 템플릿 디렉토리 경로
+        module_dir: 사전 컴파일된 템플릿 모듈 디렉토리
+
+    Returns:
+        컴파일 이후 원본 템플릿이 바뀌지 않았으면 True
+    """
+    stamp_path = Path(module_dir) / SOURCE_STAMP_FILE
+    try:
+        recorded = json.loads(stamp_path.read_text(encoding='utf-8'))
+        return recorded == _source_stamp(Path(template_dir))
+    except (OSError, ValueError):
+        return False
+
+
+def compile_templates(template_dir: Path, module_dir: Path) -> int:
+    """템플릿을 파이썬 모듈로 사전 컴파일
+
+    Args:
+        template_dir: 템플릿 디렉토리 경로
+        module_dir: 컴파일된 모듈을 저장할 디렉토리
+
+    Returns:
+        컴파일된 템플릿 수
+
+    Raises:
+        TemplateCompileError: 컴파일 또는 저장 실패 시
+    """
+    template_dir = Path(template_dir)
+    module_dir = Path(module_dir)
+    env = Environment(loader=FileSystemLoader(str(template_dir)), autoescape=True)
+    stamp = _source_stamp(template_dir)
+
+    compiled = []
+    try:
+        module_dir.mkdir(parents=True, exist_ok=True)
+        env.compile_templates(
+            str(module_dir),
+            extensions=TEMPLATE_EXTENSIONS,
+            zip=None,
+            log_function=compiled.append,
+            ignore_errors=False
+        )
+        (module_dir / SOURCE_STAMP_FILE).write_text(
+            json.dumps(stamp, sort_keys=True), encoding='utf-8'
+        )
+    except Exception as e:
+        raise TemplateCompileError(f"템플릿 사전 컴파일 실패: {e}")
+
+    count = sum(1 for message in compiled if message.startswith('Compiled'))
+    logger.info(f"템플릿 사전 컴파일 완료: {count}개 -> {module_dir}")
+
+    # 새로 컴파일된 모듈을 반영하도록 기존 공유 환경 폐기
+    clear_environments()
+    return count
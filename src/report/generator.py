@@ -4,19 +4,51 @@ HTML 백업 리포트를 생성하는 기능을 제공합니다.
 """
 
 import logging
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import List
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+from jinja2 import Environment, Template, TemplateNotFound
 from datetime import datetime
 
-from ..models.backup_job import BackupJob
+from ..models.backup_job import (
+    BackupJob,
+    CANCELED_STATUS,
+    FAILED_STATUSES,
+    RUNNING_STATUS,
+    SUCCESS_STATUS,
+)
+from ..models.job_aggregate import AggregatedJobs, JobAggregate
 from ..models.report_stats import ReportStats
 from ..utils.config import Config
 from ..utils.datetime import format_timestamp
+from ..utils.timing import stage
+from .artifact import RenderedReport
+from .email_template import (
+    EMAIL_TEMPLATE_SUBDIR,
+    EmailTemplateError,
+    ensure_email_template,
+    is_css_inlined,
+)
+from .environment import get_environment
+from .view_models import JobView, JobViewCache
 
 
 logger = logging.getLogger(__name__)
 
+# 리포트 템플릿 파일명
+REPORT_TEMPLATE = 'report_template.html'
+
+# 스트리밍 렌더링 시 한 번에 모아 쓰는 Jinja 출력 조각 수
+STREAM_CHUNK_BUFFER = 64
+
+# 리포트 파일 쓰기 버퍼 크기 (바이트)
+WRITE_BUFFER_SIZE = 256 * 1024
+
+# 새로 만드는 리포트 파일 권한
+DEFAULT_FILE_MODE = 0o644
+
 
 class ReportGeneratorError(Exception):
     """리포트 생성 관련 예외"""
@@ -32,14 +64,18 @@ class ReportGenerator:
         config: 애플리케이션 설정 객체
         template_dir: 템플릿 디렉토리 경로
         output_dir: 리포트 출력 디렉토리 경로
-        jinja_env: Jinja2 환경 객체
+        jinja_env: Jinja2 환경 객체 (프로세스 전역 공유)
+        view_cache: 작업별 표시 값(JobView) 캐시
+        email_ready: 이메일용 템플릿 변형(CSS 인라인) 사용 여부
     """
 
     def __init__(
         self,
         config: Config,
         template_dir: str = None,
-        output_dir: str = None
+        output_dir: str = None,
+        view_cache: JobViewCache = None,
+        email_ready: bool = None
     ):
         """ReportGenerator 초기화
 
@@ -47,8 +83,14 @@ class ReportGenerator:
             config: 애플리케이션 설정 객체
             template_dir: 템플릿 디렉토리 경로. None이면 기본 경로 사용
             output_dir: 출력 디렉토리 경로. None이면 기본 경로 사용
+            view_cache: JobView 캐시. None이면 새로 생성
+            email_ready: 이메일용 템플릿 변형 사용 여부. None이면 설정값 사용
         """
         self.config = config
+        self.view_cache = view_cache if view_cache is not None else JobViewCache()
+        self.email_ready = (
+            config.report_email_ready if email_ready is None else email_ready
+        )
         # 프로젝트 루트 기준 경로 설정
         project_root = Path(__file__).parent.parent.parent
 
@@ -65,12 +107,9 @@ class ReportGenerator:
         # 출력 디렉토리 생성
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Jinja2 환경 설정
+        # 프로세스 전역 Jinja2 환경 사용 (템플릿 컴파일 결과 재사용)
         try:
-            self.jinja_env = Environment(
-                loader=FileSystemLoader(str(self.template_dir)),
-                autoescape=True
-            )
+            self.jinja_env = self._get_environment()
             logger.info(
                 f"ReportGenerator 초기화: "
                 f"template={self.template_dir}, "
@@ -81,7 +120,7 @@ class ReportGenerator:
 
     def generate_report(
         self,
-        jobs: List[BackupJob],
+        jobs: Iterable[BackupJob],
         start_period: datetime,
         end_period: datetime,
         filename: str = None
@@ -89,9 +128,12 @@ class ReportGenerator:
         """백업 리포트 생성
 
         백업 작업 리스트를 받아 HTML 리포트를 생성합니다.
+        작업은 한 번만 순회하므로 이터러블을 넘기면 리포트 표에 표시되는
+        작업만 메모리에 유지됩니다. HTML은 문자열로 만들지 않고 임시 파일에
+        스트리밍한 뒤 원자적으로 교체합니다.
 
         Args:
-            jobs: 백업 작업 리스트
+            jobs: 백업 작업 리스트 또는 이터러블 (get_jobs_iter 등)
             start_period: 조회 시작 시간
             end_period: 조회 종료 시간
             filename: 출력 파일명. None이면 자동 생성
@@ -103,46 +145,20 @@ class ReportGenerator:
             ReportGeneratorError: 리포트 생성 실패 시
         """
         try:
-            logger.info(f"리포트 생성 시작: {len(jobs)}개 작업")
-
-            # 통계 생성
-            stats = ReportStats.from_jobs(jobs, start_period, end_period)
-            logger.debug(f"통계 생성 완료: {stats}")
-
-            # 작업 분류 (type='B'인 Backup 작업만 포함, Restore 작업 제외)
-            # Phase 10: Full 백업만 성공 목록에 포함
-            success_jobs = [
-                job for job in jobs
-                if job.is_success and job.is_backup and job.level == 'F'
-            ]
-            failed_jobs = [job for job in jobs if job.is_failed]
-            running_jobs = [job for job in jobs if job.is_running]
-            canceled_jobs = [job for job in jobs if job.is_canceled]
-
-            logger.debug(
-                f"작업 분류: success={len(success_jobs)}, "
-                f"failed={len(failed_jobs)}, "
-                f"running={len(running_jobs)}, "
-                f"canceled={len(canceled_jobs)}"
-            )
-
-            # 템플릿 렌더링
-            html_content = self._render_template(
-                stats=stats,
-                success_jobs=success_jobs,
-                failed_jobs=failed_jobs,
-                running_jobs=running_jobs,
-                canceled_jobs=canceled_jobs
-            )
+            with stage('stats'):
+                context = self._build_context(jobs, start_period, end_period)
 
             # 파일명 생성
             if filename is None:
                 timestamp = format_timestamp()
                 filename = f"mail_{timestamp}.html"
 
-            # 파일 저장
+            # 렌더링 결과를 임시 파일에 스트리밍한 뒤 원자적으로 교체
             output_path = self.output_dir / filename
-            self._save_report(output_path, html_content)
+            template = self._get_template()
+            # 스트리밍 렌더링은 파일 쓰기와 함께 진행되므로 write 단계로 계측
+            with stage('write', streamed=True):
+                self._stream_to_file(output_path, template, context)
 
             logger.info(f"리포트 생성 완료: {output_path}")
             return str(output_path.absolute())
@@ -151,77 +167,371 @@ class ReportGenerator:
             logger.error(f"리포트 생성 실패: {e}", exc_info=True)
             raise ReportGeneratorError(f"리포트 생성 실패: {e}")
 
-    def _render_template(
+    def render_report(
         self,
-        stats: ReportStats,
-        success_jobs: List[BackupJob],
-        failed_jobs: List[BackupJob],
-        running_jobs: List[BackupJob],
-        canceled_jobs: List[BackupJob]
-    ) -> str:
-        """템플릿 렌더링
+        jobs: Iterable[BackupJob],
+        start_period: datetime,
+        end_period: datetime,
+        filename: str = None,
+        archive: bool = True,
+        keep_html: bool = False
+    ) -> RenderedReport:
+        """백업 리포트 렌더링
+
+        keep_html이면 HTML을 메모리에 렌더링하고, archive이면 같은 문자열로 보관
+        파일을 저장합니다 (메일 발송 시 본문을 파일에서 다시 읽지 않음).
+        keep_html이 아니고 archive이면 HTML을 문자열로 만들지 않고 보관 파일에
+        스트리밍(원자적 교체)한 뒤, 본문을 처음 사용할 때 파일에서 읽는
+        RenderedReport를 반환합니다. 메일을 보내지 않는 실행은 리포트 전체를
+        메모리에 올리지 않습니다.
 
         Args:
-            stats: 통계 객체
-            success_jobs: 성공한 작업 리스트
-            failed_jobs: 실패한 작업 리스트
-            running_jobs: 실행 중인 작업 리스트
-            canceled_jobs: 취소된 작업 리스트
+            jobs: 백업 작업 리스트 또는 이터러블
+            start_period: 조회 시작 시간
+            end_period: 조회 종료 시간
+            filename: 보관 파일명. None이면 자동 생성
+            archive: 보관용 파일 저장 여부
+            keep_html: 렌더링된 HTML을 메모리에 유지할지 여부 (archive가 아니면 항상 유지)
 
         Returns:
-            렌더링된 HTML 문자열
+            RenderedReport 객체
 
         Raises:
-            ReportGeneratorError: 템플릿 로드 또는 렌더링 실패 시
+            ReportGeneratorError: 리포트 생성 실패 시
         """
         try:
-            template = self.jinja_env.get_template('report_template.html')
-
-            # Baculum 웹 URL 구성 (설정이 있는 경우에만)
-            baculum_web_url = None
-            if self.config.has_baculum_web_config():
-                baculum_web_url = (
-                    f"http://{self.config.baculum_web_host}:"
-                    f"{self.config.baculum_web_port}"
+            with stage('stats'):
+                context = self._build_context(jobs, start_period, end_period)
+            template = self._get_template()
+
+            html_content = None
+            if keep_html or not archive:
+                try:
+                    with stage('render'):
+                        html_content = template.render(**context)
+                except Exception as e:
+                    raise ReportGeneratorError(f"템플릿 렌더링 실패: {e}")
+
+            if not archive:
+                logger.info("리포트 생성 완료 (메모리)")
+                return RenderedReport(
+                    html=html_content,
+                    start_period=start_period,
+                    end_period=end_period,
+                    css_inlined=is_css_inlined(html_content),
+                )
+
+            if filename is None:
+                filename = f"mail_{format_timestamp()}.html"
+            output_path = self.output_dir / filename
+
+            if html_content is not None:
+                # 메모리에 렌더링한 문자열을 그대로 보관 파일로 저장
+                with stage('write'):
+                    self._write_atomic(output_path, lambda f: f.write(html_content))
+                logger.info(f"리포트 생성 완료: {output_path}")
+                return RenderedReport(
+                    html=html_content,
+                    start_period=start_period,
+                    end_period=end_period,
+                    css_inlined=is_css_inlined(html_content),
+                    path=output_path.absolute(),
                 )
 
-            html_content = template.render(
-                stats=stats,
-                success_jobs=success_jobs,
-                failed_jobs=failed_jobs,
-                running_jobs=running_jobs,
-                canceled_jobs=canceled_jobs,
-                baculum_web_url=baculum_web_url
+            # 스트리밍 렌더링은 파일 쓰기와 함께 진행되므로 write 단계로 계측
+            with stage('write', streamed=True):
+                self._stream_to_file(output_path, template, context)
+            logger.info(f"리포트 생성 완료: {output_path}")
+
+            return RenderedReport.from_file(
+                output_path.absolute(), start_period=start_period, end_period=end_period
             )
 
-            logger.debug("템플릿 렌더링 완료")
-            return html_content
+        except ReportGeneratorError as e:
+            logger.error(f"리포트 생성 실패: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"리포트 생성 실패: {e}", exc_info=True)
+            raise ReportGeneratorError(f"리포트 생성 실패: {e}")
 
+    def render_to_stream(
+        self,
+        jobs: Iterable[BackupJob],
+        start_period: datetime,
+        end_period: datetime,
+        stream: TextIO
+    ) -> None:
+        """백업 리포트를 스트림에 렌더링
+
+        HTML 전체를 문자열로 만들지 않고 렌더링 조각을 바로 기록합니다.
+        소켓은 socket.makefile('w', encoding='utf-8')로 감싸서 넘기면 됩니다.
+
+        Args:
+            jobs: 백업 작업 리스트 또는 이터러블
+            start_period: 조회 시작 시간
+            end_period: 조회 종료 시간
+            stream: 쓰기 가능한 텍스트 스트림
+
+        Raises:
+            ReportGeneratorError: 리포트 렌더링 실패 시
+        """
+        try:
+            context = self._build_context(jobs, start_period, end_period)
+            self._stream_template(self._get_template(), context, stream)
+        except ReportGeneratorError:
+            raise
+        except Exception as e:
+            logger.error(f"리포트 렌더링 실패: {e}", exc_info=True)
+            raise ReportGeneratorError(f"리포트 렌더링 실패: {e}")
+
+    def _build_context(
+        self,
+        jobs: Iterable[BackupJob],
+        start_period: datetime,
+        end_period: datetime
+    ) -> Dict[str, Any]:
+        """템플릿 컨텍스트 생성
+
+        통계 집계와 작업 분류를 한 번의 순회로 처리한 뒤 표시용 뷰로 변환합니다.
+        AggregatedJobs를 받으면 보관된 전체 집계를 사용하고 작업은 분류만 합니다.
+
+        Args:
+            jobs: 백업 작업 리스트, 이터러블 또는 AggregatedJobs
+            start_period: 조회 시작 시간
+            end_period: 조회 종료 시간
+
+        Returns:
+            템플릿 변수 딕셔너리
+        """
+        if isinstance(jobs, AggregatedJobs):
+            aggregate = jobs.aggregate
+            rows: Iterable[BackupJob] = jobs
+        else:
+            aggregate = JobAggregate()
+            rows = aggregate.observe(jobs)
+
+        success_jobs: List[BackupJob] = []
+        failed_jobs: List[BackupJob] = []
+        running_jobs: List[BackupJob] = []
+        canceled_jobs: List[BackupJob] = []
+
+        for job in rows:
+            status = job.status
+            if status == SUCCESS_STATUS:
+                # 작업 분류 (type='B'인 Backup 작업만 포함, Restore 작업 제외)
+                # Phase 10: Full 백업만 성공 목록에 포함
+                if job.job_type == 'B' and job.level == 'F':
+                    success_jobs.append(job)
+            elif status in FAILED_STATUSES:
+                failed_jobs.append(job)
+            elif status == RUNNING_STATUS:
+                running_jobs.append(job)
+            elif status == CANCELED_STATUS:
+                canceled_jobs.append(job)
+
+        logger.info(f"리포트 생성 시작: {aggregate.count()}개 작업")
+
+        # 통계 생성
+        stats = ReportStats.from_aggregate(aggregate, start_period, end_period)
+        logger.debug(f"통계 생성 완료: {stats}")
+
+        logger.debug(
+            f"작업 분류: success={len(success_jobs)}, "
+            f"failed={len(failed_jobs)}, "
+            f"running={len(running_jobs)}, "
+            f"canceled={len(canceled_jobs)}"
+        )
+
+        # 표시 값을 미리 포맷한 뷰로 변환
+        build_views = self.view_cache.build_many
+        return self._template_context(
+            stats=stats,
+            success_jobs=build_views(success_jobs),
+            failed_jobs=build_views(failed_jobs),
+            running_jobs=build_views(running_jobs),
+            canceled_jobs=build_views(canceled_jobs)
+        )
+
+    def _template_context(
+        self,
+        stats: ReportStats,
+        success_jobs: List[JobView],
+        failed_jobs: List[JobView],
+        running_jobs: List[JobView],
+        canceled_jobs: List[JobView]
+    ) -> Dict[str, Any]:
+        """템플릿 변수 딕셔너리 구성
+
+        Args:
+            stats: 통계 객체
+            success_jobs: 성공한 작업 뷰 리스트
+            failed_jobs: 실패한 작업 뷰 리스트
+            running_jobs: 실행 중인 작업 뷰 리스트
+            canceled_jobs: 취소된 작업 뷰 리스트
+
+        Returns:
+            템플릿 변수 딕셔너리
+        """
+        # Baculum 웹 URL 구성 (설정이 있는 경우에만)
+        baculum_web_url = None
+        if self.config.has_baculum_web_config():
+            baculum_web_url = (
+                f"http://{self.config.baculum_web_host}:"
+                f"{self.config.baculum_web_port}"
+            )
+
+        return {
+            'stats': stats,
+            'success_jobs': success_jobs,
+            'failed_jobs': failed_jobs,
+            'running_jobs': running_jobs,
+            'canceled_jobs': canceled_jobs,
+            'baculum_web_url': baculum_web_url,
+        }
+
+    def _get_template(self) -> Template:
+        """리포트 템플릿 로드
+
+        email_ready이면 CSS가 인라인된 이메일용 변형을 사용하고, 변형 생성에
+        실패하면 원본 템플릿으로 대체합니다.
+
+        Returns:
+            Jinja2 Template 객체
+
+        Raises:
+            ReportGeneratorError: 템플릿 파일이 없을 때
+        """
+        if self.email_ready:
+            template = self._get_email_template()
+            if template is not None:
+                return template
+
+        try:
+            # 사전 컴파일 이후 원본 템플릿이 바뀌었으면 원본 로더 환경으로 교체됨
+            self.jinja_env = self._get_environment()
+            return self.jinja_env.get_template(REPORT_TEMPLATE)
         except TemplateNotFound as e:
             raise ReportGeneratorError(
                 f"템플릿 파일을 찾을 수 없습니다: {e}. "
                 f"템플릿 디렉토리: {self.template_dir}"
             )
+
+    def _get_environment(self) -> Environment:
+        """공유 Jinja2 환경 조회
+
+        Returns:
+            Jinja2 Environment 객체
+        """
+        return get_environment(
+            self.template_dir,
+            cache_dir=self.config.template_cache_dir,
+            module_dir=self.config.template_module_dir
+        )
+
+    def _get_email_template(self) -> Optional[Template]:
+        """이메일용 템플릿 변형 로드 (원본이 바뀐 경우에만 다시 생성)
+
+        Returns:
+            Jinja2 Template 객체. 변형 생성 실패 시 None
+        """
+        cache_dir = self.config.template_cache_dir
+        email_dir = (
+            Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / 'baculum_report'
+        ) / EMAIL_TEMPLATE_SUBDIR
+
+        try:
+            name = ensure_email_template(self.template_dir, REPORT_TEMPLATE, email_dir)
+            env = get_environment(email_dir, cache_dir=cache_dir)
+            return env.get_template(name)
+        except (EmailTemplateError, TemplateNotFound) as e:
+            logger.warning(f"⚠ 이메일용 템플릿 사용 불가, 원본 템플릿 사용: {e}")
+            return None
+
+    def _stream_template(
+        self,
+        template: Template,
+        context: Dict[str, Any],
+        stream: TextIO
+    ) -> None:
+        """템플릿 출력 조각을 스트림에 기록
+
+        Args:
+            template: Jinja2 Template 객체
+            context: 템플릿 변수 딕셔너리
+            stream: 쓰기 가능한 텍스트 스트림
+
+        Raises:
+            ReportGeneratorError: 렌더링 실패 시
+        """
+        try:
+            template_stream = template.stream(**context)
+            template_stream.enable_buffering(STREAM_CHUNK_BUFFER)
+            template_stream.dump(stream)
+            logger.debug("템플릿 스트리밍 렌더링 완료")
         except Exception as e:
             raise ReportGeneratorError(f"템플릿 렌더링 실패: {e}")
 
-    def _save_report(self, file_path: Path, content: str) -> None:
-        """리포트 파일 저장
+    def _stream_to_file(
+        self,
+        file_path: Path,
+        template: Template,
+        context: Dict[str, Any]
+    ) -> None:
+        """템플릿을 파일로 스트리밍 렌더링 (원자적 교체)
+
+        Args:
+            file_path: 저장할 파일 경로
+            template: Jinja2 Template 객체
+            context: 템플릿 변수 딕셔너리
+
+        Raises:
+            ReportGeneratorError: 렌더링 또는 파일 저장 실패 시
+        """
+        self._write_atomic(
+            file_path, lambda f: self._stream_template(template, context, f)
+        )
+
+    def _write_atomic(self, file_path: Path, write: Callable[[TextIO], None]) -> None:
+        """파일 원자적 저장
+
+        같은 디렉토리의 임시 파일에 기록한 뒤 os.replace로 교체하므로,
+        메일러나 웹 서버가 작성 중인 리포트를 읽는 일이 없습니다.
+        기록이 실패하면 임시 파일을 삭제하고 기존 파일은 그대로 둡니다.
 
         Args:
             file_path: 저장할 파일 경로
-            content: 저장할 내용
+            write: 열린 텍스트 파일에 내용을 기록하는 함수
 
         Raises:
-            ReportGeneratorError: 파일 저장 실패 시
+            ReportGeneratorError: 렌더링 또는 파일 저장 실패 시
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            logger.debug(f"파일 저장 완료: {file_path}")
-        except IOError as e:
+            fd, tmp_name = tempfile.mkstemp(
+                dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp'
+            )
+        except OSError as e:
             raise ReportGeneratorError(f"파일 저장 실패: {e}")
 
+        try:
+            with open(
+                fd, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE
+            ) as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp는 0600으로 생성하므로 기존 파일 권한(없으면 0644)으로 맞춤
+            os.chmod(tmp_name, _target_file_mode(file_path))
+            os.replace(tmp_name, file_path)
+            logger.debug(f"파일 저장 완료: {file_path}")
+        except BaseException as e:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            if isinstance(e, OSError):
+                raise ReportGeneratorError(f"파일 저장 실패: {e}")
+            raise
+
     def get_latest_report(self) -> str:
         """최신 리포트 파일 경로 조회
 
@@ -276,3 +586,15 @@ class ReportGenerator:
 
         except Exception as e:
             raise ReportGeneratorError(f"리포트 목록 조회 실패: {e}")
+
+
+def _target_file_mode(file_path: Path) -> int:
+    """교체할 파일의 권한 (기존 파일이 없으면 DEFAULT_FILE_MODE)
+
+    umask는 프로세스 전역 상태라 serve 모드의 다른 스레드에 영향을 주므로
+    조회하지 않습니다.
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except OSError:
+        return DEFAULT_FILE_MODE
@@ -0,0 +1,161 @@
+"""리포트 렌더링용 뷰 모델
+
+템플릿이 행마다 프로퍼티와 strftime을 호출하지 않도록, 표시할 값을 미리
+문자열로 포맷한 JobView를 만들고 작업별로 캐시합니다.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from ..models.backup_job import BackupJob
+
+# 캐시 기본 크기 (작업 수)
+DEFAULT_VIEW_CACHE_SIZE = 100_000
+
+# 값이 없는 칸의 표시 문자열
+EMPTY_DISPLAY = '-'
+
+
+@dataclass(frozen=True, slots=True)
+class JobView:
+    """리포트 표 한 행의 표시 값
+
+    Attributes:
+        job_id: 작업 ID
+        job_name: 작업명
+        client_name: 클라이언트명
+        level_display: 백업 레벨 표시 문자열
+        status_display: 상태 표시 문자열
+        start_display: 시작 시간 (YYYY-MM-DD HH:MM:SS)
+        start_display_short: 시작 시간 (YYYY-MM-DD HH:MM)
+        end_display: 종료 시간 (YYYY-MM-DD HH:MM:SS, 없으면 '-')
+        end_display_short: 종료 시간 (YYYY-MM-DD HH:MM, 없으면 '-')
+        duration_display: 소요 시간 표시 문자열
+        backup_size_display: 백업 크기 표시 문자열
+        error_message: 에러 메시지 (선택)
+    """
+
+    job_id: int
+    job_name: str
+    client_name: str
+    level_display: str
+    status_display: str
+    start_display: str
+    start_display_short: str
+    end_display: str
+    end_display_short: str
+    duration_display: str
+    backup_size_display: str
+    error_message: Optional[str] = None
+
+    @classmethod
+    def from_job(cls, job: BackupJob) -> 'JobView':
+        """BackupJob에서 뷰 생성
+
+        Args:
+            job: BackupJob 객체
+
+        Returns:
+            JobView 객체
+        """
+        start = _format_datetime(job.start_time)
+        end = _format_datetime(job.end_time) if job.end_time else EMPTY_DISPLAY
+        return cls(
+            job_id=job.job_id,
+            job_name=job.job_name,
+            client_name=job.client_name,
+            level_display=job.level_display,
+            status_display=job.status_display,
+            start_display=start,
+            start_display_short=start[:16],
+            end_display=end,
+            end_display_short=end[:16],
+            duration_display=job.duration_display,
+            backup_size_display=job.backup_size_display,
+            error_message=job.error_message,
+        )
+
+
+def _format_datetime(dt: datetime) -> str:
+    """YYYY-MM-DD HH:MM:SS 형식 변환 (strftime보다 빠른 isoformat 사용)"""
+    return dt.isoformat(' ', 'seconds')
+
+
+# 캐시 무효화 기준: 작업 상태나 결과가 바뀌면 뷰를 다시 만듦
+_Fingerprint = Tuple[str, Optional[datetime], int, int, Optional[str]]
+
+
+def _fingerprint(job: BackupJob) -> _Fingerprint:
+    return (job.status, job.end_time, job.backup_bytes, job.job_files, job.error_message)
+
+
+class JobViewCache:
+    """작업별 JobView LRU 캐시
+
+    job_id로 캐시하며, 상태/종료 시간/크기/에러 메시지가 바뀐 작업은 다시
+    포맷합니다. 같은 프로세스에서 리포트를 반복 생성할 때 종료된 작업의
+    포맷 비용을 한 번만 지불합니다.
+
+    Attributes:
+        max_size: 최대 캐시 항목 수
+        hits: 캐시 적중 수
+        misses: 캐시 미스 수
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VIEW_CACHE_SIZE):
+        """JobViewCache 초기화
+
+        Args:
+            max_size: 최대 캐시 항목 수
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[int, Tuple[_Fingerprint, JobView]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, job: BackupJob) -> JobView:
+        """작업의 뷰 조회 (없거나 변경되었으면 생성)
+
+        Args:
+            job: BackupJob 객체
+
+        Returns:
+            JobView 객체
+        """
+        fingerprint = _fingerprint(job)
+        entry = self._entries.get(job.job_id)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            self._entries.move_to_end(job.job_id)
+            return entry[1]
+
+        self.misses += 1
+        view = JobView.from_job(job)
+        self._entries[job.job_id] = (fingerprint, view)
+        self._entries.move_to_end(job.job_id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return view
+
+    def build_many(self, jobs: Iterable[BackupJob]) -> List[JobView]:
+        """작업 목록의 뷰를 일괄 생성
+
+        Args:
+            jobs: BackupJob 이터러블
+
+        Returns:
+            입력 순서와 같은 JobView 리스트
+        """
+        get = self.get
+        return [get(job) for job in jobs]
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -3,23 +3,49 @@
 백업 작업 조회 및 가공 비즈니스 로직을 제공합니다.
 """
 
+import contextvars
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+from pathlib import Path
 
 from src.api.client import BaculaClient
-from src.models.backup_job import BackupJob
+from src.models.backup_job import (
+    BackupJob,
+    CANCELED_STATUS,
+    FAILED_STATUSES,
+    RUNNING_STATUS,
+    SUCCESS_STATUS
+)
+from src.models.job_aggregate import AggregatedJobs, JobAggregate
+from src.services.job_logs import JobLogFetcher
+from src.services.sync import IncrementalSync
+from src.store.job_store import JobStore
 from src.utils.datetime import (
     get_test_period,
     get_production_period,
     format_datetime_display
 )
+from src.utils.timing import stage
 
 
 logger = logging.getLogger(__name__)
 
+# 조회 대상 백업 레벨 (병합 순서 유지)
+BACKUP_LEVELS: Tuple[Tuple[str, str], ...] = (
+    ('F', 'Full'),
+    ('I', 'Incremental'),
+    ('D', 'Differential'),
+)
+
+# 작업 조회 전략
+FETCH_STRATEGY_PER_LEVEL = 'per_level'
+FETCH_STRATEGY_SINGLE = 'single'
+FETCH_STRATEGIES = (FETCH_STRATEGY_PER_LEVEL, FETCH_STRATEGY_SINGLE)
+
 
 @dataclass
 class JobsClassification:
@@ -46,15 +72,57 @@ class BackupService:
 
     Attributes:
         client: BaculaClient 인스턴스
+        fetch_workers: 레벨별 동시 조회 스레드 수 (1이면 순차 조회)
+        fetch_strategy: 작업 조회 전략 ('per_level' 또는 'single')
+        page_size: 페이지 단위 스트리밍 조회 크기 (0이면 한 번에 조회)
+        incremental_sync: 증분 동기화 객체 (None이면 매번 전체 조회)
+        job_store: 로컬 작업 저장소 (None이면 사용 안 함)
+        log_fetcher: 실패 작업 로그 조회기 (None이면 오류 메시지 조회 안 함)
     """
 
-    def __init__(self, client: BaculaClient):
+    def __init__(
+        self,
+        client: BaculaClient,
+        fetch_workers: int = 1,
+        fetch_strategy: str = FETCH_STRATEGY_PER_LEVEL,
+        page_size: int = 0,
+        sync_state_path: Optional[str] = None,
+        job_store: Optional[JobStore] = None,
+        log_fetcher: Optional[JobLogFetcher] = None
+    ):
         """BackupService 초기화
 
         Args:
             client: BaculaClient 인스턴스
+            fetch_workers: 레벨별 동시 조회 스레드 수, 기본값 1 (순차 조회)
+            fetch_strategy: 작업 조회 전략, 기본값 'per_level'
+                  - per_level: 레벨별(F/I/D)로 3회 요청
+                  - single: type=B 1회 요청 후 레벨별로 분할
+            page_size: 페이지 단위 스트리밍 조회 크기, 기본값 0 (사용 안 함)
+            sync_state_path: 증분 동기화 상태 파일 경로 (None이면 사용 안 함)
+            job_store: 로컬 작업 저장소. 지정하면 저장소에 없는 구간만 API로 조회
+            log_fetcher: 실패 작업 로그 조회기. 지정하면 실패 작업의 error_message를 채움
+
+        Raises:
+            ValueError: fetch_strategy가 잘못된 경우
         """
+        if fetch_strategy not in FETCH_STRATEGIES:
+            raise ValueError(
+                f"잘못된 조회 전략: {fetch_strategy}. "
+                f"{' 또는 '.join(FETCH_STRATEGIES)}을 사용하세요."
+            )
+
         self.client = client
+        self.fetch_workers = max(1, min(fetch_workers, len(BACKUP_LEVELS)))
+        self.fetch_strategy = fetch_strategy
+        self.page_size = max(0, page_size)
+        self.incremental_sync: Optional[IncrementalSync] = None
+        if sync_state_path:
+            self.incremental_sync = IncrementalSync(
+                client, Path(sync_state_path), self._fetch_jobs_by_level
+            )
+        self.job_store = job_store
+        self.log_fetcher = log_fetcher
 
     def get_jobs_by_period(
         self,
@@ -98,14 +166,89 @@ class BackupService:
             f"{format_datetime_display(end_period)}"
         )
 
-        # 백업 작업 조회
-        jobs_data = self._fetch_jobs_by_level(start_period, end_period)
+        if self.job_store is not None:
+            # 저장소에 없는 구간만 API로 조회하고 기간 전체는 저장소에서 조회
+            stored_data = self._fetch_via_store(start_period, end_period)
+            jobs_data = [
+                job_data
+                for level_jobs_data in self._partition_by_level(stored_data)
+                for job_data in level_jobs_data
+            ]
+            jobs = self._parse_jobs_data(jobs_data)
+        elif self.incremental_sync is not None:
+            # 워터마크 이후 변경분만 조회하여 저장된 작업과 병합
+            synced_data = self.incremental_sync.sync(start_period, end_period)
+            jobs_data = [
+                job_data
+                for level_jobs_data in self._partition_by_level(synced_data)
+                for job_data in level_jobs_data
+            ]
+            jobs = self._parse_jobs_data(jobs_data)
+        elif self.page_size > 0:
+            # 페이지 단위 스트리밍 조회: 모든 작업은 조회하면서 집계하고,
+            # 리포트 표에 표시할 작업(성공 Full/실패/실행 중/취소)만 보관
+            # 조회와 파싱이 섞여 있으므로 하나의 fetch 단계로 계측
+            with stage('fetch', level='all'):
+                jobs = AggregatedJobs.collect(
+                    self.iter_jobs(start_period, end_period),
+                    lambda job: job.is_report_listed
+                )
+            logger.info(
+                f"✓ 백업 작업 총 {jobs.aggregate.count()}건 스트리밍 조회 완료 "
+                f"(리포트 표시 작업 {len(jobs)}건 보관)"
+            )
+            self._log_jobs_summary(jobs)
+        else:
+            # 백업 작업 조회
+            jobs_data = self._fetch_jobs_by_level(start_period, end_period)
+
+            # 데이터 파싱
+            jobs = self._parse_jobs_data(jobs_data)
 
-        # 데이터 파싱
-        jobs = self._parse_jobs_data(jobs_data)
+        # 실패 작업의 오류 메시지는 작업 로그에서 별도 조회
+        if self.log_fetcher is not None:
+            self.log_fetcher.attach_error_messages(jobs)
 
         return jobs, start_period, end_period
 
+    def iter_jobs(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> Iterator[BackupJob]:
+        """기간 내 백업 작업 스트리밍 조회
+
+        BaculaClient.get_jobs_iter로 페이지 단위 조회하여 BackupJob을 하나씩
+        반환합니다. per_level 전략은 Full → Incremental → Differential 순서로,
+        single 전략은 type=B 1회 조회 결과 중 F/I/D 작업을 API 순서대로
+        반환합니다. 스트리밍 조회는 항상 순차적으로 수행됩니다.
+
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+
+        Yields:
+            BackupJob 객체
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        page_size = self.page_size or 500
+
+        if self.fetch_strategy == FETCH_STRATEGY_SINGLE:
+            levels = {level for level, _ in BACKUP_LEVELS}
+            for job in self.client.get_jobs_iter(
+                start_time, end_time, type='B', page_size=page_size
+            ):
+                if job.level in levels:
+                    yield job
+            return
+
+        for level, _ in BACKUP_LEVELS:
+            yield from self.client.get_jobs_iter(
+                start_time, end_time, level=level, type='B', page_size=page_size
+            )
+
     def get_jobs_by_level(
         self,
         start_time: datetime,
@@ -171,6 +314,9 @@ class BackupService:
         """레벨별 백업 작업 조회 및 병합
 
         Full, Incremental, Differential 백업을 각각 조회하여 병합합니다.
+        fetch_strategy가 'single'이면 1회 요청 후 레벨별로 분할하고,
+        fetch_workers가 2 이상이면 레벨별 요청을 동시에 수행합니다.
+        병합 순서는 항상 Full → Incremental → Differential입니다.
 
         Args:
             start_time: 시작 시간
@@ -184,28 +330,26 @@ class BackupService:
         """
         api_start = time.time()
 
-        logger.info("백업 레벨별 작업 조회 중...")
-
-        # Full 백업 조회
-        full_jobs_data = self.client.get_jobs(
-            start_time, end_time, level='F', type='B'
+        logger.info(
+            f"백업 레벨별 작업 조회 중... "
+            f"(strategy={self.fetch_strategy}, workers={self.fetch_workers})"
         )
-        logger.info(f"  Full 백업: {len(full_jobs_data)}건")
 
-        # Incremental 백업 조회
-        incremental_jobs_data = self.client.get_jobs(
-            start_time, end_time, level='I', type='B'
-        )
-        logger.info(f"  Incremental 백업: {len(incremental_jobs_data)}건")
+        if self.fetch_strategy == FETCH_STRATEGY_SINGLE:
+            results = self._fetch_and_partition(start_time, end_time)
+        elif self.fetch_workers > 1:
+            results = self._fetch_levels_concurrently(start_time, end_time)
+        else:
+            results = [
+                self._fetch_level(start_time, end_time, level)
+                for level, _ in BACKUP_LEVELS
+            ]
 
-        # Differential 백업 조회
-        differential_jobs_data = self.client.get_jobs(
-            start_time, end_time, level='D', type='B'
-        )
-        logger.info(f"  Differential 백업: {len(differential_jobs_data)}건")
+        for (_, level_name), level_jobs_data in zip(BACKUP_LEVELS, results):
+            logger.info(f"  {level_name} 백업: {len(level_jobs_data)}건")
 
-        # 모든 작업 합치기
-        jobs_data = full_jobs_data + incremental_jobs_data + differential_jobs_data
+        # 모든 작업 합치기 (Full → Incremental → Differential 순서)
+        jobs_data = [job_data for level_jobs_data in results for job_data in level_jobs_data]
         api_elapsed = time.time() - api_start
 
         logger.info(f"✓ 백업 작업 총 {len(jobs_data)}건 조회 완료")
@@ -218,6 +362,175 @@ class BackupService:
 
         return jobs_data
 
+    def _fetch_via_store(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict]:
+        """로컬 저장소 기반 기간 조회
+
+        저장소가 아직 포함하지 않은 구간만 API로 조회하여 upsert하고,
+        이미 저장된 작업 중 종료되지 않았던 작업은 개별 재조회합니다.
+
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+
+        Returns:
+            기간 내 type=B, F/I/D 작업 데이터 리스트
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+            JobStoreError: 저장소 접근 실패 시
+        """
+        api_start = time.time()
+        gaps = self.job_store.uncovered_ranges(start_time, end_time)
+        fetched_ids = set()
+
+        for gap_start, gap_end in gaps:
+            logger.info(
+                f"저장소 미포함 구간 조회: {format_datetime_display(gap_start)} ~ "
+                f"{format_datetime_display(gap_end)}"
+            )
+            rows = self._fetch_jobs_by_level(gap_start, gap_end)
+            self.job_store.upsert_jobs(rows)
+            self.job_store.mark_covered(gap_start, gap_end)
+            fetched_ids.update(int(row['jobid']) for row in rows)
+
+        refreshed = []
+        for job_id in self.job_store.unfinished_job_ids(start_time, end_time):
+            if job_id in fetched_ids:
+                continue
+            detail = self.client.get_job_details(job_id)
+            if detail:
+                refreshed.append(detail)
+        self.job_store.upsert_jobs(refreshed)
+
+        logger.info(
+            f"✓ 저장소 조회: API 구간 {len(gaps)}개, "
+            f"실행 중 작업 갱신 {len(refreshed)}건, "
+            f"API 호출 시간 {time.time() - api_start:.2f}초"
+        )
+
+        return self.job_store.query_jobs(
+            start_time, end_time,
+            levels=[level for level, _ in BACKUP_LEVELS],
+            job_type='B'
+        )
+
+    def _fetch_and_partition(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[List[Dict]]:
+        """단일 요청 후 레벨별 분할
+
+        type=B 작업을 1회 요청으로 조회한 뒤 메모리에서 레벨별로 나눕니다.
+        레벨별 조회와 동일하게 F/I/D 이외 레벨의 작업은 제외합니다.
+
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+
+        Returns:
+            BACKUP_LEVELS 순서의 레벨별 작업 데이터 리스트
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        with stage('fetch', level='all'):
+            jobs_data = self.client.get_jobs(start_time, end_time, type='B')
+        return self._partition_by_level(jobs_data)
+
+    def _partition_by_level(self, jobs_data: List[Dict]) -> List[List[Dict]]:
+        """작업 데이터를 레벨별로 분할
+
+        F/I/D 이외 레벨의 작업은 제외하며, 레벨 내 순서는 유지합니다.
+
+        Args:
+            jobs_data: 작업 데이터 리스트
+
+        Returns:
+            BACKUP_LEVELS 순서의 레벨별 작업 데이터 리스트
+        """
+        partitions: Dict[str, List[Dict]] = {level: [] for level, _ in BACKUP_LEVELS}
+        skipped = 0
+        for job_data in jobs_data:
+            bucket = partitions.get(job_data.get('level'))
+            if bucket is None:
+                skipped += 1
+                continue
+            bucket.append(job_data)
+
+        if skipped > 0:
+            logger.debug(f"  F/I/D 이외 레벨 작업 제외: {skipped}건")
+
+        return [partitions[level] for level, _ in BACKUP_LEVELS]
+
+    def _fetch_levels_concurrently(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[List[Dict]]:
+        """레벨별 백업 작업 동시 조회
+
+        레벨별 요청을 스레드 풀에서 병렬로 수행합니다. 결과는 BACKUP_LEVELS
+        순서로 반환되며, 실패한 레벨이 있으면 모든 요청이 끝난 뒤 가장 앞선
+        레벨의 예외를 그대로 다시 발생시킵니다.
+
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+
+        Returns:
+            BACKUP_LEVELS 순서의 레벨별 작업 데이터 리스트
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.fetch_workers,
+            thread_name_prefix='bacula-fetch'
+        ) as executor:
+            # 계측 컨텍스트를 작업 스레드에 전달 (요청마다 별도 복사본 사용)
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._fetch_level, start_time, end_time, level
+                )
+                for level, _ in BACKUP_LEVELS
+            ]
+
+        # executor 종료 시 모든 요청이 완료되어 있음
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
+        return [future.result() for future in futures]
+
+    def _fetch_level(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: str
+    ) -> List[Dict]:
+        """백업 레벨 하나의 작업 조회 (레벨별 fetch 단계로 계측)
+
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+            level: 백업 레벨 ('F', 'I', 'D')
+
+        Returns:
+            백업 작업 데이터 리스트
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        with stage('fetch', level=level):
+            return self.client.get_jobs(start_time, end_time, level=level, type='B')
+
     def _parse_jobs_data(self, jobs_data: List[Dict]) -> List[BackupJob]:
         """백업 작업 데이터 파싱
 
@@ -230,27 +543,40 @@ class BackupService:
         jobs: List[BackupJob] = []
         parse_errors = 0
 
-        for job_data in jobs_data:
-            try:
-                job = BackupJob.from_api_response(job_data)
-                jobs.append(job)
-            except ValueError as e:
-                logger.warning(f"작업 데이터 파싱 실패: {e}")
-                parse_errors += 1
+        with stage('parse'):
+            for job_data in jobs_data:
+                try:
+                    job = BackupJob.from_api_response(job_data)
+                    jobs.append(job)
+                except ValueError as e:
+                    logger.warning(f"작업 데이터 파싱 실패: {e}")
+                    parse_errors += 1
 
         logger.info(f"✓ 데이터 파싱 완료: {len(jobs)}건")
         if parse_errors > 0:
             logger.warning(f"  파싱 실패: {parse_errors}건")
 
-        # 통계 출력
-        success_count = sum(1 for job in jobs if job.is_success)
-        failed_count = sum(1 for job in jobs if job.is_failed)
-        running_count = sum(1 for job in jobs if job.is_running)
-        canceled_count = sum(1 for job in jobs if job.is_canceled)
+        self._log_jobs_summary(jobs)
+
+        return jobs
+
+    def _log_jobs_summary(self, jobs: List[BackupJob]) -> None:
+        """상태별 작업 수 로그 출력
+
+        Args:
+            jobs: 백업 작업 리스트 (AggregatedJobs면 보관된 전체 집계 기준)
+        """
+        if isinstance(jobs, AggregatedJobs):
+            aggregate = jobs.aggregate
+        else:
+            aggregate = JobAggregate.from_jobs(jobs)
+
+        success_count = aggregate.count(statuses=(SUCCESS_STATUS,))
+        failed_count = aggregate.count(statuses=FAILED_STATUSES)
+        running_count = aggregate.count(statuses=(RUNNING_STATUS,))
+        canceled_count = aggregate.count(statuses=(CANCELED_STATUS,))
 
         logger.info(f"  성공: {success_count}건")
         logger.info(f"  실패: {failed_count}건")
         logger.info(f"  실행 중: {running_count}건")
         logger.info(f"  취소됨: {canceled_count}건")
-
-        return jobs
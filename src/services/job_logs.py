@@ -0,0 +1,182 @@
+"""실패 작업 로그 조회 모듈
+
+실패/에러 작업의 로그(jobs/{id}/log)를 제한된 스레드 풀에서 동시에 조회하고,
+오류 줄만 추려 BackupJob.error_message 에 채웁니다. 종료된 작업의 로그는 바뀌지
+않으므로 추출한 메시지를 작업 ID별로 캐시하여 serve 처럼 같은 프로세스에서
+리포트를 반복 생성할 때 다시 요청하지 않습니다.
+"""
+
+import contextvars
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+from src.api.client import BaculaClient
+from src.models.backup_job import BackupJob
+from src.utils.timing import stage
+
+
+logger = logging.getLogger(__name__)
+
+# 오류 메시지로 추출하는 최대 줄 수
+MAX_ERROR_LINES = 5
+
+# 오류 줄 하나의 최대 길이 (긴 경로/명령 출력이 표를 늘리지 않도록)
+MAX_LINE_LENGTH = 300
+
+# 캐시할 최대 작업 수
+DEFAULT_LOG_CACHE_SIZE = 10_000
+
+# Bacula 오류 줄 (Fatal error:, Error:, ERR=...)
+_ERROR_LINE = re.compile(r'\b(?:Fatal error|Error):|\bERR=')
+
+# 'bacula-dir JobId 123: ' 처럼 시간/데몬/작업 ID로 된 접두어
+_LINE_PREFIX = re.compile(r'^.*?\bJobId \d+:\s*')
+
+
+def extract_error_message(
+    log_lines: Iterable[str],
+    max_lines: int = MAX_ERROR_LINES
+) -> Optional[str]:
+    """작업 로그에서 오류 줄 추출
+
+    Fatal error/Error/ERR= 가 포함된 줄을 로그 순서대로 모아 시간/데몬 접두어를
+    제거합니다. 같은 내용의 줄은 한 번만 포함합니다.
+
+    Args:
+        log_lines: 작업 로그 줄
+        max_lines: 최대 줄 수
+
+    Returns:
+        줄바꿈으로 연결한 오류 메시지, 오류 줄이 없으면 None
+    """
+    lines: List[str] = []
+    for raw_line in log_lines:
+        if not _ERROR_LINE.search(raw_line):
+            continue
+        line = _LINE_PREFIX.sub('', raw_line.strip(), count=1)
+        if len(line) > MAX_LINE_LENGTH:
+            line = line[:MAX_LINE_LENGTH - 1] + '…'
+        if line and line not in lines:
+            lines.append(line)
+            if len(lines) >= max_lines:
+                break
+    return '\n'.join(lines) or None
+
+
+class JobLogFetcher:
+    """실패 작업 오류 메시지 조회기 (스레드 안전)
+
+    Attributes:
+        client: BaculaClient 인스턴스
+        workers: 동시 조회 스레드 수
+        cache_size: 캐시할 최대 작업 수
+    """
+
+    def __init__(
+        self,
+        client: BaculaClient,
+        workers: int = 4,
+        cache_size: int = DEFAULT_LOG_CACHE_SIZE
+    ):
+        """JobLogFetcher 초기화
+
+        Args:
+            client: BaculaClient 인스턴스
+            workers: 동시 조회 스레드 수, 기본값 4 (커넥션 풀 크기 이하 권장)
+            cache_size: 캐시할 최대 작업 수
+        """
+        self.client = client
+        self.workers = max(1, workers)
+        self.cache_size = cache_size
+        self._messages: 'OrderedDict[int, Optional[str]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def attach_error_messages(self, jobs: Iterable[BackupJob]) -> int:
+        """실패/에러 작업의 error_message 채우기
+
+        이미 메시지가 있는 작업과 캐시된 작업은 요청하지 않습니다. 로그 조회에
+        실패한 작업은 경고만 남기고 메시지 없이 둡니다 (다음 실행에서 다시 조회).
+
+        Args:
+            jobs: 백업 작업 리스트
+
+        Returns:
+            메시지를 채운 작업 수
+        """
+        targets = [job for job in jobs if job.is_failed and job.error_message is None]
+        if not targets:
+            return 0
+
+        with self._lock:
+            pending_ids = sorted({
+                job.job_id for job in targets if job.job_id not in self._messages
+            })
+
+        failures = 0
+        if pending_ids:
+            with stage('fetch_logs'):
+                failures = self._fetch_all(pending_ids)
+
+        attached = 0
+        with self._lock:
+            for job in targets:
+                message = self._messages.get(job.job_id)
+                if message is not None:
+                    job.error_message = message
+                    attached += 1
+
+        logger.info(
+            f"✓ 실패 작업 로그 조회: {len(targets)}건 중 오류 메시지 {attached}건 "
+            f"(요청 {len(pending_ids)}건, 캐시 {len(targets) - len(pending_ids)}건)"
+        )
+        if failures:
+            logger.warning(f"  로그 조회 실패: {failures}건")
+        return attached
+
+    def _fetch_all(self, job_ids: List[int]) -> int:
+        """작업 로그 동시 조회 후 캐시에 보관
+
+        Args:
+            job_ids: 조회할 작업 ID 리스트
+
+        Returns:
+            조회에 실패한 작업 수
+        """
+        workers = min(self.workers, len(job_ids))
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='bacula-log'
+        ) as executor:
+            # 계측 컨텍스트를 작업 스레드에 전달 (요청마다 별도 복사본 사용)
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._fetch_one, job_id)
+                for job_id in job_ids
+            ]
+
+        return sum(1 for future in futures if not future.result())
+
+    def _fetch_one(self, job_id: int) -> bool:
+        """작업 하나의 로그 조회 및 오류 메시지 추출
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            조회 성공 시 True
+        """
+        try:
+            message = extract_error_message(self.client.get_job_log(job_id))
+        except Exception as e:
+            logger.warning(f"⚠ 작업 로그 조회 실패: job_id={job_id}, {e}")
+            return False
+
+        with self._lock:
+            self._messages[job_id] = message
+            self._messages.move_to_end(job_id)
+            while len(self._messages) > self.cache_size:
+                self._messages.popitem(last=False)
+        return True
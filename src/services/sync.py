@@ -0,0 +1,339 @@
+"""증분 동기화 모듈
+
+jobid/jobtdate 워터마크를 이용해 이전 실행 이후 변경된 작업만 조회하는
+증분 동기화 기능을 제공합니다. 작업 목록 API는 jobid 내림차순으로 응답하므로
+조회 기간 전체를 페이지 단위로 요청하되 워터마크 이하의 jobid에 도달하면 다음
+페이지를 요청하지 않습니다.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.api.client import BaculaClient
+from src.store.job_store import JOB_COLUMNS
+
+
+logger = logging.getLogger(__name__)
+
+# 상태 파일 형식 버전 (호환되지 않는 변경 시 증가)
+SYNC_STATE_VERSION = 2
+
+# 아직 종료되지 않은 작업 상태 (다음 동기화 때 다시 조회)
+UNFINISHED_STATUSES = ('R', 'C', 'F')
+
+# 변경분 조회 페이지 크기 (워터마크 이하 작업은 최대 한 페이지만 수신)
+SYNC_PAGE_SIZE = 100
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+@dataclass
+class SyncState:
+    """증분 동기화 상태
+
+    Attributes:
+        api_host: 동기화 대상 API 호스트 (호스트가 바뀌면 전체 재조회)
+        window_start: 보관 중인 작업의 조회 시작 시간
+        synced_until: 마지막 동기화 종료 시간
+        last_jobid: 보관 중인 작업의 최대 jobid
+        last_jobtdate: 보관 중인 작업의 최대 jobtdate (epoch 초)
+        running_job_ids: 마지막 동기화 시점에 종료되지 않았던 작업 ID
+        rows: 보관 중인 작업의 리포트용 컬럼 값 (JOB_COLUMNS 순서의 리스트)
+    """
+
+    api_host: str = ''
+    window_start: Optional[str] = None
+    synced_until: Optional[str] = None
+    last_jobid: int = 0
+    last_jobtdate: int = 0
+    running_job_ids: List[int] = field(default_factory=list)
+    rows: List[List[Any]] = field(default_factory=list)
+
+    @staticmethod
+    def pack(job_data: Dict) -> List[Any]:
+        """작업 데이터를 저장용 컬럼 값 리스트로 변환 (나머지 응답 필드는 버림)
+
+        Args:
+            job_data: 작업 데이터 (API 응답 형식)
+
+        Returns:
+            JOB_COLUMNS 순서의 값 리스트
+        """
+        return [job_data.get(column) for column in JOB_COLUMNS]
+
+    def job_rows(self) -> List[Dict]:
+        """보관 중인 작업을 API 응답 형식으로 복원
+
+        Returns:
+            작업 데이터 리스트 (JOB_COLUMNS 키만 포함)
+        """
+        return [dict(zip(JOB_COLUMNS, row)) for row in self.rows]
+
+    @classmethod
+    def load(cls, path: Path) -> 'SyncState':
+        """상태 파일 로드
+
+        파일이 없거나 손상되었거나 버전이 다르면 빈 상태를 반환합니다.
+
+        Args:
+            path: 상태 파일 경로
+
+        Returns:
+            SyncState 객체
+        """
+        if not path.exists():
+            return cls()
+
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            if data.pop('version', None) != SYNC_STATE_VERSION:
+                logger.warning(f"동기화 상태 버전 불일치, 전체 재조회: {path}")
+                return cls()
+            return cls(**data)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"동기화 상태 로드 실패, 전체 재조회: {e}")
+            return cls()
+
+    def save(self, path: Path) -> None:
+        """상태 파일 저장
+
+        임시 파일에 기록한 뒤 교체하여 중단 시에도 파일이 손상되지 않도록 합니다.
+
+        Args:
+            path: 상태 파일 경로
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        data = {'version': SYNC_STATE_VERSION, **asdict(self)}
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, path)
+
+
+class IncrementalSync:
+    """워터마크 기반 증분 동기화
+
+    첫 실행(또는 상태가 조회 기간을 포함하지 못하는 경우)에는 전체 기간을
+    조회하고, 이후에는 jobid가 워터마크보다 큰 새 작업과 jobtdate가 워터마크
+    이후인 변경 작업, 지난번 실행 중이던 작업만 보관 중인 작업과 병합합니다.
+    시작 시간이 오래됐지만 늦게 기록된 작업도 새 jobid를 받으므로 누락되지
+    않습니다.
+
+    Attributes:
+        client: BaculaClient 인스턴스
+        state_path: 상태 파일 경로
+        fetch_window: 전체 기간 조회 함수 (start, end) -> 작업 데이터 리스트
+    """
+
+    def __init__(
+        self,
+        client: BaculaClient,
+        state_path: Path,
+        fetch_window: Callable[[datetime, datetime], List[Dict]],
+        page_size: int = SYNC_PAGE_SIZE
+    ):
+        """IncrementalSync 초기화
+
+        Args:
+            client: BaculaClient 인스턴스
+            state_path: 상태 파일 경로
+            fetch_window: 전체 기간 조회 함수
+            page_size: 변경분 조회 페이지 크기
+        """
+        self.client = client
+        self.state_path = Path(state_path)
+        self.fetch_window = fetch_window
+        self.page_size = page_size
+
+    def sync(self, start_time: datetime, end_time: datetime) -> List[Dict]:
+        """조회 기간의 작업 데이터 동기화
+
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Returns:
+            조회 기간에 속하는 작업 데이터 리스트 (jobid 내림차순)
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        state = SyncState.load(self.state_path)
+
+        if self._needs_full_sync(state, start_time):
+            logger.info("증분 동기화: 저장된 상태가 없어 전체 기간 조회")
+            state = SyncState()
+            jobs_by_id = {
+                int(row['jobid']): row
+                for row in self.fetch_window(start_time, end_time)
+            }
+        else:
+            jobs_by_id = {int(row['jobid']): row for row in state.job_rows()}
+            self._apply_delta(state, jobs_by_id, start_time, end_time)
+
+        # 조회 기간 밖으로 밀려난 작업 제거
+        window_jobs = [
+            row for row in jobs_by_id.values()
+            if self._in_window(row, start_time, end_time)
+        ]
+        window_jobs.sort(key=lambda row: int(row['jobid']), reverse=True)
+
+        self._save_state(state, window_jobs, start_time, end_time)
+        return window_jobs
+
+    def _needs_full_sync(self, state: SyncState, start_time: datetime) -> bool:
+        """전체 재조회 필요 여부 확인
+
+        Args:
+            state: 저장된 동기화 상태
+            start_time: 조회 시작 시간
+
+        Returns:
+            전체 재조회가 필요하면 True
+        """
+        if state.api_host != self.client.api_host:
+            return True
+        if not state.window_start or not state.synced_until:
+            return True
+        # 저장된 상태가 요청 기간의 시작 부분을 포함하지 못하는 경우
+        return datetime.strptime(state.window_start, DATETIME_FORMAT) > start_time
+
+    def _apply_delta(
+        self,
+        state: SyncState,
+        jobs_by_id: Dict[int, Dict],
+        start_time: datetime,
+        end_time: datetime
+    ) -> None:
+        """워터마크 이후 변경분 조회 및 병합
+
+        조회 기간 전체를 jobid 내림차순 페이지로 요청하되, 페이지 끝이 jobid
+        워터마크 이하에 도달하면 이후 페이지는 모두 기존 작업이므로 중단합니다.
+        서버가 오름차순으로 응답하면 끝까지 조회하고 워터마크로만 거릅니다.
+
+        Args:
+            state: 저장된 동기화 상태
+            jobs_by_id: 보관 중인 작업 데이터 (jobid 키, 제자리 갱신)
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Raises:
+            BaculaAPIError: API 호출 실패 시
+        """
+        running_ids = set(state.running_job_ids)
+
+        received = 0
+        new_count = 0
+        refreshed_ids = set()
+        for page in self.client.iter_job_pages(
+            start_time, end_time, type='B', page_size=self.page_size
+        ):
+            received += len(page)
+            for row in page:
+                job_id = int(row['jobid'])
+                if job_id > state.last_jobid:
+                    new_count += 1
+                elif (
+                    job_id in running_ids
+                    or int(row.get('jobtdate') or 0) > state.last_jobtdate
+                ):
+                    refreshed_ids.add(job_id)
+                else:
+                    # 워터마크 이하의 변경 없는 종료 작업
+                    continue
+                jobs_by_id[job_id] = row
+
+            # 내림차순 페이지의 끝이 워터마크 이하이면 남은 페이지는 모두 기존 작업
+            if page:
+                first_id, last_id = int(page[0]['jobid']), int(page[-1]['jobid'])
+                if first_id >= last_id and last_id <= state.last_jobid:
+                    break
+
+        # 지난번 실행 중이던 작업 중 델타에 포함되지 않은 작업만 개별 재조회
+        repolled = 0
+        for job_id in running_ids - refreshed_ids:
+            if job_id not in jobs_by_id:
+                continue
+            try:
+                detail = self.client.get_job_details(job_id)
+            except Exception as e:
+                logger.warning(f"실행 중 작업 재조회 실패: job_id={job_id}, {e}")
+                continue
+            if detail:
+                jobs_by_id[job_id] = {**jobs_by_id[job_id], **detail}
+                repolled += 1
+
+        logger.info(
+            f"증분 동기화: 델타 {received}건 수신, 신규 {new_count}건, "
+            f"실행 중 작업 갱신 {len(refreshed_ids) + repolled}건"
+        )
+
+    def _in_window(self, row: Dict, start_time: datetime, end_time: datetime) -> bool:
+        """작업 시작 시간이 조회 기간에 속하는지 확인
+
+        Args:
+            row: 작업 데이터
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Returns:
+            조회 기간에 속하면 True (시작 시간이 없는 작업은 포함)
+        """
+        starttime = row.get('starttime')
+        if not starttime:
+            return True
+        try:
+            started = datetime.strptime(starttime, DATETIME_FORMAT)
+        except ValueError:
+            return True
+        return start_time <= started <= end_time
+
+    def _save_state(
+        self,
+        previous: SyncState,
+        window_jobs: List[Dict],
+        start_time: datetime,
+        end_time: datetime
+    ) -> None:
+        """동기화 상태 저장
+
+        워터마크는 조회 기간 밖으로 밀려난 작업이 있어도 줄어들지 않도록 이전
+        값과 비교해 큰 값을 유지합니다. 작업은 리포트에 필요한 컬럼만 저장합니다.
+
+        Args:
+            previous: 이번 동기화에 사용한 상태 (전체 조회 시 빈 상태)
+            window_jobs: 조회 기간의 작업 데이터
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+        """
+        state = SyncState(
+            api_host=self.client.api_host,
+            window_start=start_time.strftime(DATETIME_FORMAT),
+            synced_until=end_time.strftime(DATETIME_FORMAT),
+            last_jobid=max(
+                [previous.last_jobid] + [int(row['jobid']) for row in window_jobs]
+            ),
+            last_jobtdate=max(
+                [previous.last_jobtdate]
+                + [int(row.get('jobtdate') or 0) for row in window_jobs]
+            ),
+            running_job_ids=[
+                int(row['jobid']) for row in window_jobs
+                if row.get('jobstatus') in UNFINISHED_STATUSES
+            ],
+            rows=[SyncState.pack(row) for row in window_jobs],
+        )
+
+        try:
+            state.save(self.state_path)
+            logger.debug(
+                f"동기화 상태 저장: last_jobid={state.last_jobid}, "
+                f"last_jobtdate={state.last_jobtdate}, "
+                f"running={len(state.running_job_ids)}"
+            )
+        except OSError as e:
+            logger.warning(f"동기화 상태 저장 실패: {e}")
@@ -0,0 +1,8 @@
+"""로컬 작업 저장소 모듈
+
+API에서 조회한 백업 작업을 로컬 SQLite에 보관하는 기능을 제공합니다.
+"""
+
+from .job_store import JobStore, JobStoreError
+
+__all__ = ['JobStore', 'JobStoreError']
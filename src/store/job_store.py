@@ -0,0 +1,326 @@
+"""SQLite 작업 저장소
+
+API에서 조회한 백업 작업을 SQLite에 upsert하고, 조회가 완료된 기간(coverage)을
+기록하여 이후 기간 조회 시 API를 호출해야 하는 구간만 계산할 수 있게 합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 아직 종료되지 않은 작업 상태 (조회 시 다시 확인 필요)
+UNFINISHED_STATUSES = ('R', 'C', 'F')
+
+# 저장 컬럼 (API 응답 키와 동일)
+JOB_COLUMNS = (
+    'jobid', 'name', 'client', 'jobstatus', 'level', 'type',
+    'starttime', 'endtime', 'jobtdate', 'jobbytes', 'jobfiles',
+    'joberrors', 'pool', 'fileset',
+)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    jobid INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    client TEXT NOT NULL,
+    jobstatus TEXT NOT NULL,
+    level TEXT NOT NULL,
+    type TEXT,
+    starttime TEXT,
+    endtime TEXT,
+    jobtdate INTEGER,
+    jobbytes INTEGER,
+    jobfiles INTEGER,
+    joberrors INTEGER,
+    pool TEXT,
+    fileset TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_client ON jobs (client);
+CREATE INDEX IF NOT EXISTS idx_jobs_level ON jobs (level);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (jobstatus);
+CREATE INDEX IF NOT EXISTS idx_jobs_starttime ON jobs (starttime);
+CREATE TABLE IF NOT EXISTS coverage (
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL
+);
+'''
+
+
+class JobStoreError(Exception):
+    """작업 저장소 관련 예외"""
+    pass
+
+
+class JobStore:
+    """SQLite 기반 백업 작업 저장소
+
+    작업은 jobid 기준으로 upsert되며, client/level/jobstatus/starttime 인덱스로
+    기간 조회를 수행합니다. 여러 스레드에서 공유할 수 있도록 연결 접근을
+    잠금으로 보호합니다.
+
+    Attributes:
+        path: 데이터베이스 파일 경로 (':memory:' 가능)
+    """
+
+    def __init__(self, path: str):
+        """JobStore 초기화
+
+        Args:
+            path: 데이터베이스 파일 경로
+
+        Raises:
+            JobStoreError: 데이터베이스 열기 또는 스키마 생성 실패 시
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+
+        try:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise JobStoreError(f"작업 저장소 열기 실패: {self.path}, {e}")
+
+        logger.info(f"JobStore 초기화: {self.path}")
+
+    def __enter__(self) -> 'JobStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def upsert_jobs(self, jobs_data: Iterable[Dict[str, Any]]) -> int:
+        """작업 데이터 upsert
+
+        Args:
+            jobs_data: API 응답 형식의 작업 데이터
+
+        Returns:
+            저장된 작업 수
+
+        Raises:
+            JobStoreError: 저장 실패 시
+        """
+        rows = [
+            tuple(job_data.get(column) for column in JOB_COLUMNS)
+            for job_data in jobs_data
+        ]
+        if not rows:
+            return 0
+
+        placeholders = ', '.join('?' for _ in JOB_COLUMNS)
+        updates = ', '.join(
+            f"{column} = excluded.{column}" for column in JOB_COLUMNS[1:]
+        )
+        sql = (
+            f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(jobid) DO UPDATE SET {updates}"
+        )
+
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(sql, rows)
+        except sqlite3.Error as e:
+            raise JobStoreError(f"작업 저장 실패: {e}")
+
+        logger.debug(f"작업 {len(rows)}건 저장")
+        return len(rows)
+
+    def query_jobs(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        levels: Optional[Sequence[str]] = None,
+        job_type: Optional[str] = None,
+        client: Optional[str] = None,
+        statuses: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """기간 내 작업 조회
+
+        Args:
+            start_time: 조회 시작 시간 (starttime 기준, 포함)
+            end_time: 조회 종료 시간 (starttime 기준, 포함)
+            levels: 백업 레벨 필터 (선택)
+            job_type: 작업 타입 필터 (선택)
+            client: 클라이언트명 필터 (선택)
+            statuses: 작업 상태 필터 (선택)
+
+        Returns:
+            API 응답 형식의 작업 데이터 리스트 (jobid 내림차순)
+
+        Raises:
+            JobStoreError: 조회 실패 시
+        """
+        conditions = ['starttime BETWEEN ? AND ?']
+        params: List[Any] = [
+            start_time.strftime(DATETIME_FORMAT),
+            end_time.strftime(DATETIME_FORMAT),
+        ]
+
+        if levels:
+            conditions.append(f"level IN ({', '.join('?' for _ in levels)})")
+            params.extend(levels)
+        if job_type:
+            conditions.append('type = ?')
+            params.append(job_type)
+        if client:
+            conditions.append('client = ?')
+            params.append(client)
+        if statuses:
+            conditions.append(f"jobstatus IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+
+        sql = (
+            f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs "
+            f"WHERE {' AND '.join(conditions)} ORDER BY jobid DESC"
+        )
+
+        try:
+            with self._lock:
+                return [dict(row) for row in self._conn.execute(sql, params)]
+        except sqlite3.Error as e:
+            raise JobStoreError(f"작업 조회 실패: {e}")
+
+    def unfinished_job_ids(self, start_time: datetime, end_time: datetime) -> List[int]:
+        """기간 내 종료되지 않은 작업 ID 조회
+
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Returns:
+            종료되지 않은 작업 ID 리스트
+        """
+        rows = self.query_jobs(start_time, end_time, statuses=UNFINISHED_STATUSES)
+        return [row['jobid'] for row in rows]
+
+    def mark_covered(self, start_time: datetime, end_time: datetime) -> None:
+        """조회 완료 기간 기록
+
+        기존 기간과 겹치거나 맞닿는 구간은 하나로 병합합니다.
+
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Raises:
+            JobStoreError: 저장 실패 시
+        """
+        intervals = self._load_coverage()
+        intervals.append((_to_second(start_time), _to_second(end_time)))
+        merged = _merge_intervals(intervals)
+
+        try:
+            with self._lock, self._conn:
+                self._conn.execute('DELETE FROM coverage')
+                self._conn.executemany(
+                    'INSERT INTO coverage (start_time, end_time) VALUES (?, ?)',
+                    [
+                        (start.strftime(DATETIME_FORMAT), end.strftime(DATETIME_FORMAT))
+                        for start, end in merged
+                    ]
+                )
+        except sqlite3.Error as e:
+            raise JobStoreError(f"조회 기간 기록 실패: {e}")
+
+    def uncovered_ranges(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """조회 기간 중 저장소에 없는 구간 계산
+
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Returns:
+            API 조회가 필요한 (시작, 종료) 구간 리스트
+        """
+        start_time, end_time = _to_second(start_time), _to_second(end_time)
+        gaps = []
+        cursor = start_time
+        for covered_start, covered_end in self._load_coverage():
+            if covered_end < cursor:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+            if cursor >= end_time:
+                break
+
+        if cursor < end_time:
+            gaps.append((cursor, end_time))
+        return gaps
+
+    def count(self) -> int:
+        """저장된 작업 수
+
+        Returns:
+            작업 수
+        """
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def _load_coverage(self) -> List[Tuple[datetime, datetime]]:
+        """조회 완료 기간 로드
+
+        Returns:
+            시작 시간 순으로 정렬된 (시작, 종료) 구간 리스트
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT start_time, end_time FROM coverage ORDER BY start_time'
+            ).fetchall()
+        return [
+            (
+                datetime.strptime(row['start_time'], DATETIME_FORMAT),
+                datetime.strptime(row['end_time'], DATETIME_FORMAT),
+            )
+            for row in rows
+        ]
+
+
+def _to_second(dt: datetime) -> datetime:
+    """저장 형식과 맞추기 위해 마이크로초 제거"""
+    return dt.replace(microsecond=0)
+
+
+def _merge_intervals(
+    intervals: List[Tuple[datetime, datetime]]
+) -> List[Tuple[datetime, datetime]]:
+    """겹치거나 맞닿는 구간 병합
+
+    Args:
+        intervals: (시작, 종료) 구간 리스트
+
+    Returns:
+        병합된 구간 리스트 (시작 시간 순)
+    """
+    merged: List[Tuple[datetime, datetime]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -5,8 +5,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Dict, Optional
 
 
 class ConfigError(Exception):
@@ -38,6 +37,9 @@ class Config:
                 f".env.example을 참고하여 .env 파일을 생성하세요."
             )
 
+        # python-dotenv는 설정을 실제로 로드할 때만 임포트 (CLI 시작 비용 절감)
+        from dotenv import load_dotenv
+
         load_dotenv(env_file)
 
         # 필수 설정 검증
@@ -108,6 +110,139 @@ class Config:
         """API 최대 재시도 횟수"""
         return int(os.getenv('BACULUM_API_MAX_RETRIES', '3'))
 
+    @property
+    def api_pool_size(self) -> int:
+        """API 커넥션 풀 크기"""
+        return int(os.getenv('BACULUM_API_POOL_SIZE', '4'))
+
+    @property
+    def api_fetch_workers(self) -> int:
+        """레벨별 작업 동시 조회 스레드 수 (1이면 순차 조회)"""
+        return int(os.getenv('BACULUM_API_FETCH_WORKERS', '1'))
+
+    @property
+    def api_fetch_strategy(self) -> str:
+        """작업 조회 전략 (per_level: 레벨별 3회 요청, single: 1회 요청 후 분할)"""
+        return os.getenv('BACULUM_API_FETCH_STRATEGY', 'per_level').lower()
+
+    @property
+    def api_page_size(self) -> int:
+        """작업 페이지 단위 스트리밍 조회 크기 (0이면 한 번에 조회)"""
+        return int(os.getenv('BACULUM_API_PAGE_SIZE', '0'))
+
+    @property
+    def api_log_workers(self) -> int:
+        """실패 작업 로그 동시 조회 스레드 수 (0이면 로그를 조회하지 않음)"""
+        return int(os.getenv('BACULUM_API_LOG_WORKERS', '4'))
+
+    @property
+    def api_cache_ttls(self) -> Dict[str, float]:
+        """API 응답 캐시의 엔드포인트 패턴별 TTL (초)
+
+        Returns:
+            BACULUM_API_CACHE_TTL 설정값('clients=3600,jobs/{id}=86400' 형식) 파싱 결과.
+            빈 문자열로 설정하면 빈 딕셔너리 (캐시 미사용)
+
+        Raises:
+            ConfigError: 형식이 잘못된 경우
+        """
+        # 응답 캐시 모듈은 requests를 임포트하므로 실제로 사용할 때만 임포트
+        from src.api.response_cache import DEFAULT_TTL_SPEC, parse_ttl_spec
+
+        try:
+            return parse_ttl_spec(os.getenv('BACULUM_API_CACHE_TTL', DEFAULT_TTL_SPEC))
+        except ValueError as e:
+            raise ConfigError(f"BACULUM_API_CACHE_TTL: {e}")
+
+    @property
+    def api_cache_max_entries(self) -> int:
+        """API 응답 캐시 최대 보관 응답 수"""
+        return int(os.getenv('BACULUM_API_CACHE_MAX_ENTRIES', '1024'))
+
+    @property
+    def api_cache_stale_seconds(self) -> float:
+        """TTL이 지난 응답을 돌려주며 백그라운드에서 갱신하는 유예 시간 (초, 0이면 사용 안 함)"""
+        return float(os.getenv('BACULUM_API_CACHE_STALE_SECONDS', '0'))
+
+    @property
+    def api_cache_file(self) -> Optional[str]:
+        """API 응답 캐시 디스크 보관 파일 경로
+
+        Returns:
+            BACULUM_API_CACHE_FILE 설정값 (선택사항, 없으면 메모리에만 보관)
+        """
+        return os.getenv('BACULUM_API_CACHE_FILE') or None
+
+    @property
+    def sync_state_file(self) -> str:
+        """증분 동기화 상태 파일 경로
+
+        Returns:
+            SYNC_STATE_FILE 설정값, 없으면 프로젝트 루트의 data/sync_state.json
+        """
+        default_path = Path(__file__).parent.parent.parent / 'data' / 'sync_state.json'
+        return os.getenv('SYNC_STATE_FILE', str(default_path))
+
+    @property
+    def job_store_file(self) -> str:
+        """로컬 작업 저장소(SQLite) 파일 경로
+
+        Returns:
+            JOB_STORE_FILE 설정값, 없으면 프로젝트 루트의 data/jobs.sqlite3
+        """
+        default_path = Path(__file__).parent.parent.parent / 'data' / 'jobs.sqlite3'
+        return os.getenv('JOB_STORE_FILE', str(default_path))
+
+    @property
+    def template_cache_dir(self) -> Optional[str]:
+        """템플릿 바이트코드 캐시 디렉토리
+
+        Returns:
+            TEMPLATE_CACHE_DIR 설정값, 없으면 프로젝트 루트의 data/template_cache.
+            빈 문자열로 설정하면 None (디스크 캐시 미사용)
+        """
+        default_path = Path(__file__).parent.parent.parent / 'data' / 'template_cache'
+        return os.getenv('TEMPLATE_CACHE_DIR', str(default_path)) or None
+
+    @property
+    def template_module_dir(self) -> Optional[str]:
+        """사전 컴파일된 템플릿 모듈 디렉토리
+
+        Returns:
+            TEMPLATE_MODULE_DIR 설정값 (선택사항)
+        """
+        return os.getenv('TEMPLATE_MODULE_DIR') or None
+
+    @property
+    def report_email_ready(self) -> bool:
+        """이메일용 템플릿 변형 사용 여부 (CSS를 빌드 시점에 인라인하여 발송 시 변환 생략)"""
+        return os.getenv('REPORT_EMAIL_READY', 'false').lower() in ('1', 'true', 'yes')
+
+    @property
+    def metrics_jsonl_file(self) -> Optional[str]:
+        """단계별 실행 시간 기록(JSON lines) 파일 경로
+
+        Returns:
+            METRICS_JSONL_FILE 설정값, 없으면 프로젝트 루트의 data/report_timings.jsonl.
+            빈 문자열로 설정하면 None (기록 안 함)
+        """
+        default_path = Path(__file__).parent.parent.parent / 'data' / 'report_timings.jsonl'
+        return os.getenv('METRICS_JSONL_FILE', str(default_path)) or None
+
+    @property
+    def metrics_prom_file(self) -> Optional[str]:
+        """단계별 실행 시간 Prometheus textfile 경로
+
+        Returns:
+            METRICS_PROM_FILE 설정값 (선택사항, node_exporter textfile 디렉토리의 *.prom)
+        """
+        return os.getenv('METRICS_PROM_FILE') or None
+
+    @property
+    def serve_schedule(self) -> str:
+        """serve 커맨드의 리포트 실행 스케줄 (cron 식: 분 시 일 월 요일)"""
+        return os.getenv('SERVE_SCHEDULE', '0 22 * * *')
+
     @property
     def baculum_web_host(self) -> Optional[str]:
         """Baculum 웹 인터페이스 호스트 주소
@@ -166,9 +301,39 @@ class Config:
 
     @property
     def mail_to(self) -> Optional[str]:
-        """수신자 이메일 주소"""
+        """수신자 이메일 주소 (여러 명은 쉼표로 구분)"""
         return os.getenv('MAIL_TO')
 
+    @property
+    def smtp_max_retries(self) -> int:
+        """메일 발송 최대 시도 횟수"""
+        return int(os.getenv('SMTP_MAX_RETRIES', '3'))
+
+    @property
+    def smtp_retry_backoff(self) -> float:
+        """메일 발송 재시도 대기 기본 시간 (초, 시도마다 2배)"""
+        return float(os.getenv('SMTP_RETRY_BACKOFF', '2.0'))
+
+    @property
+    def mail_spool_dir(self) -> str:
+        """메일 발송 대기열(spool) 디렉토리
+
+        Returns:
+            MAIL_SPOOL_DIR 설정값, 없으면 프로젝트 루트의 data/outbox
+        """
+        default_path = Path(__file__).parent.parent.parent / 'data' / 'outbox'
+        return os.getenv('MAIL_SPOOL_DIR', str(default_path))
+
+    @property
+    def mail_spool_max_attempts(self) -> int:
+        """대기열 메시지별 최대 발송 시도 횟수 (넘으면 failed/로 이동)"""
+        return int(os.getenv('MAIL_SPOOL_MAX_ATTEMPTS', '5'))
+
+    @property
+    def mail_spool_retry_delay(self) -> float:
+        """대기열 발송 재시도 대기 기본 시간 (초, 시도마다 2배)"""
+        return float(os.getenv('MAIL_SPOOL_RETRY_DELAY', '60'))
+
     def has_mail_config(self) -> bool:
         """메일 설정이 모두 있는지 확인
 
@@ -196,6 +361,7 @@ class Config:
             'password': self.api_password,
             'timeout': self.api_timeout,
             'max_retries': self.api_max_retries,
+            'pool_size': self.api_pool_size,
         }
 
     def get_email_sender_config(self) -> dict:
@@ -219,4 +385,6 @@ class Config:
             'username': self.smtp_username,
             'password': self.smtp_password,
             'from_email': self.mail_from,
+            'max_retries': self.smtp_max_retries,
+            'retry_backoff': self.smtp_retry_backoff,
         }
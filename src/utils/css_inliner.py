@@ -0,0 +1,424 @@
+"""캐시 기반 CSS 인라인 변환 모듈
+
+premailer.transform()은 호출할 때마다 <style> 시트를 파싱하고, 규칙별 선언과
+요소별 최종 스타일을 다시 계산합니다. 같은 템플릿으로 만든 리포트는 시트가
+항상 같으므로, 시트 내용의 해시별로 "컴파일된 선택자 → 선언" 목록을 LRU
+캐시에 보관하고 새 문서에는 그 목록만 적용합니다.
+
+결과는 premailer 기본 옵션의 transform()과 같습니다. 단, 외부 스타일시트
+(<link rel="stylesheet">)는 불러오지 않습니다.
+
+규칙 파싱과 HTML 속성 변환에 premailer 내부 함수를 사용하므로, 검증된 버전이
+아니면 캐시 없이 premailer.transform()으로 변환합니다.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 크기 (서로 다른 스타일시트 수)
+DEFAULT_CSS_CACHE_SIZE = 32
+
+# 요소별 최종 스타일 메모 최대 항목 수 (시트당)
+MAX_MERGE_MEMO = 4096
+
+# 내부 함수 사용이 검증된 premailer 버전 (major.minor)
+SUPPORTED_PREMAILER_VERSIONS = ('3.10',)
+
+# 캐시 변환에 사용하는 premailer 내부 속성
+_PREMAILER_INTERNALS = (
+    '_parse_style_rules', '_css_rules_to_string',
+    '_style_to_basic_html_attributes', 'attribute_name',
+)
+
+# 가상 클래스 중 요소 필터로 쓰이는 선택자 (premailer와 동일)
+FILTER_PSEUDOSELECTORS = (':last-child', ':first-child', ':nth-child')
+
+_IMPORTANT_PATTERN = re.compile(r'\s*!important')
+
+# 스레드 로컬 상태: cssutils 경고 억제 표시(전역 로그 레벨을 바꾸지 않기 위함),
+# 스레드별 XPath 평가 객체
+_quiet = threading.local()
+_filter_installed = False
+_filter_lock = threading.Lock()
+
+
+class CssInlineError(Exception):
+    """CSS 인라인 변환 관련 예외"""
+    pass
+
+
+class _QuietCssutilsFilter(logging.Filter):
+    """인라인 변환 중인 스레드의 cssutils 경고만 걸러내는 필터"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not getattr(_quiet, 'active', 0) or record.levelno >= logging.CRITICAL
+
+
+@contextmanager
+def _quiet_cssutils() -> Iterator[None]:
+    """현재 스레드에서 발생하는 cssutils 경고 억제
+
+    cssutils는 'CSSUTILS' 로거로 기록합니다. 로거 레벨을 바꾸는 대신 스레드
+    로컬 표시를 확인하는 필터를 한 번만 설치하므로 다른 스레드에 영향이 없습니다.
+    """
+    global _filter_installed
+    if not _filter_installed:
+        with _filter_lock:
+            if not _filter_installed:
+                logging.getLogger('CSSUTILS').addFilter(_QuietCssutilsFilter())
+                _filter_installed = True
+
+    _quiet.active = getattr(_quiet, 'active', 0) + 1
+    try:
+        yield
+    finally:
+        _quiet.active -= 1
+
+
+def _premailer_compatible(premailer_module, instance) -> bool:
+    """캐시 변환에 필요한 premailer 내부 함수를 사용할 수 있는지 확인
+
+    Args:
+        premailer_module: premailer 모듈
+        instance: Premailer 인스턴스
+
+    Returns:
+        검증된 버전이고 내부 속성이 모두 있으면 True
+    """
+    version = getattr(premailer_module, '__version__', '')
+    if '.'.join(version.split('.')[:2]) not in SUPPORTED_PREMAILER_VERSIONS:
+        return False
+    from premailer import premailer as premailer_impl
+    return (
+        all(hasattr(instance, name) for name in _PREMAILER_INTERNALS)
+        and hasattr(premailer_impl, 'get_or_create_head')
+    )
+
+
+def _thread_xpaths() -> Dict[str, object]:
+    """현재 스레드 전용 XPath 평가 객체 캐시 ({XPath 식: etree.XPath})"""
+    evaluators = getattr(_quiet, 'xpaths', None)
+    if evaluators is None:
+        evaluators = _quiet.xpaths = {}
+    return evaluators
+
+
+# (선택자를 변환한 XPath 식, 선언 목록, 가상 클래스)
+# lxml 평가 객체는 스레드 간 공유하지 않도록 변환된 식만 보관
+_CompiledRule = Tuple[str, List[Tuple[str, str]], str]
+
+
+class _CompiledSheet:
+    """스타일시트 하나의 컴파일 결과
+
+    Attributes:
+        rules: 우선순위 순으로 정렬된 컴파일 규칙
+        leftovers: <style> 요소별로 남겨 둘 CSS (인라인 불가 규칙, 없으면 None)
+        merged: {(기존 inline style, 적용 규칙 번호): (최종 스타일, HTML 속성)} 메모
+            (스레드 간 공유되므로 lock을 잡고 접근)
+        lock: merged 보호용 락
+    """
+
+    __slots__ = ('rules', 'leftovers', 'merged', 'lock')
+
+    def __init__(self, rules: List[_CompiledRule], leftovers: List[Optional[str]]):
+        self.rules = rules
+        self.leftovers = leftovers
+        self.merged: Dict[Tuple[str, Tuple[int, ...]], Tuple[str, Dict[str, str]]] = {}
+        self.lock = threading.Lock()
+
+
+class CssInliner:
+    """스타일시트 해시별 캐시를 사용하는 CSS 인라인 변환기
+
+    스레드 안전하며, 프로세스에서 하나를 공유해 사용합니다 (get_css_inliner).
+
+    Attributes:
+        max_size: 캐시할 스타일시트 수
+        hits: 캐시 적중 수
+        misses: 캐시 미스(시트 컴파일) 수
+        cached: 캐시 변환 사용 여부 (False면 premailer.transform으로 대체)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CSS_CACHE_SIZE):
+        """CssInliner 초기화
+
+        Args:
+            max_size: 캐시할 스타일시트 수
+        """
+        import premailer
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._sheets: 'OrderedDict[str, _CompiledSheet]' = OrderedDict()
+        self._lock = threading.Lock()
+        # 규칙 파싱/HTML 속성 변환은 premailer 기본 옵션과 동일하게 수행
+        self._premailer = premailer.Premailer()
+        self.cached = _premailer_compatible(premailer, self._premailer)
+        if not self.cached:
+            logger.warning(
+                f"⚠ 검증되지 않은 premailer 버전({getattr(premailer, '__version__', '?')}), "
+                f"캐시 없이 premailer.transform()으로 CSS 인라인 변환"
+            )
+
+    def transform(self, html: str) -> str:
+        """HTML의 <style> 규칙을 인라인 스타일로 변환
+
+        Args:
+            html: 변환할 HTML 문자열
+
+        Returns:
+            CSS가 인라인된 HTML 문자열
+
+        Raises:
+            CssInlineError: HTML 파싱 또는 변환 실패 시
+        """
+        if not self.cached:
+            return self._transform_uncached(html)
+
+        from lxml import etree
+        from premailer.premailer import get_or_create_head
+
+        try:
+            stripped = html.strip()
+            tree = etree.fromstring(stripped, etree.HTMLParser()).getroottree()
+            page = tree.getroot()
+            # 원본에 doctype이 있을 때만 출력에 포함 (premailer와 동일)
+            root = tree if stripped.startswith(tree.docinfo.doctype) else page
+            get_or_create_head(tree)
+
+            style_elements = self._collect_style_elements(page)
+            sheet = self._get_sheet([element.text for element in style_elements])
+
+            for element, leftover in zip(style_elements, sheet.leftovers):
+                if leftover:
+                    element.text = leftover
+                else:
+                    element.getparent().remove(element)
+
+            self._apply(page, sheet)
+            self._align_floating_images(page)
+            return etree.tostring(
+                root, method='html', pretty_print=False, encoding='utf-8'
+            ).decode('utf-8')
+        except CssInlineError:
+            raise
+        except Exception as e:
+            raise CssInlineError(f"CSS 인라인 변환 실패: {e}")
+
+    def _transform_uncached(self, html: str) -> str:
+        """premailer.transform()으로 변환 (지원하지 않는 premailer 버전용)"""
+        from premailer import transform
+
+        try:
+            with _quiet_cssutils():
+                return transform(html)
+        except Exception as e:
+            raise CssInlineError(f"CSS 인라인 변환 실패: {e}")
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._sheets.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _collect_style_elements(self, page) -> list:
+        """인라인 대상 <style> 요소 목록 (media/data-premailer 규칙은 premailer와 동일)"""
+        elements = []
+        attribute_name = self._premailer.attribute_name
+        for element in page.iter('style'):
+            media = element.attrib.get('media')
+            if media and media not in ('all', 'screen'):
+                continue
+            if element.attrib.get(attribute_name) == 'ignore':
+                del element.attrib[attribute_name]
+                continue
+            elements.append(element)
+        return elements
+
+    def _get_sheet(self, css_bodies: List[Optional[str]]) -> _CompiledSheet:
+        """스타일시트 컴파일 결과 조회 (없으면 컴파일 후 캐시)
+
+        Args:
+            css_bodies: <style> 요소별 CSS 텍스트
+
+        Returns:
+            _CompiledSheet 객체
+        """
+        digest = hashlib.sha256(
+            '\0'.join(body or '' for body in css_bodies).encode('utf-8')
+        ).hexdigest()
+
+        with self._lock:
+            sheet = self._sheets.get(digest)
+            if sheet is not None:
+                self.hits += 1
+                self._sheets.move_to_end(digest)
+                return sheet
+
+            self.misses += 1
+            sheet = self._compile(css_bodies)
+            self._sheets[digest] = sheet
+            if len(self._sheets) > self.max_size:
+                self._sheets.popitem(last=False)
+            logger.debug(f"CSS 스타일시트 컴파일: {digest[:12]} ({len(sheet.rules)}개 규칙)")
+            return sheet
+
+    def _compile(self, css_bodies: List[Optional[str]]) -> _CompiledSheet:
+        """스타일시트를 선택자 → 선언 목록으로 컴파일
+
+        Args:
+            css_bodies: <style> 요소별 CSS 텍스트
+
+        Returns:
+            _CompiledSheet 객체
+        """
+        from lxml.cssselect import CSSSelector
+        from premailer.merge_style import csstext_to_pairs
+
+        premailer = self._premailer
+        parsed_rules = []
+        leftovers: List[Optional[str]] = []
+
+        with _quiet_cssutils():
+            for index, css_body in enumerate(css_bodies):
+                rules, leftover = premailer._parse_style_rules(css_body, index)
+                parsed_rules.extend(rules)
+                if leftover:
+                    leftovers.append(
+                        _IMPORTANT_PATTERN.sub('', premailer._css_rules_to_string(leftover))
+                    )
+                else:
+                    leftovers.append(None)
+
+            parsed_rules.sort(key=lambda rule: rule[0])
+
+            compiled: List[_CompiledRule] = []
+            for _, selector, style in parsed_rules:
+                pseudo = ''
+                if ':' in selector:
+                    base_selector, pseudo = selector.split(':', 1)
+                    pseudo = f':{pseudo}'
+                    if pseudo in FILTER_PSEUDOSELECTORS or pseudo.startswith(':nth-child'):
+                        pseudo = ''
+                    else:
+                        selector = base_selector
+                compiled.append((CSSSelector(selector).path, csstext_to_pairs(style), pseudo))
+
+        return _CompiledSheet(compiled, leftovers)
+
+    def _apply(self, page, sheet: _CompiledSheet) -> None:
+        """컴파일된 규칙을 문서에 적용
+
+        규칙 조합과 기존 inline style이 같은 요소는 최종 스타일이 같으므로
+        시트별 메모를 재사용합니다.
+
+        Args:
+            page: lxml 루트 요소
+            sheet: 컴파일된 스타일시트
+        """
+        evaluators = _thread_xpaths()
+        matched: Dict[int, Tuple[object, List[int]]] = {}
+        for rule_index, (path, _, _) in enumerate(sheet.rules):
+            evaluator = evaluators.get(path)
+            if evaluator is None:
+                from lxml import etree
+                evaluator = evaluators[path] = etree.XPath(path)
+            for item in evaluator(page):
+                entry = matched.get(id(item))
+                if entry is None:
+                    matched[id(item)] = (item, [rule_index])
+                else:
+                    entry[1].append(rule_index)
+
+        keyed = [
+            (item, (item.attrib.get('style', ''), tuple(rule_indexes)))
+            for item, rule_indexes in matched.values()
+        ]
+        with sheet.lock:
+            memo = [sheet.merged.get(key) for _, key in keyed]
+
+        # 메모에 없는 조합은 락 밖에서 계산한 뒤 한 번에 등록
+        computed: Dict[Tuple[str, Tuple[int, ...]], Tuple[str, Dict[str, str]]] = {}
+        for (item, key), merged in zip(keyed, memo):
+            if merged is None:
+                merged = computed.get(key)
+                if merged is None:
+                    merged = computed[key] = self._merge(key[0], sheet, list(key[1]))
+
+            final_style, attributes = merged
+            if final_style:
+                item.attrib['style'] = final_style
+            for name, value in attributes.items():
+                item.attrib[name] = value
+
+        if computed:
+            with sheet.lock:
+                for key, merged in computed.items():
+                    if len(sheet.merged) >= MAX_MERGE_MEMO:
+                        break
+                    sheet.merged.setdefault(key, merged)
+
+    def _align_floating_images(self, page) -> None:
+        """float 스타일 이미지에 align 속성 추가 (Outlook 호환, premailer와 동일)"""
+        images = page.xpath('//img[@style]')
+        if not images:
+            return
+
+        import cssutils
+
+        with _quiet_cssutils():
+            for item in images:
+                image_float = cssutils.parseStyle(item.attrib['style']).float
+                if image_float in ('left', 'right'):
+                    item.attrib['align'] = image_float
+
+    def _merge(
+        self,
+        inline_style: str,
+        sheet: _CompiledSheet,
+        rule_indexes: List[int]
+    ) -> Tuple[str, Dict[str, str]]:
+        """요소의 최종 스타일과 HTML 속성(bgcolor, align 등) 계산"""
+        from lxml import etree
+        from premailer.merge_style import merge_styles
+
+        with _quiet_cssutils():
+            final_style = merge_styles(
+                inline_style,
+                [sheet.rules[i][1] for i in rule_indexes],
+                [sheet.rules[i][2] for i in rule_indexes],
+                remove_unset_properties=True
+            )
+
+        scratch = etree.Element('div')
+        self._premailer._style_to_basic_html_attributes(scratch, final_style, force=True)
+        return final_style, dict(scratch.attrib)
+
+
+_shared_inliner: Optional[CssInliner] = None
+_shared_lock = threading.Lock()
+
+
+def get_css_inliner() -> CssInliner:
+    """프로세스 전역 CssInliner 조회 (없으면 생성)
+
+    Returns:
+        공유 CssInliner 객체
+    """
+    global _shared_inliner
+    if _shared_inliner is None:
+        with _shared_lock:
+            if _shared_inliner is None:
+                _shared_inliner = CssInliner()
+    return _shared_inliner
@@ -4,9 +4,17 @@
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple
 
 
+# Bacula API 날짜/시간 형식
+API_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 파싱 결과 캐시 크기 (스케줄 작업은 동일한 시간 문자열이 반복됨)
+PARSE_CACHE_SIZE = 65536
+
+
 def get_test_period() -> Tuple[datetime, datetime]:
     """테스트 모드 조회 기간 계산
 
@@ -72,10 +80,46 @@ def format_datetime_display(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d %H:%M:%S')
 
 
+def _is_api_layout(value: str) -> bool:
+    """YYYY-MM-DD HH:MM:SS 고정 형식 여부를 구분자 위치로 빠르게 판별"""
+    return (
+        len(value) == 19
+        and value[4] == '-' and value[7] == '-' and value[10] == ' '
+        and value[13] == ':' and value[16] == ':'
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_api_datetime(datetime_str: str) -> datetime:
+    """Bacula API 날짜/시간 문자열을 datetime 객체로 변환
+
+    YYYY-MM-DD HH:MM:SS 형식은 strptime 대신 datetime.fromisoformat으로
+    파싱하고, 결과를 캐시하여 반복되는 시간 문자열은 다시 파싱하지 않습니다.
+
+    Args:
+        datetime_str: YYYY-MM-DD HH:MM:SS 형식의 문자열
+
+    Returns:
+        datetime 객체
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우
+
+    Example:
+        >>> parse_api_datetime('2025-10-11 14:30:45')
+        datetime.datetime(2025, 10, 11, 14, 30, 45)
+    """
+    if _is_api_layout(datetime_str):
+        return datetime.fromisoformat(datetime_str)
+    # 형식이 다르면 기존과 동일한 오류 메시지를 위해 strptime 사용
+    return datetime.strptime(datetime_str, API_DATETIME_FORMAT)
+
+
 def parse_datetime(datetime_str: str) -> datetime:
     """문자열을 datetime 객체로 변환
 
     여러 날짜/시간 형식을 지원합니다.
+    YYYY-MM-DD HH:MM:SS 형식은 parse_api_datetime 빠른 경로를 사용합니다.
 
     Args:
         datetime_str: 날짜/시간 문자열
@@ -86,6 +130,12 @@ def parse_datetime(datetime_str: str) -> datetime:
     Raises:
         ValueError: 지원하지 않는 형식인 경우
     """
+    if _is_api_layout(datetime_str):
+        try:
+            return parse_api_datetime(datetime_str)
+        except ValueError:
+            pass
+
     # 시도할 형식 목록
     formats = [
         '%Y-%m-%d %H:%M:%S',
@@ -0,0 +1,182 @@
+"""cron 형식 스케줄 유틸리티
+
+serve 커맨드가 리포트 작업을 주기적으로 실행할 때 사용하는 5필드 cron 식
+(분 시 일 월 요일) 파서와 실행 루프를 제공합니다.
+
+지원 문법: `*`, 숫자, 범위(`1-5`), 목록(`1,15`), 간격(`*/10`, `8-18/2`).
+요일은 0~7 (0과 7은 일요일)입니다.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, FrozenSet, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# (필드 이름, 최소값, 최대값)
+CRON_FIELDS = (
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 7),
+)
+
+# 다음 실행 시간 탐색 범위 (2월 29일 같은 드문 조합 포함)
+MAX_SEARCH_DAYS = 366 * 4 + 1
+
+
+class ScheduleError(Exception):
+    """스케줄 식 관련 예외"""
+    pass
+
+
+def _parse_field(text: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    """cron 필드 하나를 허용 값 집합으로 변환
+
+    Args:
+        text: 필드 문자열
+        name: 필드 이름 (오류 메시지용)
+        low: 최소값
+        high: 최대값
+
+    Returns:
+        허용 값 집합
+
+    Raises:
+        ScheduleError: 형식이 잘못되었거나 범위를 벗어난 경우
+    """
+    values = set()
+    for part in text.split(','):
+        range_text, _, step_text = part.partition('/')
+        try:
+            step = int(step_text) if step_text else 1
+            if range_text == '*':
+                start, end = low, high
+            elif '-' in range_text:
+                start, end = (int(value) for value in range_text.split('-', 1))
+            else:
+                start = int(range_text)
+                end = high if step_text else start
+        except ValueError:
+            raise ScheduleError(f"잘못된 {name} 필드: '{text}'")
+
+        if step < 1 or start < low or end > high or start > end:
+            raise ScheduleError(f"{name} 필드 범위 오류: '{text}' ({low}-{high})")
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+class CronSchedule:
+    """5필드 cron 식 스케줄
+
+    Attributes:
+        expression: 원본 cron 식
+    """
+
+    def __init__(self, expression: str):
+        """CronSchedule 초기화
+
+        Args:
+            expression: cron 식 (예: '0 22 * * *')
+
+        Raises:
+            ScheduleError: 식이 잘못된 경우
+        """
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELDS):
+            raise ScheduleError(
+                f"cron 식은 5개 필드(분 시 일 월 요일)여야 합니다: '{expression}'"
+            )
+
+        self.expression = expression
+        parsed: Tuple[FrozenSet[int], ...] = tuple(
+            _parse_field(text, name, low, high)
+            for text, (name, low, high) in zip(fields, CRON_FIELDS)
+        )
+        self._minutes, self._hours, self._days, self._months, weekdays = parsed
+        # cron 요일(0=일요일, 7=일요일) → datetime.weekday()(0=월요일)
+        self._weekdays = frozenset((value - 1) % 7 for value in weekdays)
+        # 일/요일이 모두 제한되면 둘 중 하나만 맞아도 실행 (cron 규칙)
+        # '*/2'처럼 '*'로 시작하는 필드는 제한되지 않은 것으로 취급 (vixie cron과 동일)
+        self._day_restricted = not fields[2].startswith('*')
+        self._weekday_restricted = not fields[4].startswith('*')
+
+    def __repr__(self) -> str:
+        return f"CronSchedule('{self.expression}')"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self._days
+        weekday_ok = moment.weekday() in self._weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """주어진 시간 이후의 다음 실행 시간
+
+        Args:
+            moment: 기준 시간
+
+        Returns:
+            moment보다 늦은 다음 실행 시간 (초 단위 0)
+
+        Raises:
+            ScheduleError: 탐색 범위 안에 실행 시간이 없는 경우 (예: 2월 30일)
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=MAX_SEARCH_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self._months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(
+                    year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self._hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self._minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ScheduleError(f"실행 시간을 찾을 수 없는 cron 식입니다: '{self.expression}'")
+
+
+def run_on_schedule(
+    schedule: CronSchedule,
+    job: Callable[[datetime], None],
+    stop_event: threading.Event,
+    now: Callable[[], datetime] = datetime.now,
+    max_wait: float = 60.0
+) -> None:
+    """stop_event가 설정될 때까지 스케줄에 맞춰 작업 실행
+
+    시계 변경(NTP 보정, 서머타임)에 대응하도록 최대 max_wait초 단위로 나누어
+    대기하며 남은 시간을 다시 계산합니다.
+
+    Args:
+        schedule: 실행 스케줄
+        job: 실행할 작업 (예정 실행 시간을 인자로 받음)
+        stop_event: 종료 신호
+        now: 현재 시간 함수 (테스트용)
+        max_wait: 한 번에 대기할 최대 시간 (초)
+    """
+    while not stop_event.is_set():
+        next_run = schedule.next_after(now())
+        logger.info(f"다음 실행 예정: {next_run.strftime('%Y-%m-%d %H:%M')}")
+
+        while not stop_event.is_set():
+            remaining = (next_run - now()).total_seconds()
+            if remaining <= 0:
+                break
+            stop_event.wait(min(remaining, max_wait))
+
+        if stop_event.is_set():
+            break
+        job(next_run)
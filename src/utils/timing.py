@@ -0,0 +1,341 @@
+"""단계별 실행 시간 계측 모듈
+
+리포트 파이프라인의 단계(connect, fetch, parse, fetch_logs, stats, render, write,
+inline, send)마다 벽시계 시간, CPU 시간, 메모리를 기록하고 JSON lines 또는
+Prometheus textfile(node_exporter textfile collector) 형식으로 내보냅니다.
+
+메모리는 두 가지를 기록합니다. peak_rss_bytes는 단계 종료 시점까지의 프로세스
+누적 최대 RSS로 줄어들지 않으므로 단계별 사용량을 구분하지 못합니다. 단계별
+최대치는 tracemalloc이 켜져 있을 때만 traced_peak_bytes(단계 중 Python 할당
+최대치)로 기록합니다.
+
+계측 지점은 모듈 함수 stage()만 사용하므로, 활성화된 StageTimer가 없으면
+아무것도 기록하지 않습니다::
+
+    timer = StageTimer()
+    with timer.activate():
+        with stage('fetch', level='F'):
+            ...
+    timer.write_json_lines(path)
+"""
+
+import contextvars
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = 'baculum_report'
+
+# 현재 실행 중인 계측기 (스레드 풀 작업에는 contextvars.copy_context()로 전달)
+_current_timer: contextvars.ContextVar[Optional['StageTimer']] = contextvars.ContextVar(
+    'current_stage_timer', default=None
+)
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """프로세스 최대 RSS (바이트, 측정 불가 시 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@dataclass
+class StageTiming:
+    """단계 하나의 계측 결과
+
+    Attributes:
+        stage: 단계 이름
+        labels: 추가 구분 값 (예: {'level': 'F'})
+        wall_seconds: 벽시계 시간 (초)
+        cpu_seconds: 프로세스 CPU 시간 (초, 동시 실행 단계끼리는 겹쳐서 집계됨)
+        peak_rss_bytes: 단계 종료 시점까지의 프로세스 누적 최대 RSS (바이트)
+        traced_peak_bytes: 단계 중 Python 할당 최대치 (바이트, tracemalloc 사용 시,
+            동시 실행 단계의 할당도 포함)
+        ok: 예외 없이 끝났는지 여부
+    """
+
+    stage: str
+    labels: Dict[str, str] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: Optional[int] = None
+    traced_peak_bytes: Optional[int] = None
+    ok: bool = True
+
+
+class StageTimer:
+    """단계별 계측 결과 수집기 (스레드 안전)
+
+    Attributes:
+        run_id: 실행 ID (JSON lines에서 같은 실행의 단계를 묶는 데 사용)
+        started_at: 계측 시작 시간
+        records: 기록된 단계 목록 (종료 순)
+    """
+
+    def __init__(self, run_id: Optional[str] = None):
+        """StageTimer 초기화
+
+        Args:
+            run_id: 실행 ID (None이면 자동 생성)
+        """
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started_at = datetime.now()
+        self.records: List[StageTiming] = []
+        self._lock = threading.Lock()
+        # 진행 중인 단계별 [시작 시 할당량, 최대 할당량] (tracemalloc 사용 시)
+        self._traced: Dict[int, List[int]] = {}
+
+    @contextmanager
+    def activate(self) -> Iterator['StageTimer']:
+        """현재 컨텍스트의 계측기로 설정 (블록 안의 stage() 호출이 기록됨)"""
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+    @contextmanager
+    def stage(self, name: str, **labels: Any) -> Iterator[StageTiming]:
+        """단계 계측
+
+        Args:
+            name: 단계 이름
+            **labels: 추가 구분 값
+
+        Yields:
+            기록 중인 StageTiming (블록 종료 시 값이 채워짐)
+        """
+        record = StageTiming(stage=name, labels={k: str(v) for k, v in labels.items()})
+        self._start_tracing(record)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        except BaseException:
+            record.ok = False
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = time.process_time() - cpu_start
+            record.peak_rss_bytes = _peak_rss_bytes()
+            self._stop_tracing(record)
+            with self._lock:
+                self.records.append(record)
+
+    def _fold_traced_peak(self) -> None:
+        """지금까지의 할당 최대치를 진행 중인 단계에 반영하고 최대치 초기화 (잠금 필요)
+
+        단계마다 reset_peak()를 호출하므로, 바깥 단계의 최대치가 안쪽 단계
+        시작 시 사라지지 않도록 초기화 전에 반영해 둡니다.
+        """
+        _, peak = tracemalloc.get_traced_memory()
+        for state in self._traced.values():
+            state[1] = max(state[1], peak)
+        tracemalloc.reset_peak()
+
+    def _start_tracing(self, record: StageTiming) -> None:
+        """단계 시작 시 할당량 기록 (tracemalloc이 꺼져 있으면 무시)"""
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            self._fold_traced_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            self._traced[id(record)] = [current, current]
+
+    def _stop_tracing(self, record: StageTiming) -> None:
+        """단계 종료 시 단계 중 할당 최대치 기록"""
+        with self._lock:
+            state = self._traced.get(id(record))
+            if state is None:
+                return
+            if tracemalloc.is_tracing():
+                self._fold_traced_peak()
+                record.traced_peak_bytes = state[1] - state[0]
+            del self._traced[id(record)]
+
+    def totals(self) -> Dict[Tuple[str, Tuple[Tuple[str, str], ...]], StageTiming]:
+        """같은 단계/레이블끼리 합산한 결과 (시간은 합계, 메모리는 최대값)"""
+        totals: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], StageTiming] = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            key = (record.stage, tuple(sorted(record.labels.items())))
+            total = totals.get(key)
+            if total is None:
+                totals[key] = StageTiming(**asdict(record))
+                continue
+            total.wall_seconds += record.wall_seconds
+            total.cpu_seconds += record.cpu_seconds
+            total.ok = total.ok and record.ok
+            if record.peak_rss_bytes is not None:
+                total.peak_rss_bytes = max(total.peak_rss_bytes or 0, record.peak_rss_bytes)
+            if record.traced_peak_bytes is not None:
+                total.traced_peak_bytes = max(
+                    total.traced_peak_bytes or 0, record.traced_peak_bytes
+                )
+        return totals
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약 (예: 'connect 0.12s, fetch[level=F] 1.03s')"""
+        parts = []
+        for (name, labels), total in self.totals().items():
+            label_text = ','.join(f'{k}={v}' for k, v in labels)
+            display = f'{name}[{label_text}]' if label_text else name
+            parts.append(f'{display} {total.wall_seconds:.2f}s')
+        return ', '.join(parts)
+
+    def to_json_lines(self, **extra: Any) -> List[str]:
+        """단계별 JSON 문자열 목록
+
+        Args:
+            **extra: 모든 줄에 추가할 필드 (예: mode='production')
+
+        Returns:
+            단계마다 한 줄씩의 JSON 문자열 리스트
+        """
+        with self._lock:
+            records = list(self.records)
+        return [
+            json.dumps({
+                'run_id': self.run_id,
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                **extra,
+                **asdict(record),
+            }, ensure_ascii=False, sort_keys=False)
+            for record in records
+        ]
+
+    def write_json_lines(self, path: Path, **extra: Any) -> None:
+        """JSON lines 파일에 단계별 결과 추가
+
+        Args:
+            path: 출력 파일 경로 (없으면 생성, 있으면 이어 씀)
+            **extra: 모든 줄에 추가할 필드
+
+        Raises:
+            OSError: 파일 쓰기 실패 시
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = self.to_json_lines(**extra)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(''.join(line + '\n' for line in lines))
+
+    def to_prometheus(self, prefix: str = METRIC_PREFIX) -> str:
+        """Prometheus 텍스트 노출 형식 문자열
+
+        Args:
+            prefix: 지표 이름 접두사
+
+        Returns:
+            Prometheus 텍스트 형식 지표
+        """
+        totals = self.totals()
+        metrics = (
+            ('stage_wall_seconds', 'Wall-clock time spent in each report stage.',
+             lambda t: t.wall_seconds),
+            ('stage_cpu_seconds', 'Process CPU time spent in each report stage.',
+             lambda t: t.cpu_seconds),
+            ('stage_process_peak_rss_bytes',
+             'Cumulative process peak RSS observed when each report stage ended.',
+             lambda t: t.peak_rss_bytes),
+            ('stage_traced_peak_bytes',
+             'Peak Python allocations while each report stage ran (tracemalloc only).',
+             lambda t: t.traced_peak_bytes),
+            ('stage_success', 'Whether each report stage finished without error.',
+             lambda t: 1 if t.ok else 0),
+        )
+
+        lines = []
+        for suffix, help_text, value_of in metrics:
+            name = f'{prefix}_{suffix}'
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for (stage_name, labels), total in totals.items():
+                value = value_of(total)
+                if value is None:
+                    continue
+                label_text = ','.join(
+                    f'{key}="{_escape_label(val)}"'
+                    for key, val in (('stage', stage_name),) + labels
+                )
+                lines.append(f'{name}{{{label_text}}} {value}')
+
+        name = f'{prefix}_last_run_timestamp_seconds'
+        lines.append(f'# HELP {name} Unix time when the last report run started.')
+        lines.append(f'# TYPE {name} gauge')
+        lines.append(f'{name} {self.started_at.timestamp():.0f}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: Path, prefix: str = METRIC_PREFIX) -> None:
+        """Prometheus textfile 저장 (수집기가 반쯤 쓴 파일을 읽지 않도록 원자적 교체)
+
+        Args:
+            path: 출력 파일 경로 (node_exporter는 .prom 확장자만 읽음)
+            prefix: 지표 이름 접두사
+
+        Raises:
+            OSError: 파일 쓰기 실패 시
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus(prefix))
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus 레이블 값 이스케이프"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def current_timer() -> Optional[StageTimer]:
+    """현재 컨텍스트에서 활성화된 계측기 (없으면 None)"""
+    return _current_timer.get()
+
+
+@contextmanager
+def stage(name: str, **labels: Any) -> Iterator[Optional[StageTiming]]:
+    """활성화된 계측기가 있으면 단계를 기록하고, 없으면 아무것도 하지 않음
+
+    Args:
+        name: 단계 이름
+        **labels: 추가 구분 값
+
+    Yields:
+        기록 중인 StageTiming 또는 None
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield None
+        return
+    with timer.stage(name, **labels) as record:
+        yield record
@@ -0,0 +1,174 @@
+"""BaculaClient 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+from src.api.client import BaculaClient
+
+
+def make_response(payload):
+    """성공 응답 mock 생성"""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+class TestBaculaClientSession:
+    """BaculaClient 세션 재사용 테스트"""
+
+    def make_client(self, **kwargs):
+        return BaculaClient(
+            api_host='localhost',
+            api_port=9096,
+            username='admin',
+            password='secret',
+            **kwargs
+        )
+
+    def test_prebuilt_auth_header(self):
+        """Basic 인증 헤더가 세션에 미리 설정되는지 테스트"""
+        client = self.make_client()
+
+        assert client.session.headers['Authorization'] == (
+            'Basic YWRtaW46c2VjcmV0'
+        )
+        assert client.session.headers['Connection'] == 'keep-alive'
+        client.close()
+
+    def test_pool_size(self):
+        """커넥션 풀 크기 설정 테스트"""
+        client = self.make_client(pool_size=8)
+        adapter = client.session.get_adapter('http://localhost:9096')
+
+        assert adapter._pool_maxsize == 8
+        client.close()
+
+    def test_session_reused_across_requests(self):
+        """여러 요청이 하나의 세션을 재사용하는지 테스트"""
+        client = self.make_client()
+
+        with patch.object(
+            client.session, 'request',
+            return_value=make_response({'output': []})
+        ) as mock_request:
+            client.connect()
+            client.get_jobs(level='F', type='B')
+            client.get_clients()
+
+        assert mock_request.call_count == 3
+        client.close()
+
+    def test_context_manager_closes_session(self):
+        """컨텍스트 매니저 종료 시 세션이 닫히는지 테스트"""
+        client = self.make_client()
+        session = client.session
+
+        with patch.object(session, 'close') as mock_close:
+            with client:
+                pass
+
+        mock_close.assert_called_once()
+        assert client.session is None
+
+        # close()는 여러 번 호출해도 안전해야 함
+        client.close()
+
+
+class TestGetJobsIter:
+    """페이지 단위 작업 조회 테스트"""
+
+    def make_rows(self, count):
+        return [
+            {
+                'jobid': i + 1,
+                'name': f'job-{i + 1}',
+                'client': 'client-1',
+                'jobstatus': 'T',
+                'level': 'F',
+                'type': 'B',
+                'starttime': '2025-10-11 00:00:00',
+                'endtime': '2025-10-11 00:01:00',
+            }
+            for i in range(count)
+        ]
+
+    def paged_request(self, rows):
+        """limit/offset을 따르는 _request 대역"""
+        calls = []
+
+        def request(method, endpoint, params=None, json_data=None):
+            calls.append(dict(params))
+            offset, limit = params['offset'], params['limit']
+            return {'output': rows[offset:offset + limit]}
+
+        return request, calls
+
+    def test_pages_through_results(self):
+        """limit/offset으로 모든 페이지를 순회하는지 테스트"""
+        client = BaculaClient('localhost', 9096, 'admin', 'secret')
+        request, calls = self.paged_request(self.make_rows(5))
+
+        with patch.object(client, '_request', side_effect=request):
+            jobs = list(client.get_jobs_iter(level='F', page_size=2))
+
+        assert [job.job_id for job in jobs] == [1, 2, 3, 4, 5]
+        assert [call['offset'] for call in calls] == [0, 2, 4]
+        assert all(call['level'] == 'F' for call in calls)
+        client.close()
+
+    def test_stops_when_limit_ignored(self):
+        """서버가 limit을 무시하면 한 번만 조회하는지 테스트"""
+        client = BaculaClient('localhost', 9096, 'admin', 'secret')
+        rows = self.make_rows(5)
+
+        with patch.object(
+            client, '_request', return_value={'output': rows}
+        ) as mock_request:
+            jobs = list(client.get_jobs_iter(page_size=2))
+
+        assert len(jobs) == 5
+        assert mock_request.call_count == 1
+        client.close()
+
+    def test_continues_when_server_caps_page_size(self):
+        """서버 최대 페이지 크기가 더 작아도 빈 페이지까지 계속 조회하는지 테스트"""
+        client = BaculaClient('localhost', 9096, 'admin', 'secret')
+        rows = self.make_rows(7)
+        calls = []
+
+        def request(method, endpoint, params=None, json_data=None):
+            calls.append(params['offset'])
+            offset = params['offset']
+            return {'output': rows[offset:offset + min(params['limit'], 3)]}
+
+        with patch.object(client, '_request', side_effect=request):
+            jobs = list(client.get_jobs_iter(page_size=5))
+
+        assert [job.job_id for job in jobs] == list(range(1, 8))
+        assert calls == [0, 3, 6, 7]
+        client.close()
+
+    def test_stops_when_offset_ignored(self):
+        """offset을 무시하는 서버가 같은 페이지를 돌려주면 중복 없이 종료하는지 테스트"""
+        client = BaculaClient('localhost', 9096, 'admin', 'secret')
+
+        with patch.object(
+            client, '_request', return_value={'output': self.make_rows(3)}
+        ) as mock_request:
+            jobs = list(client.get_jobs_iter(page_size=5))
+
+        assert [job.job_id for job in jobs] == [1, 2, 3]
+        assert mock_request.call_count == 2
+        client.close()
+
+    def test_skips_unparsable_rows(self):
+        """파싱 실패한 작업은 건너뛰는지 테스트"""
+        client = BaculaClient('localhost', 9096, 'admin', 'secret')
+        rows = self.make_rows(2)
+        del rows[0]['starttime']
+
+        with patch.object(client, '_request', return_value={'output': rows}):
+            jobs = list(client.get_jobs_iter(page_size=10))
+
+        assert [job.job_id for job in jobs] == [2]
+        client.close()
@@ -0,0 +1,141 @@
+"""BackupService 테스트"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.api.client import BaculaAPIError
+from src.services.backup import BackupService
+from src.store.job_store import JobStore
+
+
+START = datetime(2025, 10, 10, 22, 0, 0)
+END = datetime(2025, 10, 11, 9, 0, 0)
+
+
+def make_job_data(job_id, level, status='T'):
+    """API 응답 형식의 작업 데이터 생성"""
+    return {
+        'jobid': job_id,
+        'name': f'job-{job_id}',
+        'client': 'client-1',
+        'jobstatus': status,
+        'level': level,
+        'type': 'B',
+        'starttime': '2025-10-11 00:00:00',
+        'endtime': '2025-10-11 00:10:00',
+        'jobbytes': 1024,
+        'jobfiles': 10,
+        'joberrors': 0,
+    }
+
+
+class FakeClient:
+    """레벨별 응답을 반환하는 BaculaClient 대역"""
+
+    def __init__(self, delays=None, errors=None, rows=None):
+        self.delays = delays or {}
+        self.rows = rows or []
+        self.errors = errors or {}
+        self.calls = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def get_jobs(self, start_time=None, end_time=None, level=None, type=None):
+        with self.lock:
+            self.calls.append(level)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self.delays.get(level, 0))
+        if level in self.errors:
+            raise self.errors[level]
+        if level is None:
+            return self.rows
+        return [make_job_data(ord(level), level)]
+
+
+class TestFetchJobsByLevel:
+    """레벨별 작업 조회 테스트"""
+
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_merge_order_is_deterministic(self, workers):
+        """응답 순서와 무관하게 F → I → D 순서로 병합되는지 테스트"""
+        client = FakeClient(delays={'F': 0.05, 'I': 0.02})
+        service = BackupService(client, fetch_workers=workers)
+
+        jobs_data = service._fetch_jobs_by_level(START, END)
+
+        assert [job['level'] for job in jobs_data] == ['F', 'I', 'D']
+
+    def test_concurrent_fetch_uses_worker_threads(self):
+        """동시 조회 모드에서 스레드 풀이 사용되는지 테스트"""
+        client = FakeClient()
+        service = BackupService(client, fetch_workers=3)
+
+        service._fetch_jobs_by_level(START, END)
+
+        assert sorted(client.calls) == ['D', 'F', 'I']
+        assert all(name.startswith('bacula-fetch') for name in client.threads)
+
+    def test_workers_are_bounded(self):
+        """동시 조회 스레드 수가 레벨 수로 제한되는지 테스트"""
+        assert BackupService(FakeClient(), fetch_workers=10).fetch_workers == 3
+        assert BackupService(FakeClient(), fetch_workers=0).fetch_workers == 1
+
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_level_error_propagates(self, workers):
+        """레벨 조회 실패 시 BaculaAPIError가 그대로 전달되는지 테스트"""
+        error = BaculaAPIError('작업 목록 조회 실패: boom')
+        client = FakeClient(errors={'I': error})
+        service = BackupService(client, fetch_workers=workers)
+
+        with pytest.raises(BaculaAPIError) as exc_info:
+            service._fetch_jobs_by_level(START, END)
+
+        assert exc_info.value is error
+
+
+class TestSingleFetchStrategy:
+    """단일 요청 조회 전략 테스트"""
+
+    def test_partitions_by_level(self):
+        """1회 요청 결과가 F → I → D 순서로 분할되는지 테스트"""
+        rows = [
+            make_job_data(1, 'I'),
+            make_job_data(2, 'F'),
+            make_job_data(3, 'D'),
+            make_job_data(4, 'F'),
+            make_job_data(5, 'V'),
+        ]
+        client = FakeClient(rows=rows)
+        service = BackupService(client, fetch_strategy='single')
+
+        jobs_data = service._fetch_jobs_by_level(START, END)
+
+        assert [job['jobid'] for job in jobs_data] == [2, 4, 1, 3]
+        assert client.calls == [None]
+
+    def test_invalid_strategy(self):
+        """잘못된 조회 전략 테스트"""
+        with pytest.raises(ValueError, match="조회 전략"):
+            BackupService(FakeClient(), fetch_strategy='bulk')
+
+
+class TestJobStoreFetch:
+    """로컬 저장소 기반 조회 테스트"""
+
+    def test_second_query_uses_store(self):
+        """이미 조회한 기간은 API를 다시 호출하지 않는지 테스트"""
+        client = FakeClient()
+        with JobStore(':memory:') as store:
+            service = BackupService(client, job_store=store)
+
+            first, _, _ = service.get_jobs_by_period('test', START, END)
+            calls_after_first = len(client.calls)
+            second, _, _ = service.get_jobs_by_period('test', START, END)
+
+        assert calls_after_first == 3
+        assert len(client.calls) == 3
+        assert [job.level for job in second] == ['F', 'I', 'D']
+        assert [job.job_id for job in second] == [job.job_id for job in first]
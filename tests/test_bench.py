@@ -0,0 +1,161 @@
+"""파이프라인 벤치마크 테스트"""
+
+import json
+import logging
+from argparse import ArgumentParser
+from pathlib import Path
+
+import pytest
+
+from src.bench.dataset import DatasetSpec, make_job_payloads, mix_summary, parse_mix
+from src.bench.runner import (
+    BenchError,
+    compare_to_baseline,
+    load_baseline,
+    parse_size,
+    run_suite,
+    save_baseline,
+)
+from src.commands.bench import BenchCommand
+from src.models.backup_job import BackupJob
+
+
+FIXTURE_FILE = Path(__file__).parent / 'fixtures' / 'api_response_jobs.json'
+
+
+class TestDataset:
+    """합성 작업 응답 생성 테스트"""
+
+    def test_matches_fixture_schema(self):
+        """픽스처와 같은 필드 구성이고 BackupJob으로 파싱되는지 테스트"""
+        fixture = json.loads(FIXTURE_FILE.read_text(encoding='utf-8'))
+        payloads = make_job_payloads(DatasetSpec(50))
+
+        assert all(set(payload) == set(fixture[0]) for payload in payloads)
+        jobs = [BackupJob.from_api_response(payload) for payload in payloads]
+        assert [job.job_id for job in jobs] == list(range(1, 51))
+        assert all(job.end_time is None for job in jobs if job.status == 'R')
+
+    def test_deterministic_with_seed(self):
+        """같은 시드는 같은 데이터를, 다른 시드는 다른 데이터를 만드는지 테스트"""
+        first = make_job_payloads(DatasetSpec(100, seed=1))
+        assert make_job_payloads(DatasetSpec(100, seed=1)) == first
+        assert make_job_payloads(DatasetSpec(100, seed=2)) != first
+
+    def test_status_and_level_mix(self):
+        """지정한 상태/레벨 비율만 생성하는지 테스트"""
+        spec = DatasetSpec(1000, status_mix=parse_mix('T=1,f=1'), level_mix=parse_mix('F=1,I=0'))
+        statuses, levels = mix_summary(make_job_payloads(spec))
+
+        assert set(statuses) == {'T', 'f'} and 400 < statuses['T'] < 600
+        assert levels == {'F': 1000}
+
+    @pytest.mark.parametrize('text', ['T85', 'T=-1', 'T=0,f=0', '=3'])
+    def test_invalid_mix(self, text):
+        """잘못된 비율 문자열 테스트"""
+        with pytest.raises(ValueError):
+            parse_mix(text)
+
+    def test_parse_size(self):
+        """작업 수 접미사(k, M) 파싱 테스트"""
+        assert [parse_size(text) for text in ('500', '10k', '1M')] == [500, 10000, 1000000]
+        with pytest.raises(ValueError):
+            parse_size('0')
+
+
+@pytest.fixture(scope='module')
+def results():
+    """여러 테스트가 공유하는 측정 결과 (측정은 모듈에서 한 번만 수행)"""
+    return run_suite([DatasetSpec(100), DatasetSpec(300)])
+
+
+class TestPipelineBenchmark:
+    """오프라인 파이프라인 측정 및 기준선 비교 테스트"""
+
+    def test_measures_each_stage(self, results):
+        """단계별 처리량과 메모리를 측정하는지 테스트"""
+        assert [result.spec.size for result in results] == [100, 300]
+        for result in results:
+            assert list(result.stages) == ['parse', 'stats', 'render', 'inline']
+            assert result.html_bytes > 0
+            for stage_result in result.stages.values():
+                assert stage_result.jobs == result.spec.size
+                assert stage_result.jobs_per_second > 0
+
+    def test_trace_memory_and_no_inline(self):
+        """tracemalloc 할당 최대치 측정과 inline 단계 제외 테스트"""
+        result, = run_suite([DatasetSpec(100)], trace_memory=True, inline=False)
+
+        assert list(result.stages) == ['parse', 'stats', 'render']
+        assert all(stage.traced_peak_bytes > 0 for stage in result.stages.values())
+
+    def test_baseline_roundtrip(self, results, tmp_path):
+        """저장한 기준선과 비교하면 회귀가 없는지 테스트"""
+        path = tmp_path / 'baseline.json'
+        save_baseline(path, results)
+
+        comparisons = compare_to_baseline(results, load_baseline(path))
+        assert len(comparisons) == 8
+        assert not any(comparison.regressed for comparison in comparisons)
+
+    def test_detects_regression(self, results, tmp_path):
+        """기준선보다 허용 범위 넘게 느리면 회귀로 판정하는지 테스트"""
+        path = tmp_path / 'baseline.json'
+        save_baseline(path, results)
+        baseline = load_baseline(path)
+        baseline['results'][0]['stages']['render']['jobs_per_second'] *= 10
+        # 명세가 다른 항목은 비교하지 않음
+        baseline['results'][1]['seed'] = 99
+
+        comparisons = compare_to_baseline(results, baseline, tolerance=0.5)
+        assert {comparison.size for comparison in comparisons} == {100}
+        assert [c.stage for c in comparisons if c.regressed] == ['render']
+
+    def test_invalid_baseline(self, tmp_path):
+        """없는 파일과 형식이 다른 기준선 파일 테스트"""
+        with pytest.raises(BenchError):
+            load_baseline(tmp_path / 'missing.json')
+
+        path = tmp_path / 'baseline.json'
+        path.write_text('{"version": 0}', encoding='utf-8')
+        with pytest.raises(BenchError):
+            load_baseline(path)
+
+
+class TestBenchCommand:
+    """bench 커맨드 테스트"""
+
+    def run_command(self, *argv):
+        command = BenchCommand()
+        command.logger = logging.getLogger('test')
+        parser = ArgumentParser()
+        command.setup_args(parser)
+        return command.execute(parser.parse_args(list(argv)))
+
+    def test_save_then_compare(self, tmp_path):
+        """기준선 저장 후 비교 실행 (.env 없이) 테스트"""
+        baseline = tmp_path / 'baseline.json'
+        output = tmp_path / 'result.json'
+        args = ('--sizes', '100', '--repeat', '1', '--baseline', str(baseline))
+
+        assert self.run_command(*args, '--save-baseline') == 0
+        assert baseline.exists()
+        assert self.run_command(*args, '--tolerance', '0.99', '--json', str(output)) == 0
+        assert json.loads(output.read_text(encoding='utf-8'))[0]['size'] == 100
+
+    def test_regression_exit_code(self, tmp_path):
+        """회귀가 있으면 종료 코드 1을 반환하는지 테스트"""
+        baseline = tmp_path / 'baseline.json'
+        args = ('--sizes', '100', '--repeat', '1', '--no-inline', '--baseline', str(baseline))
+        assert self.run_command(*args, '--save-baseline') == 0
+
+        data = json.loads(baseline.read_text(encoding='utf-8'))
+        data['results'][0]['stages']['parse']['jobs_per_second'] *= 1000
+        baseline.write_text(json.dumps(data), encoding='utf-8')
+
+        assert self.run_command(*args) == 1
+
+    def test_invalid_arguments(self):
+        """잘못된 크기/비율 인자 테스트"""
+        assert self.run_command('--sizes', 'abc') == 1
+        assert self.run_command('--status-mix', 'T85') == 1
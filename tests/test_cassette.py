@@ -0,0 +1,138 @@
+"""API 응답 녹화/재생 테스트"""
+
+import gzip
+import json
+import logging
+from argparse import Namespace
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api.cassette import Cassette, CassetteError
+from src.api.client import BaculaClient
+from src.bench.dataset import DatasetSpec
+from src.bench.fake_server import FakeBaculumServer
+from src.commands.report import ReportCommand
+
+
+@pytest.fixture
+def server():
+    with FakeBaculumServer.from_spec(DatasetSpec(120, seed=5)) as server:
+        yield server
+
+
+class TestCassette:
+    """녹화/재생 저장소 테스트"""
+
+    def test_request_key_is_normalized(self):
+        """파라미터 순서/타입과 None 값에 관계없이 같은 키인지 테스트"""
+        _, first = Cassette.request_key('get', 'jobs', {'limit': 1, 'level': 'F'})
+        _, second = Cassette.request_key('GET', '/jobs', {'level': 'F', 'limit': '1', 'x': None})
+        _, other = Cassette.request_key('GET', 'jobs', {'level': 'I', 'limit': 1})
+
+        assert first == second != other
+        assert first.startswith('jobs-') and first.endswith('.json.gz')
+
+    def test_record_then_replay_without_network(self, server, tmp_path):
+        """녹화한 응답을 서버 없이 그대로 재생하는지 테스트"""
+        cassette = Cassette(tmp_path / 'cassette', 'record')
+        with BaculaClient(**server.client_config(), cassette=cassette) as client:
+            recorded = (
+                client.get_jobs(level='F', type='B'),
+                client.get_clients(),
+                client.get_job_details(7),
+                [job.job_id for job in client.get_jobs_iter(page_size=50)],
+            )
+        assert cassette.recorded == 3 + 3
+
+        config = server.client_config()
+        server.stop()
+        replay = Cassette(tmp_path / 'cassette', 'replay')
+        with BaculaClient(**config, cassette=replay) as client:
+            replayed = (
+                client.get_jobs(level='F', type='B'),
+                client.get_clients(),
+                client.get_job_details(7),
+                [job.job_id for job in client.get_jobs_iter(page_size=50)],
+            )
+
+        assert replayed == recorded
+        assert replay.replayed == 6
+
+    def test_responses_are_compressed(self, server, tmp_path):
+        """응답이 요청 정보와 함께 gzip으로 저장되는지 테스트"""
+        cassette = Cassette(tmp_path, 'record')
+        with BaculaClient(**server.client_config(), cassette=cassette) as client:
+            client.get_clients()
+
+        path, = tmp_path.glob('clients-*.json.gz')
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            entry = json.load(f)
+        assert entry['request'] == {'method': 'GET', 'endpoint': 'clients', 'params': {},
+                                    'json': None}
+        assert entry['response']['output'] == server.clients
+
+    def test_replay_miss(self, tmp_path):
+        """녹화되지 않은 요청과 없는 디렉토리는 CassetteError인지 테스트"""
+        with pytest.raises(CassetteError):
+            Cassette(tmp_path / 'missing', 'replay')
+
+        client = BaculaClient('127.0.0.1', 1, 'u', 'p', cassette=Cassette(tmp_path, 'replay'))
+        with client, pytest.raises(CassetteError, match='녹화된 응답이 없습니다'):
+            client._request('GET', 'clients')
+
+    def test_record_write_failure(self, server, tmp_path):
+        """녹화 파일 쓰기 실패는 요청 실패가 아닌 CassetteError로 알리는지 테스트"""
+        cassette = Cassette(tmp_path, 'record')
+        cassette.save = MagicMock(side_effect=OSError('disk full'))
+
+        with BaculaClient(**server.client_config(), cassette=cassette) as client:
+            with pytest.raises(CassetteError, match='녹화 실패.*disk full'):
+                client._request('GET', 'clients')
+
+        assert server.stats().endpoints['clients'] == 1
+
+    def test_invalid_mode(self, tmp_path):
+        """잘못된 모드 테스트"""
+        with pytest.raises(ValueError):
+            Cassette(tmp_path, 'rewind')
+
+
+class TestReportCommandCassette:
+    """report --record/--replay 테스트"""
+
+    def make_command(self, server_config):
+        command = ReportCommand()
+        command.logger = logging.getLogger('test')
+        command.config = MagicMock(
+            api_fetch_workers=3, api_fetch_strategy='per_level', api_page_size=0,
+            api_log_workers=3
+        )
+        command.config.get_baculum_client_config.return_value = server_config
+        return command
+
+    def make_args(self, record=None, replay=None):
+        return Namespace(mode='test', store=False, incremental=False, record=record, replay=replay)
+
+    def test_replay_uses_recorded_period(self, tmp_path):
+        """재생 시 녹화 당시 기간으로 같은 작업을 조회하는지 테스트"""
+        now = datetime.now().replace(microsecond=0)
+        spec = DatasetSpec(90, start=now - timedelta(days=3), end=now - timedelta(days=1))
+        cassette_dir = tmp_path / 'cassette'
+
+        with FakeBaculumServer.from_spec(spec) as server:
+            config = server.client_config()
+            recorded = self.make_command(config)._collect_jobs(self.make_args(record=cassette_dir))
+
+        assert (cassette_dir / 'cassette.json').exists()
+        replayed = self.make_command(config)._collect_jobs(self.make_args(replay=cassette_dir))
+
+        assert [job.job_id for job in replayed[0]] == [job.job_id for job in recorded[0]]
+        # 실패 작업 로그도 녹화/재생됨
+        assert [job.error_message for job in replayed[0]] == [
+            job.error_message for job in recorded[0]
+        ]
+        assert any(job.error_message for job in recorded[0])
+        assert len(recorded[0]) == spec.size
+        assert replayed[1:] == recorded[1:]
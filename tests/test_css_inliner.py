@@ -0,0 +1,91 @@
+"""CssInliner 테스트"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import premailer
+from premailer import transform
+
+from src.utils.css_inliner import CssInliner
+
+
+HTML = '''<!DOCTYPE html>
+<html>
+<head>
+<style>
+    td { padding: 4px; text-align: left; }
+    .failed { color: red !important; background-color: #fee; }
+    table td.failed { font-weight: bold; }
+    a:hover { color: blue; }
+    tr:first-child td { border-top: 0; }
+    @media (max-width: 600px) { td { padding: 2px; } }
+</style>
+</head>
+<body>
+<table>
+<tr><td class="failed" style="color: black">1</td><td>2</td></tr>
+<tr><td>3</td><td class="failed">4</td></tr>
+</table>
+<a href="#">link</a>
+</body>
+</html>
+'''
+
+
+class TestCssInliner:
+    """캐시 기반 CSS 인라인 변환 테스트"""
+
+    def test_matches_premailer(self):
+        """premailer 기본 변환과 결과가 같은지 테스트"""
+        inliner = CssInliner()
+
+        assert inliner.transform(HTML) == transform(HTML)
+
+    def test_stylesheet_compiled_once(self):
+        """같은 스타일시트는 한 번만 컴파일하고 재사용하는지 테스트"""
+        inliner = CssInliner()
+        first = inliner.transform(HTML)
+        second = inliner.transform(HTML.replace('>1<', '>10<'))
+
+        assert (inliner.misses, inliner.hits) == (1, 1)
+        assert second == first.replace('>1<', '>10<')
+
+        inliner.transform(HTML.replace('padding: 4px', 'padding: 6px'))
+        assert inliner.misses == 2
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 오래된 스타일시트가 제거되는지 테스트"""
+        inliner = CssInliner(max_size=1)
+        inliner.transform(HTML)
+        inliner.transform(HTML.replace('4px', '6px'))
+        inliner.transform(HTML)
+
+        assert inliner.misses == 3
+
+    def test_concurrent_transform(self):
+        """여러 스레드에서 동시에 변환해도 결과가 같은지 테스트"""
+        inliner = CssInliner()
+        expected = transform(HTML)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: inliner.transform(HTML), range(16)))
+
+        assert all(result == expected for result in results)
+
+    def test_does_not_change_cssutils_logger_level(self):
+        """cssutils 로거 레벨을 바꾸지 않는지 테스트"""
+        cssutils_logger = logging.getLogger('CSSUTILS')
+        level = cssutils_logger.level
+
+        CssInliner().transform(HTML.replace('padding: 4px', 'paddin: 4px'))
+
+        assert cssutils_logger.level == level
+
+    def test_unsupported_premailer_falls_back(self, monkeypatch):
+        """검증되지 않은 premailer 버전이면 premailer.transform으로 변환하는지 테스트"""
+        monkeypatch.setattr(premailer, '__version__', '99.0.0')
+        inliner = CssInliner()
+
+        assert not inliner.cached
+        assert inliner.transform(HTML) == transform(HTML)
+        assert inliner.misses == 0
@@ -0,0 +1,59 @@
+"""날짜/시간 유틸리티 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from src.utils.datetime import parse_api_datetime, parse_datetime
+
+
+class TestParseApiDatetime:
+    """parse_api_datetime 테스트"""
+
+    def test_matches_strptime(self):
+        """strptime 결과와 동일한지 테스트"""
+        value = '2025-10-11 00:00:03'
+
+        assert parse_api_datetime(value) == datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+
+    def test_repeated_values_are_cached(self):
+        """반복되는 시간 문자열은 캐시를 사용하는지 테스트"""
+        parse_api_datetime.cache_clear()
+
+        for _ in range(5):
+            parse_api_datetime('2025-10-11 22:00:00')
+
+        info = parse_api_datetime.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+    @pytest.mark.parametrize('value', [
+        '2025-10-11',
+        '2025-10-11T00:00:03',
+        '2025/10/11 00:00:03',
+        '2025-13-11 00:00:03',
+        '',
+    ])
+    def test_rejects_other_layouts(self, value):
+        """고정 형식이 아니면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            parse_api_datetime(value)
+
+
+class TestParseDatetime:
+    """parse_datetime 테스트"""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('2025-10-11 14:30:45', datetime(2025, 10, 11, 14, 30, 45)),
+        ('2025-10-11', datetime(2025, 10, 11)),
+        ('2025/10/11 14:30:45', datetime(2025, 10, 11, 14, 30, 45)),
+        ('2025/10/11', datetime(2025, 10, 11)),
+    ])
+    def test_supported_formats(self, value, expected):
+        """지원 형식 파싱 테스트"""
+        assert parse_datetime(value) == expected
+
+    def test_unsupported_format(self):
+        """지원하지 않는 형식 테스트"""
+        with pytest.raises(ValueError, match="지원하지 않는"):
+            parse_datetime('11.10.2025')
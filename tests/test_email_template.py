@@ -0,0 +1,123 @@
+"""이메일용 템플릿 변형 테스트"""
+
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+from premailer import transform
+
+from src.report import email_template
+from src.report.email_template import (
+    CSS_INLINED_MARKER,
+    ensure_email_template,
+    inline_template_css,
+    is_css_inlined,
+)
+from src.report.generator import ReportGenerator
+from tests.test_report_generator import PERIOD, make_jobs
+
+
+SOURCE = '''<html>
+<head>
+<style>
+    .cell { padding: 4px; }
+</style>
+</head>
+<body>
+{% for job in jobs %}<p class="cell">{{ job if job > 0 else '-' }}</p>{% endfor %}
+</body>
+</html>
+'''
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    directory = tmp_path / 'templates'
+    directory.mkdir()
+    (directory / 'page.html').write_text(SOURCE, encoding='utf-8')
+    return directory
+
+
+def normalize(html):
+    return re.sub(r'\s+', ' ', html).strip()
+
+
+class TestInlineTemplateCss:
+    """템플릿 CSS 인라인 변환 테스트"""
+
+    def test_inlines_css_and_keeps_jinja(self):
+        """CSS는 인라인되고 Jinja 구문은 그대로 유지되는지 테스트"""
+        inlined = inline_template_css(SOURCE)
+
+        assert '<style>' not in inlined
+        assert 'style="padding:4px"' in inlined
+        assert "{{ job if job > 0 else '-' }}" in inlined
+        assert '{% for job in jobs %}' in inlined
+        assert is_css_inlined(inlined)
+
+
+class TestEnsureEmailTemplate:
+    """이메일 변형 캐시 테스트"""
+
+    def test_reused_until_source_changes(self, template_dir, tmp_path):
+        """원본이 바뀌지 않으면 다시 변환하지 않고, 바뀌면 새로 만드는지 테스트"""
+        cache_dir = tmp_path / 'email'
+        email_template._variants.clear()
+
+        with patch.object(
+            email_template, 'inline_template_css', wraps=inline_template_css
+        ) as mock_inline:
+            first = ensure_email_template(template_dir, 'page.html', cache_dir)
+            email_template._variants.clear()
+            assert ensure_email_template(template_dir, 'page.html', cache_dir) == first
+            assert mock_inline.call_count == 1
+
+            (template_dir / 'page.html').write_text(
+                SOURCE.replace('4px', '8px'), encoding='utf-8'
+            )
+            second = ensure_email_template(template_dir, 'page.html', cache_dir)
+
+        assert second != first
+        assert mock_inline.call_count == 2
+        assert [p.name for p in cache_dir.iterdir()] == [second]
+
+
+class TestEmailReadyReport:
+    """이메일용 변형으로 생성한 리포트 테스트"""
+
+    def test_matches_send_time_inlining(self, tmp_path):
+        """빌드 시점 인라인 결과가 발송 시점 premailer 변환과 같은지 테스트"""
+        config = MagicMock()
+        config.has_baculum_web_config.return_value = True
+        config.baculum_web_host = 'baculum'
+        config.baculum_web_port = 9095
+        config.template_cache_dir = str(tmp_path / 'template_cache')
+        config.template_module_dir = None
+        output_dir = str(tmp_path / 'reports')
+
+        plain = ReportGenerator(config, output_dir=output_dir, email_ready=False)
+        ready = ReportGenerator(config, output_dir=output_dir, email_ready=True)
+        plain_path = plain.generate_report(make_jobs(), *PERIOD, filename='plain.html')
+        ready_path = ready.generate_report(make_jobs(), *PERIOD, filename='ready.html')
+
+        with open(plain_path, encoding='utf-8') as f:
+            expected = transform(f.read())
+        with open(ready_path, encoding='utf-8') as f:
+            actual = f.read()
+
+        assert is_css_inlined(actual)
+        assert normalize(actual.replace(CSS_INLINED_MARKER, '')) == normalize(expected)
+
+    def test_sender_skips_inlining(self, tmp_path):
+        """CSS 인라인 리포트는 발송 시 변환하지 않는지 테스트"""
+        from src.mail.sender import EmailSender
+
+        report = tmp_path / 'report.html'
+        report.write_text(f'<html><head>{CSS_INLINED_MARKER}</head></html>', encoding='utf-8')
+        sender = EmailSender('smtp.example.com', 587, 'user', 'secret')
+
+        with patch.object(sender, '_transform_css_to_inline') as mock_transform, \
+                patch.object(sender, 'send_html_email', return_value=True):
+            assert sender.send_report_email('to@example.com', report, '2025-10-11')
+
+        mock_transform.assert_not_called()
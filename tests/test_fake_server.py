@@ -0,0 +1,153 @@
+"""로컬 Baculum API 대역 서버 테스트"""
+
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.api.client import BaculaAPIError, BaculaClient
+from src.bench.dataset import DatasetSpec
+from src.bench.fake_server import FakeBaculumServer, FaultConfig
+from src.bench.runner import FetchOptions, run_suite
+from src.models.job_aggregate import AggregatedJobs, JobAggregate
+from src.services.backup import BackupService
+
+
+SPEC = DatasetSpec(300, seed=3)
+
+
+@pytest.fixture
+def server():
+    with FakeBaculumServer.from_spec(SPEC) as server:
+        yield server
+
+
+def make_client(server, **overrides):
+    return BaculaClient(**server.client_config(**overrides))
+
+
+class TestEndpoints:
+    """엔드포인트 응답 테스트"""
+
+    def test_jobs_filters(self, server):
+        """레벨/기간 필터와 jobid 내림차순 limit/offset 페이지 조회 테스트"""
+        with make_client(server) as client:
+            full_jobs = client.get_jobs(level='F', type='B')
+            window = client.get_jobs(
+                start_time=datetime(2025, 10, 11, 0, 0), end_time=datetime(2025, 10, 11, 2, 0)
+            )
+            paged = list(client.get_jobs_iter(SPEC.start, SPEC.end, page_size=70))
+
+        assert full_jobs and all(job['level'] == 'F' for job in full_jobs)
+        assert window and all('2025-10-11 00:00:00' <= job['starttime'] <= '2025-10-11 02:00:00'
+                              for job in window)
+        assert [job.job_id for job in paged] == list(range(SPEC.size, 0, -1))
+        assert server.stats().endpoints['jobs'] == 2 + 5
+
+    def test_details_clients_and_log(self, server):
+        """작업 상세, 클라이언트 목록, 작업 로그 테스트"""
+        failed = next(job for job in server.jobs if job['jobstatus'] == 'f')
+
+        with make_client(server) as client:
+            detail = client.get_job_details(failed['jobid'])
+            clients = client.get_clients()
+            log = client._request('GET', f"jobs/{failed['jobid']}/log")['output']
+
+        assert detail == failed
+        assert {entry['name'] for entry in clients} == {job['client'] for job in server.jobs}
+        assert any('Fatal error' in line for line in log)
+        assert log[-1].endswith('*** Backup Error ***')
+
+    def test_not_found_and_auth(self, server):
+        """없는 작업과 잘못된 인증 정보는 HTTP 오류로 응답하는지 테스트"""
+        with make_client(server) as client, pytest.raises(BaculaAPIError, match='404'):
+            client.get_job_details(99999)
+
+        with make_client(server, password='wrong') as client:
+            with pytest.raises(BaculaAPIError, match='401'):
+                client.get_clients()
+
+
+class TestStreamingFetch:
+    """페이지 단위 스트리밍 조회 테스트"""
+
+    def test_keeps_only_listed_jobs(self, server):
+        """전체 작업을 집계하면서 리포트 표시 작업만 보관하는지 테스트"""
+        with make_client(server) as client:
+            full, _, _ = BackupService(client).get_jobs_by_period('test', SPEC.start, SPEC.end)
+            streamed, _, _ = BackupService(client, page_size=40).get_jobs_by_period(
+                'test', SPEC.start, SPEC.end
+            )
+
+        assert isinstance(streamed, AggregatedJobs)
+        assert streamed.aggregate.groups == JobAggregate.from_jobs(full).groups
+        assert sorted(job.job_id for job in streamed) == sorted(
+            job.job_id for job in full if job.is_report_listed
+        )
+        assert len(streamed) < len(full)
+
+
+class TestFaultInjection:
+    """지연/오류/무응답 주입 테스트"""
+
+    def test_latency_and_concurrency(self, server):
+        """지연이 적용되고 동시 조회 시 요청이 겹치는지 테스트"""
+        server.faults = FaultConfig(latency=0.1)
+
+        with make_client(server) as client:
+            started = time.perf_counter()
+            BackupService(client, fetch_workers=3)._fetch_jobs_by_level(SPEC.start, SPEC.end)
+            elapsed = time.perf_counter() - started
+
+        stats = server.stats()
+        assert stats.requests == 3 and stats.max_in_flight == 3
+        assert 0.1 <= elapsed < 0.3
+
+    def test_server_error_is_not_retried(self, server):
+        """5xx 응답은 재시도 없이 BaculaAPIError로 전달되는지 테스트"""
+        server.faults = FaultConfig(fail_first=1, error_status=502)
+
+        with make_client(server) as client, pytest.raises(BaculaAPIError, match='502'):
+            client.get_clients()
+        assert server.stats().injected_errors == 1
+
+    def test_timeout_retry_and_backoff(self, server):
+        """무응답은 타임아웃 후 지수 백오프로 재시도하는지 테스트"""
+        server.faults = FaultConfig(timeout_rate=1.0, stall_seconds=5)
+
+        with make_client(server, timeout=0.2, max_retries=3) as client:
+            with patch('src.api.client.time.sleep') as sleep:
+                with pytest.raises(BaculaAPIError, match='타임아웃'):
+                    client.get_clients()
+
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+        assert server.stats().injected_timeouts == 3
+
+    def test_error_rate_is_seeded(self):
+        """같은 시드는 같은 오류 패턴을 만드는지 테스트"""
+        def error_pattern():
+            faults = FaultConfig(error_rate=0.5, seed=7)
+            with FakeBaculumServer(jobs=[], faults=faults) as server:
+                with make_client(server) as client:
+                    pattern = []
+                    for _ in range(10):
+                        try:
+                            client.get_clients()
+                            pattern.append(True)
+                        except BaculaAPIError:
+                            pattern.append(False)
+            return pattern
+
+        assert error_pattern() == error_pattern()
+
+
+class TestBenchFetchStage:
+    """bench fetch 단계 테스트"""
+
+    def test_fetch_stage(self):
+        """대역 서버 조회 결과를 parse 단계가 모두 처리하는지 테스트"""
+        result, = run_suite([DatasetSpec(200)], inline=False, fetch=FetchOptions(workers=3))
+
+        assert list(result.stages) == ['fetch', 'parse', 'stats', 'render']
+        assert result.stages['fetch'].jobs_per_second > 0
@@ -0,0 +1,62 @@
+"""CLI 시작 시간 예산 테스트
+
+짧은 CLI 실행(--help, 모니터링 래퍼의 잦은 호출)이 무거운 의존성을 로드하지
+않는지, src.cli 임포트 시간이 예산 안에 있는지 검사합니다.
+"""
+
+import subprocess
+import sys
+
+from benchmarks.bench_import_time import HEAVY_MODULES, PROJECT_ROOT, median_import_time
+
+
+# src.cli 누적 임포트 시간 예산 (밀리초). 지연 임포트 적용 전 약 250ms, 적용 후 약 40ms
+IMPORT_TIME_BUDGET_MS = 150
+
+
+def loaded_heavy_modules(code: str) -> list:
+    """새 프로세스에서 코드를 실행한 뒤 로드된 무거운 의존성 목록"""
+    script = (
+        f'{code}\n'
+        'import sys\n'
+        f'print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return [name for name in result.stdout.strip().split(',') if name]
+
+
+class TestImportTime:
+    """지연 임포트 및 시작 시간 테스트"""
+
+    def test_cli_parser_does_not_load_heavy_modules(self):
+        """CLI 파서 생성(--help)이 무거운 의존성을 로드하지 않는지 테스트"""
+        assert loaded_heavy_modules('import src.cli; src.cli.create_parser()') == []
+
+    def test_report_without_mail_does_not_load_mail_stack(self):
+        """메일 없는 리포트 경로가 premailer/lxml/smtplib를 로드하지 않는지 테스트"""
+        loaded = loaded_heavy_modules(
+            'import src.commands.report, src.report.generator, src.api.client'
+        )
+
+        assert not {'premailer', 'lxml', 'cssutils', 'smtplib'} & set(loaded)
+
+    def test_artifact_does_not_load_jinja(self):
+        """리포트 산출물 모듈만 임포트할 때 jinja2를 로드하지 않는지 테스트"""
+        loaded = loaded_heavy_modules('from src.report.artifact import RenderedReport')
+
+        assert 'jinja2' not in loaded
+
+    def test_cli_import_time_budget(self):
+        """src.cli 임포트 시간이 예산 안에 있는지 테스트 (-X importtime, 3회 중앙값)"""
+        elapsed_ms, _ = median_import_time('src.cli', runs=3)
+
+        assert elapsed_ms < IMPORT_TIME_BUDGET_MS, (
+            f"src.cli 임포트 시간 {elapsed_ms:.1f}ms가 예산 {IMPORT_TIME_BUDGET_MS}ms를 초과했습니다. "
+            "python -m benchmarks.bench_import_time 으로 원인 모듈을 확인하세요."
+        )
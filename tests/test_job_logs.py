@@ -0,0 +1,129 @@
+"""실패 작업 로그 조회 테스트"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.api.client import BaculaClient
+from src.bench.dataset import DatasetSpec, parse_mix
+from src.bench.fake_server import FakeBaculumServer, FaultConfig, make_job_log
+from src.models.backup_job import BackupJob
+from src.services.backup import BackupService
+from src.services.job_logs import JobLogFetcher, MAX_LINE_LENGTH, extract_error_message
+
+
+# 실패 80건이 나온 밤을 가정한 데이터
+SPEC = DatasetSpec(100, status_mix=parse_mix('T=20,f=50,E=30'), seed=11)
+
+
+@pytest.fixture
+def server():
+    with FakeBaculumServer.from_spec(SPEC) as server:
+        yield server
+
+
+def parse_jobs(server):
+    return [BackupJob.from_api_response(job) for job in server.jobs]
+
+
+class TestExtractErrorMessage:
+    """오류 줄 추출 테스트"""
+
+    def test_bacula_log(self):
+        """Fatal error/Error 줄만 접두어 없이 추출하는지 테스트"""
+        job = {'jobid': 7, 'job': 'job.7', 'client': 'web-fd', 'jobstatus': 'f',
+               'starttime': '2025-10-11 01:00:00', 'endtime': '2025-10-11 01:00:05'}
+
+        message = extract_error_message(make_job_log(job))
+
+        assert message.splitlines() == [
+            'Fatal error: bsock.c:112 Unable to connect to Client: web-fd on web:9102. '
+            'ERR=Connection refused',
+            'Error: No Job status returned from FD.',
+        ]
+        assert extract_error_message(make_job_log(dict(job, jobstatus='T'))) is None
+
+    def test_limits(self):
+        """중복 제거, 최대 줄 수, 줄 길이 제한 테스트"""
+        lines = ['dir JobId 1: Error: same'] * 3 + [
+            f'dir JobId 1: Error: {index}' for index in range(10)
+        ] + ['Fatal error: ' + 'x' * 1000]
+
+        message = extract_error_message(lines, max_lines=3)
+        assert message.splitlines() == ['Error: same', 'Error: 0', 'Error: 1']
+
+        long_line = extract_error_message(lines[-1:])
+        assert len(long_line) == MAX_LINE_LENGTH and long_line.endswith('…')
+
+
+class TestJobLogFetcher:
+    """동시 조회 및 캐시 테스트"""
+
+    def test_concurrent_fetch(self, server):
+        """실패 작업 로그를 동시에 조회하여 error_message를 채우는지 테스트"""
+        server.faults = FaultConfig(latency=0.05)
+        jobs = parse_jobs(server)
+        failed = [job for job in jobs if job.is_failed]
+        assert len(failed) >= 70
+
+        with BaculaClient(**server.client_config(pool_size=8)) as client:
+            started = time.perf_counter()
+            attached = JobLogFetcher(client, workers=8).attach_error_messages(jobs)
+            elapsed = time.perf_counter() - started
+
+        stats = server.stats()
+        assert attached == len(failed)
+        assert all(job.error_message.startswith('Fatal error:') for job in failed)
+        assert all(job.error_message is None for job in jobs if not job.is_failed)
+        assert stats.endpoints['jobs/{id}/log'] == len(failed)
+        assert stats.max_in_flight > 1
+        # 순차 조회(실패 건수 x 50ms)보다 충분히 빠름
+        assert elapsed < len(failed) * 0.05 / 2
+
+    def test_cache_and_existing_messages(self, server):
+        """캐시된 작업과 메시지가 이미 있는 작업은 다시 요청하지 않는지 테스트"""
+        with BaculaClient(**server.client_config()) as client:
+            fetcher = JobLogFetcher(client, workers=4)
+            first = [job for job in parse_jobs(server) if job.is_failed]
+            first[0].error_message = 'already known'
+            fetcher.attach_error_messages(first[:10])
+            assert server.stats().endpoints['jobs/{id}/log'] == 9
+
+            # 다음 실행: 캐시된 9건은 요청하지 않고 나머지만 조회
+            second = parse_jobs(server)
+            fetcher.attach_error_messages(second)
+
+        failed_total = sum(1 for job in second if job.is_failed)
+        assert server.stats().endpoints['jobs/{id}/log'] == failed_total
+        assert first[0].error_message == 'already known'
+        assert all(job.error_message for job in second if job.is_failed)
+
+    def test_fetch_failure_is_not_fatal(self, server):
+        """로그 조회 실패 시 메시지 없이 두고 다음 호출에서 다시 조회하는지 테스트"""
+        jobs = [job for job in parse_jobs(server) if job.is_failed][:5]
+        server.faults = FaultConfig(error_rate=1.0)
+
+        with BaculaClient(**server.client_config()) as client:
+            fetcher = JobLogFetcher(client, workers=2)
+            assert fetcher.attach_error_messages(jobs) == 0
+            assert all(job.error_message is None for job in jobs)
+
+            server.faults = FaultConfig()
+            assert fetcher.attach_error_messages(jobs) == 5
+
+
+class TestBackupServiceLogs:
+    """BackupService 연동 테스트"""
+
+    def test_get_jobs_by_period_attaches_messages(self, server):
+        """기간 조회 결과의 실패 작업에 오류 메시지가 채워지는지 테스트"""
+        with BaculaClient(**server.client_config()) as client:
+            service = BackupService(client, log_fetcher=JobLogFetcher(client))
+            jobs, _, _ = service.get_jobs_by_period(
+                'test', datetime(2025, 10, 10), datetime(2025, 10, 12)
+            )
+
+        assert len(jobs) == SPEC.size
+        assert all(job.error_message for job in jobs if job.is_failed)
+        assert not any(job.error_message for job in jobs if job.is_success)
@@ -0,0 +1,97 @@
+"""JobStore 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from src.store.job_store import JobStore
+
+
+def make_row(job_id, level='F', status='T', client='client-1',
+             starttime='2025-10-11 00:00:00'):
+    """API 응답 형식의 작업 데이터 생성"""
+    return {
+        'jobid': job_id,
+        'name': f'job-{job_id}',
+        'client': client,
+        'jobstatus': status,
+        'level': level,
+        'type': 'B',
+        'starttime': starttime,
+        'endtime': starttime,
+        'jobtdate': 1760108400,
+        'jobbytes': 1024,
+        'jobfiles': 10,
+        'joberrors': 0,
+        'pool': 'pool',
+        'fileset': 'fileset',
+    }
+
+
+@pytest.fixture
+def store():
+    job_store = JobStore(':memory:')
+    yield job_store
+    job_store.close()
+
+
+class TestJobStore:
+    """JobStore 테스트"""
+
+    def test_upsert_replaces_existing_job(self, store):
+        """같은 jobid는 갱신되는지 테스트"""
+        store.upsert_jobs([make_row(1, status='R')])
+        store.upsert_jobs([make_row(1, status='T'), make_row(2)])
+
+        rows = store.query_jobs(
+            datetime(2025, 10, 11, 0, 0, 0), datetime(2025, 10, 11, 1, 0, 0)
+        )
+
+        assert store.count() == 2
+        assert [(row['jobid'], row['jobstatus']) for row in rows] == [(2, 'T'), (1, 'T')]
+
+    def test_query_filters(self, store):
+        """기간/레벨/클라이언트 필터 테스트"""
+        store.upsert_jobs([
+            make_row(1, level='F', client='a'),
+            make_row(2, level='I', client='b'),
+            make_row(3, level='I', client='a', starttime='2025-10-12 00:00:00'),
+        ])
+        start = datetime(2025, 10, 11, 0, 0, 0)
+        end = datetime(2025, 10, 11, 23, 59, 59)
+
+        assert [r['jobid'] for r in store.query_jobs(start, end, levels=['I'])] == [2]
+        assert [r['jobid'] for r in store.query_jobs(start, end, client='a')] == [1]
+
+    def test_unfinished_job_ids(self, store):
+        """종료되지 않은 작업 조회 테스트"""
+        store.upsert_jobs([make_row(1), make_row(2, status='R')])
+
+        ids = store.unfinished_job_ids(
+            datetime(2025, 10, 11, 0, 0, 0), datetime(2025, 10, 11, 1, 0, 0)
+        )
+
+        assert ids == [2]
+
+    def test_uncovered_ranges(self, store):
+        """조회 완료 기간을 제외한 구간 계산 테스트"""
+        day = datetime(2025, 10, 11)
+        store.mark_covered(day.replace(hour=2), day.replace(hour=4))
+        store.mark_covered(day.replace(hour=6), day.replace(hour=8))
+        store.mark_covered(day.replace(hour=4), day.replace(hour=5))
+
+        gaps = store.uncovered_ranges(day.replace(hour=0), day.replace(hour=10))
+
+        assert gaps == [
+            (day.replace(hour=0), day.replace(hour=2)),
+            (day.replace(hour=5), day.replace(hour=6)),
+            (day.replace(hour=8), day.replace(hour=10)),
+        ]
+
+    def test_fully_covered_has_no_gaps(self, store):
+        """전체가 포함된 기간은 API 조회 구간이 없는지 테스트"""
+        start = datetime(2025, 10, 11, 0, 0, 0, 500)
+        end = datetime(2025, 10, 11, 9, 0, 0, 900)
+        store.mark_covered(start, end)
+
+        assert store.uncovered_ranges(start, end) == []
@@ -0,0 +1,82 @@
+"""JobTable 테스트"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.models.backup_job import BackupJob
+from src.models.job_table import JobTable
+
+
+FIXTURE_PATH = Path(__file__).parent / 'fixtures' / 'api_response_jobs.json'
+
+
+@pytest.fixture
+def api_rows():
+    return json.loads(FIXTURE_PATH.read_text(encoding='utf-8'))
+
+
+class TestJobTable:
+    """JobTable 테스트"""
+
+    def test_rows_match_backup_job(self, api_rows):
+        """행 뷰가 BackupJob.from_api_response와 동일한지 테스트"""
+        table = JobTable.from_api_rows(api_rows)
+
+        assert len(table) == len(api_rows)
+        assert list(table) == [BackupJob.from_api_response(row) for row in api_rows]
+
+    def test_running_job_without_endtime(self):
+        """종료 시간이 없는 작업 테스트"""
+        table = JobTable.from_jobs([
+            BackupJob(
+                job_id=1, job_name='job', client_name='client', status='R',
+                level='I', job_type='B',
+                start_time=datetime(2025, 10, 11, 0, 0, 0), end_time=None,
+                backup_bytes=0, job_files=0, job_errors=0,
+            )
+        ])
+
+        assert table[0].end_time is None
+        assert table[0].is_running is True
+
+    def test_invalid_row_leaves_table_unchanged(self, api_rows):
+        """파싱 실패 시 컬럼이 어긋나지 않는지 테스트"""
+        table = JobTable.from_api_rows(api_rows[:1])
+        broken = dict(api_rows[1], starttime='invalid')
+
+        with pytest.raises(ValueError):
+            table.append_api_row(broken)
+
+        assert len(table) == 1
+        assert len(table.statuses) == len(table.backup_bytes) == 1
+
+    def test_filters_and_aggregates(self, api_rows):
+        """필터 및 집계 결과가 행 단위 계산과 같은지 테스트"""
+        table = JobTable.from_api_rows(api_rows)
+        jobs = [BackupJob.from_api_response(row) for row in api_rows]
+
+        full_success = table.where(status='T', level='F')
+        assert [table.job_ids[i] for i in full_success] == [
+            job.job_id for job in jobs if job.is_success and job.level == 'F'
+        ]
+        assert table.count(status=('f', 'E')) == sum(1 for job in jobs if job.is_failed)
+        assert table.count(status='T') == sum(1 for job in jobs if job.is_success)
+        assert table.sum_bytes() == sum(job.backup_bytes for job in jobs)
+        assert table.sum_files(full_success) == sum(
+            job.job_files for job in jobs if job.is_success and job.level == 'F'
+        )
+        assert table.clients() == {job.client_name for job in jobs}
+
+    def test_filter_returns_table(self, api_rows):
+        """filter 결과 테이블의 행 뷰 테스트"""
+        table = JobTable.from_api_rows(api_rows)
+        first_client = api_rows[0]['client']
+
+        subset = table.filter(client=first_client, exclude_status='A')
+
+        assert all(job.client_name == first_client for job in subset)
+        assert all(not job.is_canceled for job in subset)
+        assert table.filter(client='unknown').job_ids.tolist() == []
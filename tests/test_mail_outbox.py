@@ -0,0 +1,159 @@
+"""메일 발송 대기열 테스트"""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.mail.outbox import Outbox, OutboxError, OutboxWorker
+from src.mail.sender import EmailSendError
+from src.report.artifact import RenderedReport
+
+
+REPORT = RenderedReport(html='<html><body>리포트</body></html>', css_inlined=True)
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return Outbox(tmp_path / 'outbox')
+
+
+def make_worker(outbox, sender, **kwargs):
+    return OutboxWorker(outbox, sender_factory=lambda: sender, **kwargs)
+
+
+class TestOutbox:
+    """스풀 디렉토리 대기열 테스트"""
+
+    def test_enqueue_persists_message(self, outbox, tmp_path):
+        """등록한 메시지가 새 Outbox 객체에서도 보이는지 테스트 (재시작 유지)"""
+        message = outbox.enqueue('a@example.com, b@example.com', '제목', REPORT)
+
+        reopened = Outbox(tmp_path / 'outbox')
+        assert reopened.pending() == [message.message_id]
+
+        claimed = reopened.claim(message.message_id)
+        assert claimed.to == ['a@example.com', 'b@example.com']
+        assert claimed.html == REPORT.html
+        assert claimed.css_inlined is True
+
+    def test_claim_is_exclusive(self, outbox):
+        """같은 메시지는 한 번만 점유되는지 테스트"""
+        message = outbox.enqueue('a@example.com', '제목', REPORT)
+
+        assert outbox.claim(message.message_id) is not None
+        assert outbox.claim(message.message_id) is None
+
+    def test_enqueue_requires_recipient(self, outbox):
+        """수신자가 없으면 OutboxError를 발생시키는지 테스트"""
+        with pytest.raises(OutboxError):
+            outbox.enqueue('', '제목', REPORT)
+
+    def test_recover_stale_claim(self, outbox):
+        """중단된 워커가 점유한 메시지를 점유 시간 기준으로 복구하는지 테스트"""
+        message = outbox.enqueue('a@example.com', '제목', REPORT)
+        # 오래전에 등록된 메시지도 방금 점유했으면 복구 대상이 아님
+        old = time.time() - 7200
+        os.utime(outbox.spool_dir / 'new' / message.filename, (old, old))
+        outbox.claim(message.message_id)
+
+        assert outbox.recover_stale() == 0
+        assert outbox.recover_stale(now=time.time() + 7200) == 1
+        assert outbox.pending() == [message.message_id]
+
+    def test_claim_skips_not_due_without_moving(self, outbox, monkeypatch):
+        """재시도 시간이 되지 않은 메시지는 work/로 옮기지 않는지 테스트"""
+        message = outbox.enqueue('a@example.com', '제목', REPORT)
+        claimed = outbox.claim(message.message_id)
+        outbox.release(claimed, 'timeout', retry_at=time.time() + 600)
+
+        renames = []
+        monkeypatch.setattr(
+            'src.mail.outbox.os.rename', lambda *args: renames.append(args)
+        )
+        assert outbox.claim(message.message_id) is None
+        assert renames == []
+        assert outbox.counts() == {'new': 1, 'work': 0, 'failed': 0}
+
+    def test_release_interrupted_leaves_single_copy(self, outbox, monkeypatch):
+        """되돌리기가 중간에 실패해도 메시지가 한 곳에만 남는지 테스트 (중복 발송 방지)"""
+        message = outbox.enqueue('a@example.com', '제목', REPORT)
+        claimed = outbox.claim(message.message_id)
+
+        def fail_rename(source, target):
+            raise OSError('crash')
+
+        monkeypatch.setattr('src.mail.outbox.os.rename', fail_rename)
+        with pytest.raises(OutboxError):
+            outbox.release(claimed, 'timeout', retry_at=0)
+        monkeypatch.undo()
+
+        assert outbox.counts() == {'new': 0, 'work': 1, 'failed': 0}
+        assert outbox.recover_stale(max_age=0) == 1
+        assert outbox.claim(message.message_id).last_error == 'timeout'
+
+
+class TestOutboxWorker:
+    """대기열 워커 테스트"""
+
+    def test_sends_all_with_one_sender(self, outbox):
+        """대기 메시지를 하나의 발송기로 보내고 대기열을 비우는지 테스트"""
+        for i in range(3):
+            outbox.enqueue('a@example.com', f'제목 {i}', REPORT)
+        sender = MagicMock()
+        factory = MagicMock(return_value=sender)
+
+        result = OutboxWorker(outbox, sender_factory=factory).run_once()
+
+        assert result == (3, 0, 0)
+        factory.assert_called_once()
+        assert [c.kwargs['subject'] for c in sender.send_report.call_args_list] == [
+            '제목 0', '제목 1', '제목 2'
+        ]
+        sender.close.assert_called_once()
+        assert outbox.counts() == {'new': 0, 'work': 0, 'failed': 0}
+
+    def test_empty_queue_does_not_connect(self, outbox):
+        """대기 메시지가 없으면 발송기를 만들지 않는지 테스트"""
+        factory = MagicMock()
+
+        assert OutboxWorker(outbox, sender_factory=factory).run_once() == (0, 0, 0)
+        factory.assert_not_called()
+
+    def test_failed_message_retried_later(self, outbox):
+        """실패한 메시지는 백오프 시간 이후에 다시 발송되는지 테스트"""
+        message = outbox.enqueue('a@example.com', '제목', REPORT)
+        sender = MagicMock()
+        sender.send_report.side_effect = [EmailSendError('throttled'), True]
+        worker = make_worker(outbox, sender, retry_delay=60)
+        now = time.time()
+
+        assert worker.run_once(now=now) == (0, 1, 0)
+        assert worker.run_once(now=now + 30) == (0, 0, 0)
+        assert worker.run_once(now=now + 61) == (1, 0, 0)
+        assert outbox.pending() == []
+        assert message.message_id not in os.listdir(outbox.spool_dir / 'work')
+
+    def test_moves_to_failed_after_max_attempts(self, outbox):
+        """최대 시도 횟수를 넘기면 failed/로 옮기는지 테스트"""
+        outbox.enqueue('a@example.com', '제목', REPORT)
+        sender = MagicMock()
+        sender.send_report.side_effect = EmailSendError('rejected')
+        worker = make_worker(outbox, sender, max_attempts=2, retry_delay=0)
+
+        assert worker.run_once() == (0, 1, 0)
+        assert worker.run_once() == (0, 0, 1)
+        assert outbox.counts() == {'new': 0, 'work': 0, 'failed': 1}
+
+    def test_sender_error_keeps_message(self, outbox):
+        """발송기 생성 실패 시 메시지를 대기열에 남기는지 테스트"""
+        message = outbox.enqueue('a@example.com', '제목', REPORT)
+
+        def factory():
+            raise RuntimeError('no config')
+
+        with pytest.raises(RuntimeError):
+            OutboxWorker(outbox, sender_factory=factory).run_once()
+
+        assert outbox.pending() == [message.message_id]
@@ -0,0 +1,155 @@
+"""EmailSender 테스트"""
+
+import smtplib
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.mail.sender import EmailSendError, EmailSender, parse_recipients
+from src.report.artifact import RenderedReport
+
+
+def make_sender(**kwargs):
+    return EmailSender('smtp.example.com', 587, 'user', 'secret', **kwargs)
+
+
+def make_smtp():
+    server = MagicMock()
+    server.noop.return_value = (250, b'OK')
+    server.send_message.return_value = {}
+    return server
+
+
+class TestSendReport:
+    """메모리 리포트 발송 테스트"""
+
+    def test_sends_in_memory_html_and_inlines_once(self):
+        """파일 없이 발송하고, 재발송 시 CSS 변환을 재사용하는지 테스트"""
+        report = RenderedReport(
+            html='<html><head><style>p { color: red; }</style></head>'
+                 '<body><p>ok</p></body></html>',
+            start_period=datetime(2025, 10, 10),
+            end_period=datetime(2025, 10, 11),
+        )
+        sender = make_sender()
+        inline = MagicMock(side_effect=lambda html: html.replace('<p>', '<p style="color:red">'))
+
+        with patch.object(sender, '_transform_css_to_inline', inline), \
+                patch.object(sender, 'send_html_email', return_value=True) as mock_send:
+            assert sender.send_report('a@example.com', report)
+            assert sender.send_report('b@example.com', report)
+
+        inline.assert_called_once()
+        subject, html = mock_send.call_args.args[1:]
+        assert subject == '[Bacula] 백업 리포트 - 2025-10-11'
+        assert '<p style="color:red">ok</p>' in html
+
+    def test_send_report_email_reads_file(self, tmp_path):
+        """파일 경로 기반 발송이 같은 경로를 거치는지 테스트"""
+        path = tmp_path / 'report.html'
+        path.write_text('<html><body>file</body></html>', encoding='utf-8')
+        sender = make_sender()
+
+        with patch.object(sender, '_transform_css_to_inline', side_effect=lambda h: h), \
+                patch.object(sender, 'send_html_email', return_value=True) as mock_send:
+            assert sender.send_report_email('a@example.com', path, '2025-10-11')
+
+        assert mock_send.call_args.args[1] == '[Bacula] 백업 리포트 - 2025-10-11'
+        assert 'file' in mock_send.call_args.args[2]
+
+
+class TestSmtpSession:
+    """SMTP 세션 재사용 및 재시도 테스트"""
+
+    def test_parse_recipients(self):
+        """쉼표/세미콜론 구분 수신자 목록을 정규화하는지 테스트"""
+        assert parse_recipients('a@example.com, b@example.com;c@example.com,,a@example.com') == [
+            'a@example.com', 'b@example.com', 'c@example.com'
+        ]
+        assert parse_recipients(['a@example.com', ' ']) == ['a@example.com']
+
+    def test_one_session_for_recipients_and_reports(self):
+        """여러 수신자와 여러 발송에 연결/인증을 한 번만 하는지 테스트"""
+        recipients = ','.join(f'user{i}@example.com' for i in range(15))
+        server = make_smtp()
+
+        with patch('smtplib.SMTP', return_value=server) as mock_smtp:
+            with make_sender() as sender:
+                assert sender.send_html_email(recipients, '제목 1', '<p>1</p>')
+                assert sender.send_html_email(recipients, '제목 2', '<p>2</p>')
+
+        assert mock_smtp.call_count == 1
+        server.starttls.assert_called_once()
+        server.login.assert_called_once()
+        assert server.send_message.call_count == 2
+        message = server.send_message.call_args.args[0]
+        assert len(server.send_message.call_args.kwargs['to_addrs']) == 15
+        assert message['To'].count('@') == 15
+        server.quit.assert_called_once()
+
+    def test_reconnects_when_session_dropped(self):
+        """끊긴 세션은 NOOP으로 감지하여 다시 연결하는지 테스트"""
+        first, second = make_smtp(), make_smtp()
+        first.noop.side_effect = smtplib.SMTPServerDisconnected()
+
+        with patch('smtplib.SMTP', side_effect=[first, second]) as mock_smtp:
+            sender = make_sender()
+            sender.send_html_email('a@example.com', '제목', '<p>1</p>')
+            sender.send_html_email('a@example.com', '제목', '<p>2</p>')
+
+        assert mock_smtp.call_count == 2
+        second.send_message.assert_called_once()
+
+    def test_retry_with_backoff(self):
+        """발송 실패 시 지수 백오프 후 새 세션으로 재시도하는지 테스트"""
+        delays = []
+        failing, working = make_smtp(), make_smtp()
+        failing.send_message.side_effect = smtplib.SMTPServerDisconnected()
+        sender = make_sender(max_retries=3, retry_backoff=0.5, sleep=delays.append)
+
+        with patch('smtplib.SMTP', side_effect=[failing, failing, working]):
+            assert sender.send_html_email('a@example.com', '제목', '<p>1</p>')
+
+        assert delays == [0.5, 1.0]
+        working.send_message.assert_called_once()
+
+    def test_gives_up_after_max_retries(self):
+        """최대 시도 후 EmailSendError를 발생시키는지 테스트"""
+        delays = []
+        server = make_smtp()
+        server.send_message.side_effect = smtplib.SMTPServerDisconnected()
+        sender = make_sender(max_retries=2, sleep=delays.append)
+
+        with patch('smtplib.SMTP', return_value=server):
+            with pytest.raises(EmailSendError):
+                sender.send_html_email('a@example.com', '제목', '<p>1</p>')
+
+        assert delays == [2.0]
+        assert server.send_message.call_count == 2
+
+    def test_no_retry_on_refused_recipients_or_auth(self):
+        """수신자 전체 거부와 인증 실패는 재시도하지 않는지 테스트"""
+        delays = []
+        refused = make_smtp()
+        refused.send_message.side_effect = smtplib.SMTPRecipientsRefused(
+            {'a@example.com': (550, b'no such user')}
+        )
+        bad_login = make_smtp()
+        bad_login.login.side_effect = smtplib.SMTPAuthenticationError(535, b'bad')
+        sender = make_sender(sleep=delays.append)
+
+        with patch('smtplib.SMTP', side_effect=[refused, bad_login]) as mock_smtp:
+            with pytest.raises(EmailSendError):
+                sender.send_html_email('a@example.com', '제목', '<p>1</p>')
+            sender.close()
+            with pytest.raises(EmailSendError):
+                sender.send_html_email('a@example.com', '제목', '<p>1</p>')
+
+        assert mock_smtp.call_count == 2
+        assert delays == []
+
+    def test_requires_recipient(self):
+        """수신자가 없으면 EmailSendError를 발생시키는지 테스트"""
+        with pytest.raises(EmailSendError):
+            make_sender().send_html_email(' , ', '제목', '<p>1</p>')
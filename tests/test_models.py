@@ -3,6 +3,8 @@
 from datetime import datetime
 
 from src.models.backup_job import BackupJob
+from src.models.job_aggregate import JobAggregate
+from src.models.job_table import JobTable
 from src.models.report_stats import ReportStats
 
 
@@ -149,3 +151,101 @@ class TestReportStats:
         assert stats.failed_count == 5
         assert stats.success_rate == 50.0
         assert stats.failed_rate == 50.0
+
+    def test_from_jobs_excludes_canceled(self):
+        """취소된 작업이 통계에서 제외되는지 테스트"""
+        statuses = ['T', 'T', 'f', 'E', 'R', 'A', 'A']
+        levels = ['F', 'I', 'F', 'D', 'I', 'F', 'I']
+        jobs = [
+            BackupJob(
+                job_id=i,
+                job_name=f'job-{i}',
+                client_name='canceled-only' if status == 'A' else f'client-{i % 2}',
+                status=status,
+                level=level,
+                job_type='B',
+                start_time=datetime(2025, 10, 11, 10, 0, 0),
+                end_time=datetime(2025, 10, 11, 10, 5, 0),
+                backup_bytes=100,
+                job_files=1,
+                job_errors=0
+            )
+            for i, (status, level) in enumerate(zip(statuses, levels))
+        ]
+
+        stats = ReportStats.from_jobs(
+            jobs, datetime(2025, 10, 11), datetime(2025, 10, 12)
+        )
+
+        assert stats.total_jobs == 5
+        assert stats.success_count == 2
+        assert stats.failed_count == 2
+        assert stats.running_count == 1
+        assert stats.canceled_count == 2
+        assert stats.total_clients == 2
+        assert stats.total_backup_bytes == 500
+        assert stats.full_total == 2
+        assert stats.full_failed == 1
+        assert stats.incremental_success == 1
+        assert stats.differential_failed == 1
+        assert stats.running_incremental == 1
+
+
+class TestJobAggregate:
+    """JobAggregate 테스트"""
+
+    def make_jobs(self, count):
+        return [
+            BackupJob(
+                job_id=i,
+                job_name=f'job-{i}',
+                client_name=f'client-{i % 3}',
+                status='TfRAE'[i % 5],
+                level='FID'[i % 3],
+                job_type='B',
+                start_time=datetime(2025, 10, 11, 10, 0, 0),
+                end_time=datetime(2025, 10, 11, 10, 5, 0),
+                backup_bytes=i * 10,
+                job_files=i,
+                job_errors=0
+            )
+            for i in range(count)
+        ]
+
+    def test_merge_equals_single_pass(self):
+        """부분 집계 병합 결과가 전체 집계와 같은지 테스트"""
+        jobs = self.make_jobs(30)
+
+        whole = JobAggregate.from_jobs(jobs)
+        merged = JobAggregate.from_jobs(jobs[:10]).merge(
+            JobAggregate.from_jobs(jobs[10:])
+        )
+
+        assert merged.groups == whole.groups
+        assert (JobAggregate.from_jobs(jobs[:5]) + JobAggregate.from_jobs(jobs[5:])).groups \
+            == whole.groups
+
+    def test_from_table_equals_from_jobs(self):
+        """JobTable 집계 결과가 BackupJob 집계와 같은지 테스트"""
+        jobs = self.make_jobs(30)
+
+        assert JobAggregate.from_table(JobTable.from_jobs(jobs)).groups == \
+            JobAggregate.from_jobs(jobs).groups
+
+    def test_from_table_without_client(self):
+        """클라이언트가 없는 작업을 다른 클라이언트로 집계하지 않는지 테스트"""
+        jobs = self.make_jobs(4)
+        jobs[3].client_name = None
+        table = JobTable.from_jobs(jobs)
+
+        assert list(table.client_names()) == ['client-0', 'client-1', 'client-2', None]
+        assert JobAggregate.from_table(table).groups == JobAggregate.from_jobs(jobs).groups
+
+    def test_counts(self):
+        """조건별 작업 수 테스트"""
+        aggregate = JobAggregate.from_jobs(self.make_jobs(30))
+
+        assert aggregate.count() == 30
+        assert aggregate.count(statuses=('T',)) == 6
+        assert aggregate.count(exclude_canceled=True) == 24
+        assert aggregate.total_files() == sum(range(30))
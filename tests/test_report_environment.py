@@ -0,0 +1,107 @@
+"""Jinja2 공유 환경 테스트"""
+
+import os
+
+import pytest
+
+from src.report.environment import (
+    clear_environments,
+    compile_templates,
+    get_environment,
+    is_compiled_fresh,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_environments():
+    clear_environments()
+    yield
+    clear_environments()
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    directory = tmp_path / 'templates'
+    directory.mkdir()
+    (directory / 'page.html').write_text('<p>{{ value }}</p>', encoding='utf-8')
+    return directory
+
+
+class TestSharedEnvironment:
+    """공유 환경 테스트"""
+
+    def test_same_environment_reused(self, template_dir):
+        """같은 템플릿 디렉토리에 대해 환경과 컴파일 결과를 재사용하는지 테스트"""
+        env = get_environment(template_dir)
+
+        assert get_environment(template_dir) is env
+        assert env.get_template('page.html') is env.get_template('page.html')
+
+    def test_bytecode_cache_written(self, template_dir, tmp_path):
+        """디스크 바이트코드 캐시가 기록되는지 테스트"""
+        cache_dir = tmp_path / 'cache'
+        env = get_environment(template_dir, cache_dir=cache_dir)
+
+        assert env.get_template('page.html').render(value='<b>') == '<p>&lt;b&gt;</p>'
+        assert any(cache_dir.iterdir())
+
+
+class TestCompileTemplates:
+    """템플릿 사전 컴파일 테스트"""
+
+    def test_compiled_modules_used(self, template_dir, tmp_path):
+        """사전 컴파일 모듈을 ModuleLoader로 로드하는지 테스트"""
+        module_dir = tmp_path / 'compiled'
+
+        assert compile_templates(template_dir, module_dir) == 1
+        assert is_compiled_fresh(template_dir, module_dir)
+
+        env = get_environment(template_dir, module_dir=module_dir)
+        template = env.get_template('page.html')
+        assert template.filename.endswith('.py')
+        assert template.render(value=1) == '<p>1</p>'
+
+    def test_stale_modules_ignored(self, template_dir, tmp_path):
+        """원본 템플릿이 바뀌면 사전 컴파일 모듈을 무시하는지 테스트"""
+        module_dir = tmp_path / 'compiled'
+        compile_templates(template_dir, module_dir)
+        (template_dir / 'page.html').write_text('<div>{{ value }}</div>', encoding='utf-8')
+
+        assert not is_compiled_fresh(template_dir, module_dir)
+        env = get_environment(template_dir, module_dir=module_dir)
+        assert env.get_template('page.html').render(value=1) == '<div>1</div>'
+
+
+def edit_template(path, text):
+    """템플릿 수정 (같은 초 안의 수정도 감지되도록 수정 시간을 앞당김)"""
+    stat = path.stat()
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+class TestLongRunningReload:
+    """장시간 실행 프로세스의 템플릿 변경 반영 테스트"""
+
+    def test_source_template_reloaded(self, template_dir):
+        """원본 로더 환경은 수정된 템플릿을 다시 로드하는지 테스트"""
+        env = get_environment(template_dir)
+        assert env.get_template('page.html').render(value=1) == '<p>1</p>'
+
+        edit_template(template_dir / 'page.html', '<b>{{ value }}</b>')
+
+        assert get_environment(template_dir) is env
+        assert env.get_template('page.html').render(value=1) == '<b>1</b>'
+
+    def test_compiled_environment_switches_to_source(self, template_dir, tmp_path):
+        """사전 컴파일 이후 원본이 바뀌면 다음 조회부터 원본 템플릿을 쓰는지 테스트"""
+        module_dir = tmp_path / 'compiled'
+        compile_templates(template_dir, module_dir)
+        env = get_environment(template_dir, module_dir=module_dir)
+        assert env.get_template('page.html').filename.endswith('.py')
+
+        edit_template(template_dir / 'page.html', '<b>{{ value }}</b>')
+
+        reloaded = get_environment(template_dir, module_dir=module_dir)
+        assert reloaded is not env
+        assert reloaded.get_template('page.html').render(value=1) == '<b>1</b>'
+        assert get_environment(template_dir, module_dir=module_dir) is reloaded
@@ -0,0 +1,145 @@
+"""ReportGenerator 테스트"""
+
+import io
+import stat
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.models.backup_job import BackupJob
+from src.report.generator import ReportGenerator, ReportGeneratorError
+
+
+PERIOD = (datetime(2025, 10, 10), datetime(2025, 10, 12))
+
+
+def make_jobs():
+    """테스트용 작업 목록 (성공/실패/실행 중)"""
+    return [
+        BackupJob(
+            job_id=job_id,
+            job_name=f'job-{job_id}',
+            client_name='client-1',
+            status=status,
+            level='F',
+            job_type='B',
+            start_time=datetime(2025, 10, 11, 10, 0, 0),
+            end_time=None if status == 'R' else datetime(2025, 10, 11, 10, 5, 0),
+            backup_bytes=1024,
+            job_files=10,
+            job_errors=0
+        )
+        for job_id, status in ((1, 'T'), (2, 'f'), (3, 'R'))
+    ]
+
+
+@pytest.fixture
+def generator(tmp_path):
+    config = MagicMock()
+    config.has_baculum_web_config.return_value = False
+    config.template_cache_dir = str(tmp_path / 'template_cache')
+    config.template_module_dir = None
+    config.report_email_ready = False
+    return ReportGenerator(config, output_dir=str(tmp_path / 'reports'))
+
+
+class TestStreamingRender:
+    """스트리밍 렌더링 테스트"""
+
+    def test_file_matches_string_render(self, generator):
+        """파일로 스트리밍한 결과가 문자열 렌더링과 같은지 테스트"""
+        path = generator.generate_report(make_jobs(), *PERIOD, filename='report.html')
+
+        buffer = io.StringIO()
+        generator.render_to_stream(make_jobs(), *PERIOD, buffer)
+
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        assert content == buffer.getvalue()
+        assert 'job-1' in content and 'job-2' in content
+
+    def test_failed_render_keeps_previous_report(self, generator):
+        """렌더링 실패 시 기존 파일이 유지되고 임시 파일이 남지 않는지 테스트"""
+        target = generator.output_dir / 'report.html'
+        target.write_text('previous', encoding='utf-8')
+
+        with patch.object(
+            generator, '_stream_template',
+            side_effect=ReportGeneratorError('boom')
+        ):
+            with pytest.raises(ReportGeneratorError):
+                generator.generate_report(make_jobs(), *PERIOD, filename='report.html')
+
+        assert target.read_text(encoding='utf-8') == 'previous'
+        assert [p.name for p in generator.output_dir.iterdir()] == ['report.html']
+
+    def test_file_mode(self, generator):
+        """새 파일은 0644, 기존 파일은 권한을 유지하는지 테스트"""
+        path = Path(generator.generate_report(make_jobs(), *PERIOD, filename='report.html'))
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+        path.chmod(0o640)
+        generator.generate_report(make_jobs(), *PERIOD, filename='report.html')
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_temp_file_not_listed_as_report(self, generator):
+        """작성 중인 임시 파일이 리포트 목록에 보이지 않는지 테스트"""
+        seen = []
+
+        def record_listing(template, context, stream):
+            stream.write('partial')
+            seen.append(generator.list_reports())
+
+        with patch.object(generator, '_stream_template', side_effect=record_listing):
+            generator.generate_report(make_jobs(), *PERIOD, filename='mail_1.html')
+
+        assert seen == [[]]
+        assert generator.get_latest_report().endswith('mail_1.html')
+
+
+class TestRenderReport:
+    """메모리 렌더링 테스트"""
+
+    def test_archive_matches_in_memory_html(self, generator):
+        """보관 파일이 메모리의 HTML과 같은지 테스트"""
+        report = generator.render_report(make_jobs(), *PERIOD, filename='report.html')
+
+        assert report.path == generator.output_dir.absolute() / 'report.html'
+        # 보관 파일로 스트리밍하고 본문은 처음 사용할 때 읽음
+        assert not report.loaded
+        assert report.path.read_text(encoding='utf-8') == report.html
+        assert report.loaded
+        assert report.report_date == '2025-10-12'
+        assert report.css_inlined is False
+
+    def test_keep_html_archives_same_string(self, generator):
+        """keep_html이면 메모리의 HTML로 보관 파일을 저장하는지 테스트"""
+        report = generator.render_report(
+            make_jobs(), *PERIOD, filename='report.html', keep_html=True
+        )
+
+        assert report.loaded
+        assert report.path == generator.output_dir.absolute() / 'report.html'
+        assert report.path.read_text(encoding='utf-8') == report.html
+        assert report.css_inlined is False
+
+    def test_without_archive(self, generator):
+        """archive=False이면 파일을 만들지 않는지 테스트"""
+        report = generator.render_report(make_jobs(), *PERIOD, archive=False)
+
+        assert report.path is None
+        assert 'job-1' in report.html
+        assert list(generator.output_dir.iterdir()) == []
+
+    def test_failed_job_error_message(self, generator):
+        """실패 목록에 작업 로그 오류 메시지가 이스케이프되어 표시되는지 테스트"""
+        jobs = make_jobs()
+        jobs[1].error_message = 'Fatal error: <FD> unreachable\nError: No Job status'
+
+        html = generator.render_report(jobs, *PERIOD, archive=False).html
+
+        assert '<div class="error-log">Fatal error: &lt;FD&gt; unreachable\nError: No Job status' \
+            in html
+        assert html.count('class="error-log"') == 1
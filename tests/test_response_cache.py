@@ -0,0 +1,248 @@
+"""API 응답 캐시 테스트"""
+
+import gzip
+import threading
+
+import pytest
+
+from src.api.client import BaculaAPIError, BaculaClient
+from src.api.response_cache import ResponseCache, endpoint_pattern, parse_ttl_spec
+from src.bench.dataset import DatasetSpec
+from src.bench.fake_server import FakeBaculumServer
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class CountingFetch:
+    """호출 횟수를 세는 fetch 함수"""
+
+    def __init__(self, output='value'):
+        self.calls = 0
+        self.output = output
+
+    def __call__(self):
+        self.calls += 1
+        return {'output': f'{self.output}-{self.calls}'}
+
+
+def get(cache, endpoint, fetch, params=None):
+    return cache.get_or_fetch('GET', endpoint, params, None, fetch)['output']
+
+
+class TestTtlSpec:
+    """TTL 설정 파싱 테스트"""
+
+    def test_endpoint_pattern(self):
+        """숫자 경로를 {id}로 묶는지 테스트"""
+        assert endpoint_pattern('/jobs/123/log') == 'jobs/{id}/log'
+        assert endpoint_pattern('clients') == 'clients'
+
+    def test_parse(self):
+        """패턴 정규화와 빈 설정 테스트"""
+        assert parse_ttl_spec(' clients=60, /jobs/{id}=1.5 ') == {'clients': 60, 'jobs/{id}': 1.5}
+        assert parse_ttl_spec('jobs/1/log=10') == {'jobs/{id}/log': 10}
+        assert parse_ttl_spec('') == {}
+
+    @pytest.mark.parametrize('text', ['clients', 'clients=0', '=60', 'clients=abc'])
+    def test_invalid(self, text):
+        """잘못된 TTL 설정 테스트"""
+        with pytest.raises(ValueError):
+            parse_ttl_spec(text)
+
+
+class TestResponseCache:
+    """TTL/LRU/stale-while-revalidate 동작 테스트"""
+
+    def test_ttl_expiry(self):
+        """TTL 안에서는 재사용하고 지나면 다시 조회하는지 테스트"""
+        clock = FakeClock()
+        cache = ResponseCache({'clients': 60}, clock=clock)
+        fetch = CountingFetch()
+
+        assert get(cache, 'clients', fetch) == get(cache, 'clients', fetch) == 'value-1'
+        clock.now += 60
+        assert get(cache, 'clients', fetch) == 'value-2'
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+
+    def test_uncached_requests(self):
+        """TTL이 없는 엔드포인트와 GET 이외 요청은 항상 조회하는지 테스트"""
+        cache = ResponseCache({'clients': 60})
+        fetch = CountingFetch()
+
+        get(cache, 'jobs', fetch)
+        get(cache, 'jobs', fetch)
+        cache.get_or_fetch('POST', 'clients', None, None, fetch)
+        cache.get_or_fetch('POST', 'clients', None, None, fetch)
+
+        assert fetch.calls == 4
+        assert cache.stats().misses == 0
+
+    def test_params_are_part_of_key(self):
+        """파라미터가 다른 요청은 따로 보관하는지 테스트"""
+        cache = ResponseCache({'jobs': 60})
+        fetch = CountingFetch()
+
+        assert get(cache, 'jobs', fetch, {'level': 'F'}) == 'value-1'
+        assert get(cache, 'jobs', fetch, {'level': 'I'}) == 'value-2'
+        assert get(cache, 'jobs', fetch, {'level': 'F'}) == 'value-1'
+
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 응답부터 제거하는지 테스트"""
+        cache = ResponseCache({'jobs/{id}/log': 60}, max_entries=2)
+        fetch = CountingFetch()
+
+        get(cache, 'jobs/1/log', fetch)
+        get(cache, 'jobs/2/log', fetch)
+        get(cache, 'jobs/1/log', fetch)
+        get(cache, 'jobs/3/log', fetch)
+        assert fetch.calls == 3
+
+        get(cache, 'jobs/1/log', fetch)
+        assert fetch.calls == 3
+        get(cache, 'jobs/2/log', fetch)
+        assert fetch.calls == 4
+        assert cache.stats().evictions == 2
+
+    def test_returned_response_is_a_copy(self):
+        """돌려준 응답을 수정해도 캐시에 영향이 없는지 테스트"""
+        cache = ResponseCache({'clients': 60})
+        fetch = CountingFetch()
+
+        cache.get_or_fetch('GET', 'clients', None, None, fetch)['output'] = 'changed'
+        assert get(cache, 'clients', fetch) == 'value-1'
+
+    def test_unfinished_job_detail_is_not_cached(self):
+        """실행 중인 작업 상세는 캐시하지 않고, 종료된 작업만 캐시하는지 테스트"""
+        cache = ResponseCache({'jobs/{id}': 60})
+        status = {'value': 'R'}
+        calls = []
+
+        def fetch():
+            calls.append(status['value'])
+            return {'output': {'jobid': 1, 'jobstatus': status['value']}}
+
+        cache.get_or_fetch('GET', 'jobs/1', None, None, fetch)
+        status['value'] = 'T'
+        cache.get_or_fetch('GET', 'jobs/1', None, None, fetch)
+        cache.get_or_fetch('GET', 'jobs/1', None, None, fetch)
+
+        assert calls == ['R', 'T']
+
+    def test_stale_while_revalidate(self):
+        """유예 시간 안에서는 이전 응답을 즉시 돌려주고 백그라운드에서 한 번만 갱신하는지 테스트"""
+        clock = FakeClock()
+        cache = ResponseCache({'clients': 60}, stale_seconds=300, clock=clock)
+        release = threading.Event()
+        fetch = CountingFetch()
+
+        def slow_fetch():
+            release.wait(5)
+            return fetch()
+
+        get(cache, 'clients', fetch)
+        clock.now += 120
+
+        assert get(cache, 'clients', slow_fetch) == 'value-1'
+        assert get(cache, 'clients', slow_fetch) == 'value-1'
+        release.set()
+        cache.wait(5)
+
+        assert get(cache, 'clients', fetch) == 'value-2'
+        stats = cache.stats()
+        assert (stats.stale_hits, stats.revalidations, fetch.calls) == (2, 1, 2)
+
+        # 유예 시간까지 지나면 기다려서 다시 조회
+        clock.now += 60 + 300
+        assert get(cache, 'clients', fetch) == 'value-3'
+
+    def test_failed_revalidation_keeps_stale_response(self):
+        """백그라운드 갱신이 실패해도 이전 응답을 유지하는지 테스트"""
+        clock = FakeClock()
+        cache = ResponseCache({'clients': 60}, stale_seconds=300, clock=clock)
+        get(cache, 'clients', CountingFetch())
+        clock.now += 120
+
+        def failing_fetch():
+            raise BaculaAPIError('down')
+
+        assert get(cache, 'clients', failing_fetch) == 'value-1'
+        cache.wait(5)
+        assert get(cache, 'clients', failing_fetch) == 'value-1'
+        assert cache.stats().revalidations == 0
+
+    def test_invalid_arguments(self):
+        """잘못된 생성 인자 테스트"""
+        with pytest.raises(ValueError):
+            ResponseCache({'clients': 60}, max_entries=0)
+        with pytest.raises(ValueError):
+            ResponseCache({'clients': 60}, stale_seconds=-1)
+
+
+class TestPersistence:
+    """디스크 보관 테스트"""
+
+    def test_roundtrip_drops_expired(self, tmp_path):
+        """저장한 응답을 다음 실행에서 불러오고 만료된 응답은 제외하는지 테스트"""
+        path = tmp_path / 'cache' / 'api.json.gz'
+        clock = FakeClock()
+        cache = ResponseCache({'clients': 60, 'jobs/{id}/log': 3600}, path=path, clock=clock)
+        get(cache, 'clients', CountingFetch('clients'))
+        get(cache, 'jobs/5/log', CountingFetch('log'))
+        cache.close()
+        assert path.exists()
+
+        clock.now += 120
+        fetch = CountingFetch('new')
+        reloaded = ResponseCache({'clients': 60, 'jobs/{id}/log': 3600}, path=path, clock=clock)
+
+        assert reloaded.stats().entries == 1
+        assert get(reloaded, 'jobs/5/log', fetch) == 'log-1'
+        assert get(reloaded, 'clients', fetch) == 'new-1'
+
+    def test_corrupted_file_is_ignored(self, tmp_path):
+        """손상된 보관 파일은 무시하고 빈 캐시로 시작하는지 테스트"""
+        path = tmp_path / 'api.json.gz'
+        path.write_bytes(b'not gzip')
+        cache = ResponseCache({'clients': 60}, path=path)
+        assert cache.stats().entries == 0
+
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write('{"version": 0, "entries": []}')
+        assert ResponseCache({'clients': 60}, path=path).stats().entries == 0
+
+
+class TestClientCache:
+    """BaculaClient 응답 캐시 연동 테스트"""
+
+    @pytest.fixture
+    def server(self):
+        with FakeBaculumServer.from_spec(DatasetSpec(60, seed=4)) as server:
+            yield server
+
+    def test_repeated_requests_hit_cache(self, server):
+        """클라이언트 목록과 종료된 작업 상세를 한 번만 요청하는지 테스트"""
+        finished = next(job for job in server.jobs if job['jobstatus'] == 'T')
+        running = next(job for job in server.jobs if job['jobstatus'] == 'R')
+        cache = ResponseCache(parse_ttl_spec('clients=3600,jobs/{id}=86400'))
+
+        with BaculaClient(**server.client_config(), response_cache=cache) as client:
+            for _ in range(3):
+                assert client.get_clients() == server.clients
+                assert client.get_job_details(finished['jobid']) == finished
+                client.get_job_details(running['jobid'])
+                client.get_jobs(level='F')
+
+        endpoints = server.stats().endpoints
+        assert endpoints['jobs/{id}'] == 1 + 3
+        assert endpoints['jobs'] == 3
+        assert cache.stats().hits == 4
@@ -0,0 +1,100 @@
+"""cron 스케줄 테스트"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.utils.schedule import CronSchedule, ScheduleError, run_on_schedule
+
+
+class TestCronSchedule:
+    """cron 식 파싱 및 다음 실행 시간 계산 테스트"""
+
+    def test_daily(self):
+        """매일 22시 스케줄의 다음 실행 시간 테스트"""
+        schedule = CronSchedule('0 22 * * *')
+
+        assert schedule.next_after(datetime(2025, 10, 10, 21, 59, 30)) == \
+            datetime(2025, 10, 10, 22, 0)
+        assert schedule.next_after(datetime(2025, 10, 10, 22, 0)) == \
+            datetime(2025, 10, 11, 22, 0)
+
+    def test_steps_ranges_and_lists(self):
+        """간격/범위/목록 문법 테스트"""
+        schedule = CronSchedule('*/15 8-10,20 * * *')
+
+        assert schedule.next_after(datetime(2025, 10, 10, 8, 1)) == datetime(2025, 10, 10, 8, 15)
+        assert schedule.next_after(datetime(2025, 10, 10, 10, 45)) == datetime(2025, 10, 10, 20, 0)
+
+    def test_weekday_and_year_rollover(self):
+        """요일 제한과 연말 넘김 테스트 (2025-12-31은 수요일)"""
+        weekdays = CronSchedule('30 6 * * 1-5')
+        assert weekdays.next_after(datetime(2025, 10, 10, 7, 0)) == datetime(2025, 10, 13, 6, 30)
+
+        sunday = CronSchedule('0 0 * * 7')
+        assert sunday.next_after(datetime(2025, 12, 31)) == datetime(2026, 1, 4)
+
+    def test_day_or_weekday(self):
+        """일/요일이 모두 제한되면 둘 중 하나만 맞아도 실행되는지 테스트"""
+        schedule = CronSchedule('0 0 1 * 1')
+
+        assert schedule.next_after(datetime(2025, 10, 1, 1)) == datetime(2025, 10, 6)
+
+    def test_step_from_star_is_not_day_restriction(self):
+        """'*/2'처럼 '*'로 시작하는 일/요일 필드는 제한으로 보지 않는지 테스트"""
+        # 홀수 일이면서 월요일이어야 함 (2025-10-20은 월요일이지만 짝수 일)
+        schedule = CronSchedule('0 0 */2 * 1')
+        assert schedule.next_after(datetime(2025, 10, 14)) == datetime(2025, 10, 27)
+
+        # 일만 제한: 요일 필드 '*/1'은 모든 요일
+        assert CronSchedule('0 0 15 * */1').next_after(datetime(2025, 10, 10)) == \
+            datetime(2025, 10, 15)
+
+    @pytest.mark.parametrize('expression', [
+        '0 22 * *', '60 * * * *', '0 22 * * 8', '*/0 * * * *', 'a * * * *', '5-1 * * * *',
+    ])
+    def test_invalid_expression(self, expression):
+        """잘못된 cron 식은 ScheduleError를 발생시키는지 테스트"""
+        with pytest.raises(ScheduleError):
+            CronSchedule(expression)
+
+    def test_impossible_date(self):
+        """존재하지 않는 날짜는 ScheduleError를 발생시키는지 테스트"""
+        with pytest.raises(ScheduleError):
+            CronSchedule('0 0 30 2 *').next_after(datetime(2025, 1, 1))
+
+
+class TestRunOnSchedule:
+    """스케줄 실행 루프 테스트"""
+
+    def test_runs_job_at_scheduled_times(self):
+        """예정 시간이 되면 작업을 실행하고 종료 신호로 멈추는지 테스트"""
+        clock = iter([
+            datetime(2025, 10, 10, 21, 59),  # 다음 실행 계산
+            datetime(2025, 10, 10, 22, 0),   # 예정 시간 도달
+            datetime(2025, 10, 10, 22, 1),   # 다음 실행 계산
+            datetime(2025, 10, 11, 22, 0),
+        ])
+        stop_event = threading.Event()
+        runs = []
+
+        def job(scheduled_at):
+            runs.append(scheduled_at)
+            if len(runs) == 2:
+                stop_event.set()
+
+        run_on_schedule(CronSchedule('0 22 * * *'), job, stop_event, now=lambda: next(clock))
+
+        assert runs == [datetime(2025, 10, 10, 22, 0), datetime(2025, 10, 11, 22, 0)]
+
+    def test_stop_while_waiting(self):
+        """대기 중 종료 신호를 받으면 작업 없이 종료하는지 테스트"""
+        stop_event = threading.Event()
+        timer = threading.Timer(0.05, stop_event.set)
+        timer.start()
+        job_calls = []
+
+        run_on_schedule(CronSchedule('0 22 * * *'), job_calls.append, stop_event, max_wait=0.01)
+
+        assert job_calls == []
@@ -0,0 +1,91 @@
+"""serve 커맨드 테스트"""
+
+import logging
+import signal
+from unittest.mock import MagicMock, patch
+
+from src.cli import create_parser
+from src.commands.serve import ServeCommand
+
+
+def run_serve(argv, runs=2, run_report=None):
+    """run_on_schedule이 작업을 runs번 실행하도록 하고 serve 커맨드 실행"""
+    parser = create_parser()
+    args = parser.parse_args(['serve'] + argv)
+    command: ServeCommand = args.command_instance
+    command.config = MagicMock(serve_schedule='0 22 * * *', api_cache_ttls={})
+    command.config.get_baculum_client_config.return_value = {}
+    command.logger = logging.getLogger('test')
+
+    def fake_schedule(schedule, job, stop_event):
+        for _ in range(runs):
+            job(None)
+
+    mock_run = MagicMock(side_effect=run_report, return_value=0)
+    command.report_command.run_report = mock_run
+
+    with patch('src.api.client.BaculaClient') as mock_client, \
+            patch('src.commands.serve.run_on_schedule', side_effect=fake_schedule):
+        result = command.execute(args)
+
+    return result, args, mock_client, mock_run
+
+
+class TestServeCommand:
+    """상주 실행 커맨드 테스트"""
+
+    def test_reuses_client_across_runs(self):
+        """여러 번 실행해도 API 세션을 하나만 만들고 종료 시 닫는지 테스트"""
+        result, args, mock_client, mock_run = run_serve([], runs=3)
+
+        assert result == 0
+        assert args.mode == 'production'
+        mock_client.assert_called_once()
+        clients = {id(call.kwargs['client']) for call in mock_run.call_args_list}
+        assert mock_run.call_count == 3 and len(clients) == 1
+        mock_client.return_value.__exit__.assert_called_once()
+
+    def test_reuses_email_sender_until_shutdown(self):
+        """여러 번 실행해도 EmailSender를 하나만 만들고 serve 종료 시 닫는지 테스트"""
+        report = MagicMock()
+
+        def send(args, client=None, job_store=None):
+            command = args.command_instance.report_command
+            command.config.has_mail_config.return_value = True
+            command._send_email(report)
+
+        with patch('src.mail.sender.EmailSender') as mock_sender:
+            result = run_serve([], runs=3, run_report=send)[0]
+
+        assert result == 0
+        mock_sender.assert_called_once()
+        assert mock_sender.return_value.send_report.call_count == 3
+        mock_sender.return_value.close.assert_called_once()
+
+    def test_job_failure_does_not_stop_serve(self):
+        """작업 예외가 상주 프로세스를 종료시키지 않는지 테스트"""
+        result, _, _, mock_run = run_serve([], runs=2, run_report=RuntimeError('boom'))
+
+        assert result == 0
+        assert mock_run.call_count == 2
+
+    def test_restores_signal_handlers(self):
+        """종료 후 이전 시그널 핸들러를 복원하는지 테스트"""
+        previous = signal.getsignal(signal.SIGTERM)
+
+        run_serve([])
+
+        assert signal.getsignal(signal.SIGTERM) is previous
+
+    def test_invalid_schedule(self):
+        """잘못된 스케줄이면 종료 코드 1을 반환하는지 테스트"""
+        result = run_serve(['--schedule', '0 25 * * *'])[0]
+
+        assert result == 1
+
+    def test_schedule_without_run_time(self):
+        """실행 시간이 없는 스케줄은 시작 시점에 종료 코드 1을 반환하는지 테스트"""
+        result, _, mock_client, _ = run_serve(['--schedule', '0 0 30 2 *'])
+
+        assert result == 1
+        mock_client.assert_not_called()
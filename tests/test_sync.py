@@ -0,0 +1,177 @@
+"""증분 동기화 테스트"""
+
+from datetime import datetime
+
+from src.services.sync import IncrementalSync, SyncState
+
+
+START = datetime(2025, 10, 10, 22, 0, 0)
+
+
+def make_row(job_id, status='T', starttime='2025-10-11 00:00:00', jobtdate=None):
+    """API 응답 형식의 작업 데이터 생성"""
+    return {
+        'jobid': job_id,
+        'name': f'job-{job_id}',
+        'client': 'client-1',
+        'jobstatus': status,
+        'level': 'I',
+        'type': 'B',
+        'starttime': starttime,
+        'endtime': starttime if status != 'R' else None,
+        'jobtdate': jobtdate if jobtdate is not None else 1760108400 + job_id,
+    }
+
+
+class FakeClient:
+    """증분 동기화용 BaculaClient 대역"""
+
+    api_host = 'director'
+
+    def __init__(self):
+        self.delta_rows = []
+        self.details = {}
+        self.page_calls = []
+        self.detail_calls = []
+
+    def iter_job_pages(self, start_time=None, end_time=None, level=None, type=None,
+                       page_size=500):
+        # 실제 API와 같이 jobid 내림차순으로 페이지 반환
+        rows = sorted(self.delta_rows, key=lambda row: row['jobid'], reverse=True)
+        offset = 0
+        while True:
+            self.page_calls.append((start_time, offset))
+            page = rows[offset:offset + page_size]
+            yield page
+            if len(page) < page_size:
+                break
+            offset += page_size
+
+    def get_job_details(self, job_id):
+        self.detail_calls.append(job_id)
+        return self.details.get(job_id, {})
+
+
+class TestIncrementalSync:
+    """IncrementalSync 테스트"""
+
+    def make_sync(self, tmp_path, client, window_rows):
+        self.window_calls = []
+
+        def fetch_window(start_time, end_time):
+            self.window_calls.append((start_time, end_time))
+            return list(window_rows)
+
+        return IncrementalSync(client, tmp_path / 'state.json', fetch_window)
+
+    def test_first_run_fetches_full_window(self, tmp_path):
+        """첫 실행 시 전체 기간을 조회하고 워터마크를 저장하는지 테스트"""
+        client = FakeClient()
+        sync = self.make_sync(tmp_path, client, [make_row(1), make_row(2, 'R')])
+
+        rows = sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        assert [row['jobid'] for row in rows] == [2, 1]
+        assert len(self.window_calls) == 1
+        assert client.page_calls == []
+
+        state = SyncState.load(tmp_path / 'state.json')
+        assert state.last_jobid == 2
+        assert state.running_job_ids == [2]
+
+    def test_second_run_fetches_only_delta(self, tmp_path):
+        """두 번째 실행 시 새 작업과 실행 중이던 작업만 반영하는지 테스트"""
+        client = FakeClient()
+        sync = self.make_sync(
+            tmp_path, client,
+            [make_row(1), make_row(2, 'R'), make_row(3, 'R')]
+        )
+        sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        # 델타에는 작업 1(변경 없음), 작업 2(종료됨), 작업 4(신규)만 포함
+        client.delta_rows = [make_row(1), make_row(2, 'T'), make_row(4, 'R')]
+        client.details = {3: {'jobid': 3, 'jobstatus': 'T'}}
+
+        rows = sync.sync(START, datetime(2025, 10, 11, 2, 0, 0))
+
+        statuses = {row['jobid']: row['jobstatus'] for row in rows}
+        assert statuses == {1: 'T', 2: 'T', 3: 'T', 4: 'R'}
+        assert len(self.window_calls) == 1
+        assert client.page_calls == [(START, 0)]
+        assert client.detail_calls == [3]
+
+        state = SyncState.load(tmp_path / 'state.json')
+        assert state.last_jobid == 4
+        assert state.running_job_ids == [4]
+
+    def test_late_written_job_is_included(self, tmp_path):
+        """시작 시간이 오래됐지만 늦게 기록된 작업도 jobid 워터마크로 반영하는지 테스트"""
+        client = FakeClient()
+        sync = self.make_sync(tmp_path, client, [make_row(1), make_row(2)])
+        sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        client.delta_rows = [
+            make_row(1), make_row(2), make_row(3, starttime='2025-10-10 22:05:00'),
+        ]
+        rows = sync.sync(START, datetime(2025, 10, 11, 2, 0, 0))
+
+        assert [row['jobid'] for row in rows] == [3, 2, 1]
+
+    def test_paging_stops_at_watermark(self, tmp_path):
+        """워터마크 이하 jobid에 도달하면 다음 페이지를 요청하지 않는지 테스트"""
+        client = FakeClient()
+        old_rows = [make_row(job_id) for job_id in range(1, 11)]
+        sync = self.make_sync(tmp_path, client, old_rows)
+        sync.page_size = 3
+        sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        client.delta_rows = old_rows + [make_row(11), make_row(12)]
+        rows = sync.sync(START, datetime(2025, 10, 11, 2, 0, 0))
+
+        assert len(rows) == 12
+        assert client.page_calls == [(START, 0)]
+
+    def test_state_keeps_only_report_columns(self, tmp_path):
+        """상태 파일에는 리포트에 필요한 컬럼만 저장하는지 테스트"""
+        client = FakeClient()
+        row = {**make_row(1), 'priorjobid': 0, 'comment': 'x' * 100}
+        sync = self.make_sync(tmp_path, client, [row])
+        sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        stored = SyncState.load(tmp_path / 'state.json').job_rows()
+
+        assert stored[0]['jobid'] == 1
+        assert 'comment' not in stored[0]
+        assert stored[0]['jobtdate'] == row['jobtdate']
+
+    def test_window_moves_forward(self, tmp_path):
+        """조회 기간 밖으로 벗어난 작업이 제거되는지 테스트"""
+        client = FakeClient()
+        sync = self.make_sync(tmp_path, client, [
+            make_row(1, starttime='2025-10-10 22:30:00'),
+            make_row(2, starttime='2025-10-11 00:30:00'),
+        ])
+        sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        rows = sync.sync(
+            datetime(2025, 10, 11, 0, 0, 0), datetime(2025, 10, 11, 2, 0, 0)
+        )
+
+        assert [row['jobid'] for row in rows] == [2]
+
+    def test_earlier_window_triggers_full_sync(self, tmp_path):
+        """저장된 상태보다 이른 기간 요청 시 전체 재조회하는지 테스트"""
+        client = FakeClient()
+        sync = self.make_sync(tmp_path, client, [make_row(1)])
+        sync.sync(START, datetime(2025, 10, 11, 1, 0, 0))
+
+        sync.sync(datetime(2025, 10, 4, 0, 0, 0), datetime(2025, 10, 11, 1, 0, 0))
+
+        assert len(self.window_calls) == 2
+
+    def test_corrupted_state_is_ignored(self, tmp_path):
+        """손상된 상태 파일은 빈 상태로 처리되는지 테스트"""
+        path = tmp_path / 'state.json'
+        path.write_text('{not json', encoding='utf-8')
+
+        assert SyncState.load(path).last_jobid == 0
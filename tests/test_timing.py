@@ -0,0 +1,150 @@
+"""단계별 실행 시간 계측 테스트"""
+
+import json
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.report.generator import ReportGenerator
+from src.services.backup import BackupService
+from src.utils.timing import StageTimer, current_timer, stage
+from tests.test_backup_service import END, START, FakeClient
+from tests.test_report_generator import PERIOD, make_jobs
+
+
+class TestStageTimer:
+    """StageTimer 기록 및 출력 테스트"""
+
+    def test_stage_is_noop_without_timer(self):
+        """활성화된 계측기가 없으면 기록하지 않는지 테스트"""
+        assert current_timer() is None
+        with stage('render') as record:
+            assert record is None
+
+    def test_records_wall_cpu_and_memory(self):
+        """단계별 시간/메모리와 레이블을 기록하는지 테스트"""
+        timer = StageTimer()
+        with timer.activate():
+            with stage('fetch', level='F'):
+                sum(range(10000))
+
+        record, = timer.records
+        assert (record.stage, record.labels, record.ok) == ('fetch', {'level': 'F'}, True)
+        assert record.wall_seconds >= 0 and record.cpu_seconds >= 0
+        assert record.peak_rss_bytes is None or record.peak_rss_bytes > 0
+        assert current_timer() is None
+
+    def test_traced_peak_per_stage(self):
+        """tracemalloc 사용 시 단계마다 단계 중 할당 최대치를 기록하는지 테스트"""
+        timer = StageTimer()
+        tracemalloc.start()
+        try:
+            with timer.stage('total'):
+                with timer.stage('render'):
+                    buffer = bytearray(4 * 1024 * 1024)
+                    del buffer
+                with timer.stage('write'):
+                    pass
+        finally:
+            tracemalloc.stop()
+
+        peaks = {r.stage: r.traced_peak_bytes for r in timer.records}
+        assert peaks['render'] >= 4 * 1024 * 1024
+        assert peaks['write'] < 1024 * 1024
+        # 안쪽 단계가 reset_peak()를 호출해도 바깥 단계의 최대치는 유지됨
+        assert peaks['total'] >= peaks['render']
+
+    def test_no_traced_peak_without_tracemalloc(self):
+        """tracemalloc이 꺼져 있으면 할당 최대치를 기록하지 않는지 테스트"""
+        timer = StageTimer()
+        with timer.stage('render'):
+            pass
+
+        assert timer.records[0].traced_peak_bytes is None
+
+    def test_failed_stage(self):
+        """예외가 난 단계는 ok=False로 기록하고 예외를 그대로 전달하는지 테스트"""
+        timer = StageTimer()
+        with pytest.raises(RuntimeError), timer.activate(), stage('send'):
+            raise RuntimeError('smtp down')
+
+        assert timer.records[0].ok is False
+
+    def test_json_lines(self, tmp_path):
+        """단계마다 한 줄의 JSON을 이어 쓰는지 테스트"""
+        path = tmp_path / 'metrics' / 'timings.jsonl'
+        for _ in range(2):
+            timer = StageTimer()
+            with timer.stage('connect'), timer.stage('render'):
+                pass
+            timer.write_json_lines(path, mode='test')
+
+        rows = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        assert [row['stage'] for row in rows] == ['render', 'connect'] * 2
+        assert len({row['run_id'] for row in rows}) == 2
+        assert rows[0]['mode'] == 'test' and 'wall_seconds' in rows[0]
+
+    def test_prometheus_textfile(self, tmp_path):
+        """같은 단계는 합산하여 Prometheus 형식으로 저장하는지 테스트"""
+        timer = StageTimer()
+        for _ in range(2):
+            with timer.stage('fetch', level='F') as record:
+                pass
+            record.wall_seconds = 1.5
+        with timer.stage('send'):
+            pass
+
+        path = tmp_path / 'baculum_report.prom'
+        timer.write_prometheus(path)
+        text = path.read_text(encoding='utf-8')
+
+        assert '# TYPE baculum_report_stage_wall_seconds gauge' in text
+        assert 'baculum_report_stage_wall_seconds{stage="fetch",level="F"} 3.0' in text
+        assert 'baculum_report_stage_success{stage="send"} 1' in text
+        assert 'baculum_report_last_run_timestamp_seconds ' in text
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestPipelineStages:
+    """파이프라인 계측 지점 테스트"""
+
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_fetch_per_level_and_parse(self, workers):
+        """레벨별 fetch와 parse 단계가 기록되는지 테스트 (동시 조회 포함)"""
+        service = BackupService(FakeClient(), fetch_workers=workers)
+        timer = StageTimer()
+
+        with timer.activate():
+            service.get_jobs_by_period('test', START, END)
+
+        stages = sorted((r.stage, r.labels.get('level', '')) for r in timer.records)
+        assert stages == [('fetch', 'D'), ('fetch', 'F'), ('fetch', 'I'), ('parse', '')]
+
+    def test_report_stages(self, tmp_path):
+        """메일 없는 리포트 생성은 stats/write(스트리밍) 단계만 기록되는지 테스트"""
+        config = MagicMock(template_cache_dir=None, template_module_dir=None)
+        config.has_baculum_web_config.return_value = False
+        generator = ReportGenerator(config, output_dir=str(tmp_path), email_ready=False)
+        timer = StageTimer()
+
+        with timer.activate():
+            generator.render_report(make_jobs(), *PERIOD, filename='report.html')
+
+        assert [r.stage for r in timer.records] == ['stats', 'write']
+        assert timer.records[-1].labels == {'streamed': 'True'}
+
+    def test_report_stages_with_mail(self, tmp_path):
+        """메일 발송용 리포트 생성은 render와 write 단계가 따로 기록되는지 테스트"""
+        config = MagicMock(template_cache_dir=None, template_module_dir=None)
+        config.has_baculum_web_config.return_value = False
+        generator = ReportGenerator(config, output_dir=str(tmp_path), email_ready=False)
+        timer = StageTimer()
+
+        with timer.activate():
+            generator.render_report(
+                make_jobs(), *PERIOD, filename='report.html', keep_html=True
+            )
+
+        assert [r.stage for r in timer.records] == ['stats', 'render', 'write']
+        assert timer.records[-1].labels == {}
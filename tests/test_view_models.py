@@ -0,0 +1,87 @@
+"""리포트 뷰 모델 테스트"""
+
+from dataclasses import replace
+from datetime import datetime
+
+from src.models.backup_job import BackupJob
+from src.report.view_models import JobView, JobViewCache
+
+
+def make_job(job_id=1, status='T', end_time=datetime(2025, 10, 11, 10, 5, 7)):
+    """테스트용 BackupJob 생성"""
+    return BackupJob(
+        job_id=job_id,
+        job_name=f'job-{job_id}',
+        client_name='client-1',
+        status=status,
+        level='F',
+        job_type='B',
+        start_time=datetime(2025, 10, 11, 10, 0, 3),
+        end_time=end_time,
+        backup_bytes=1024 * 1024,
+        job_files=10,
+        job_errors=0
+    )
+
+
+class TestJobView:
+    """JobView 테스트"""
+
+    def test_from_job_matches_job_properties(self):
+        """미리 포맷한 값이 BackupJob 프로퍼티 및 strftime 결과와 같은지 테스트"""
+        job = make_job()
+        view = JobView.from_job(job)
+
+        assert view.start_display == job.start_time.strftime('%Y-%m-%d %H:%M:%S')
+        assert view.start_display_short == job.start_time.strftime('%Y-%m-%d %H:%M')
+        assert view.end_display == job.end_time.strftime('%Y-%m-%d %H:%M:%S')
+        assert view.end_display_short == job.end_time.strftime('%Y-%m-%d %H:%M')
+        assert view.status_display == job.status_display
+        assert view.level_display == job.level_display
+        assert view.duration_display == job.duration_display
+        assert view.backup_size_display == job.backup_size_display
+
+    def test_missing_end_time(self):
+        """종료 시간이 없으면 '-'로 표시되는지 테스트"""
+        view = JobView.from_job(make_job(status='R', end_time=None))
+
+        assert view.end_display == '-'
+        assert view.end_display_short == '-'
+
+
+class TestJobViewCache:
+    """JobViewCache 테스트"""
+
+    def test_reuses_view_for_unchanged_job(self):
+        """변경되지 않은 작업은 캐시된 뷰를 재사용하는지 테스트"""
+        cache = JobViewCache()
+        job = make_job()
+
+        first = cache.get(job)
+        second = cache.get(make_job())
+
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_rebuilds_view_when_job_changes(self):
+        """상태가 바뀐 작업은 뷰를 다시 만드는지 테스트"""
+        cache = JobViewCache()
+        running = make_job(status='R', end_time=None)
+        finished = replace(running, status='T', end_time=datetime(2025, 10, 11, 11, 0, 0))
+
+        assert cache.get(running).status_display == '실행 중'
+        assert cache.get(finished).status_display == '성공'
+        assert cache.misses == 2
+
+    def test_evicts_least_recently_used(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목을 제거하는지 테스트"""
+        cache = JobViewCache(max_size=2)
+        cache.build_many([make_job(1), make_job(2)])
+        cache.get(make_job(1))
+        cache.get(make_job(3))
+
+        assert len(cache) == 2
+        cache.get(make_job(1))
+        assert cache.hits == 2
+        cache.get(make_job(2))
+        assert cache.misses == 4